@@ -0,0 +1,273 @@
+"""Benchmarks for building apps with explore().
+
+For each distribution, the wall time of each stage of building an app
+is recorded, along with the size of the serialized output. Results can
+be saved as a baseline and compared with later runs.
+
+Usage from the command line:
+
+    python -m distribution_explorer.benchmarks
+    python -m distribution_explorer.benchmarks --save baseline.json
+    python -m distribution_explorer.benchmarks --compare baseline.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+import bokeh
+import bokeh.embed
+import bokeh.resources
+
+from . import distribution_explorer as de
+
+
+stages = (
+    "load_params",
+    "quantile_setter_params",
+    "scipy_eval",
+    "bokeh_models",
+    "embed_json",
+    "embed_html",
+)
+
+
+def _timed(f, *args):
+    """Call f(*args) and return the result and the wall time in
+    seconds."""
+    start = time.perf_counter()
+    result = f(*args)
+    return result, time.perf_counter() - start
+
+
+def _scipy_eval(dist, params, x_min, x_max, n=400):
+    """Evaluate the PMF/PDF and CDF for the default parameters on the
+    grid used by explore()."""
+    fun_p, fun_c = de._funs(dist)
+    param_vals = [param["value"] for param in params]
+    if dist in de.discrete_dists:
+        x = np.arange(int(np.ceil(x_min)), int(np.floor(x_max)) + 1)
+    else:
+        x = np.linspace(x_min, x_max, n)
+
+    return fun_p(x, *param_vals), fun_c(x, *param_vals)
+
+
+def benchmark_dist(dist, repeat=3, **kwargs):
+    """Time building and serializing an app for a distribution.
+
+    Parameters
+    ----------
+    dist : str
+        Name of distribution.
+    repeat : int, default 3
+        Number of times to build the app. The minimum time over the
+        repeats is reported for each stage.
+    kwargs : dict
+        Any kwargs to be passed to explore().
+
+    Returns
+    -------
+    output : dict
+        Times in seconds for each stage, keyed by the entries of
+        `stages`, total time to run explore() keyed by "explore", and
+        the sizes in bytes of the JSON and standalone HTML outputs,
+        keyed by "json_bytes" and "html_bytes". The time for Bokeh
+        model construction is the time to run explore() less the times
+        of the preceding stages.
+    """
+    dist = de._canonical_dist_name(dist)
+    times = {stage: [] for stage in stages + ("explore",)}
+
+    for _ in range(repeat):
+        (params, x_min, x_max, _, _), t = _timed(
+            de._load_params, dist, None, None, None, None, None
+        )
+        times["load_params"].append(t)
+
+        _, t = _timed(de._compute_quantile_setter_params, dist, params)
+        times["quantile_setter_params"].append(t)
+
+        _, t = _timed(_scipy_eval, dist, params, x_min, x_max)
+        times["scipy_eval"].append(t)
+
+        layout, t = _timed(lambda: de.explore(dist, **kwargs))
+        times["explore"].append(t)
+        times["bokeh_models"].append(
+            max(
+                0.0,
+                t
+                - times["load_params"][-1]
+                - times["quantile_setter_params"][-1]
+                - times["scipy_eval"][-1],
+            )
+        )
+
+        json_item, t = _timed(bokeh.embed.json_item, layout)
+        times["embed_json"].append(t)
+
+        html, t = _timed(bokeh.embed.file_html, layout, bokeh.resources.CDN)
+        times["embed_html"].append(t)
+
+    output = {stage: min(t) for stage, t in times.items()}
+    output["json_bytes"] = len(json.dumps(json_item).encode("utf-8"))
+    output["html_bytes"] = len(html.encode("utf-8"))
+
+    return output
+
+
+def run(dists=None, repeat=3, verbose=False, **kwargs):
+    """Run benchmarks for distributions.
+
+    Parameters
+    ----------
+    dists : list of str or None, default None
+        Names of distributions to benchmark. If None, all distributions
+        in `discrete_dists` and `continuous_dists` are benchmarked.
+    repeat : int, default 3
+        Number of times to build each app.
+    verbose : bool, default False
+        If True, print results for each distribution as it is done.
+    kwargs : dict
+        Any kwargs to be passed to explore().
+
+    Returns
+    -------
+    output : dict
+        Dictionary with keys "meta", containing information about the
+        environment, and "results", with results of benchmark_dist()
+        for each distribution.
+    """
+    if dists is None:
+        dists = de._dist_names()
+
+    results = {}
+    for dist in dists:
+        results[dist] = benchmark_dist(dist, repeat=repeat, **kwargs)
+        if verbose:
+            print(_format_result(dist, results[dist]))
+
+    meta = dict(
+        date=time.strftime("%Y-%m-%dT%H:%M:%S"),
+        python=platform.python_version(),
+        bokeh=bokeh.__version__,
+        numpy=np.__version__,
+        platform=platform.platform(),
+        repeat=repeat,
+        explore_kwargs={key: repr(val) for key, val in kwargs.items()},
+    )
+
+    return dict(meta=meta, results=results)
+
+
+def _format_result(dist, result):
+    """One line summary of the results for a distribution."""
+    times = "  ".join(
+        f"{stage} {1000 * result[stage]:8.2f}" for stage in stages + ("explore",)
+    )
+    return (
+        f"{dist:26s} {times}  (ms)  json {result['json_bytes']:8d}  "
+        f"html {result['html_bytes']:8d}  (bytes)"
+    )
+
+
+def save_baseline(benchmark, fname):
+    """Save results of run() as a JSON baseline."""
+    with open(fname, "w") as f:
+        json.dump(benchmark, f, indent=2)
+
+
+def load_baseline(fname):
+    """Load a baseline saved with save_baseline()."""
+    with open(fname, "r") as f:
+        return json.load(f)
+
+
+def compare(benchmark, baseline, threshold=0.25, min_time=1e-3):
+    """Compare results of run() to a baseline.
+
+    Parameters
+    ----------
+    benchmark : dict
+        Output of run().
+    baseline : dict
+        Output of run() for the baseline, e.g., as loaded with
+        load_baseline().
+    threshold : float, default 0.25
+        Relative increase in time or size that is considered a
+        regression.
+    min_time : float, default 0.001
+        Times in seconds below which increases are not considered
+        regressions, since they are dominated by noise.
+
+    Returns
+    -------
+    output : list of tuples
+        Each entry is (dist, quantity, baseline value, new value) for a
+        quantity that regressed.
+    """
+    regressions = []
+    for dist, result in benchmark["results"].items():
+        if dist not in baseline["results"]:
+            continue
+
+        base = baseline["results"][dist]
+        for quantity, val in result.items():
+            if quantity not in base:
+                continue
+
+            if quantity.endswith("_bytes"):
+                regressed = val > (1 + threshold) * base[quantity]
+            else:
+                regressed = val > min_time and val > (1 + threshold) * base[quantity]
+
+            if regressed:
+                regressions.append((dist, quantity, base[quantity], val))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark building apps with distribution_explorer.explore()."
+    )
+    parser.add_argument(
+        "dists", nargs="*", help="distributions to benchmark (default all)"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", help="save results as a baseline to this file")
+    parser.add_argument("--compare", help="compare results to this baseline")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    benchmark = run(
+        dists=args.dists if len(args.dists) > 0 else None,
+        repeat=args.repeat,
+        verbose=True,
+    )
+
+    if args.save is not None:
+        save_baseline(benchmark, args.save)
+
+    if args.compare is not None:
+        regressions = compare(
+            benchmark, load_baseline(args.compare), threshold=args.threshold
+        )
+        for dist, quantity, base_val, val in regressions:
+            print(
+                f"REGRESSION {dist} {quantity}: {base_val:.4g} -> {val:.4g} "
+                f"({val / base_val:.2f}x)"
+            )
+        print(f"{len(regressions)} regression(s) with threshold {args.threshold}.")
+
+        return 1 if len(regressions) > 0 else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -38,6 +38,10 @@ class UnivariateDistribution {
 
     
     this.epsilon = 1.0e-8;
+
+    this.expensiveCdf = false;
+
+    this.tol = 1.0e-8;
   }
 
   generateLocationParamIndex() {
@@ -137,6 +141,36 @@ class UnivariateDistribution {
   scalarToArrayParams(params) {
     return params instanceof Array ? params : [params]
   }
+
+  logNormalizer(params) {
+
+    return 0.0;
+  }
+
+  cachedLogNormalizer(params) {
+
+    let cache = this.logNormalizerCache;
+    if (cache !== undefined && cache.params.length === params.length) {
+      let i = 0;
+      while (i < params.length && cache.params[i] === params[i]) i++;
+      if (i === params.length) return cache.value;
+    }
+
+    this.logNormalizerCache = {params: params.slice(), value: this.logNormalizer(params)};
+
+    return this.logNormalizerCache.value;
+  }
+
+  sample(out, params, rng, parametrization = this.parametrization) {
+
+    params = this.scalarToArrayParams(params);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = this.ppfSingleValue(rng(), params, parametrization);
+    }
+
+    return out;
+  }
 }
 """,
     "DiscreteUnivariateDistribution": """
@@ -158,6 +192,21 @@ class DiscreteUnivariateDistribution extends UnivariateDistribution {
       params);
   }
 
+  logpmfSingleValue(x, params, parametrization = this.parametrization) {
+    
+    
+    return Math.log(this.pmfSingleValue(x, params, parametrization));
+  }
+
+  logpmf(x, params, parametrization = this.parametrization) {
+    params = this.scalarToArrayParams(params);
+
+    return this.scalarOrArrayCompute(
+      (x, params) => this.logpmfSingleValue(x, params, parametrization),
+      x,
+      params);
+  }
+
   cdfSingleValue(x, params, parametrization = this.parametrization) {
     params = this.scalarToArrayParams(params);
 
@@ -232,6 +281,68 @@ class DiscreteUnivariateDistribution extends UnivariateDistribution {
     return y_c;
   }
 
+  bucketedPMFandCDF(edges, params, aggregate = 'max', log = false, parametrization = this.parametrization) {
+
+    params = this.scalarToArrayParams(params);
+
+    let nBuckets = edges.length - 1;
+    let x_p = [];
+    let y_p = [];
+    let y_c = [];
+
+    if (aggregate === 'sum' && !log && this.cdfSingleValue !== DiscreteUnivariateDistribution.prototype.cdfSingleValue) {
+      let cdfPrev = this.cdfSingleValue(edges[0] - 1, params, parametrization);
+      y_c.push(cdfPrev);
+      for (let k = 0; k < nBuckets; k++) {
+        let cdfVal = this.cdfSingleValue(edges[k + 1] - 1, params, parametrization);
+        x_p.push((edges[k] + edges[k + 1] - 1) / 2);
+        y_p.push(cdfVal - cdfPrev);
+        y_c.push(cdfVal);
+        cdfPrev = cdfVal;
+      }
+
+      return [x_p, y_p, y_c];
+    }
+
+    let cumsum = this.cdfSingleValue(edges[0] - 1, params, parametrization);
+    y_c.push(cumsum);
+    for (let k = 0; k < nBuckets; k++) {
+      let bucketMax = NaN;
+      let xArgMax = edges[k];
+      let bucketSum = 0.0;
+      let bucketLogSum = -Infinity;
+      for (let x = edges[k]; x < edges[k + 1]; x++) {
+        let val = log ? this.logpmfSingleValue(x, params, parametrization) : this.pmfSingleValue(x, params, parametrization);
+        if (!isNaN(val)) {
+          if (log) {
+            bucketSum += Math.exp(val);
+            bucketLogSum = bucketLogSum === -Infinity ? val : logSumExp(bucketLogSum, val);
+          }
+          else {
+            bucketSum += val;
+          }
+          if (!(val <= bucketMax)) {
+            bucketMax = val;
+            xArgMax = x;
+          }
+        }
+      }
+      cumsum += bucketSum;
+
+      if (aggregate === 'sum') {
+        x_p.push((edges[k] + edges[k + 1] - 1) / 2);
+        y_p.push(log ? bucketLogSum : bucketSum);
+      }
+      else {
+        x_p.push(xArgMax);
+        y_p.push(bucketMax);
+      }
+      y_c.push(cumsum);
+    }
+
+    return [x_p, y_p, y_c];
+  }
+
   ppfSingleValue(p, params, parametrization = this.parametrization) {
     if (p < 0 || p > 1) throw new Error('p must be between 0 and 1.')
 
@@ -262,6 +373,42 @@ class DiscreteUnivariateDistribution extends UnivariateDistribution {
     return n;
   }
 
+  aliasTableForParams(params, parametrization = this.parametrization) {
+
+    let key = JSON.stringify([params, parametrization]);
+    if (this.aliasCache !== undefined && this.aliasCache.key === key) return this.aliasCache;
+
+    let maxSupport = 1048576;
+    let xMin = this.xMin(params, parametrization);
+    let xMax = this.xMax(params, parametrization);
+    let probs = [];
+    let start = xMin;
+    let cumsum = 0.0;
+    for (let x = xMin; x <= xMax && x - xMin < maxSupport && cumsum < 1 - 1e-10; x++) {
+      let prob = this.pmfSingleValue(x, params, parametrization);
+      if (!(prob > 0)) prob = 0.0;
+      cumsum += prob;
+
+      if (probs.length === 0 && cumsum < 1e-12) start = x + 1;
+      else probs.push(prob);
+    }
+
+    this.aliasCache = {key: key, start: start, table: cumsum > 0 ? aliasTable(probs) : null};
+
+    return this.aliasCache;
+  }
+
+  sample(out, params, rng, parametrization = this.parametrization) {
+    params = this.scalarToArrayParams(params);
+    let {start, table} = this.aliasTableForParams(params, parametrization);
+    if (table === null) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = start + aliasSample(table, rng);
+    }
+
+    return out;
+  }
 }
 """,
     "ContinuousUnivariateDistribution": """
@@ -284,6 +431,99 @@ class ContinuousUnivariateDistribution extends UnivariateDistribution {
     );
   }
 
+  logpdfSingleValue(x, params, parametrization = this.parametrization) {
+    
+    
+    return Math.log(this.pdfSingleValue(x, params, parametrization));
+  }
+
+  logpdf(x, params, parametrization = this.parametrization) {
+    params = this.scalarToArrayParams(params);
+
+    return this.scalarOrArrayCompute(
+      (x, params) => this.logpdfSingleValue(x, params, parametrization),
+      x,
+      params
+    );
+  }
+
+  cdfFromPDF(x, pdfVals, params, tol = 1.0e-6, stride = 16, parametrization = this.parametrization) {
+
+    params = this.scalarToArrayParams(params);
+
+    let nPts = x.length;
+    let cdfVals = new Array(nPts);
+    if (nPts === 0) return cdfVals;
+
+    const g = 1.0 / Math.sqrt(3.0);
+    const usable = j => j >= 0 && j < nPts && isFinite(x[j]) && isFinite(pdfVals[j]);
+    const exact = j => this.cdfSingleValue(x[j], params, parametrization);
+
+    const intervalIntegral = (i, j0, m) => {
+      let mid = (x[i] + x[i + 1]) / 2;
+      let halfWidth = (x[i + 1] - x[i]) / 2;
+      let t1 = mid - g * halfWidth;
+      let t2 = mid + g * halfWidth;
+      let result = 0.0;
+      for (let j = j0; j < j0 + m; j++) {
+        let l1 = 1.0;
+        let l2 = 1.0;
+        for (let k = j0; k < j0 + m; k++) {
+          if (k !== j) {
+            l1 *= (t1 - x[k]) / (x[j] - x[k]);
+            l2 *= (t2 - x[k]) / (x[j] - x[k]);
+          }
+        }
+        result += pdfVals[j] * (l1 + l2);
+      }
+
+      return halfWidth * result;
+    };
+
+    let lastExact = 0;
+    let errEst = 0.0;
+    const anchor = (j, approx) => {
+      let val = exact(j);
+      if (approx !== null && !(Math.abs(approx - val) <= tol)) {
+        for (let k = lastExact + 1; k < j; k++) cdfVals[k] = exact(k);
+      }
+      cdfVals[j] = val;
+      lastExact = j;
+      errEst = 0.0;
+    };
+
+    cdfVals[0] = exact(0);
+    for (let i = 0; i < nPts - 1; i++) {
+      
+      let j0 = null;
+      for (let first of [i - 1, i, i - 2]) {
+        if (usable(first) && usable(first + 1) && usable(first + 2) && usable(first + 3)) {
+          j0 = first;
+          break;
+        }
+      }
+
+      if (j0 === null) {
+        anchor(i + 1, null);
+        continue;
+      }
+
+      
+      let integral = intervalIntegral(i, j0, 4);
+      errEst += Math.abs(integral - intervalIntegral(i, j0 === i - 2 ? j0 + 1 : j0, 3));
+
+      let approx = cdfVals[i] + integral;
+      if (errEst > tol || i + 1 - lastExact >= stride || i + 1 === nPts - 1) {
+        anchor(i + 1, approx);
+      }
+      else {
+        cdfVals[i + 1] = approx;
+      }
+    }
+
+    return cdfVals.map(val => Math.min(1.0, Math.max(0.0, val)));
+  }
+
 }
 """,
     "TemplateDiscreteUnivariateDistribution": """
@@ -523,11 +763,21 @@ class BetaBinomialDistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(n, params) {
+    return Math.exp(this.logpmfSingleValue(n, params));
+  }
+
+  logpmfSingleValue(n, params) {
     let [N, alpha, beta] = params.slice(0, 3);
 
     if (n > N || n < 0) return NaN;
 
-    return Math.exp(lnchoice(N, n) + lnbeta(n + alpha, N - n + beta) - lnbeta(alpha, beta));
+    return lnchoice(N, n) + lnbeta(n + alpha, N - n + beta) + this.cachedLogNormalizer(params);
+  }
+
+  logNormalizer(params) {
+    let [alpha, beta] = params.slice(1, 3);
+
+    return -lnbeta(alpha, beta);
   }
 
   ppfSingleValue(p, params) {
@@ -584,23 +834,27 @@ class BinomialDistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(n, params) {
+    return Math.exp(this.logpmfSingleValue(n, params));
+  }
+
+  logpmfSingleValue(n, params) {
     let [N, theta] = params.slice(0, 2);
 
     if (n > N || n < 0) return NaN;
 
     if (theta == 0) {
-      if (n == 0) return 1.0;
-      return 0.0;
+      if (n == 0) return 0.0;
+      return -Infinity;
     }
 
     if (theta == 1) {
-      if (n == N) return 1.0;
-      return 0.0;
+      if (n == N) return 0.0;
+      return -Infinity;
     }
 
-    return Math.exp(lnchoice(N, n) +
+    return lnchoice(N, n) +
       n * Math.log(theta) +
-      (N - n) * Math.log(1 - theta));
+      (N - n) * Math.log(1 - theta);
   }
 
   cdfSingleValue(n, params) {
@@ -608,6 +862,9 @@ class BinomialDistribution extends DiscreteUnivariateDistribution {
 
     if (n < 0) return 0.0;
     if (n >= N) return 1.0;
+    if (betaincAsymptoticError(N - n, n + 1) <= this.tol) {
+      return betaincAsymptotic(1.0 - theta, N - n, n + 1);
+    }
     return regularizedIncompleteBeta(1.0 - theta, N - n, n + 1);
   }
 
@@ -789,6 +1046,17 @@ class DiscreteUniformDistribution extends DiscreteUnivariateDistribution {
     return [low - 1, high + 1];
   }
 
+  sample(out, params, rng) {
+    let [low, high] = params.slice(0, 2);
+    if (!(high >= low)) return out.fill(NaN);
+
+    let nVals = high - low + 1;
+    for (let i = 0; i < out.length; i++) {
+      out[i] = low + Math.floor(rng() * nVals);
+    }
+
+    return out;
+  }
 }
 """,
     "GeometricDistribution": """
@@ -831,18 +1099,22 @@ class GeometricDistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(x, params) {
+    return Math.exp(this.logpmfSingleValue(x, params));
+  }
+
+  logpmfSingleValue(x, params) {
     let theta = params[0];
 
     if (theta == 1) {
-      if (x == 0) return 1.0;
-      return 0.0;
+      if (x == 0) return 0.0;
+      return -Infinity;
     }
 
-    if (theta == 0) return 0.0;
+    if (theta == 0) return -Infinity;
 
     if (x < 0) return NaN;
 
-    return Math.exp(x * Math.log(1.0 - theta) + Math.log(theta));
+    return x * Math.log(1.0 - theta) + Math.log(theta);
   }
 
   cdfSingleValue(x, params) {
@@ -887,6 +1159,19 @@ class GeometricDistribution extends DiscreteUnivariateDistribution {
     return [[1.0 - Math.pow(1.0 - p1, 1.0 / (x1 + 1.0))], true];
   }
 
+  sample(out, params, rng) {
+    
+    let theta = params[0];
+    if (!(theta > 0 && theta <= 1)) return out.fill(NaN);
+    if (theta === 1) return out.fill(0);
+
+    let logq = Math.log1p(-theta);
+    for (let i = 0; i < out.length; i++) {
+      out[i] = Math.floor(Math.log(rng()) / logq);
+    }
+
+    return out;
+  }
 }
 """,
     "HypergeometricDistribution": """
@@ -931,11 +1216,15 @@ class HypergeometricDistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(n, params) {
+    return Math.exp(this.logpmfSingleValue(n, params));
+  }
+
+  logpmfSingleValue(n, params) {
     let [N, a, b] = params.slice(0, 3);
 
     if (n < Math.max(0, N - b) || n > Math.min(N, a)) return NaN;
 
-    return Math.exp(lnchoice(a, n) + lnchoice(b, N - n) - lnchoice(a + b, N));
+    return lnchoice(a, n) + lnchoice(b, N - n) - lnchoice(a + b, N);
   }
 
   ppfSingleValue(p, params) {
@@ -1068,6 +1357,10 @@ class NegativeBinomialDistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(y, params, parametrization = this.parametrization) {
+    return Math.exp(this.logpmfSingleValue(y, params, parametrization));
+  }
+
+  logpmfSingleValue(y, params, parametrization = this.parametrization) {
     if (y < 0) return NaN;
 
     
@@ -1075,11 +1368,16 @@ class NegativeBinomialDistribution extends DiscreteUnivariateDistribution {
 
     if (alpha <= 0 || beta <= 0) return NaN;
 
-    return Math.exp(lngamma(y + alpha)
-                    - lngamma(alpha)
-                    - lnfactorial(y)
-                    + alpha * Math.log(beta / (1 + beta))
-                    - y * Math.log(1 + beta));
+    return lngamma(y + alpha)
+           - lnfactorial(y)
+           - y * Math.log(1 + beta)
+           + this.cachedLogNormalizer([alpha, beta]);
+  }
+
+  logNormalizer(params) {
+    let [alpha, beta] = params;
+
+    return alpha * Math.log(beta / (1 + beta)) - lngamma(alpha);
   }
 
   cdfSingleValue(y, params, parametrization = this.parametrization) {
@@ -1088,9 +1386,12 @@ class NegativeBinomialDistribution extends DiscreteUnivariateDistribution {
     if (alpha === 0 || beta === Infinity) return 1.0;
     if (alpha === Infinity) return y === Infinity ? 1.0 : 0.0; 
 
-    if (y <= 0) return 0.0;
+    if (y < 0) return 0.0;
     if (y === Infinity) return 1.0;
 
+    if (betaincAsymptoticError(alpha, y + 1) <= this.tol) {
+      return betaincAsymptotic(beta / (1 + beta), alpha, y + 1);
+    }
     return regularizedIncompleteBeta(beta / (1 + beta), alpha, y + 1);
   }
 
@@ -1313,16 +1614,20 @@ class PoissonDistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(n, params) {
+    return Math.exp(this.logpmfSingleValue(n, params));
+  }
+
+  logpmfSingleValue(n, params) {
     let lam = params[0];
 
     if (lam < 0) {
       return NaN;
     } else if (lam == 0) {
-      if (n == 0) return 1.0;
-      return 0.0;
+      if (n == 0) return 0.0;
+      return -Infinity;
     }
 
-    return Math.exp(n * Math.log(lam) - lnfactorial(n) - lam);
+    return n * Math.log(lam) - lnfactorial(n) - lam;
   }
 
   cdfSingleValue(n, params) {
@@ -1333,6 +1638,7 @@ class PoissonDistribution extends DiscreteUnivariateDistribution {
 
     if (lam === 0) return 1.0;
 
+    if (gammaincAsymptoticError(n + 1) <= this.tol) return gammaincAsymptotic(lam, n + 1, true);
     return gammaincU(lam, n + 1, true);
   }
 
@@ -1408,42 +1714,43 @@ class TelegraphRNADistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(n, params) {
+    return Math.exp(this.logpmfSingleValue(n, params));
+  }
+
+  logpmfSingleValue(n, params) {
     let kon = params[0];
     let koff = params[1];
     let beta = params[2];
-    let result;
 
     
     if (beta == 0 || koff == 0) {
-      result = n == 0 ? 1.0 : 0.0;
+      return n == 0 ? 0.0 : -Infinity;
     }
     else if (n == 0) {
-      result = hyp1f1(kon, kon + koff, -beta); 
+      return Math.log(hyp1f1(kon, kon + koff, -beta));
     }
-    else {
-      
-      let logpmf = n * Math.log(beta) - lnfactorial(n);
 
-      
-      logpmf += lngamma(kon + n) - lngamma(kon);
-      logpmf -= lngamma(kon + koff + n) - lngamma(kon + koff);
+    
+    let logpmf = n * Math.log(beta) - lnfactorial(n);
 
-      
-      logpmf += Math.log(hyp1f1(kon + n, kon + koff + n, -beta));
+    
+    logpmf += lngamma(kon + n) - lngamma(kon);
+    logpmf -= lngamma(kon + koff + n) - lngamma(kon + koff);
 
-      result = Math.exp(logpmf);
-    }
+    
+    logpmf += Math.log(hyp1f1(kon + n, kon + koff + n, -beta));
 
-    return result;
+    return logpmf;
   }
 
   defaultXRange(params, parametrization = this.parametrization) {
     return [0.0, super.ppfSingleValue(0.999, params)];
   }
 
-  quantileSet(x, p) {
+  quantileSet(x, p, extraParams) {
     let x1 = x[0];
     let p1 = p[0];
+    let [kon, koff] = extraParams;
 
     if (!Number.isInteger(x1)) {
       throw new Error(this.varName + ' must be integer.')
@@ -1458,7 +1765,7 @@ class TelegraphRNADistribution extends DiscreteUnivariateDistribution {
     
     const rootFun = (xi) => {
       if (xi === 1) return p1;
-      return p1 - this.cdfSingleValue(x1, [xi / (1 - xi)]);
+      return p1 - this.cdfSingleValue(x1, [kon, koff, xi / (1 - xi)]);
     }
 
     let xiOpt = brentSolve(rootFun, 0.0, 1.0);
@@ -1562,6 +1869,10 @@ class BetaDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params, parametrization = this.parametrization) {
+    return Math.exp(this.logpdfSingleValue(x, params, parametrization));
+  }
+
+  logpdfSingleValue(x, params, parametrization = this.parametrization) {
     
     let [alpha, beta] = this.convertParamsToAlphaBeta(params, parametrization);
 
@@ -1571,28 +1882,32 @@ class BetaDistribution extends ContinuousUnivariateDistribution {
 
     if (iszero(x)) {
         if (alpha == 1) {
-            return Math.exp(-lnbeta(alpha, beta));
+            return this.cachedLogNormalizer([alpha, beta]);
         } else if (alpha > 1) {
-            return 0.0;
+            return -Infinity;
         } else {
             return Infinity;
         }
     }
     else if (isone(x)) {
         if (beta == 1) {
-            return Math.exp(-lnbeta(alpha, beta));
+            return this.cachedLogNormalizer([alpha, beta]);
         }
         else if (beta > 1) {
-            return 0.0;
+            return -Infinity;
         }
         else {
             return Infinity;
         }
     }
 
-    let lnProb = (alpha - 1.0) * Math.log(x) + (beta - 1.0) * Math.log(1.0 - x) - lnbeta(alpha, beta);
+    return (alpha - 1.0) * Math.log(x) + (beta - 1.0) * Math.log(1.0 - x) + this.cachedLogNormalizer([alpha, beta]);
+  }
+
+  logNormalizer(params) {
+    let [alpha, beta] = params;
 
-    return Math.exp(lnProb);
+    return -lnbeta(alpha, beta);
   }
 
   cdfSingleValue(x, params, parametrization = this.parametrization) {
@@ -1602,6 +1917,7 @@ class BetaDistribution extends ContinuousUnivariateDistribution {
     if (x <= 0) return 0.0;
     if (x >= 1) return 1.0;
 
+    if (betaincAsymptoticError(alpha, beta) <= this.tol) return betaincAsymptotic(x, alpha, beta);
     return regularizedIncompleteBeta(x, alpha, beta);
   }
 
@@ -1610,6 +1926,10 @@ class BetaDistribution extends ContinuousUnivariateDistribution {
     if (p == 1) return 1.0;
 
     
+    let [alpha, beta] = this.convertParamsToAlphaBeta(params, parametrization);
+    let x = regularizedIncompleteBetaInv(p, alpha, beta);
+    if (!isNaN(x)) return x;
+
     let rootFun = (x, params, p) => p - this.cdfSingleValue(x, params, parametrization);
     
     return brentSolve(rootFun, 0.0, 1.0, [params, p]);
@@ -1631,7 +1951,15 @@ class BetaDistribution extends ContinuousUnivariateDistribution {
     };
 
     let args = [x1, p1, x2, p2];
-    let guess = [1.0, 1.0];
+
+    let z1 = Math.SQRT2 * erfinv(2 * p1 - 1);
+    let z2 = Math.SQRT2 * erfinv(2 * p2 - 1);
+    let spread = (logit(x2) - logit(x1)) / (z2 - z1);
+    let table = betaQuantileSetTable();
+    let [u, v] = [logit(x1) - spread * z1, Math.log(spread)];
+    let guess = [bilinearInterp(table, table.logAlpha, u, v), bilinearInterp(table, table.logBeta, u, v)];
+    if (!guess.every(isFinite)) guess = [1.0, 1.0];
+
     let [logParams, optimSuccess] = findRootTrustRegion(quantileRootFun, guess, args=args);
 
     return [this.convertParamsFromAlphaBeta([Math.exp(logParams[0]), Math.exp(logParams[1])], this.parametrization), optimSuccess];
@@ -1641,6 +1969,41 @@ class BetaDistribution extends ContinuousUnivariateDistribution {
     return [0.0, 1.0];
   }
 
+  sample(out, params, rng, parametrization = this.parametrization) {
+    let [alpha, beta] = this.convertParamsToAlphaBeta(params, parametrization);
+    if (!(alpha > 0 && beta > 0)) return out.fill(NaN);
+
+    if (alpha <= 1 && beta <= 1) {
+      
+      for (let i = 0; i < out.length; i++) {
+        while (true) {
+          let u = rng();
+          let v = rng();
+          let x = Math.pow(u, 1 / alpha);
+          let y = Math.pow(v, 1 / beta);
+          if (x + y <= 1) {
+            if (x + y > 0) {
+              out[i] = x / (x + y);
+            }
+            else {
+              out[i] = 1 / (1 + Math.exp(Math.log(v) / beta - Math.log(u) / alpha));
+            }
+            break;
+          }
+        }
+      }
+    }
+    else {
+      
+      let zig = zigguratNormalTables();
+      for (let i = 0; i < out.length; i++) {
+        let x = standardGamma(alpha, rng, zig);
+        out[i] = x / (x + standardGamma(beta, rng, zig));
+      }
+    }
+
+    return out;
+  }
 }
 """,
     "BetaPhiKappaDistribution": """
@@ -1703,6 +2066,14 @@ class CauchyDistribution extends ContinuousUnivariateDistribution {
     return 1.0 / Math.PI / sigma / (1 + Math.pow((x - mu) / sigma, 2))
   }
 
+  logpdfSingleValue(x, params) {
+    if (x == Infinity || x == -Infinity) return -Infinity;
+
+    let [mu, sigma] = params.slice(0, 2);
+
+    return -Math.log(Math.PI * sigma) - 2 * Math.log(Math.hypot(1, (x - mu) / sigma));
+  }
+
   cdfSingleValue(x, params) {
     let [mu, sigma] = params.slice(0, 2);
 
@@ -1728,11 +2099,22 @@ class CauchyDistribution extends ContinuousUnivariateDistribution {
     let cotp2 = 1.0 / Math.tan(Math.PI * p2);
 
     let mu = (x2 * cotp1 - x1 * cotp2) / (cotp1 - cotp2);
-    let sigma = (x1 - x2) * Math.sin(Math.PI * p1) * Math.sin(Math.PI * p1) 
+    let sigma = (x1 - x2) * Math.sin(Math.PI * p1) * Math.sin(Math.PI * p2)
                 / Math.sin(Math.PI * (p1 - p2));
 
     return [[mu, sigma], true];
   }
+
+  sample(out, params, rng) {
+    let [mu, sigma] = params.slice(0, 2);
+    if (!(sigma > 0)) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = mu + sigma * Math.tan(Math.PI * (rng() - 0.5));
+    }
+
+    return out;
+  }
 }
 """,
     "ExponentialDistribution": """
@@ -1775,12 +2157,16 @@ class ExponentialDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     let beta = params[0];
 
     if (x < 0) return NaN;
-    if (x == Infinity) return 0.0;
+    if (x == Infinity) return -Infinity;
 
-    return beta * Math.exp(-beta * x);
+    return Math.log(beta) - beta * x;
   }
 
   cdfSingleValue(x, params) {
@@ -1820,6 +2206,16 @@ class ExponentialDistribution extends ContinuousUnivariateDistribution {
     return [0.0, this.ppfSingleValue(0.999, params)];
   }
 
+  sample(out, params, rng) {
+    let beta = params[0];
+    if (!(beta > 0)) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = -Math.log(rng()) / beta;
+    }
+
+    return out;
+  }
 }
 """,
     "GammaDistribution": """
@@ -1862,25 +2258,30 @@ class GammaDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     if (x < 0) return NaN;
-    if (x == Infinity) return 0.0;
+    if (x == Infinity) return -Infinity;
 
     let [alpha, beta] = params.slice(0, 2);
 
     if (x == 0) {
       if (alpha == 1) {
-        return beta;
+        return Math.log(beta);
       } else if (alpha > 1) {
-        return 0.0;
+        return -Infinity;
       } else {  
         return Infinity;
       }
     }
 
-    let lnProb;
-    lnProb = alpha * Math.log(beta * x) - Math.log(x) - beta * x - lngamma(alpha);
+    return alpha * Math.log(beta * x) - Math.log(x) - beta * x + this.cachedLogNormalizer(params);
+  }
 
-    return Math.exp(lnProb);
+  logNormalizer(params) {
+    return -lngamma(params[0]);
   }
 
   cdfSingleValue(x, params) {
@@ -1889,6 +2290,7 @@ class GammaDistribution extends ContinuousUnivariateDistribution {
 
     let [alpha, beta] = params.slice(0, 2);
 
+    if (gammaincAsymptoticError(alpha) <= this.tol) return gammaincAsymptotic(beta * x, alpha, false);
     return gammaincL(beta * x, alpha, true);
   }
 
@@ -1897,6 +2299,9 @@ class GammaDistribution extends ContinuousUnivariateDistribution {
     if (p === 1) return Infinity;
 
     
+    let x = gammaincLInv(p, params[0]);
+    if (!isNaN(x)) return x / params[1];
+
     let rescaledParams = [params[0], 1.0];
 
     let rootFun = (xi, params, p) => {
@@ -1962,7 +2367,12 @@ class GammaDistribution extends ContinuousUnivariateDistribution {
 
     let args = [x1Rescaled, p1, x2Rescaled, p2];
 
-    let guess = [0.75, 0.75];
+    let z1 = Math.SQRT2 * erfinv(2 * p1 - 1);
+    let z2 = Math.SQRT2 * erfinv(2 * p2 - 1);
+    let table = gammaQuantileSetTable();
+    let logAlpha = bilinearInterp(table, table.logAlpha, Math.log(-Math.log(x1Rescaled) / (z2 - z1)), (z1 + z2) / 2);
+    let guess = [logAlpha, Math.log(gammaincLInv(p2, Math.exp(logAlpha)) / x2Rescaled)];
+    if (!guess.every(isFinite)) guess = [0.75, 0.75];
 
     let [logParams, optimSuccess] = findRootTrustRegion(quantileRootFun, guess, args=args);
 
@@ -1996,6 +2406,17 @@ class GammaDistribution extends ContinuousUnivariateDistribution {
     return [[retval[0], retval[1] / x2], optimSuccess];
   }
 
+  sample(out, params, rng) {
+    let [alpha, beta] = params.slice(0, 2);
+    if (!(alpha > 0 && beta > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      out[i] = standardGamma(alpha, rng, zig) / beta;
+    }
+
+    return out;
+  }
 }
 """,
     "HalfCauchyDistribution": """
@@ -2052,6 +2473,15 @@ class HalfCauchyDistribution extends ContinuousUnivariateDistribution {
     return 2.0 / Math.PI / sigma / (1 + Math.pow((x - mu) / sigma, 2));
   }
 
+  logpdfSingleValue(x, params) {
+    let [mu, sigma] = params.slice(0, 2);
+
+    if (x < mu) return NaN;
+    if (x === Infinity) return -Infinity;
+
+    return Math.log(2.0 / Math.PI / sigma) - 2 * Math.log(Math.hypot(1, (x - mu) / sigma));
+  }
+
   cdfSingleValue(x, params) {
     let [mu, sigma] = params.slice(0, 2);
 
@@ -2079,6 +2509,17 @@ class HalfCauchyDistribution extends ContinuousUnivariateDistribution {
 
     return [[(x1 - mu) / Math.tan(Math.PI * p1 / 2)], true];
   }
+
+  sample(out, params, rng) {
+    let [mu, sigma] = params.slice(0, 2);
+    if (!(sigma > 0)) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = mu + sigma * Math.tan(0.5 * Math.PI * rng());
+    }
+
+    return out;
+  }
 }
 """,
     "HalfNormalDistribution": """
@@ -2136,6 +2577,15 @@ class HalfNormalDistribution extends ContinuousUnivariateDistribution {
     return Math.exp(-expTerm) / sigma * Math.sqrt(2.0 / Math.PI);
   }
 
+  logpdfSingleValue(x, params) {
+    let [mu, sigma] = params.slice(0, 2);
+
+    if (x < mu) return NaN;
+    if (x === Infinity) return -Infinity;
+
+    return -Math.pow(x - mu, 2) / 2.0 / Math.pow(sigma, 2) - Math.log(sigma) + Math.log(2.0 / Math.PI) / 2;
+  }
+
   cdfSingleValue(x, params) {
     let [mu, sigma] = params.slice(0, 2);
 
@@ -2165,6 +2615,18 @@ class HalfNormalDistribution extends ContinuousUnivariateDistribution {
 
     return [[(x1 - mu) / sqrt2 / erfinv(p1)], true];
   }
+
+  sample(out, params, rng) {
+    let [mu, sigma] = params.slice(0, 2);
+    if (!(sigma > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      out[i] = mu + sigma * Math.abs(standardNormal(rng, zig));
+    }
+
+    return out;
+  }
 }
 """,
     "HalfStudentTDistribution": """
@@ -2198,6 +2660,9 @@ class HalfStudentTDistribution extends ContinuousUnivariateDistribution {
     this.fixedParams = ['ν', 'μ'];
 
     
+    this.expensiveCdf = true;
+
+    
     super.generateActiveFixedInds();
 
     
@@ -2213,17 +2678,23 @@ class HalfStudentTDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     let [nu, mu, sigma] = params.slice(0, 3);
 
     if (x < mu) return NaN;
-    if (x === Infinity) return 0.0;
+    if (x === Infinity) return -Infinity;
 
-    let lnprob;
+    return this.cachedLogNormalizer(params)
+           - (nu + 1) / 2 * log1p(Math.pow(x - mu, 2) / nu / Math.pow(sigma, 2));
+  }
 
-    lnprob = Math.log(2.0) + lngamma((nu + 1) / 2) - lngamma(nu / 2) - Math.log(Math.PI * nu) / 2 
-             - Math.log(sigma) - (nu + 1) / 2 * log1p(Math.pow(x - mu, 2) / nu / Math.pow(sigma, 2));
+  logNormalizer(params) {
+    let [nu, , sigma] = params.slice(0, 3);
 
-    return Math.exp(lnprob);
+    return Math.log(2.0) + lnGammaHalfRatio(nu / 2) - Math.log(Math.PI * nu) / 2 - Math.log(sigma);
   }
 
   cdfSingleValue(x, params) {
@@ -2234,6 +2705,7 @@ class HalfStudentTDistribution extends ContinuousUnivariateDistribution {
 
     let y = (x - mu) / sigma;
 
+    if (2 * studentTCdfAsymptoticError(nu) <= this.tol) return 2 * studentTCdfAsymptotic(y, nu) - 1;
     return 1 - regularizedIncompleteBeta(nu / (Math.pow(y, 2) + nu), 0.5 * nu, 0.5);
   }
 
@@ -2326,6 +2798,20 @@ class HalfStudentTDistribution extends ContinuousUnivariateDistribution {
 
     return retval;
   }
+
+  sample(out, params, rng) {
+    
+    let [nu, mu, sigma] = params.slice(0, 3);
+    if (!(nu > 0 && sigma > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      let g = standardGamma(nu / 2, rng, zig);
+      out[i] = mu + sigma * Math.abs(standardNormal(rng, zig)) * Math.sqrt(nu / (2 * g));
+    }
+
+    return out;
+  }
 }
 """,
     "InverseGammaDistribution": """
@@ -2368,15 +2854,22 @@ class InverseGammaDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     if (x < 0) return NaN;
-    if (x === 0 || x === Infinity) return 0.0;
+    if (x === 0 || x === Infinity) return -Infinity;
 
     let [alpha, beta] = params.slice(0, 2);
 
-    let lnProb;
-    lnProb = alpha * Math.log(beta) - (alpha + 1) * Math.log(x) - beta / x - lngamma(alpha);
+    return this.cachedLogNormalizer(params) - (alpha + 1) * Math.log(x) - beta / x;
+  }
+
+  logNormalizer(params) {
+    let [alpha, beta] = params.slice(0, 2);
 
-    return Math.exp(lnProb);
+    return alpha * Math.log(beta) - lngamma(alpha);
   }
 
   cdfSingleValue(x, params) {
@@ -2385,6 +2878,7 @@ class InverseGammaDistribution extends ContinuousUnivariateDistribution {
 
     let [alpha, beta] = params.slice(0, 2);
 
+    if (gammaincAsymptoticError(alpha) <= this.tol) return gammaincAsymptotic(beta / x, alpha, true);
     return gammaincU(beta / x, alpha, true);
   }
 
@@ -2409,10 +2903,24 @@ class InverseGammaDistribution extends ContinuousUnivariateDistribution {
   quantileSet(x, p) {
     let [x1, x2] = x.slice(0, 2);
 
+    let [p1, p2] = p.slice(0, 2);
+
+    
     let gamma = new GammaDistribution();
-    return gamma.quantileSet([1.0 / x2, 1.0 / x1], p);
+    return gamma.quantileSet([1.0 / x2, 1.0 / x1], [1.0 - p2, 1.0 - p1]);
   }
 
+  sample(out, params, rng) {
+    let [alpha, beta] = params.slice(0, 2);
+    if (!(alpha > 0 && beta > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      out[i] = beta / standardGamma(alpha, rng, zig);
+    }
+
+    return out;
+  }
 }
 """,
     "InverseGaussianDistribution": """
@@ -2463,16 +2971,17 @@ class InverseGaussianDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params, parametrization = this.parametrization) {
+    return Math.exp(this.logpdfSingleValue(x, params, parametrization));
+  }
+
+  logpdfSingleValue(x, params, parametrization = this.parametrization) {
     if (x < 0) return NaN;
-    if (x === 0 || x === Infinity) return 0.0;  
+    if (x === 0 || x === Infinity) return -Infinity;  
 
     let [mu, lambda] = params.slice(0, 2);
 
-    let lnProb;
-    lnProb = -Math.log(2.0 * Math.PI) / 2.0 + (Math.log(lambda) - 3.0 * Math.log(x)) / 2.0
-             - lambda * Math.pow(x - mu, 2) / (2.0 * Math.pow(mu, 2) * x);
-
-    return Math.exp(lnProb);
+    return -Math.log(2.0 * Math.PI) / 2.0 + (Math.log(lambda) - 3.0 * Math.log(x)) / 2.0
+           - lambda * Math.pow(x - mu, 2) / (2.0 * Math.pow(mu, 2) * x);
   }
 
   cdfSingleValue(x, params, parametrization = this.parametrization) {
@@ -2553,9 +3062,26 @@ class InverseGaussianDistribution extends ContinuousUnivariateDistribution {
     
     return [[x2 * paramsOpt[0], x2 * paramsOpt[1]], optimSuccess];
   }
-}
-""",
-    "LogNormalDistribution": """
+
+  sample(out, params, rng) {
+    
+    let [mu, lam] = params.slice(0, 2);
+    if (!(mu > 0 && lam > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      let z = standardNormal(rng, zig);
+      let y = mu * z * z;
+      let sqrtTerm = y + Math.sqrt(y * (4 * lam + y));
+      let x = 4 * mu * lam * y / (sqrtTerm * sqrtTerm);
+      out[i] = rng() * (mu + x) <= mu ? x : mu * mu / x;
+    }
+
+    return out;
+  }
+}
+""",
+    "LogNormalDistribution": """
 class LogNormalDistribution extends ContinuousUnivariateDistribution {
   constructor() {
     super();
@@ -2610,6 +3136,14 @@ class LogNormalDistribution extends ContinuousUnivariateDistribution {
     return Math.exp(-expTerm) / x / sigma / Math.sqrt(2 * Math.PI);
   }
 
+  logpdfSingleValue(x, params) {
+    if (x < 0.0) return NaN;
+    if (x === 0 || x === Infinity) return -Infinity;
+
+    let [mu, sigma] = params.slice(0, 2);
+    return -Math.pow(Math.log(x) - mu, 2) / 2.0 / Math.pow(sigma, 2) - Math.log(x * sigma) - Math.log(2 * Math.PI) / 2;
+  }
+
   cdfSingleValue(x, params) {
     if (x <= 0) return 0.0;
     if (x === Infinity) return 1.0;
@@ -2653,6 +3187,18 @@ class LogNormalDistribution extends ContinuousUnivariateDistribution {
 
     return [[mu, sigma], true];
   }
+
+  sample(out, params, rng) {
+    let [mu, sigma] = params.slice(0, 2);
+    if (!(sigma > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      out[i] = Math.exp(mu + sigma * standardNormal(rng, zig));
+    }
+
+    return out;
+  }
 }
 """,
     "NormalDistribution": """
@@ -2709,6 +3255,14 @@ class NormalDistribution extends ContinuousUnivariateDistribution {
     return Math.exp(-expTerm) / sigma / Math.sqrt(2 * Math.PI);
   }
 
+  logpdfSingleValue(x, params) {
+    if (x === -Infinity || x === Infinity) return -Infinity;
+
+    let [mu, sigma] = params.slice(0, 2);
+
+    return -Math.pow(x - mu, 2) / 2.0 / Math.pow(sigma, 2) - Math.log(sigma) - Math.log(2 * Math.PI) / 2;
+  }
+
   cdfSingleValue(x, params) {
     if (x === -Infinity) return 0.0;
     if (x === Infinity) return 1.0;
@@ -2746,6 +3300,18 @@ class NormalDistribution extends ContinuousUnivariateDistribution {
 
     return [[mu, sigma], true];
   }
+
+  sample(out, params, rng) {
+    let [mu, sigma] = params.slice(0, 2);
+    if (!(sigma > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      out[i] = mu + sigma * standardNormal(rng, zig);
+    }
+
+    return out;
+  }
 }
 """,
     "ParetoDistribution": """
@@ -2788,13 +3354,16 @@ class ParetoDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     let [ymin, alpha] = params.slice(0, 2);
 
     if (x < ymin) return NaN;
-    if (x === Infinity) return 0.0;
+    if (x === Infinity) return -Infinity;
 
-    let logp = Math.log(alpha) + alpha * Math.log(ymin) - (alpha + 1) * Math.log(x); 
-    return Math.exp(logp);
+    return Math.log(alpha) + alpha * Math.log(ymin) - (alpha + 1) * Math.log(x); 
   }
 
   cdfSingleValue(x, params) {
@@ -2837,6 +3406,17 @@ class ParetoDistribution extends ContinuousUnivariateDistribution {
 
     return [[ymin, alpha], true];
   }
+
+  sample(out, params, rng) {
+    let [yMin, alpha] = params.slice(0, 2);
+    if (!(yMin > 0 && alpha > 0)) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = yMin * Math.exp(-Math.log(rng()) / alpha);
+    }
+
+    return out;
+  }
 }
 """,
     "StudentTDistribution": """
@@ -2870,6 +3450,9 @@ class StudentTDistribution extends ContinuousUnivariateDistribution {
     this.fixedParams = ['ν'];
 
     
+    this.expensiveCdf = true;
+
+    
     super.generateActiveFixedInds();
 
     
@@ -2885,16 +3468,22 @@ class StudentTDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
-    if (x === -Infinity || x === Infinity) return 0.0;
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
+    if (x === -Infinity || x === Infinity) return -Infinity;
 
     let [nu, mu, sigma] = params.slice(0, 3);
 
-    let lnprob;
+    return this.cachedLogNormalizer(params)
+           - (nu + 1) / 2 * log1p(Math.pow(x - mu, 2) / nu / Math.pow(sigma, 2));
+  }
 
-    lnprob = lngamma((nu + 1) / 2) - lngamma(nu / 2) - Math.log(Math.PI * nu) / 2 - Math.log(sigma)
-             - (nu + 1) / 2 * log1p(Math.pow(x - mu, 2) / nu / Math.pow(sigma, 2));
+  logNormalizer(params) {
+    let [nu, , sigma] = params.slice(0, 3);
 
-    return Math.exp(lnprob);
+    return lnGammaHalfRatio(nu / 2) - Math.log(Math.PI * nu) / 2 - Math.log(sigma);
   }
 
   cdfSingleValue(x, params) {
@@ -2905,6 +3494,8 @@ class StudentTDistribution extends ContinuousUnivariateDistribution {
 
     let y = (x - mu) / sigma;
 
+    if (studentTCdfAsymptoticError(nu) <= this.tol) return studentTCdfAsymptotic(y, nu);
+
     if (y >= 0) {
         return 1 - regularizedIncompleteBeta(nu / (Math.pow(y, 2) + nu), 0.5 * nu, 0.5) / 2;
     }
@@ -2927,6 +3518,18 @@ class StudentTDistribution extends ContinuousUnivariateDistribution {
     
     if (nu === 1 || nu === Infinity) return mu + sigma * guess;
 
+    let pTail = Math.min(p, 1 - p);
+    let t;
+    if (pTail < 0.25) {
+      let z = regularizedIncompleteBetaInv(2 * pTail, nu / 2, 0.5);
+      t = Math.sqrt(nu * (1 - z) / z);
+    }
+    else {
+      let y = regularizedIncompleteBetaInv(1 - 2 * pTail, 0.5, nu / 2);
+      t = Math.sqrt(nu * y / (1 - y));
+    }
+    if (!isNaN(t)) return mu + sigma * (p < 0.5 ? -t : t);
+
     
     let rootFun = (x, nu, p) => [p - this.cdfSingleValue(x, [nu, 0, 1])];
     let [xOpt, success] = findRootTrustRegion(rootFun, [guess], [nu, p]);
@@ -3038,6 +3641,19 @@ class StudentTDistribution extends ContinuousUnivariateDistribution {
     return retval;
   }
 
+  sample(out, params, rng) {
+    
+    let [nu, mu, sigma] = params.slice(0, 3);
+    if (!(nu > 0 && sigma > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      let g = standardGamma(nu / 2, rng, zig);
+      out[i] = mu + sigma * standardNormal(rng, zig) * Math.sqrt(nu / (2 * g));
+    }
+
+    return out;
+  }
 }
 """,
     "UniformDistribution": """
@@ -3125,6 +3741,17 @@ class UniformDistribution extends ContinuousUnivariateDistribution {
 
     return [[alpha, beta], true];
   }
+
+  sample(out, params, rng) {
+    let [alpha, beta] = params.slice(0, 2);
+    if (!(beta > alpha)) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = alpha + (beta - alpha) * rng();
+    }
+
+    return out;
+  }
 }
 """,
     "VonMisesDistribution": """
@@ -3160,6 +3787,9 @@ class VonMisesDistribution extends ContinuousUnivariateDistribution {
     this.fixedParams = [];
 
     
+    this.expensiveCdf = true;
+
+    
     super.generateActiveFixedInds();
 
     
@@ -3175,9 +3805,17 @@ class VonMisesDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     let [mu, kappa] = params.slice(0, 2);
 
-    return Math.exp(kappa * cosm1(x - mu)) / (2 * Math.PI * besseli0(kappa, true));
+    return kappa * cosm1(x - mu) + this.cachedLogNormalizer(params);
+  }
+
+  logNormalizer(params) {
+    return -Math.log(2 * Math.PI * besseli0(params[1], true));
   }
 
   cdfSingleValueNormalApprox(x, params) {
@@ -3334,6 +3972,51 @@ class VonMisesDistribution extends ContinuousUnivariateDistribution {
 
     return [paramsOpt, optimSuccess];
   }
+
+  sample(out, params, rng) {
+    
+    
+    let [mu, kappa] = params.slice(0, 2);
+    if (!(kappa >= 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    const wrap = theta => theta - 2 * Math.PI * Math.floor((theta + Math.PI) / (2 * Math.PI));
+
+    if (kappa < 1e-8) {
+      for (let i = 0; i < out.length; i++) out[i] = Math.PI * (2 * rng() - 1);
+      return out;
+    }
+
+    if (kappa > 1e5) {
+      for (let i = 0; i < out.length; i++) out[i] = wrap(mu + standardNormal(rng, zig) / Math.sqrt(kappa));
+      return out;
+    }
+
+    let s;
+    if (kappa < 1e-5) {
+      s = 1 / kappa + kappa;
+    }
+    else {
+      let r = 1 + Math.sqrt(1 + 4 * kappa * kappa);
+      let rho = (r - Math.sqrt(2 * r)) / (2 * kappa);
+      s = (1 + rho * rho) / (2 * rho);
+    }
+
+    for (let i = 0; i < out.length; i++) {
+      let w;
+      while (true) {
+        let z = Math.cos(Math.PI * rng());
+        w = (1 + s * z) / (s + z);
+        let y = kappa * (s - w);
+        let v = rng();
+        if (y * (2 - y) - v >= 0 || Math.log(y / v) + 1 - y >= 0) break;
+      }
+      let theta = Math.acos(Math.min(1, Math.max(-1, w)));
+      out[i] = wrap(rng() < 0.5 ? mu - theta : mu + theta);
+    }
+
+    return out;
+  }
 }
 """,
     "WeibullDistribution": """
@@ -3376,22 +4059,24 @@ class WeibullDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     if (x < 0) return NaN;
-    if (x === Infinity) return 0.0;
+    if (x === Infinity) return -Infinity;
 
     let [alpha, sigma] = params.slice(0, 2);
 
     if (x === 0) {
-      if (alpha > 1.0) return 0.0;
+      if (alpha > 1.0) return -Infinity;
       if (alpha < 1.0) return Infinity;
-      if (alpha == 1.0) return Math.exp(-x / sigma) / sigma;
+      if (alpha == 1.0) return -Math.log(sigma);
     }
 
 
-    let logp = -Math.pow(x / sigma, alpha) + (alpha - 1) * Math.log(x) 
-                + Math.log(alpha) - alpha * Math.log(sigma);
-
-    return Math.exp(logp);
+    return -Math.pow(x / sigma, alpha) + (alpha - 1) * Math.log(x) 
+           + Math.log(alpha) - alpha * Math.log(sigma);
   }
 
   cdfSingleValue(x, params) {
@@ -3436,795 +4121,1459 @@ class WeibullDistribution extends ContinuousUnivariateDistribution {
     return [[alpha, sigma], true];
   }
 
-  
-}
-""",
-    "isclose": """
-function isclose(x, y, rtol = 1.0e-7, atol = 1.0e-8) {
-  return Math.abs(x - y) <= (atol + rtol * Math.abs(y));
-}
+  sample(out, params, rng) {
+    let [alpha, sigma] = params.slice(0, 2);
+    if (!(alpha > 0 && sigma > 0)) return out.fill(NaN);
 
-""",
-    "isone": """
-function isone(x, rtol = 1.0e-5, atol = 1.0e-8) {
-  return isclose(x, 1.0, rtol, atol);
-}
+    for (let i = 0; i < out.length; i++) {
+      out[i] = sigma * Math.pow(-Math.log(rng()), 1 / alpha);
+    }
 
-""",
-    "iszero": """
-function iszero(x, eps = 1.0e-8) {
-  return Math.abs(x) <= eps;
+    return out;
+  }
 }
-
 """,
-    "logspace": """
-function logspace(start, stop, n) {
-  let x = new Array(n);
-  let step = (stop - start) / (n - 1);
-  for (let i = 0; i < n; i++) {
-    x[i] = Math.pow(10, start + i * step);
-  }
+    "SumDistribution": """
+class SumDistribution extends DiscreteUnivariateDistribution {
 
-  return x;
-}
+  constructor(components) {
+    super();
 
-""",
-    "linspace": """
-function linspace(start, stop, n) {
-  let x = new Array(n);
-  let step = (stop - start) / (n - 1);
-  for (let i = 0; i < n; i++) {
-    x[i] = start + i * step;
-  }
+    this.components = components;
 
-  return x;
-}
+    
+    this.name = 'Sum of ' + components.map(component => component.name).join(', ');
 
-""",
-    "arange": """
-function arange(start, stop) {
-  let x = new Array(stop - start);
-  for (let i = 0; i < stop - start; i++) {
-    x[i] = start + i;
-  }
+    
+    this.varName = components[0].varName;
 
-  return x;
-}
+    
+    this.hardMin = components.reduce((a, component) => a + component.hardMin, 0);
+    this.hardMax = components.reduce((a, component) => a + component.hardMax, 0);
 
-""",
-    "meshgrid": """
-function meshgrid(x, y) {
-  let m = y.length;
-  let n = x.length;
+    
+    this.paramNames = components.flatMap(
+      (component, i) => component.paramNames.map(name => name + subscript(i + 1))
+    );
 
-  let xGrid = new Array(m);
-  let yGrid = new Array(m);
+    
+    this.paramMin = components.flatMap(component => component.paramMin);
+    this.paramMax = components.flatMap(component => component.paramMax);
 
-  for (let i = 0; i < m; i++) {
-    xGrid[i] = new Array(n);
-    yGrid[i] = new Array(n);
-    for (let j = 0; j < n; j++) {
-      xGrid[i][j] = x[j];
-      yGrid[i][j] = y[i];
-    }
+    
+    this.fixedParams = this.paramNames;
+
+    
+    this.maxLattice = 4194304;
+
+    
+    super.generateActiveFixedInds()
   }
 
-  return [xGrid, yGrid];
-}
+  xMin(params) {
+    let parts = componentParams(params, this.components);
+    return this.components.reduce((a, component, i) => a + component.xMin(parts[i]), 0);
+  }
 
-""",
-    "logit": """
-function logit(x) {
-  if (x == 0) return -Infinity;
+  xMax(params) {
+    let parts = componentParams(params, this.components);
+    return this.components.reduce((a, component, i) => a + component.xMax(parts[i]), 0);
+  }
+
+  lattice(hi, params) {
+
+    let key = JSON.stringify(params);
+    let cache = this.latticeCache;
+    if (cache !== undefined && cache.key === key && hi <= cache.hi) return cache;
+
+    let parts = componentParams(params, this.components);
+    let lows = this.components.map((component, i) => component.xMin(parts[i]));
+    let start = lows.reduce((a, b) => a + b, 0);
+    if (!Number.isFinite(start)) {
+      this.latticeCache = {key: key, start: NaN, hi: Infinity, pmf: [NaN], cdf: [NaN]};
+      return this.latticeCache;
+    }
+    if (cache !== undefined && cache.key === key) hi = Math.max(hi, 2 * cache.hi - start + 1);
+    hi = Math.min(Math.max(hi, start), start + this.maxLattice - 1);
+    let nInts = hi - start + 1;
+
+    let pmf = null;
+    for (let i = 0; i < this.components.length && (pmf === null || !isNaN(pmf[0])); i++) {
+      let component = this.components[i];
+      let highest = Math.min(nInts - 1, component.xMax(parts[i]) - lows[i]);
+      let componentPMF = new Float64Array(nInts);
+      let valid = false;
+      for (let k = 0; k <= highest; k++) {
+        let prob = component.pmfSingleValue(lows[i] + k, parts[i]);
+        if (!isNaN(prob)) {
+          componentPMF[k] = prob;
+          valid = true;
+        }
+      }
+      if (!valid) componentPMF.fill(NaN);
 
-  if (x == 1) return Infinity;
+      pmf = pmf === null ? componentPMF : fftConvolve(pmf, componentPMF, nInts);
+    }
 
-  if (x < 0 || x > 1) return NaN;
+    
+    let cdf = new Float64Array(nInts);
+    let cumsum = 0.0;
+    for (let k = 0; k < nInts; k++) {
+      if (pmf[k] < 0) pmf[k] = 0.0;
+      cumsum += pmf[k];
+      cdf[k] = Math.min(1.0, cumsum);
+    }
 
-  return Math.log(x / (1.0 - x));
-}
+    this.latticeCache = {key: key, start: start, hi: hi, pmf: pmf, cdf: cdf};
 
-""",
-    "log1p": """
-function log1p(x) {
-  
-  
-  if (x <= -1.0) {
-    throw new RangeError('Argument must be greater than -1.0');
+    return this.latticeCache;
   }
 
-  
-  else if (Math.abs(x) > 1e-4) {
-    return Math.log(1.0 + x);
-  }
+  pmfSingleValue(x, params) {
+    let {start, hi, pmf} = this.lattice(x, params);
+    if (isNaN(start)) return NaN;
+    if (x < start || !Number.isInteger(x)) return 0.0;
 
-  else {
-    return (-0.5*x + 1.0)*x;
+    return x <= hi ? pmf[x - start] : NaN;
   }
-}
 
-""",
-    "logSumExp": """
-function logSumExp(x1, x2) {
-  if (x1 > x2) {
-    return x1 + log1p(Math.exp(x2 - x1));
-  }
-  else {
-    return x2 + log1p(Math.exp(x1 - x2));
+  cdfSingleValue(x, params) {
+    x = Math.floor(x);
+    let {start, hi, cdf} = this.lattice(x, params);
+    if (isNaN(start) || isNaN(cdf[0])) return NaN;
+    if (x < start) return 0.0;
+    if (x === Infinity) return 1.0;
+
+    return x <= hi ? cdf[x - start] : NaN;
   }
-}
 
-""",
-    "erf": """
-function erf(x) {
-  
-  var a = [1.00002368,
-           0.37409196,
-           0.09678418,
-           -0.18628806,
-           0.27886807,
-           -1.13520398,
-           1.48851587,
-           -0.82215223,
-           0.17087277];
+  ppfSingleValue(p, params) {
+    let start = this.xMin(params);
+    let xMax = this.xMax(params);
+    if (isNaN(start)) return NaN;
+    if (p <= 0) return start;
+    if (p >= 1) return xMax;
 
-  var t = 1 / (1 + Math.abs(x)/2);
-  var expSum = -Math.pow(x, 2) - 1.26551223;
+    let hi = start + 63;
+    let lattice = this.lattice(hi, params);
+    while (!(lattice.cdf[lattice.cdf.length - 1] >= p) && lattice.hi < xMax && lattice.hi - start + 1 < this.maxLattice) {
+      lattice = this.lattice(lattice.hi + 1, params);
+    }
 
-  for (var i = 0; i < a.length; i++) {
-      expSum += a[i] * Math.pow(t, i+1);
+    let cdf = lattice.cdf;
+    if (isNaN(cdf[0])) return NaN;
+    if (!(cdf[cdf.length - 1] >= p) && !isclose(cdf[cdf.length - 1], p)) return Math.min(lattice.hi, xMax);
+
+    
+    let lo = -1;
+    hi = cdf.length - 1;
+    while (hi - lo > 1) {
+      let mid = (lo + hi) >> 1;
+      if (cdf[mid] >= p || isclose(cdf[mid], p)) hi = mid;
+      else lo = mid;
+    }
+
+    return lattice.start + hi;
   }
 
-  var result = 1 - t * Math.exp(expSum);
+  defaultXRange(params) {
+    return [this.ppfSingleValue(0.001, params) - 1, this.ppfSingleValue(0.999, params) + 1];
+  }
 
-  if (x < 0) return -result;
-  return result;
-}
+  sample(out, params, rng) {
+    
+    let parts = componentParams(params, this.components);
+    if (this.sampleBuffer === undefined || this.sampleBuffer.length !== out.length) {
+      this.sampleBuffer = new Float64Array(out.length);
+    }
 
+    out.fill(0);
+    for (let i = 0; i < this.components.length; i++) {
+      this.components[i].sample(this.sampleBuffer, parts[i], rng);
+      for (let j = 0; j < out.length; j++) out[j] += this.sampleBuffer[j];
+    }
+
+    return out;
+  }
+}
 """,
-    "erfc": """
-function erfc(x) {
-  let y2 = Math.pow(x, 2);
-  let y = x < 0 ? -x : x;
-  const term1 = 0.56418958354775629 / (y + 2.06955023132914151);
-  
-  const term2 = (y**2 + 2.71078540045147805 * y + 5.80755613130301624) / 
-                (y**2 + 3.47954057099518960 * y + 12.06166887286239555);
+    "DiscreteMixtureDistribution": """
+class DiscreteMixtureDistribution extends DiscreteUnivariateDistribution {
 
-  const term3 = (y**2 + 3.47469513777439592 * y + 12.07402036406381411) / 
-                (y**2 + 3.72068443960225092 * y + 8.44319781003968454);
+  constructor(components) {
+    super();
 
-  const term4 = (y**2 + 4.00561509202259545 * y + 9.30596659485887898) / 
-                (y**2 + 3.90225704029924078 * y + 6.36161630953880464);
-
-  const term5 = (y**2 + 5.16722705817812584 * y + 9.12661617673673262) / 
-                (y**2 + 4.03296893109262491 * y + 5.13578530585681539);
+    this.components = components;
 
-  const term6 = (y**2 + 5.95908795446633271 * y + 9.19435612886969243) / 
-                (y**2 + 4.11240942957450885 * y + 4.48640329523408675);
+    
+    this.name = 'Mixture of ' + components.map(component => component.name).join(', ');
 
-  const expTerm = Math.exp(-Math.pow(x,2));
+    
+    this.varName = components[0].varName;
 
-  let res = term1 * term2 * term3 * term4 * term5 * term6 * expTerm;
+    
+    this.hardMin = Math.min(...components.map(component => component.hardMin));
+    this.hardMax = Math.max(...components.map(component => component.hardMax));
 
-  return x < 0 ? 2.0 - res : res;
-}
+    
+    let weightNames = components.slice(1).map((component, i) => 'w' + subscript(i + 1));
+    this.paramNames = components.flatMap(
+      (component, i) => component.paramNames.map(name => name + subscript(i + 1))
+    ).concat(weightNames);
 
-""",
-    "erfinv": """
-function erfinv(x) {
-  
-  let p = (x + 1.0) / 2.0;
+    
+    this.paramMin = components.flatMap(component => component.paramMin).concat(weightNames.map(name => 0));
+    this.paramMax = components.flatMap(component => component.paramMax).concat(weightNames.map(name => 1));
 
-  
-  if (p == 0.0) return -Infinity;
-  if (p == 1.0) return Infinity;
-  if (p > 1.0 || p < 0.0) return undefined;
+    
+    this.fixedParams = this.paramNames;
 
-  let split1 = 0.425;
-  let split2 = 5.0;
-  let const1 = 0.180625;
-  let const2 = 1.6;
+    
+    super.generateActiveFixedInds()
+  }
 
-  
-  let a0 = 3.3871327179;
-  let a1 = 5.0434271938e1;
-  let a2 = 1.5929113202e2;
-  let a3 = 5.9109374720e1;
-  let b1 = 1.7895169469e1;
-  let b2 = 7.8757757664e1;
-  let b3 = 6.7187563600e1;
+  xMin(params) {
+    let parts = componentParams(params, this.components);
+    return Math.min(...this.components.map((component, i) => component.xMin(parts[i])));
+  }
 
-  
-  let c0 = 1.4234372777;
-  let c1 = 2.7568153900;
-  let c2 = 1.3067284816;
-  let c3 = 1.7023821103e-1;
-  let d1 = 7.3700164250e-1;
-  let d2 = 1.2021132975e-1;
+  xMax(params) {
+    let parts = componentParams(params, this.components);
+    return Math.max(...this.components.map((component, i) => component.xMax(parts[i])));
+  }
 
-  
-  let e0 = 6.6579051150;
-  let e1 = 3.0812263860;
-  let e2 = 4.2868294337e-1;
-  let e3 = 1.7337203997e-2;
-  let f1 = 2.4197894225e-1;
-  let f2 = 1.2258202635e-2;
+  pmfSingleValue(x, params) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
 
-  let r;
-  let res;
-  let q = p - 0.5;
+    let parts = componentParams(params, this.components);
+    let prob = 0.0;
+    for (let i = 0; i < this.components.length; i++) {
+      if (weights[i] > 0) prob += weights[i] * this.components[i].pmfSingleValue(x, parts[i]);
+    }
 
-  if (Math.abs(q) <= split1) {
-    r = const1 - q * q;
-    res = q * (((a3 * r + a2) * r + a1) * r + a0) /
-              (((b3 * r + b2) * r + b1) * r + 1.0);
-  } else {
-    r = q < 0 ? p : 1.0 - p;
+    return prob;
+  }
 
-    r = Math.sqrt(-Math.log(r));
+  logpmfSingleValue(x, params) {
+    
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
 
-    if (r <= split2) {
-      r -= const2;
-      res = (((c3 * r + c2) * r + c1) * r + c0) /
-             ((d2 * r + d1) * r + 1.0);
-    } else {
-      r -= split2;
-      res = (((e3 * r + e2) * r + e1) * r + e0) /
-             ((f2 * r + f1) * r + 1.0);
-    }
-  
-    if (q < 0) {
-      res = -res;
+    let parts = componentParams(params, this.components);
+    let result = -Infinity;
+    for (let i = 0; i < this.components.length; i++) {
+      if (weights[i] > 0) {
+        let term = Math.log(weights[i]) + this.components[i].logpmfSingleValue(x, parts[i]);
+        if (isNaN(term)) continue;
+        result = result === -Infinity ? term : logSumExp(result, term);
+      }
     }
+
+    return result;
   }
 
-  
-  return 0.7071067811865475 * res;
+  cdfSingleValue(x, params) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
 
-}
+    let parts = componentParams(params, this.components);
+    let prob = 0.0;
+    for (let i = 0; i < this.components.length; i++) {
+      if (weights[i] > 0) prob += weights[i] * this.components[i].cdfSingleValue(x, parts[i]);
+    }
 
-""",
-    "lnStdNormCdf": """
-function lnStdNormCdf(x) {
-  
-  let y = x / 1.4142135623730950488016887;
+    return Math.min(1.0, prob);
+  }
 
-  let res;
-  
-  if (y > 0.0) {
-    res = log1p(-0.5 * erfc(y));
-  } 
-  else if (y > -20.0) {
+  ppfSingleValue(p, params) {
     
-    res = Math.log(erfc(-y)) - 0.6931471805599453;
-  }
-  else {
     
-    const y2 = Math.pow(y, 2);
-    const y4 = Math.pow(y, 4);
-    const y6 = Math.pow(y, 6);
-    const y8 = Math.pow(y, 8);
-    const y10 = Math.pow(y, 10);
-    const temp_p = 0.000658749161529837803157 + 0.0160837851487422766278 / y2
-                 + 0.125781726111229246204 / y4 + 0.360344899949804439429 / y6
-                 + 0.305326634961232344035 / y8 + 0.0163153871373020978498 / y10;
-    const temp_q = -0.00233520497626869185443 - 0.0605183413124413191178 / y2
-                   - 0.527905102951428412248 / y4 - 1.87295284992346047209 / y6
-                   - 2.56852019228982242072 / y8 - 1.0 / y10;
-    res = -0.6931471805599453 + Math.log(0.5641895835477563 + (temp_p / temp_q) / y2) - Math.log(-y) - y2;
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
+
+    let parts = componentParams(params, this.components);
+    let quantiles = this.components.map((component, i) => component.ppfSingleValue(p, parts[i]))
+      .filter((x, i) => weights[i] > 0);
+    let lo = Math.min(...quantiles) - 1;
+    let hi = Math.max(...quantiles);
+    if (!isFinite(lo) || !isFinite(hi)) return hi;
+
+    while (hi - lo > 1) {
+      let mid = Math.floor((lo + hi) / 2);
+      let cdfVal = this.cdfSingleValue(mid, params);
+      if (cdfVal >= p || isclose(cdfVal, p)) hi = mid;
+      else lo = mid;
+    }
+
+    return hi;
   }
 
-  if (isNaN(res)) {
-    return -Infinity;
+  defaultXRange(params) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return [NaN, NaN];
+
+    let parts = componentParams(params, this.components);
+    let ranges = this.components.map((component, i) => component.defaultXRange(parts[i]))
+      .filter((range, i) => weights[i] > 0);
+
+    return [Math.min(...ranges.map(range => range[0])), Math.max(...ranges.map(range => range[1]))];
   }
-  else {
-    return res;
+
+  sample(out, params, rng) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return out.fill(NaN);
+
+    return sampleMixture(out, this.components, componentParams(params, this.components), weights, rng);
   }
 }
-
 """,
-    "lnchoice": """
-function lnchoice(n, k) {
-    return lnfactorial(n) - lnfactorial(n-k) - lnfactorial(k);
-}
+    "ContinuousMixtureDistribution": """
+class ContinuousMixtureDistribution extends ContinuousUnivariateDistribution {
 
-""",
-    "lnbeta": """
-function lnbeta(x, y) {
-    if (x < 0 || y < 0) {
-        throw RangeError('Arguments must be positive.');
-    }
-    else if (x === 0 && y === 0) return NaN;
-    else if (x === 0 || y === 0) return Infinity;
+  constructor(components) {
+    super();
 
-    return lngamma(x) + lngamma(y) - lngamma(x + y);
-}
+    this.components = components;
 
-""",
-    "betacf": """
-function betacf(x, a, b) {
     
+    this.name = 'Mixture of ' + components.map(component => component.name).join(', ');
+
     
-    var fpmin = 1e-30,
-        m = 1,
-        m2, aa, c, d, del, h, qab, qam, qap;
+    this.varName = components[0].varName;
+
     
-    qab = a + b;
-    qap = a + 1;
-    qam = a - 1;
-    c = 1;
-    d = 1 - qab * x / qap;
-    if (Math.abs(d) < fpmin) d = fpmin;
-    d = 1 / d;
-    h = d;
-    for (; m <= 100; m++) {
-        m2 = 2 * m;
-        aa = m * (b - m) * x / ((qam + m2) * (a + m2));
-        
-        d = 1 + aa * d;
-        if (Math.abs(d) < fpmin) d = fpmin;
-        c = 1 + aa / c;
-        if (Math.abs(c) < fpmin) c = fpmin;
-        d = 1 / d;
-        h *= d * c;
-        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2));
-        
-        d = 1 + aa * d;
-        if (Math.abs(d) < fpmin) d = fpmin;
-        c = 1 + aa / c;
-        if (Math.abs(c) < fpmin) c = fpmin;
-        d = 1 / d;
-        del = d * c;
-        h *= del;
-        if (Math.abs(del - 1.0) < 3e-7) break;
-    }
-    return h;
-}
+    this.hardMin = Math.min(...components.map(component => component.hardMin));
+    this.hardMax = Math.max(...components.map(component => component.hardMax));
 
-""",
-    "regularizedIncompleteBeta": """
-function regularizedIncompleteBeta(x, a, b) {
     
+    let weightNames = components.slice(1).map((component, i) => 'w' + subscript(i + 1));
+    this.paramNames = components.flatMap(
+      (component, i) => component.paramNames.map(name => name + subscript(i + 1))
+    ).concat(weightNames);
+
     
-    if (x < 0 || x > 1) {
-        throw new RangeError('First argument must be between 0 and 1.');
-    }
+    this.paramMin = components.flatMap(component => component.paramMin).concat(weightNames.map(name => 0));
+    this.paramMax = components.flatMap(component => component.paramMax).concat(weightNames.map(name => 1));
 
     
-    else if (a === 1 && b === 1) return x;
-    else if (x === 0) return 0;
-    else if (x === 1) return 1;
-    else if (a === 0) return 1;
-    else if (b === 0) return 0;
+    this.fixedParams = this.paramNames;
 
-    else {
-        var bt = Math.exp(lngamma(a + b) - lngamma(a) - lngamma(b) + a * Math.log(x) + b * log1p(-x));
+    
+    this.expensiveCdf = components.some(component => component.expensiveCdf);
 
-        
-        if (x < (a + 1) / (a + b + 2)) return bt * betacf(x, a, b) / a;
+    
+    super.generateActiveFixedInds()
+  }
 
-        
-        else return 1 - bt * betacf(1 - x, b, a) / b;
-    }
-}
+  xMin(params) {
+    let parts = componentParams(params, this.components);
+    return Math.min(...this.components.map((component, i) => component.xMin(parts[i])));
+  }
 
-""",
-    "incompleteBeta": """
-function incompleteBeta(x, a, b) {
-    return regularizedIncompleteBeta(x, a, b) * Math.exp(lnbeta(a, b));
-}
+  xMax(params) {
+    let parts = componentParams(params, this.components);
+    return Math.max(...this.components.map((component, i) => component.xMax(parts[i])));
+  }
 
-""",
-    "lngamma": """
-function lngamma(z) {
+  pdfSingleValue(x, params) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
 
-    if(z < 0) return Number('0/0');
+    let parts = componentParams(params, this.components);
+    let density = 0.0;
+    for (let i = 0; i < this.components.length; i++) {
+      if (weights[i] > 0) density += weights[i] * this.components[i].pdfSingleValue(x, parts[i]);
+    }
 
-    if (z < 0.5) return Math.log(Math.PI) - Math.log(Math.sin(Math.PI * z)) - lngamma(1-z);
+    return density;
+  }
 
-    var p = [676.5203681218851,
-             -1259.1392167224028,
-             771.32342877765313,
-             -176.61502916214059,
-             12.507343278686905,
-             -0.13857109526572012,
-             9.9843695780195716e-6,
-             1.5056327351493116e-7];
+  logpdfSingleValue(x, params) {
+    
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
 
-    z -= 1.0;
-    var Ag = 0.99999999999980993;
-    for (var i = 0; i < p.length; i++) {
-        Ag += p[i] / (z + i + 1);
+    let parts = componentParams(params, this.components);
+    let result = -Infinity;
+    for (let i = 0; i < this.components.length; i++) {
+      if (weights[i] > 0) {
+        let term = Math.log(weights[i]) + this.components[i].logpdfSingleValue(x, parts[i]);
+        if (isNaN(term)) continue;
+        result = result === -Infinity ? term : logSumExp(result, term);
+      }
     }
-    var t = z + p.length - 0.5;
 
-    return 0.5 * Math.log(2*Math.PI) + (z + 0.5)*Math.log(t) - t + Math.log(Ag);
-}
+    return result;
+  }
 
-""",
-    "gammaincU": """
-function gammaincU(x, s, regularized) {
+  cdfSingleValue(x, params) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
 
-  var EPSILON = 1e-12;
+    let parts = componentParams(params, this.components);
+    let prob = 0.0;
+    for (let i = 0; i < this.components.length; i++) {
+      if (weights[i] > 0) prob += weights[i] * this.components[i].cdfSingleValue(x, parts[i]);
+    }
 
-  if (x <= 1.1 || x <= s) {
-    if (regularized !== false) {
-      return 1 - gammaincL(x, s, regularized);
-    } else {
-      return Math.exp(lngamma(s)) - gammaincL(x, s, regularized);
-    }
+    return Math.min(1.0, prob);
   }
 
-  var f = 1 + x - s,
-    C = f,
-    D = 0,
-    i = 1,
-    a, b, chg;
-  for (i = 1; i < 10000; i++) {
-    a = i * (s - i);
-    b = (i<<1) + 1 + x - s;
-    D = b + a * D;
-    C = b + a / C;
-    D = 1 / D;
-    chg = C * D;
-    f *= chg;
-    if (Math.abs(chg - 1) < EPSILON) {
-      break;
-    }
+  ppfSingleValue(p, params) {
+    
+    
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
+
+    let parts = componentParams(params, this.components);
+    let quantiles = this.components.map((component, i) => component.ppfSingleValue(p, parts[i]))
+      .filter((x, i) => weights[i] > 0);
+    let lo = Math.min(...quantiles);
+    let hi = Math.max(...quantiles);
+    if (!isFinite(lo) || !isFinite(hi) || lo === hi) return lo;
+
+    let x = brentSolve(x => this.cdfSingleValue(x, params) - p, lo, hi, [], 1e-10 * (hi - lo));
+
+    return x === null ? (lo + hi) / 2 : x;
   }
-  if (regularized !== false) {
-    return Math.exp(s * Math.log(x) - x - lngamma(s) - Math.log(f));
-  } else {
-    return Math.exp(s * Math.log(x) - x - Math.log(f));
+
+  defaultXRange(params) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return [NaN, NaN];
+
+    let parts = componentParams(params, this.components);
+    let ranges = this.components.map((component, i) => component.defaultXRange(parts[i]))
+      .filter((range, i) => weights[i] > 0);
+
+    return [Math.min(...ranges.map(range => range[0])), Math.max(...ranges.map(range => range[1]))];
+  }
+
+  sample(out, params, rng) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return out.fill(NaN);
+
+    return sampleMixture(out, this.components, componentParams(params, this.components), weights, rng);
   }
 }
+""",
+    "isclose": """
+function isclose(x, y, rtol = 1.0e-7, atol = 1.0e-8) {
+  return Math.abs(x - y) <= (atol + rtol * Math.abs(y));
+}
 
 """,
-    "gammaincL": """
-function gammaincL(x, s, regularized) {
+    "isone": """
+function isone(x, rtol = 1.0e-5, atol = 1.0e-8) {
+  return isclose(x, 1.0, rtol, atol);
+}
 
-  var EPSILON = 1e-12;
+""",
+    "iszero": """
+function iszero(x, eps = 1.0e-8) {
+  return Math.abs(x) <= eps;
+}
 
-  if (x === 0) {
-    return 0;
-  }
-  if (x < 0 || s <= 0) {
-    return NaN;
+""",
+    "logspace": """
+function logspace(start, stop, n) {
+  let x = new Array(n);
+  let step = (stop - start) / (n - 1);
+  for (let i = 0; i < n; i++) {
+    x[i] = Math.pow(10, start + i * step);
   }
 
-  if (x > 1.1 && x > s) {
-    if (regularized !== false) {
-      return 1 - gammaincU(x, s, regularized);
-    } else {
-      return Math.exp(lngamma(s)) - gammaincU(x, s, regularized);
-    }
+  return x;
+}
+
+""",
+    "linspace": """
+function linspace(start, stop, n) {
+  let x = new Array(n);
+  let step = (stop - start) / (n - 1);
+  for (let i = 0; i < n; i++) {
+    x[i] = start + i * step;
   }
 
-  var ft,
-    r = s,
-    c = 1,
-    pws = 1;
+  return x;
+}
 
-  if (regularized !== false) {
-    ft = s * Math.log(x) - x - lngamma(s);
-  } else {
-    ft = s * Math.log(x) - x;
+""",
+    "arange": """
+function arange(start, stop) {
+  let x = new Array(stop - start);
+  for (let i = 0; i < stop - start; i++) {
+    x[i] = start + i;
   }
-  ft = Math.exp(ft);
-  do {
-    r += 1;
-    c *= x/r;
-    pws += c;
-  } while (c / pws > EPSILON);
 
-  return pws * ft / s;
+  return x;
 }
 
 """,
-    "hyp1f1": """
-function hyp1f1(a, b, x) {
-  let i, j, la, n, nl;
-  let a0 = a, a1 = a, x0 = x, y0, y1, hg1, hg2, r1, r2, rg, xg, sum1, sum2;
-  let hg = 0.0;
+    "meshgrid": """
+function meshgrid(x, y) {
+  let m = y.length;
+  let n = x.length;
 
-  
-  if (x < 0.0) {
-    a = b - a;
-    a0 = a;
-    x = Math.abs(x);
-  }
-  nl = 0;
-  la = 0;
-  if (a >= 2.0) {
-    
-    nl = 1;
-    la = Math.floor(a);
-    a -= la + 1;
-  }
-  y0 = 0.0;
-  y1 = 0.0;
-  for (n = 0; n < (nl + 1); n++) {
-    if (a0 >= 2.0) { a += 1.0; }
-    if ((x <= 30.0 + Math.abs(b)) || (a < 0.0)) {
-      hg = 1.0;
-      rg = 1.0;
-      for (j = 1; j < 501; j++) {
-        rg *= (a + j - 1.0) / (j * (b + j - 1.0)) * x;
-        hg += rg;
-        if (rg / hg < 1e-15) {
-          
-          if (x0 < 0.0) { hg *= Math.exp(x0); }
-          break;
-        }
-      }
-    } else {
-      
-      const cta = lngamma(a);
-      const ctb = lngamma(b);
-      xg = b - a;
-      const ctba = lngamma(xg);
-      sum1 = 1.0;
-      sum2 = 1.0;
-      r1 = 1.0;
-      r2 = 1.0;
-      for (i = 1; i < 9; i++) {
-        r1 = -r1 * (a + i - 1.0) * (a - b + i) / (x * i);
-        r2 = -r2 * (b - a + i - 1.0) * (a - i) / (x * i);
-        sum1 += r1;
-        sum2 += r2;
-      }
-      if (x0 >= 0.0) {
-        hg1 = Math.exp(ctb - ctba) * Math.pow(x, -a) * Math.cos(Math.PI * a) * sum1;
-        hg2 = Math.exp(ctb - cta + x) * Math.pow(x, a - b) * sum2;
-      } else {
-        
-        hg1 = Math.exp(ctb - ctba + x0) * Math.pow(x, -a) * Math.cos(Math.PI * a) * sum1;
-        hg2 = Math.exp(ctb - cta) * Math.pow(x, a - b) * sum2;
-      }
-      hg = hg1 + hg2;
-    }
-    if (n === 0) { y0 = hg; }
-    if (n === 1) { y1 = hg; }
-  }
-  if (a0 >= 2.0) {
-    
-    for (i = 1; i < la; i++) {
-      hg = ((2.0 * a - b + x) * y1 + (b - a) * y0) / a;
-      y0 = y1;
-      y1 = hg;
-      a += 1.0;
+  let xGrid = new Array(m);
+  let yGrid = new Array(m);
+
+  for (let i = 0; i < m; i++) {
+    xGrid[i] = new Array(n);
+    yGrid[i] = new Array(n);
+    for (let j = 0; j < n; j++) {
+      xGrid[i][j] = x[j];
+      yGrid[i][j] = y[i];
     }
   }
-  a = a1;
-  x = x0;
-  return hg;
+
+  return [xGrid, yGrid];
 }
 
 """,
-    "chbevl": """
-function chbevl(x, A) {
-
-  let b0, b1, b2;
-  let n = A.length;
-  let i = n - 1;
+    "logit": """
+function logit(x) {
+  if (x == 0) return -Infinity;
 
-  b0 = A[0];
-  b1 = 0.0;
+  if (x == 1) return Infinity;
 
-  for (let j = 1; j <= i; j++) {
-    b2 = b1;
-    b1 = b0;
-    b0 = x * b1 - b2 + A[j];
-  }
+  if (x < 0 || x > 1) return NaN;
 
-  return 0.5 * (b0 - b2);
+  return Math.log(x / (1.0 - x));
 }
 
 """,
-    "polevl": """
-function polevl(x, coef) {
+    "log1p": """
+function log1p(x) {
+  
+  
+  if (x <= -1.0) {
+    throw new RangeError('Argument must be greater than -1.0');
+  }
 
-    let result;
-    let n = coef.length;
+  
+  else if (Math.abs(x) > 1e-4) {
+    return Math.log(1.0 + x);
+  }
 
-    let i = n;
+  else {
+    return (-0.5*x + 1.0)*x;
+  }
+}
 
-    result = coef[0];
+""",
+    "log1pmx": """
+function log1pmx(x) {
 
-    for (let j = 1; j <= n; j++) {
-        result = result * x + coef[j];
-    }
+  if (Math.abs(x) >= 1e-2) return Math.log1p(x) - x;
 
-    return result;
+  let result = 0;
+  for (let k = 10; k >= 2; k--) result = (k % 2 === 0 ? -1 : 1) / k + x * result;
+
+  return x * x * result;
 }
 
 """,
-    "besseli0": """
-function besseli0(x, expWeighted = false) {
+    "logSumExp": """
+function logSumExp(x1, x2) {
+  if (x1 > x2) {
+    return x1 + log1p(Math.exp(x2 - x1));
+  }
+  else {
+    return x2 + log1p(Math.exp(x1 - x2));
+  }
+}
 
-  let A = [
-    -4.41534164647933937950e-18,
-     3.33079451882223809783e-17,
-    -2.43127984654795469359e-16,
-     1.71539128555513303061e-15,
-    -1.16853328779934516808e-14,
-     7.67618549860493561688e-14,
-    -4.85644678311192946090e-13,
-     2.95505266312963983461e-12,
-    -1.72682629144155570723e-11,
-     9.67580903537323691224e-11,
-    -5.18979560163526290666e-10,
-     2.65982372468238665035e-9,
-    -1.30002500998624804212e-8,
-     6.04699502254191894932e-8,
-    -2.67079385394061173391e-7,
-     1.11738753912010371815e-6,
-    -4.41673835845875056359e-6,
-     1.64484480707288970893e-5,
-    -5.75419501008210370398e-5,
-     1.88502885095841655729e-4,
-    -5.76375574538582365885e-4,
-     1.63947561694133579842e-3,
-    -4.32430999505057594430e-3,
-     1.05464603945949983183e-2,
-    -2.37374148058994688156e-2,
-     4.93052842396707084878e-2,
-    -9.49010970480476444210e-2,
-     1.71620901522208775349e-1,
-    -3.04682672343198398683e-1,
-     6.76795274409476084995e-1
-  ];
-
-  let B = [
-    -7.23318048787475395456e-18,
-    -4.83050448594418207126e-18,
-     4.46562142029675999901e-17,
-     3.46122286769746109310e-17,
-    -2.82762398051658348494e-16,
-    -3.42548561967721913462e-16,
-     1.77256013305652638360e-15,
-     3.81168066935262242075e-15,
-    -9.55484669882830764870e-15,
-    -4.15056934728722208663e-14,
-     1.54008621752140982691e-14,
-     3.85277838274214270114e-13,
-     7.18012445138366623367e-13,
-    -1.79417853150680611778e-12,
-    -1.32158118404477131188e-11,
-    -3.14991652796324136454e-11,
-     1.18891471078464383424e-11,
-     4.94060238822496958910e-10,
-     3.39623202570838634515e-9,
-     2.26666899049817806459e-8,
-     2.04891858946906374183e-7,
-     2.89137052083475648297e-6,
-     6.88975834691682398426e-5,
-     3.36911647825569408990e-3,
-     8.04490411014108831608e-1
-  ];
+""",
+    "erf": """
+function erf(x) {
+  
+  var a = [1.00002368,
+           0.37409196,
+           0.09678418,
+           -0.18628806,
+           0.27886807,
+           -1.13520398,
+           1.48851587,
+           -0.82215223,
+           0.17087277];
 
-  if ( x < 0 ) x = -x;
+  var t = 1 / (1 + Math.abs(x)/2);
+  var expSum = -Math.pow(x, 2) - 1.26551223;
 
-  let result;
-  if (x <= 8.0) {
-    let y = x / 2.0 - 2.0;
-    result = chbevl(y, A);
-  } else {
-    result = chbevl(32.0 / x - 2.0, B) / Math.sqrt(x)
+  for (var i = 0; i < a.length; i++) {
+      expSum += a[i] * Math.pow(t, i+1);
   }
 
-  if (expWeighted) return result;
-  else return Math.exp(x) * result;
+  var result = 1 - t * Math.exp(expSum);
+
+  if (x < 0) return -result;
+  return result;
 }
 
 """,
-    "cosm1": """
-function cosm1(x) {
-
-  let coeffs = [
-     4.7377507964246204691685E-14,
-    -1.1470284843425359765671E-11,
-     2.0876754287081521758361E-9,
-    -2.7557319214999787979814E-7,
-     2.4801587301570552304991E-5,
-    -1.3888888888888872993737E-3,
-     4.1666666666666666609054E-2
-   ];
+    "erfc": """
+function erfc(x) {
+  let y2 = Math.pow(x, 2);
+  let y = x < 0 ? -x : x;
+  const term1 = 0.56418958354775629 / (y + 2.06955023132914151);
+  
+  const term2 = (y**2 + 2.71078540045147805 * y + 5.80755613130301624) / 
+                (y**2 + 3.47954057099518960 * y + 12.06166887286239555);
 
-  let quarterPi = Math.PI / 4;
+  const term3 = (y**2 + 3.47469513777439592 * y + 12.07402036406381411) / 
+                (y**2 + 3.72068443960225092 * y + 8.44319781003968454);
 
-  if (x < quarterPi || x > quarterPi) return Math.cos(x) - 1.0;
+  const term4 = (y**2 + 4.00561509202259545 * y + 9.30596659485887898) / 
+                (y**2 + 3.90225704029924078 * y + 6.36161630953880464);
 
-  let x2 = x * x;
-  return -0.5 * x2 + x2 * x2 * polevl(x2, coeffs);
-}
+  const term5 = (y**2 + 5.16722705817812584 * y + 9.12661617673673262) / 
+                (y**2 + 4.03296893109262491 * y + 5.13578530585681539);
 
-""",
-    "chebPoints": """
-function chebPoints(n, low = -1, high = 1) {
-  
-  let points = Array.from({ length: n }, (_, i) => Math.cos(Math.PI * i / (n - 1)));
+  const term6 = (y**2 + 5.95908795446633271 * y + 9.19435612886969243) / 
+                (y**2 + 4.11240942957450885 * y + 4.48640329523408675);
 
-  
-  let m = (high - low) / 2.0;
-  let b = (high + low) / 2.0;
+  const expTerm = Math.exp(-Math.pow(x,2));
 
-  points = points.map((x) => m * x + b);
+  let res = term1 * term2 * term3 * term4 * term5 * term6 * expTerm;
 
-  return points;
+  return x < 0 ? 2.0 - res : res;
 }
 
 """,
-    "clenshawCurtisWeights": """
-function clenshawCurtisWeights(n) {
-    n -= 1; 
+    "erfinv": """
+function erfinv(x) {
+  
+  let p = (x + 1.0) / 2.0;
 
-    const theta = Array.from({ length: n + 1 }, (_, i) => Math.PI * i / n);
-    let w = new Array(n + 1).fill(0);
-    let v = new Array(n - 1).fill(1);
+  
+  if (p == 0.0) return -Infinity;
+  if (p == 1.0) return Infinity;
+  if (p > 1.0 || p < 0.0) return undefined;
 
-    if (n % 2 === 0) {
-        w[0] = 1.0 / (n ** 2 - 1);
-        w[n] = w[0];
-        for (let k = 1; k < n / 2; k++) {
-            for (let j = 1; j < n; j++) {
-                v[j - 1] -= 2.0 * Math.cos(2.0 * k * theta[j]) / (4.0 * k ** 2 - 1);
-            }
-        }
-        for (let j = 1; j < n; j++) {
-            v[j - 1] -= Math.cos(n * theta[j]) / (n ** 2 - 1);
-        }
-    } else {
-        w[0] = 1.0 / n ** 2;
-        w[n] = w[0];
-        for (let k = 1; k <= (n - 1) / 2; k++) {
-            for (let j = 1; j < n; j++) {
-                v[j - 1] -= 2.0 * Math.cos(2.0 * k * theta[j]) / (4.0 * k ** 2 - 1);
-            }
-        }
-    }
+  let split1 = 0.425;
+  let split2 = 5.0;
+  let const1 = 0.180625;
+  let const2 = 1.6;
 
-    for (let j = 1; j < n; j++) {
-        w[j] = 2.0 * v[j - 1] / n;
-    }
+  
+  let a0 = 3.3871327179;
+  let a1 = 5.0434271938e1;
+  let a2 = 1.5929113202e2;
+  let a3 = 5.9109374720e1;
+  let b1 = 1.7895169469e1;
+  let b2 = 7.8757757664e1;
+  let b3 = 6.7187563600e1;
 
-    return w;
-}
+  
+  let c0 = 1.4234372777;
+  let c1 = 2.7568153900;
+  let c2 = 1.3067284816;
+  let c3 = 1.7023821103e-1;
+  let d1 = 7.3700164250e-1;
+  let d2 = 1.2021132975e-1;
 
-""",
-    "clenshawCurtisIntegrate": """
-function clenshawCurtisIntegrate(f, a, b, n = 100, args = [], weights = undefined) {
+  
+  let e0 = 6.6579051150;
+  let e1 = 3.0812263860;
+  let e2 = 4.2868294337e-1;
+  let e3 = 1.7337203997e-2;
+  let f1 = 2.4197894225e-1;
+  let f2 = 1.2258202635e-2;
 
-  if (weights === undefined) {
-    
-    let ccWeights = clenshawCurtisWeights(n);
+  let r;
+  let res;
+  let q = p - 0.5;
 
-    
-    weights = ccWeights.map((x) => (b - a) / 2.0 * x);
-  }
+  if (Math.abs(q) <= split1) {
+    r = const1 - q * q;
+    res = q * (((a3 * r + a2) * r + a1) * r + a0) /
+              (((b3 * r + b2) * r + b1) * r + 1.0);
+  } else {
+    r = q < 0 ? p : 1.0 - p;
 
-  
-  let x = chebPoints(n);
+    r = Math.sqrt(-Math.log(r));
 
+    if (r <= split2) {
+      r -= const2;
+      res = (((c3 * r + c2) * r + c1) * r + c0) /
+             ((d2 * r + d1) * r + 1.0);
+    } else {
+      r -= split2;
+      res = (((e3 * r + e2) * r + e1) * r + e0) /
+             ((f2 * r + f1) * r + 1.0);
+    }
   
-  x = x.map((x) => (b - a) / 2.0 * x + (b + a) / 2.0);
+    if (q < 0) {
+      res = -res;
+    }
+  }
 
   
-  let fVals = x.map((x) => f(x, ...args));
+  return 0.7071067811865475 * res;
 
-  
-  return dot(weights, fVals);
 }
 
 """,
-    "lnfactorial": """
-function lnfactorial(n) {
-  if (n > 254) { 
-    let x = n + 1;
-    return (x - 0.5) * Math.log(x) - x + 0.5 * Math.log(2 * Math.PI) + 1.0 / (12.0 * x);
+    "lnStdNormCdf": """
+function lnStdNormCdf(x) {
+  
+  let y = x / 1.4142135623730950488016887;
+
+  let res;
+  
+  if (y > 0.0) {
+    res = log1p(-0.5 * erfc(y));
+  } 
+  else if (y > -20.0) {
+    
+    res = Math.log(erfc(-y)) - 0.6931471805599453;
   }
-  else { 
+  else {
+    
+    const y2 = Math.pow(y, 2);
+    const y4 = Math.pow(y, 4);
+    const y6 = Math.pow(y, 6);
+    const y8 = Math.pow(y, 8);
+    const y10 = Math.pow(y, 10);
+    const temp_p = 0.000658749161529837803157 + 0.0160837851487422766278 / y2
+                 + 0.125781726111229246204 / y4 + 0.360344899949804439429 / y6
+                 + 0.305326634961232344035 / y8 + 0.0163153871373020978498 / y10;
+    const temp_q = -0.00233520497626869185443 - 0.0605183413124413191178 / y2
+                   - 0.527905102951428412248 / y4 - 1.87295284992346047209 / y6
+                   - 2.56852019228982242072 / y8 - 1.0 / y10;
+    res = -0.6931471805599453 + Math.log(0.5641895835477563 + (temp_p / temp_q) / y2) - Math.log(-y) - y2;
+  }
+
+  if (isNaN(res)) {
+    return -Infinity;
+  }
+  else {
+    return res;
+  }
+}
+
+""",
+    "lnchoice": """
+function lnchoice(n, k) {
+    return lnfactorial(n) - lnfactorial(n-k) - lnfactorial(k);
+}
+
+""",
+    "lnbeta": """
+function lnbeta(x, y) {
+    if (x < 0 || y < 0) {
+        throw RangeError('Arguments must be positive.');
+    }
+    else if (x === 0 && y === 0) return NaN;
+    else if (x === 0 || y === 0) return Infinity;
+
+    return lngamma(x) + lngamma(y) - lngamma(x + y);
+}
+
+""",
+    "betacf": """
+function betacf(x, a, b) {
+    
+    
+    var fpmin = 1e-30,
+        m = 1,
+        m2, aa, c, d, del, h, qab, qam, qap;
+    
+    qab = a + b;
+    qap = a + 1;
+    qam = a - 1;
+    c = 1;
+    d = 1 - qab * x / qap;
+    if (Math.abs(d) < fpmin) d = fpmin;
+    d = 1 / d;
+    h = d;
+    for (; m <= 100; m++) {
+        m2 = 2 * m;
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2));
+        
+        d = 1 + aa * d;
+        if (Math.abs(d) < fpmin) d = fpmin;
+        c = 1 + aa / c;
+        if (Math.abs(c) < fpmin) c = fpmin;
+        d = 1 / d;
+        h *= d * c;
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2));
+        
+        d = 1 + aa * d;
+        if (Math.abs(d) < fpmin) d = fpmin;
+        c = 1 + aa / c;
+        if (Math.abs(c) < fpmin) c = fpmin;
+        d = 1 / d;
+        del = d * c;
+        h *= del;
+        if (Math.abs(del - 1.0) < 3e-7) break;
+    }
+    return h;
+}
+
+""",
+    "regularizedIncompleteBeta": """
+function regularizedIncompleteBeta(x, a, b) {
+    
+    
+    if (x < 0 || x > 1) {
+        throw new RangeError('First argument must be between 0 and 1.');
+    }
+
+    
+    else if (a === 1 && b === 1) return x;
+    else if (x === 0) return 0;
+    else if (x === 1) return 1;
+    else if (a === 0) return 1;
+    else if (b === 0) return 0;
+
+    else {
+        var bt = Math.exp(lngamma(a + b) - lngamma(a) - lngamma(b) + a * Math.log(x) + b * log1p(-x));
+
+        
+        if (x < (a + 1) / (a + b + 2)) return bt * betacf(x, a, b) / a;
+
+        
+        else return 1 - bt * betacf(1 - x, b, a) / b;
+    }
+}
+
+""",
+    "regularizedIncompleteBetaInv": """
+function regularizedIncompleteBetaInv(p, a, b) {
+
+    if (p <= 0) return 0;
+    if (p >= 1) return 1;
+
+    var EPSILON = 1e-10;
+    var a1 = a - 1,
+        b1 = b - 1,
+        x, t, u, w, err;
+
+    if (a >= 1 && b >= 1) {
+        var pp = p < 0.5 ? p : 1 - p;
+        t = Math.sqrt(-2 * Math.log(pp));
+        x = (2.30753 + t * 0.27061) / (1 + t * (0.99229 + t * 0.04481)) - t;
+        if (p < 0.5) x = -x;
+        var al = (x * x - 3) / 6;
+        var h = 2 / (1 / (2 * a - 1) + 1 / (2 * b - 1));
+        w = x * Math.sqrt(al + h) / h - (1 / (2 * b - 1) - 1 / (2 * a - 1)) * (al + 5 / 6 - 2 / (3 * h));
+        x = a / (a + b * Math.exp(2 * w));
+    }
+    else {
+        t = Math.exp(a * Math.log(a / (a + b))) / a;
+        u = Math.exp(b * Math.log(b / (a + b))) / b;
+        w = t + u;
+        if (p < t / w) x = Math.pow(a * w * p, 1 / a);
+        else x = 1 - Math.pow(b * w * (1 - p), 1 / b);
+    }
+
+    var afac = -lnbeta(a, b);
+    for (var i = 0; i < 20; i++) {
+        if (x === 0 || x === 1) return x;
+
+        err = regularizedIncompleteBeta(x, a, b) - p;
+        t = Math.exp(a1 * Math.log(x) + b1 * log1p(-x) + afac);
+        u = err / t;
+        t = u / (1 - 0.5 * Math.min(1, u * (a1 / x - b1 / (1 - x))));
+        x -= t;
+        if (x <= 0) x = 0.5 * (x + t);
+        if (x >= 1) x = 0.5 * (x + t + 1);
+        if (Math.abs(t) < EPSILON * x && i > 0) return x;
+    }
+
+    return Math.abs(regularizedIncompleteBeta(x, a, b) - p) < 1e-8 ? x : NaN;
+}
+
+""",
+    "betaincAsymptotic": """
+function betaincAsymptotic(x, a, b) {
+  if (x <= 0) return 0;
+  if (x >= 1) return 1;
+
+  const wCutoff = 0.05;
+
+  
+  let saddle = (x) => {
+    let sHat = (b * x - a * (1 - x)) / (x * (1 - x) * (a + b));
+    let u = -(1 - x) * sHat;
+    let v = x * sHat;
+    let K = -a * log1pmx(u) - b * log1pmx(v) - sHat**2 * x * (1 - x) * (a + b);
+    let K2 = a * ((1 - x) / (1 + u))**2 + b * (x / (1 + v))**2;
+
+    return [Math.sign(sHat) * Math.sqrt(Math.max(-2 * K, 0)), sHat * Math.sqrt(K2)];
+  };
+
+  let stdNormCdf = (w) => erfc(-w / Math.SQRT2) / 2;
+  let stdNormPdf = (w) => Math.exp(-w * w / 2) / Math.sqrt(2 * Math.PI);
+
+  let [w, u] = saddle(x);
+  if (Math.abs(w) >= wCutoff) return stdNormCdf(w) + stdNormPdf(w) * (1 / w - 1 / u);
+
+  
+  let xi = a / (a + b);
+  let delta = 1.5 * wCutoff * Math.sqrt(xi * (1 - xi) / (a + b + 1));
+  let K2 = a * (1 - xi)**2 + b * xi**2;
+  let K3 = 2 * a * (1 - xi)**3 - 2 * b * xi**3;
+  let h0 = K3 / Math.pow(K2, 1.5) / 6;
+
+  let [wLeft, uLeft] = saddle(xi - delta);
+  let [wRight, uRight] = saddle(xi + delta);
+  let hLeft = 1 / wLeft - 1 / uLeft;
+  let hRight = 1 / wRight - 1 / uRight;
+
+  let t = (x - xi) / delta;
+  let h = h0 + t * (hRight - hLeft) / 2 + t**2 * ((hRight + hLeft) / 2 - h0);
+
+  return stdNormCdf(w) + stdNormPdf(w) * h;
+}
+
+""",
+    "betaincAsymptoticError": """
+function betaincAsymptoticError(a, b) {
+  return 0.005 * Math.pow(Math.min(a, b), -1.5);
+}
+
+""",
+    "studentTCdfAsymptotic": """
+function studentTCdfAsymptotic(t, nu) {
+  let stdNormCdf = erfc(-t / Math.SQRT2) / 2;
+
+  
+  if (Math.abs(t) > 40) return stdNormCdf;
+
+  let g1 = (t**3 + t) / 4;
+  let g2 = (3 * t**7 - 7 * t**5 - 5 * t**3 - 3 * t) / 96;
+
+  return stdNormCdf - Math.exp(-t * t / 2) / Math.sqrt(2 * Math.PI) * (g1 / nu + g2 / nu**2);
+}
+
+""",
+    "studentTCdfAsymptoticError": """
+function studentTCdfAsymptoticError(nu) {
+  return 1 / nu**3;
+}
+
+""",
+    "lnGammaHalfRatio": """
+function lnGammaHalfRatio(z) {
+  if (z < 10) return lngamma(z + 0.5) - lngamma(z);
+
+  return Math.log(z) / 2 - 1 / (8 * z) + 1 / (192 * z**3) - 1 / (640 * z**5) + 17 / (14336 * z**7);
+}
+
+""",
+    "incompleteBeta": """
+function incompleteBeta(x, a, b) {
+    return regularizedIncompleteBeta(x, a, b) * Math.exp(lnbeta(a, b));
+}
+
+""",
+    "lngamma": """
+function lngamma(z) {
+
+    if(z < 0) return Number('0/0');
+
+    if (z < 0.5) return Math.log(Math.PI) - Math.log(Math.sin(Math.PI * z)) - lngamma(1-z);
+
+    var p = [676.5203681218851,
+             -1259.1392167224028,
+             771.32342877765313,
+             -176.61502916214059,
+             12.507343278686905,
+             -0.13857109526572012,
+             9.9843695780195716e-6,
+             1.5056327351493116e-7];
+
+    z -= 1.0;
+    var Ag = 0.99999999999980993;
+    for (var i = 0; i < p.length; i++) {
+        Ag += p[i] / (z + i + 1);
+    }
+    var t = z + p.length - 0.5;
+
+    return 0.5 * Math.log(2*Math.PI) + (z + 0.5)*Math.log(t) - t + Math.log(Ag);
+}
+
+""",
+    "gammaincU": """
+function gammaincU(x, s, regularized) {
+
+  var EPSILON = 1e-12;
+
+  if (x <= 1.1 || x <= s) {
+    if (regularized !== false) {
+      return 1 - gammaincL(x, s, regularized);
+    } else {
+      return Math.exp(lngamma(s)) - gammaincL(x, s, regularized);
+    }
+  }
+
+  var f = 1 + x - s,
+    C = f,
+    D = 0,
+    i = 1,
+    a, b, chg;
+  for (i = 1; i < 10000; i++) {
+    a = i * (s - i);
+    b = (i<<1) + 1 + x - s;
+    D = b + a * D;
+    C = b + a / C;
+    D = 1 / D;
+    chg = C * D;
+    f *= chg;
+    if (Math.abs(chg - 1) < EPSILON) {
+      break;
+    }
+  }
+  if (regularized !== false) {
+    return Math.exp(s * Math.log(x) - x - lngamma(s) - Math.log(f));
+  } else {
+    return Math.exp(s * Math.log(x) - x - Math.log(f));
+  }
+}
+
+""",
+    "gammaincL": """
+function gammaincL(x, s, regularized) {
+
+  var EPSILON = 1e-12;
+
+  if (x === 0) {
+    return 0;
+  }
+  if (x < 0 || s <= 0) {
+    return NaN;
+  }
+
+  if (x > 1.1 && x > s) {
+    if (regularized !== false) {
+      return 1 - gammaincU(x, s, regularized);
+    } else {
+      return Math.exp(lngamma(s)) - gammaincU(x, s, regularized);
+    }
+  }
+
+  var ft,
+    r = s,
+    c = 1,
+    pws = 1;
+
+  if (regularized !== false) {
+    ft = s * Math.log(x) - x - lngamma(s);
+  } else {
+    ft = s * Math.log(x) - x;
+  }
+  ft = Math.exp(ft);
+  do {
+    r += 1;
+    c *= x/r;
+    pws += c;
+  } while (c / pws > EPSILON);
+
+  return pws * ft / s;
+}
+
+""",
+    "gammaincLInv": """
+function gammaincLInv(p, s) {
+
+  if (p <= 0) return 0;
+  if (p >= 1) return Infinity;
+
+  var EPSILON = 1e-10;
+  var s1 = s - 1,
+    gln = lngamma(s),
+    x, t, u, err, lns1, afac;
+
+  if (s > 1) {
+    lns1 = Math.log(s1);
+    afac = Math.exp(s1 * (lns1 - 1) - gln);
+    var pp = p < 0.5 ? p : 1 - p;
+    t = Math.sqrt(-2 * Math.log(pp));
+    x = (2.30753 + t * 0.27061) / (1 + t * (0.99229 + t * 0.04481)) - t;
+    if (p < 0.5) x = -x;
+    x = Math.max(1e-3, s * Math.pow(1 - 1 / (9 * s) - x / (3 * Math.sqrt(s)), 3));
+  }
+  else {
+    t = 1 - s * (0.253 + s * 0.12);
+    if (p < t) x = Math.pow(p / t, 1 / s);
+    else x = 1 - Math.log(1 - (p - t) / (1 - t));
+  }
+
+  for (var i = 0; i < 20; i++) {
+    if (x <= 0) return 0;
+
+    err = p < 0.5 ? gammaincL(x, s, true) - p : (1 - p) - gammaincU(x, s, true);
+    if (s > 1) t = afac * Math.exp(-(x - s1) + s1 * (Math.log(x) - lns1));
+    else t = Math.exp(-x + s1 * Math.log(x) - gln);
+    u = err / t;
+    t = u / (1 - 0.5 * Math.min(1, u * (s1 / x - 1)));
+    x -= t;
+    if (x <= 0) x = 0.5 * (x + t);
+    if (Math.abs(t) < EPSILON * x) return x;
+  }
+
+  return Math.abs(gammaincL(x, s, true) - p) < 1e-8 ? x : NaN;
+}
+
+""",
+    "gammaincAsymptotic": """
+function gammaincAsymptotic(x, s, upper) {
+  if (x <= 0) return upper ? 1 : 0;
+  if (x === Infinity) return upper ? 0 : 1;
+
+  let sigma = (x - s) / s;
+  let eta = Math.sign(sigma) * Math.sqrt(-2.0 * log1pmx(sigma));
+
+  
+  let c0, c1;
+  if (Math.abs(sigma) < 1e-3) {
+    c0 = -1 / 3 + eta / 12 - 2 * eta**2 / 135 + eta**3 / 864;
+    c1 = -1 / 540 - eta / 288 + 2.6455026455026455e-3 * eta**2;
+  }
+  else {
+    c0 = 1 / sigma - 1 / eta;
+    c1 = 1 / eta**3 - 1 / sigma**3 - 1 / sigma**2 - 1 / (12 * sigma);
+  }
+
+  let remainder = Math.exp(-s * eta**2 / 2) / Math.sqrt(2 * Math.PI * s) * (c0 + c1 / s);
+  let z = eta * Math.sqrt(s / 2);
+
+  if (upper) return erfc(z) / 2 + remainder;
+  return erfc(-z) / 2 - remainder;
+}
+
+""",
+    "gammaincAsymptoticError": """
+function gammaincAsymptoticError(s) {
+  return 0.01 * Math.pow(s, -2.5);
+}
+
+""",
+    "hyp1f1": """
+function hyp1f1(a, b, x) {
+  let i, j, la, n, nl;
+  let a0 = a, a1 = a, x0 = x, y0, y1, hg1, hg2, r1, r2, rg, xg, sum1, sum2;
+  let hg = 0.0;
+
+  
+  if (x < 0.0) {
+    a = b - a;
+    a0 = a;
+    x = Math.abs(x);
+  }
+  nl = 0;
+  la = 0;
+  if (a >= 2.0) {
+    
+    nl = 1;
+    la = Math.floor(a);
+    a -= la + 1;
+  }
+  y0 = 0.0;
+  y1 = 0.0;
+  for (n = 0; n < (nl + 1); n++) {
+    if (a0 >= 2.0) { a += 1.0; }
+    if ((x <= 30.0 + Math.abs(b)) || (a < 0.0)) {
+      hg = 1.0;
+      rg = 1.0;
+      for (j = 1; j < 501; j++) {
+        rg *= (a + j - 1.0) / (j * (b + j - 1.0)) * x;
+        hg += rg;
+        if (rg / hg < 1e-15) {
+          
+          if (x0 < 0.0) { hg *= Math.exp(x0); }
+          break;
+        }
+      }
+    } else {
+      
+      const cta = lngamma(a);
+      const ctb = lngamma(b);
+      xg = b - a;
+      const ctba = lngamma(xg);
+      sum1 = 1.0;
+      sum2 = 1.0;
+      r1 = 1.0;
+      r2 = 1.0;
+      for (i = 1; i < 9; i++) {
+        r1 = -r1 * (a + i - 1.0) * (a - b + i) / (x * i);
+        r2 = -r2 * (b - a + i - 1.0) * (a - i) / (x * i);
+        sum1 += r1;
+        sum2 += r2;
+      }
+      if (x0 >= 0.0) {
+        hg1 = Math.exp(ctb - ctba) * Math.pow(x, -a) * Math.cos(Math.PI * a) * sum1;
+        hg2 = Math.exp(ctb - cta + x) * Math.pow(x, a - b) * sum2;
+      } else {
+        
+        hg1 = Math.exp(ctb - ctba + x0) * Math.pow(x, -a) * Math.cos(Math.PI * a) * sum1;
+        hg2 = Math.exp(ctb - cta) * Math.pow(x, a - b) * sum2;
+      }
+      hg = hg1 + hg2;
+    }
+    if (n === 0) { y0 = hg; }
+    if (n === 1) { y1 = hg; }
+  }
+  if (a0 >= 2.0) {
+    
+    for (i = 1; i < la; i++) {
+      hg = ((2.0 * a - b + x) * y1 + (b - a) * y0) / a;
+      y0 = y1;
+      y1 = hg;
+      a += 1.0;
+    }
+  }
+  a = a1;
+  x = x0;
+  return hg;
+}
+
+""",
+    "chbevl": """
+function chbevl(x, A) {
+
+  let b0, b1, b2;
+  let n = A.length;
+  let i = n - 1;
+
+  b0 = A[0];
+  b1 = 0.0;
+
+  for (let j = 1; j <= i; j++) {
+    b2 = b1;
+    b1 = b0;
+    b0 = x * b1 - b2 + A[j];
+  }
+
+  return 0.5 * (b0 - b2);
+}
+
+""",
+    "polevl": """
+function polevl(x, coef) {
+
+    let result;
+    let n = coef.length;
+
+    let i = n;
+
+    result = coef[0];
+
+    for (let j = 1; j <= n; j++) {
+        result = result * x + coef[j];
+    }
+
+    return result;
+}
+
+""",
+    "besseli0": """
+function besseli0(x, expWeighted = false) {
+
+  let A = [
+    -4.41534164647933937950e-18,
+     3.33079451882223809783e-17,
+    -2.43127984654795469359e-16,
+     1.71539128555513303061e-15,
+    -1.16853328779934516808e-14,
+     7.67618549860493561688e-14,
+    -4.85644678311192946090e-13,
+     2.95505266312963983461e-12,
+    -1.72682629144155570723e-11,
+     9.67580903537323691224e-11,
+    -5.18979560163526290666e-10,
+     2.65982372468238665035e-9,
+    -1.30002500998624804212e-8,
+     6.04699502254191894932e-8,
+    -2.67079385394061173391e-7,
+     1.11738753912010371815e-6,
+    -4.41673835845875056359e-6,
+     1.64484480707288970893e-5,
+    -5.75419501008210370398e-5,
+     1.88502885095841655729e-4,
+    -5.76375574538582365885e-4,
+     1.63947561694133579842e-3,
+    -4.32430999505057594430e-3,
+     1.05464603945949983183e-2,
+    -2.37374148058994688156e-2,
+     4.93052842396707084878e-2,
+    -9.49010970480476444210e-2,
+     1.71620901522208775349e-1,
+    -3.04682672343198398683e-1,
+     6.76795274409476084995e-1
+  ];
+
+  let B = [
+    -7.23318048787475395456e-18,
+    -4.83050448594418207126e-18,
+     4.46562142029675999901e-17,
+     3.46122286769746109310e-17,
+    -2.82762398051658348494e-16,
+    -3.42548561967721913462e-16,
+     1.77256013305652638360e-15,
+     3.81168066935262242075e-15,
+    -9.55484669882830764870e-15,
+    -4.15056934728722208663e-14,
+     1.54008621752140982691e-14,
+     3.85277838274214270114e-13,
+     7.18012445138366623367e-13,
+    -1.79417853150680611778e-12,
+    -1.32158118404477131188e-11,
+    -3.14991652796324136454e-11,
+     1.18891471078464383424e-11,
+     4.94060238822496958910e-10,
+     3.39623202570838634515e-9,
+     2.26666899049817806459e-8,
+     2.04891858946906374183e-7,
+     2.89137052083475648297e-6,
+     6.88975834691682398426e-5,
+     3.36911647825569408990e-3,
+     8.04490411014108831608e-1
+  ];
+
+  if ( x < 0 ) x = -x;
+
+  let result;
+  if (x <= 8.0) {
+    let y = x / 2.0 - 2.0;
+    result = chbevl(y, A);
+  } else {
+    result = chbevl(32.0 / x - 2.0, B) / Math.sqrt(x)
+  }
+
+  if (expWeighted) return result;
+  else return Math.exp(x) * result;
+}
+
+""",
+    "cosm1": """
+function cosm1(x) {
+
+  let coeffs = [
+     4.7377507964246204691685E-14,
+    -1.1470284843425359765671E-11,
+     2.0876754287081521758361E-9,
+    -2.7557319214999787979814E-7,
+     2.4801587301570552304991E-5,
+    -1.3888888888888872993737E-3,
+     4.1666666666666666609054E-2
+   ];
+
+  let quarterPi = Math.PI / 4;
+
+  if (x < quarterPi || x > quarterPi) return Math.cos(x) - 1.0;
+
+  let x2 = x * x;
+  return -0.5 * x2 + x2 * x2 * polevl(x2, coeffs);
+}
+
+""",
+    "bilinearInterp": """
+function bilinearInterp(table, values, u, v) {
+
+  let i = (table.nU - 1) * (u - table.uMin) / (table.uMax - table.uMin);
+  let j = (table.nV - 1) * (v - table.vMin) / (table.vMax - table.vMin);
+  i = Math.min(Math.max(i, 0), table.nU - 1);
+  j = Math.min(Math.max(j, 0), table.nV - 1);
+
+  let i0 = Math.min(Math.floor(i), table.nU - 2);
+  let j0 = Math.min(Math.floor(j), table.nV - 2);
+  let di = i - i0;
+  let dj = j - j0;
+  let k = i0 * table.nV + j0;
+
+  return (1 - di) * ((1 - dj) * values[k] + dj * values[k + 1])
+         + di * ((1 - dj) * values[k + table.nV] + dj * values[k + table.nV + 1]);
+}
+
+""",
+    "chebPoints": """
+function chebPoints(n, low = -1, high = 1) {
+  
+  let points = Array.from({ length: n }, (_, i) => Math.cos(Math.PI * i / (n - 1)));
+
+  
+  let m = (high - low) / 2.0;
+  let b = (high + low) / 2.0;
+
+  points = points.map((x) => m * x + b);
+
+  return points;
+}
+
+""",
+    "clenshawCurtisWeights": """
+function clenshawCurtisWeights(n) {
+    n -= 1; 
+
+    const theta = Array.from({ length: n + 1 }, (_, i) => Math.PI * i / n);
+    let w = new Array(n + 1).fill(0);
+    let v = new Array(n - 1).fill(1);
+
+    if (n % 2 === 0) {
+        w[0] = 1.0 / (n ** 2 - 1);
+        w[n] = w[0];
+        for (let k = 1; k < n / 2; k++) {
+            for (let j = 1; j < n; j++) {
+                v[j - 1] -= 2.0 * Math.cos(2.0 * k * theta[j]) / (4.0 * k ** 2 - 1);
+            }
+        }
+        for (let j = 1; j < n; j++) {
+            v[j - 1] -= Math.cos(n * theta[j]) / (n ** 2 - 1);
+        }
+    } else {
+        w[0] = 1.0 / n ** 2;
+        w[n] = w[0];
+        for (let k = 1; k <= (n - 1) / 2; k++) {
+            for (let j = 1; j < n; j++) {
+                v[j - 1] -= 2.0 * Math.cos(2.0 * k * theta[j]) / (4.0 * k ** 2 - 1);
+            }
+        }
+    }
+
+    for (let j = 1; j < n; j++) {
+        w[j] = 2.0 * v[j - 1] / n;
+    }
+
+    return w;
+}
+
+""",
+    "clenshawCurtisIntegrate": """
+function clenshawCurtisIntegrate(f, a, b, n = 100, args = [], weights = undefined) {
+
+  if (weights === undefined) {
+    
+    let ccWeights = clenshawCurtisWeights(n);
+
+    
+    weights = ccWeights.map((x) => (b - a) / 2.0 * x);
+  }
+
+  
+  let x = chebPoints(n);
+
+  
+  x = x.map((x) => (b - a) / 2.0 * x + (b + a) / 2.0);
+
+  
+  let fVals = x.map((x) => f(x, ...args));
+
+  
+  return dot(weights, fVals);
+}
+
+""",
+    "lnfactorial": """
+function lnfactorial(n) {
+  if (n > 254) { 
+    let x = n + 1;
+    return (x - 0.5) * Math.log(x) - x + 0.5 * Math.log(2 * Math.PI) + 1.0 / (12.0 * x);
+  }
+  else { 
     const lnfact = [0.000000000000000,
                     0.000000000000000,
                     0.693147180559945,
@@ -4485,666 +5834,1816 @@ function lnfactorial(n) {
 }
 
 """,
-    "transpose": """
-function transpose(A) {
-    return A[0].map((_, colIndex) => A.map(row => row[colIndex]));
+    "makeRng": """
+function makeRng(seed = Date.now()) {
+  let z = seed >>> 0;
+  let state = [];
+  for (let i = 0; i < 4; i++) {
+    z = (z + 0x9e3779b9) >>> 0;
+    let t = z;
+    t = Math.imul(t ^ (t >>> 16), 0x21f0aaad);
+    t = Math.imul(t ^ (t >>> 15), 0x735a2d97);
+    state.push((t ^ (t >>> 15)) >>> 0);
+  }
+  let [a, b, c, d] = state;
+
+  return () => {
+    let r = Math.imul(b, 5);
+    r = Math.imul((r << 7) | (r >>> 25), 9);
+    let t = b << 9;
+    c ^= a;
+    d ^= b;
+    b ^= c;
+    a ^= d;
+    c ^= t;
+    d = (d << 11) | (d >>> 21);
+
+    return ((r >>> 0) + 0.5) / 4294967296;
+  };
+}
+
+""",
+    "zigguratNormalTables": """
+function zigguratNormalTables() {
+  if (globalThis.distributionExplorerZiggurat !== undefined) {
+    return globalThis.distributionExplorerZiggurat;
+  }
+
+  let nLayers = 128;
+  let r = 3.442619855899;
+  let v = 9.91256303526217e-3;
+
+  let x = new Float64Array(nLayers + 1);
+  let f = new Float64Array(nLayers + 1);
+  x[0] = v / Math.exp(-0.5 * r * r);
+  x[1] = r;
+  for (let i = 2; i < nLayers; i++) {
+    x[i] = Math.sqrt(-2 * Math.log(v / x[i - 1] + Math.exp(-0.5 * x[i - 1] * x[i - 1])));
+  }
+  x[nLayers] = 0;
+
+  let ratio = new Float64Array(nLayers);
+  for (let i = 0; i <= nLayers; i++) {
+    f[i] = Math.exp(-0.5 * x[i] * x[i]);
+    if (i < nLayers) ratio[i] = x[i + 1] / x[i];
+  }
+
+  globalThis.distributionExplorerZiggurat = {nLayers: nLayers, r: r, x: x, f: f, ratio: ratio};
+
+  return globalThis.distributionExplorerZiggurat;
+}
+
+""",
+    "standardNormal": """
+function standardNormal(rng, zig) {
+  while (true) {
+    let u = 2 * rng() - 1;
+    let i = Math.floor(rng() * zig.nLayers);
+
+    
+    if (Math.abs(u) < zig.ratio[i]) return u * zig.x[i];
+
+    
+    if (i === 0) {
+      let xTail, yTail;
+      do {
+        xTail = Math.log(rng()) / zig.r;
+        yTail = Math.log(rng());
+      } while (-2 * yTail < xTail * xTail);
+
+      return u < 0 ? xTail - zig.r : zig.r - xTail;
+    }
+
+    
+    let x = u * zig.x[i];
+    if (zig.f[i + 1] + rng() * (zig.f[i] - zig.f[i + 1]) < Math.exp(-0.5 * x * x)) return x;
+  }
+}
+
+""",
+    "standardGamma": """
+function standardGamma(alpha, rng, zig) {
+  if (alpha < 1) {
+    return standardGamma(alpha + 1, rng, zig) * Math.pow(rng(), 1 / alpha);
+  }
+
+  let d = alpha - 1 / 3;
+  let c = 1 / Math.sqrt(9 * d);
+  while (true) {
+    let x, v;
+    do {
+      x = standardNormal(rng, zig);
+      v = 1 + c * x;
+    } while (v <= 0);
+
+    v = v * v * v;
+    let u = rng();
+    if (u < 1 - 0.0331 * x * x * x * x) return d * v;
+    if (Math.log(u) < 0.5 * x * x + d * (1 - v + Math.log(v))) return d * v;
+  }
+}
+
+""",
+    "aliasTable": """
+function aliasTable(probs) {
+  let nProbs = probs.length;
+  let total = 0.0;
+  for (let i = 0; i < nProbs; i++) {
+    if (probs[i] > 0) total += probs[i];
+  }
+
+  let prob = new Float64Array(nProbs);
+  let alias = new Int32Array(nProbs);
+  let small = new Int32Array(nProbs);
+  let large = new Int32Array(nProbs);
+  let nSmall = 0;
+  let nLarge = 0;
+  for (let i = 0; i < nProbs; i++) {
+    prob[i] = probs[i] > 0 ? probs[i] * nProbs / total : 0.0;
+    if (prob[i] < 1) small[nSmall++] = i;
+    else large[nLarge++] = i;
+  }
+
+  while (nSmall > 0 && nLarge > 0) {
+    let s = small[--nSmall];
+    let l = large[--nLarge];
+    alias[s] = l;
+    prob[l] = prob[l] + prob[s] - 1;
+    if (prob[l] < 1) small[nSmall++] = l;
+    else large[nLarge++] = l;
+  }
+
+  
+  while (nLarge > 0) prob[large[--nLarge]] = 1;
+  while (nSmall > 0) prob[small[--nSmall]] = 1;
+
+  return {prob: prob, alias: alias};
+}
+
+""",
+    "aliasSample": """
+function aliasSample(table, rng) {
+  let w = rng() * table.prob.length;
+  let i = Math.floor(w);
+
+  return w - i < table.prob[i] ? i : table.alias[i];
+}
+
+""",
+    "subscript": """
+function subscript(n) {
+  return String(n).split('').map(d => '₀₁₂₃₄₅₆₇₈₉'[Number(d)]).join('');
+}
+
+""",
+    "fftTwiddles": """
+function fftTwiddles(n) {
+  let cache = globalThis.distributionExplorerTwiddles;
+  if (cache === undefined || cache.n !== n) {
+    let cos = new Float64Array(n / 2);
+    let sin = new Float64Array(n / 2);
+    for (let k = 0; k < n / 2; k++) {
+      cos[k] = Math.cos(2 * Math.PI * k / n);
+      sin[k] = Math.sin(2 * Math.PI * k / n);
+    }
+    cache = {n: n, cos: cos, sin: sin};
+    globalThis.distributionExplorerTwiddles = cache;
+  }
+
+  return cache;
+}
+
+""",
+    "fftRadix2": """
+function fftRadix2(re, im, inverse = false) {
+  let n = re.length;
+  if (n <= 1) return;
+
+  
+  for (let i = 1, j = 0; i < n; i++) {
+    let bit = n >> 1;
+    for (; j & bit; bit >>= 1) j ^= bit;
+    j ^= bit;
+    if (i < j) {
+      let t = re[i]; re[i] = re[j]; re[j] = t;
+      t = im[i]; im[i] = im[j]; im[j] = t;
+    }
+  }
+
+  let {cos, sin} = fftTwiddles(n);
+  let sign = inverse ? 1 : -1;
+  for (let len = 2; len <= n; len <<= 1) {
+    let half = len >> 1;
+    let stride = n / len;
+    for (let i = 0; i < n; i += len) {
+      for (let k = 0; k < half; k++) {
+        let wr = cos[k * stride];
+        let wi = sign * sin[k * stride];
+        let a = i + k;
+        let b = a + half;
+        let tr = re[b] * wr - im[b] * wi;
+        let ti = re[b] * wi + im[b] * wr;
+        re[b] = re[a] - tr;
+        im[b] = im[a] - ti;
+        re[a] += tr;
+        im[a] += ti;
+      }
+    }
+  }
+
+  if (inverse) {
+    for (let i = 0; i < n; i++) {
+      re[i] /= n;
+      im[i] /= n;
+    }
+  }
+}
+
+""",
+    "fftConvolve": """
+function fftConvolve(a, b, nOut = a.length + b.length - 1) {
+  let nA = Math.min(a.length, nOut);
+  let nB = Math.min(b.length, nOut);
+  let out = new Float64Array(nOut);
+  if (nA === 0 || nB === 0) return out;
+
+  let n = 1;
+  while (n < nA + nB - 1) n <<= 1;
+
+  let re = new Float64Array(n);
+  let im = new Float64Array(n);
+  for (let i = 0; i < nA; i++) re[i] = a[i];
+  for (let i = 0; i < nB; i++) im[i] = b[i];
+
+  fftRadix2(re, im);
+
+  for (let k = 0; k <= n / 2; k++) {
+    let j = (n - k) % n;
+    let dRe = re[k] * re[k] - im[k] * im[k] - re[j] * re[j] + im[j] * im[j];
+    let dIm = 2 * (re[k] * im[k] + re[j] * im[j]);
+
+    
+    re[k] = dIm / 4;
+    im[k] = -dRe / 4;
+    re[j] = dIm / 4;
+    im[j] = dRe / 4;
+  }
+
+  fftRadix2(re, im, true);
+
+  for (let i = 0; i < Math.min(nOut, n); i++) out[i] = re[i];
+
+  return out;
+}
+
+""",
+    "componentParams": """
+function componentParams(params, components) {
+  let parts = [];
+  let offset = 0;
+  for (let component of components) {
+    parts.push(params.slice(offset, offset + component.paramNames.length));
+    offset += component.paramNames.length;
+  }
+
+  return parts;
+}
+
+""",
+    "mixtureWeights": """
+function mixtureWeights(params, nComponents) {
+  let weights = params.slice(params.length - nComponents + 1);
+  let last = 1 - weights.reduce((a, b) => a + b, 0);
+  if (last < 0 && last > -1e-12) last = 0;
+  weights.push(last);
+
+  return weights.every(w => w >= 0 && w <= 1) ? weights : null;
+}
+
+""",
+    "sampleMixture": """
+function sampleMixture(out, components, parts, weights, rng) {
+  let counts = new Array(components.length).fill(0);
+  for (let i = 0; i < out.length; i++) {
+    let u = rng();
+    let j = 0;
+    while (j < components.length - 1 && u >= weights[j]) {
+      u -= weights[j];
+      j++;
+    }
+    counts[j]++;
+  }
+
+  let offset = 0;
+  for (let j = 0; j < components.length; j++) {
+    if (counts[j] > 0) components[j].sample(out.subarray(offset, offset + counts[j]), parts[j], rng);
+    offset += counts[j];
+  }
+
+  return out;
+}
+
+""",
+    "transpose": """
+function transpose(A) {
+    return A[0].map((_, colIndex) => A.map(row => row[colIndex]));
+}
+
+""",
+    "mvMult": """
+function mvMult(A, v) {
+  return A.map(Arow => dot(Arow, v));
+}
+
+""",
+    "svMult": """
+function svMult(a, v) {
+  return v.map(x => a * x);
+}
+
+""",
+    "smMult": """
+function smMult(a, A) {
+  return A.map(Arow => svMult(a, Arow));
+}
+
+""",
+    "svAdd": """
+function svAdd(a, v) {
+  return v.map(x => a + x);
+}
+
+""",
+    "mmMult": """
+function mmMult(A, B) {
+  let mA = A.length;
+  let nA = A[0].length;
+  let mB = B.length;
+  let nB = B[0].length;
+
+  if (nA !== mB) {
+      throw new Error('Matrix dimension mismatch.');
+  }
+
+  let result = zeros(mA, nB);
+
+  for (let i = 0; i < mA; i++) {
+    for (let j = 0; j < nB; j++) {
+      for (let k = 0; k < nA; k++) {
+        result[i][j] += A[i][k] * B[k][j];
+      }
+    }
+  }
+
+  return result;
+}
+
+""",
+    "vectorAdd": """
+function vectorAdd() {
+  let m = arguments.length;
+  let n = arguments[0].length;
+ 
+  let result = new Array(n).fill(0.0);
+ 
+  for (let i = 0; i < n; i++) {
+    for (let j = 0; j < m; j++) {
+        result[i] += arguments[j][i];
+    }
+  }
+
+  return result;
+}
+
+""",
+    "elementwiseVectorDivide": """
+function elementwiseVectorDivide(v1, v2) {
+  return v1.map((value, i) => value / v2[i]);
+}
+
+""",
+    "elementwiseVectorMult": """
+function elementwiseVectorMult(v1, v2) {
+  return v1.map((value, i) => value * v2[i]);
+}
+
+""",
+    "svMultAdd": """
+function svMultAdd(scalars, vectors) {
+  let m = scalars.length;
+  let n = vectors[0].length;
+
+  if (vectors.length != m) {
+      console.warn("svMultAdd: Different number of scalars and vectors.");
+      return null;
+  }
+
+  let result = new Array(n).fill(0.0);
+  for (let i = 0; i < n; i++) {
+    for (let j = 0; j < m; j++) {
+      result[i] += scalars[j] * vectors[j][i];
+    }
+  }
+
+  return result;
+}
+
+""",
+    "absVector": """
+function absVector(v) {
+  return v.map(x => Math.abs(x));
+}
+
+""",
+    "dot": """
+function dot(v1, v2) {
+  const n = v1.length;
+  let result = 0.0;
+  for (let i = 0; i < n; i++) result += v1[i] * v2[i];
+
+  return result;
+}
+
+""",
+    "norm": """
+function norm(v) {
+  return Math.sqrt(dot(v, v));
+}
+
+""",
+    "quadForm": """
+function quadForm(A, x) {
+   return dot(x, mvMult(A, x)); 
+}
+
+""",
+    "shallowCopyMatrix": """
+function shallowCopyMatrix(A) {
+  var Ac = [];
+  var n = A.length;
+  for (i = 0; i < n; i++) {
+      Ac.push([...A[i]]);
+  }
+
+  return Ac;
+}
+
+""",
+    "deepCopy": """
+function deepCopy(x) {
+  return JSON.parse(JSON.stringify(x));
+}
+
+""",
+    "zeros": """
+function zeros(...dims) {
+  let A = [];
+
+  
+  for (let i = dims.length - 1; i >= 0; i--) {
+    let size = dims[i];
+    if (i === dims.length - 1) {
+      
+      A = new Array(size).fill(0.0);
+    } else {
+      
+      A = new Array(size).fill().map(() => deepCopy(A));
+    }
+  }
+
+  return A;
+}
+
+""",
+    "lowerTriSolve": """
+function lowerTriSolve(L, b) {
+    const floatEps = 1.0e-14;
+    const n = L.length;
+
+    
+    let x = Array.from(b);
+
+    
+    for (let j = 0; j < n - 1; j++) {
+        if (Math.abs(L[j][j]) > floatEps) {
+            x[j] /= L[j][j];
+            for (let i = j + 1; i < n; i++) {
+                x[i] -= x[j] * L[i][j];
+            }
+        } else {
+            x[j] = 0.0;
+        }
+    }
+
+    if (n > 0) {
+        if (Math.abs(L[n - 1][n - 1]) > floatEps) {
+            x[n - 1] /= L[n - 1][n - 1];
+        } else {
+            x[n - 1] = 0.0;
+        }
+    }
+
+    return x;
+}
+
+""",
+    "upperTriSolve": """
+function upperTriSolve(U, b) {
+    const floatEps = 1.0e-14;
+    const n = U.length;
+
+    
+    let x = Array.from(b);
+
+    
+    for (let j = n - 1; j > 0; j--) {
+        if (Math.abs(U[j][j]) > floatEps) {
+            x[j] /= U[j][j];
+            for (let i = 0; i < j; i++) {
+                x[i] -= x[j] * U[i][j];
+            }
+        } else {
+            x[j] = 0.0;
+        }
+    }
+
+    if (n > 0) {
+        if (Math.abs(U[0][0]) > floatEps) {
+            x[0] /= U[0][0];
+        } else {
+            x[0] = 0.0;
+        }
+    }
+
+    return x;
+}
+
+""",
+    "modifiedCholesky": """
+function modifiedCholesky(A) {
+    const floatEps = 1.0e-14;
+    const n = A.length;
+
+    
+    let L = deepCopy(A); 
+    let p = arange(0, n);
+
+    
+    let success = true;
+
+    let xi = 0;
+    for (let i = 0; i < n; i++) {
+        for (let j = 0; j < i; j++) {
+            let temp = Math.abs(L[i][j]);
+            xi = Math.max(xi, temp);
+        }
+    }
+
+    let eta = 0;
+    for (let i = 0; i < n; i++) {
+        let temp = Math.abs(L[i][i]);
+        eta = Math.max(eta, temp);
+    }
+
+    let beta;
+    if (n > 1) {
+        beta = Math.sqrt(Math.max(eta, xi / Math.sqrt(n * n - 1)));
+    } else {
+        beta = Math.sqrt(eta);
+    }
+    beta = Math.max(beta, floatEps);
+
+    for (let k = 0; k < n; k++) {
+        
+        let muVal = L[k][k];
+        let mu = k;
+        for (let i = k + 1; i < n; i++) {
+            let temp = L[i][i];
+            if (muVal < temp) {
+                mu = i;
+                muVal = temp;
+            }
+        }
+
+        
+        let iTemp = p[mu];
+        p[mu] = p[k];
+        p[k] = iTemp;
+
+        for (let i = 0; i < k; i++) {
+            let temp = L[k][i];
+            L[k][i] = L[mu][i];
+            L[mu][i] = temp;
+        }
+
+        let temp = L[k][k];
+        L[k][k] = L[mu][mu];
+        L[mu][mu] = temp;
+        for (let i = k + 1; i < mu; i++) {
+            let temp = L[i][k];
+            L[i][k] = L[mu][i];
+            L[mu][i] = temp;
+        }
+
+        for (let i = mu + 1; i < n; i++) {
+            let temp = L[i][k];
+            L[i][k] = L[i][mu];
+            L[i][mu] = temp;
+        }
+
+        
+        let cSum = 0;
+        for (let i = k + 1; i < n; i++) {
+            cSum = Math.max(cSum, Math.abs(L[i][k]));
+        }
+        cSum /= beta;
+        cSum = cSum * cSum;
+
+        
+        if (L[k][k] < 0) {
+            success = false;
+        }
+
+        temp = Math.abs(L[k][k]);
+        temp = Math.max(temp, floatEps * eta);
+        temp = Math.max(temp, cSum);
+        L[k][k] = Math.sqrt(temp);
+
+        
+        for (let i = k + 1; i < n; i++) {
+            L[i][k] /= L[k][k];
+        }
+
+        
+        for (let j = k + 1; j < n; j++) {
+            for (let i = j; i < n; i++) {
+                L[i][j] -= L[i][k] * L[j][k];
+            }
+        }
+
+        
+        for (let i = 0; i < n - 1; i++) {
+            for (let j = i + 1; j < n; j++) {
+                L[i][j] = 0.0;
+            }
+        }
+    }
+
+    return [L, p, success];
+}
+
+""",
+    "modifiedCholeskySolve": """
+function modifiedCholeskySolve(L, p, b) {
+    const n = L.length;
+
+    let U = transpose(L);
+    let xp = new Array(n).fill(0);
+    for (let i = 0; i < n; i++) {
+        xp[i] = b[p[i]];
+    }
+
+    
+    let x = lowerTriSolve(L, xp);
+
+    
+    xp = upperTriSolve(U, x);
+
+    for (let i = 0; i < n; i++) {
+        x[p[i]] = xp[i];
+    }
+
+    return x;
+}
+
+""",
+    "solvePosDef": """
+function solvePosDef(A, b) {
+  let [L, p, success] = modifiedCholesky(A);
+
+  if (!success) {
+    return [zeros(b.length), success];
+  }
+
+  return [modifiedCholeskySolve(L, p, b), success];
+}
+
+""",
+    "LUPDecompose": """
+function LUPDecompose(A, eps) {
+    var i, j, k, imax;
+    var maxA, absA;
+    var Arow;
+    var p = [];
+    var n = A.length;
+    var LU = shallowCopyMatrix(A);
+
+    
+    for (i = 0; i <= n; i++) p.push(i);
+
+    for (i = 0; i < n; i++) {
+        maxA = 0.0;
+        imax = i;
+
+        for (k = i; k < n; k++) {
+            absA = Math.abs(LU[k][i]);
+            if (absA > maxA) {
+                maxA = absA;
+                imax = k;
+            }
+        }
+
+        
+        if (maxA < eps) return [null, null];
+
+        if (imax != i) {
+            
+            j = p[i];
+            p[i] = p[imax];
+            p[imax] = j;
+
+            
+            Arow = LU[i];
+            LU[i] = LU[imax];
+            LU[imax] = Arow;
+
+            
+            p[n]++;
+        }
+
+        for (j = i + 1; j < n; j++) {
+            LU[j][i] /= LU[i][i];
+
+            for (k = i + 1; k < n; k++) LU[j][k] -= LU[j][i] * LU[i][k];
+        }
+    }
+
+    return [LU, p];
 }
 
 """,
-    "mvMult": """
-function mvMult(A, v) {
-  return A.map(Arow => dot(Arow, v));
+    "LUPSolve": """
+function LUPSolve(LU, p, b) {
+    var n = b.length;
+    var x = [];
+
+    for (var i = 0; i < n; i++) {
+        x.push(b[p[i]]);
+        for (var k = 0; k < i; k++) x[i] -= LU[i][k] * x[k];
+    }
+
+    for (i = n - 1; i >= 0; i--) {
+        for (k = i + 1; k < n; k++) x[i] -= LU[i][k] * x[k];
+
+        x[i] /= LU[i][i];
+    }
+
+    return x;
 }
 
 """,
-    "svMult": """
-function svMult(a, v) {
-  return v.map(x => a * x);
+    "solve": """
+function solvePosDef(A, b) {
+  let [L, p, success] = modifiedCholesky(A);
+
+  if (!success) {
+    return [zeros(b.length), success];
+  }
+
+  return [modifiedCholeskySolve(L, p, b), success];
 }
 
 """,
-    "smMult": """
-function smMult(a, A) {
-  return A.map(Arow => svMult(a, Arow));
+    "gammaQuantileSetTable": """
+function gammaQuantileSetTable() {
+  
+  return {
+    uMin: -6,
+    uMax: 6,
+    nU: 49,
+    vMin: -2,
+    vMax: 2,
+    nV: 9,
+    logAlpha: [12.003, 12.002, 12.002, 12.001, 12, 11.999, 11.998, 11.998, 11.997, 11.504, 11.503, 11.502, 11.501, 11.5, 11.499, 11.498, 11.497, 11.496, 11.005, 11.004, 11.003, 11.001, 11, 10.999, 10.997, 10.996, 10.995, 10.507, 10.505, 10.504, 10.502, 10.5, 10.498, 10.497, 10.495, 10.493, 10.009, 10.007, 10.005, 10.002, 10, 9.9978, 9.9955, 9.9933, 9.991, 9.5115, 9.5087, 9.5058, 9.5029, 9.5, 9.4971, 9.4943, 9.4914, 9.4885, 9.0148, 9.0111, 9.0074, 9.0038, 9.0001, 8.9964, 8.9926, 8.9889, 8.9852, 8.519, 8.5143, 8.5096, 8.5048, 8.5001, 8.4953, 8.4906, 8.4858, 8.4809, 8.0244, 8.0184, 8.0123, 8.0063, 8.0002, 7.994, 7.9879, 7.9817, 7.9755, 7.5313, 7.5236, 7.5159, 7.5081, 7.5003, 7.4924, 7.4845, 7.4766, 7.4686, 7.0401, 7.0303, 7.0204, 7.0105, 7.0004, 6.9903, 6.9802, 6.9699, 6.9596, 6.5514, 6.5389, 6.5263, 6.5136, 6.5007, 6.4878, 6.4747, 6.4614, 6.4481, 6.0659, 6.05, 6.034, 6.0177, 6.0012, 5.9845, 5.9677, 5.9506, 5.9332, 5.5844, 5.5643, 5.5439, 5.5231, 5.502, 5.4806, 5.4588, 5.4367, 5.4141, 5.1081, 5.0827, 5.0567, 5.0303, 5.0033, 4.9758, 4.9477, 4.9189, 4.8896, 4.6382, 4.6062, 4.5735, 4.5399, 4.5054, 4.4701, 4.4337, 4.3964, 4.358, 4.1765, 4.1365, 4.0953, 4.0528, 4.0089, 3.9635, 3.9166, 3.8679, 3.8174, 3.7249, 3.6753, 3.6239, 3.5704, 3.5146, 3.4565, 3.3957, 3.3321, 3.2653, 3.2857, 3.2249, 3.1612, 3.0943, 3.0239, 2.9497, 2.8711, 2.7877, 2.6988, 2.8616, 2.7879, 2.7099, 2.6271, 2.5389, 2.4446, 2.3433, 2.2338, 2.115, 2.4551, 2.3672, 2.2731, 2.172, 2.0627, 1.9441, 1.8143, 1.6711, 1.5116, 2.0687, 1.9657, 1.8543, 1.7329, 1.5998, 1.4527, 1.2886, 1.1031, 0.89048, 1.7042, 1.5861, 1.4568, 1.3143, 1.1558, 0.97748, 0.77443, 0.53945, 0.26205, 1.362, 1.2296, 1.0833, 0.92019, 0.73637, 0.52663, 0.28366, -0.0030453, -0.34887, 1.0411, 0.89609, 0.73452, 0.55277, 0.34602, 0.10764, -0.17157, -0.50461, -0.90992, 0.73888, 0.58327, 0.40889, 0.21155, -0.014318, -0.27622, -0.58447, -0.95321, -1.4016, 0.4518, 0.2877, 0.10305, -0.10669, -0.34747, -0.62726, -0.95675, -1.3502, -1.8265, 0.17623, 0.0054479, -0.18724, -0.40654, -0.65859, -0.95147, -1.2958, -1.7058, -2.1996, -0.091006, -0.26699, -0.46593, -0.6926, -0.95313, -1.2555, -1.6104, -2.0314, -2.5365, -0.35232, -0.53235, -0.73619, -0.96857, -1.2356, -1.545, -1.9074, -2.3361, -2.8488, -0.60948, -0.79265, -1.0003, -1.2372, -1.5092, -1.824, -2.1919, -2.6261, -3.1442, -0.86381, -1.0494, -1.26, -1.5004, -1.7764, -2.0953, -2.4674, -2.9058, -3.4277, -1.1162, -1.3036, -1.5166, -1.7598, -2.0388, -2.361, -2.7363, -3.1778, -3.7027, -1.3675, -1.556, -1.7708, -2.0163, -2.2978, -2.6226, -3.0004, -3.4443, -3.9714, -1.6181, -1.8074, -2.0235, -2.2707, -2.5542, -2.8811, -3.2609, -3.7066, -4.2355, -1.8683, -2.0581, -2.2751, -2.5236, -2.8087, -3.1372, -3.5187, -3.9659, -4.4961, -2.1183, -2.3084, -2.526, -2.7755, -3.0619, -3.3917, -3.7745, -4.2229, -4.7542, -2.3684, -2.5585, -2.7764, -3.0267, -3.314, -3.645, -4.0288, -4.4781, -5.0103, -2.6184, -2.8085, -3.0266, -3.2773, -3.5655, -3.8973, -4.2819, -4.7321, -5.2649, -2.8684, -3.0585, -3.2767, -3.5277, -3.8164, -4.1489, -4.5343, -4.985, -5.5184, -3.1184, -3.3085, -3.5267, -3.7779, -4.067, -4.4001, -4.786, -5.2373, -5.771, -3.3684, -3.5585, -3.7767, -4.0279, -4.3173, -4.6508, -5.0372, -5.4889, -6.0231, -3.6184, -3.8085, -4.0267, -4.278, -4.5675, -4.9014, -5.2881, -5.7401, -6.2746, -3.8684, -4.0585, -4.2767, -4.528, -4.8176, -5.1517, -5.5387, -5.991, -6.5257, -4.1184, -4.3085, -4.5267, -4.778, -5.0676, -5.4019, -5.7892, -6.2417, -6.7766, -4.2912, -4.5066, -4.7445, -5.0095, -5.3075, -5.6462, -6.0358, -6.4899, -7.0257, -4.2912, -4.5066, -4.7445, -5.0095, -5.3075, -5.6462, -6.0358, -6.4899, -7.0257, -4.2912, -4.5066, -4.7445, -5.0095, -5.3075, -5.6462, -6.0358, -6.4899, -7.0257, -4.2912, -4.5066, -4.7445, -5.0095, -5.3075, -5.6462, -6.0358, -6.4899, -7.0257],
+  };
 }
 
 """,
-    "svAdd": """
-function svAdd(a, v) {
-  return v.map(x => a + x);
+    "betaQuantileSetTable": """
+function betaQuantileSetTable() {
+  
+  return {
+    uMin: -8,
+    uMax: 8,
+    nU: 17,
+    vMin: -5,
+    vMax: 2,
+    nV: 15,
+    logAlpha: [10, 9.0004, 8.0005, 7.0008, 6.0016, 5.0036, 4.0093, 3.0243, 2.0631, 1.1561, 0.34647, -0.34663, -0.9495, -1.4709, -1.8814, 10.001, 9.001, 8.0011, 7.0014, 6.0021, 5.0042, 4.0098, 3.0248, 2.0637, 1.1567, 0.34723, -0.3452, -0.94369, -1.4418, -1.8492, 10.002, 9.0025, 8.0026, 7.0029, 6.0037, 5.0058, 4.0114, 3.0264, 2.0653, 1.1584, 0.3493, -0.34138, -0.93002, -1.4041, -1.8149, 10.007, 9.0068, 8.0069, 7.0072, 6.0079, 5.01, 4.0157, 3.0307, 2.0696, 1.163, 0.35485, -0.33153, -0.90231, -1.3591, -1.7784, 10.018, 9.0182, 8.0183, 7.0186, 6.0194, 5.0215, 4.0271, 3.0422, 2.0813, 1.1752, 0.36943, -0.30781, -0.85583, -1.3074, -1.7396, 10.049, 9.0486, 8.0488, 7.049, 6.0498, 5.0519, 4.0576, 3.0728, 2.1121, 1.2072, 0.40577, -0.25763, -0.78952, -1.2493, -1.6983, 10.127, 9.127, 8.1271, 7.1274, 6.1281, 5.1302, 4.1359, 3.151, 2.1903, 1.2858, 0.48779, -0.16794, -0.70374, -1.1843, -1.6543, 10.313, 9.3133, 8.3134, 7.3137, 6.3144, 5.3163, 4.3215, 3.3353, 2.3713, 1.4596, 0.64828, -0.029143, -0.59757, -1.1117, -1.6074, 10.693, 9.6932, 8.6932, 7.6934, 6.6939, 5.6951, 4.6983, 3.7072, 2.7304, 1.789, 0.9218, 0.16952, -0.46758, -1.0303, -1.5572, 11.313, 10.313, 9.3133, 8.3133, 7.3133, 6.3133, 5.3133, 4.3134, 3.3141, 2.3187, 1.3446, 0.44807, -0.30687, -0.93841, -1.5032, 12.127, 11.127, 10.127, 9.1267, 8.1263, 7.1253, 6.1224, 5.1148, 4.0947, 3.0456, 1.9469, 0.84082, -0.10315, -0.83334, -1.4451, 13.049, 12.049, 11.048, 10.048, 9.0476, 8.046, 7.0415, 6.0295, 4.9975, 3.9148, 2.7217, 1.3898, 0.16476, -0.71133, -1.382, 14.018, 13.018, 12.018, 11.018, 10.017, 9.0152, 8.01, 6.9961, 5.9587, 4.8603, 3.6164, 2.1128, 0.53156, -0.56653, -1.3133, 15.007, 14.007, 13.007, 12.006, 11.006, 10.004, 8.9981, 7.9835, 6.944, 5.8391, 4.5732, 2.9747, 1.0432, -0.38956, -1.2378, 16.002, 15.002, 14.002, 13.002, 12.001, 10.999, 9.9937, 8.9788, 7.9385, 6.8312, 5.5565, 3.9158, 1.7297, -0.16472, -1.1541, 17.001, 16.001, 15.001, 14, 13, 11.998, 10.992, 9.9771, 8.9364, 7.8283, 6.5503, 4.8928, 2.5674, 0.13466, -1.0603, 18, 17, 16, 15, 13.999, 12.997, 11.992, 10.976, 9.9357, 8.8272, 7.548, 5.8841, 3.4966, 0.55037, -0.9537],
+    logBeta: [18, 17, 16, 15, 13.999, 12.997, 11.992, 10.976, 9.9357, 8.8272, 7.548, 5.8841, 3.4966, 0.55037, -0.9537, 17.001, 16.001, 15.001, 14, 13, 11.998, 10.992, 9.9771, 8.9364, 7.8283, 6.5503, 4.8928, 2.5674, 0.13466, -1.0603, 16.002, 15.002, 14.002, 13.002, 12.001, 10.999, 9.9937, 8.9788, 7.9385, 6.8312, 5.5565, 3.9158, 1.7297, -0.16472, -1.1541, 15.007, 14.007, 13.007, 12.006, 11.006, 10.004, 8.9981, 7.9835, 6.944, 5.8391, 4.5732, 2.9747, 1.0432, -0.38956, -1.2378, 14.018, 13.018, 12.018, 11.018, 10.017, 9.0152, 8.01, 6.9961, 5.9587, 4.8603, 3.6164, 2.1128, 0.53156, -0.56653, -1.3133, 13.049, 12.049, 11.048, 10.048, 9.0476, 8.046, 7.0415, 6.0295, 4.9975, 3.9148, 2.7217, 1.3898, 0.16476, -0.71133, -1.382, 12.127, 11.127, 10.127, 9.1267, 8.1263, 7.1253, 6.1224, 5.1148, 4.0947, 3.0456, 1.9469, 0.84082, -0.10315, -0.83334, -1.4451, 11.313, 10.313, 9.3133, 8.3133, 7.3133, 6.3133, 5.3133, 4.3134, 3.3141, 2.3187, 1.3446, 0.44807, -0.30687, -0.93841, -1.5032, 10.693, 9.6932, 8.6932, 7.6934, 6.6939, 5.6951, 4.6983, 3.7072, 2.7304, 1.789, 0.9218, 0.16952, -0.46758, -1.0303, -1.5572, 10.313, 9.3133, 8.3134, 7.3137, 6.3144, 5.3163, 4.3215, 3.3353, 2.3713, 1.4596, 0.64828, -0.029143, -0.59757, -1.1117, -1.6074, 10.127, 9.127, 8.1271, 7.1274, 6.1281, 5.1302, 4.1359, 3.151, 2.1903, 1.2858, 0.48779, -0.16794, -0.70374, -1.1843, -1.6543, 10.049, 9.0486, 8.0488, 7.049, 6.0498, 5.0519, 4.0576, 3.0728, 2.1121, 1.2072, 0.40577, -0.25763, -0.78952, -1.2493, -1.6983, 10.018, 9.0182, 8.0183, 7.0186, 6.0194, 5.0215, 4.0271, 3.0422, 2.0813, 1.1752, 0.36943, -0.30781, -0.85583, -1.3074, -1.7396, 10.007, 9.0068, 8.0069, 7.0072, 6.0079, 5.01, 4.0157, 3.0307, 2.0696, 1.163, 0.35485, -0.33153, -0.90231, -1.3591, -1.7784, 10.002, 9.0025, 8.0026, 7.0029, 6.0037, 5.0058, 4.0114, 3.0264, 2.0653, 1.1584, 0.3493, -0.34138, -0.93002, -1.4041, -1.8149, 10.001, 9.001, 8.0011, 7.0014, 6.0021, 5.0042, 4.0098, 3.0248, 2.0637, 1.1567, 0.34723, -0.3452, -0.94369, -1.4418, -1.8492, 10, 9.0004, 8.0005, 7.0008, 6.0016, 5.0036, 4.0093, 3.0243, 2.0631, 1.1561, 0.34647, -0.34663, -0.9495, -1.4709, -1.8814],
+  };
 }
 
 """,
-    "mmMult": """
-function mmMult(A, B) {
-  let mA = A.length;
-  let nA = A[0].length;
-  let mB = B.length;
-  let nB = B[0].length;
+    "paramsFromSliders": """
+function paramsFromSliders(sliders) {
+  let params = [];
+  for (let slider of sliders) {
+    params.push(slider.value);
+  }
 
-  if (nA !== mB) {
-      throw new Error('Matrix dimension mismatch.');
+  return params;
+}
+
+""",
+    "paramsFromBoxes": """
+function paramsFromBoxes(boxes) {
+  let params = [];
+  for (let box of boxes) {
+    if (isNaN(box.value)) {
+      throw new Error(box.value + ' is not a valid number.');
+    }
+    params.push(Number(box.value));
+  }
+
+  return params;
+}
+
+""",
+    "setYRanges": """
+function setYRanges(p_p, p_c, source_p) {
+    p_c.y_range.start = 0.0;
+    p_c.y_range.end = 1.0;        
+
+    if (logDensity) return;
+
+    let pdfMax = source_p.data['y_p'];
+    p_p.y_range.start = 0.0;
+    p_p.y_range.end = 1.04 * pdfMax;
+
+}
+
+""",
+    "checkQuantileInput": """
+function checkQuantileInput(x, p, xMin, xMax, varName, quantileSetterDiv) {
+  for (let i = 0; i < x.length; i++) {
+    if (p[i] <= 0 || p[i] >= 1) {
+      quantileSetterDiv.text = '<p style="color:tomato;">Must have 0 < quantile < 1.</p>';
+      return false; 
+    }
+
+    if (x[i] < xMin || x[i] > xMax) {
+      let qStr = '<p style="color:tomato;">Must have ' + xMin.toString() + ' ≤ yy ≤ ' + xMax.toString() + '.</p>';
+      quantileSetterDiv.text = qStr.replace(/yy/g, varName);
+      return false;
+    }
+  }
+
+
+  if (p.length === 2) {
+    if (p[1] <= 0 || p[1] >= 1) {
+        quantileSetterDiv.text = '<p style="color:tomato;">Must have 0 < quantile < 1.</p>';
+        return false;
+    }
+
+    if (p[0] >= p[1]) {
+        quantileSetterDiv.text = '<p style="color:tomato;">Lower quantile must be less than upper quantile.</p>';
+        return false;
+    }
+
+    if (x[0] >= x[1]) {
+        quantileSetterDiv.text = '<p style="color:tomato;">Lower yy must be less than upper yy.</p>'.replace(/yy/g, varName);
+        return false;        
+    }
   }
 
-  let result = zeros(mA, nB);
-
-  for (let i = 0; i < mA; i++) {
-    for (let j = 0; j < nB; j++) {
-      for (let k = 0; k < nA; k++) {
-        result[i][j] += A[i][k] * B[k][j];
-      }
+  if (p.length === 3) {
+    if (p[2] <= 0 || p[2] >= 1 || p[1] <= 0 || p[1] >= 1) {
+        quantileSetterDiv.text = '<p style="color:tomato;">Must have 0 < quantile < 1.</p>';
+        return false;
     }
-  }
 
-  return result;
-}
+    if (p[0] >= p[1] || p[1] >= p[2]) {
+        quantileSetterDiv.text = '<p style="color:tomato;">Quantiles must be ordered lower, middle, upper.</p>';
+        return false;
+    }
 
-""",
-    "vectorAdd": """
-function vectorAdd() {
-  let m = arguments.length;
-  let n = arguments[0].length;
- 
-  let result = new Array(n).fill(0.0);
- 
-  for (let i = 0; i < n; i++) {
-    for (let j = 0; j < m; j++) {
-        result[i] += arguments[j][i];
+    if (x[0] >= x[1] || x[1] >= x[2]) {
+        quantileSetterDiv.text = '<p style="color:tomato;">yy values must be ordered, lower, middle, upper.</p>'.replace(/yy/g, varName);
+        return false;
     }
   }
 
-  return result;
-}
-
-""",
-    "elementwiseVectorDivide": """
-function elementwiseVectorDivide(v1, v2) {
-  return v1.map((value, i) => value / v2[i]);
+    return true;
 }
 
 """,
-    "elementwiseVectorMult": """
-function elementwiseVectorMult(v1, v2) {
-  return v1.map((value, i) => value * v2[i]);
+    "plotFrameSize": """
+function plotFrameSize(p) {
+  try {
+    return [p.inner_width, p.inner_height];
+  }
+  catch (e) {
+    
+    return [p.frame_width || p.width || 300, p.frame_height || p.height || 175];
+  }
 }
 
 """,
-    "svMultAdd": """
-function svMultAdd(scalars, vectors) {
-  let m = scalars.length;
-  let n = vectors[0].length;
+    "adaptiveGrid": """
+function adaptiveGrid(f, xMin, xMax, width, height, tol = 0.5, maxPoints = null, logScale = false) {
+  if (maxPoints === null) maxPoints = 4 * width;
 
-  if (vectors.length != m) {
-      console.warn("svMultAdd: Different number of scalars and vectors.");
-      return null;
-  }
+  let nInit = Math.min(Math.max(16, Math.floor(width / 4)), maxPoints);
+  let x = linspace(xMin, xMax, nInit);
+  let y = f(x);
 
-  let result = new Array(n).fill(0.0);
-  for (let i = 0; i < n; i++) {
-    for (let j = 0; j < m; j++) {
-      result[i] += scalars[j] * vectors[j][i];
-    }
-  }
+  let minDx = (xMax - xMin) / width / 2;
 
-  return result;
-}
+  while (x.length < maxPoints) {
+    let yPlot = logScale ? y.map(val => Math.log10(val)) : y;
+    let finite = yPlot.map(val => isFinite(val));
 
-""",
-    "absVector": """
-function absVector(v) {
-  return v.map(x => Math.abs(x));
-}
+    
+    let yLow = Infinity;
+    let yHigh = -Infinity;
+    for (let i = 0; i < yPlot.length; i++) {
+      if (finite[i]) {
+        yLow = Math.min(yLow, logScale ? yPlot[i] : -Math.abs(yPlot[i]));
+        yHigh = Math.max(yHigh, logScale ? yPlot[i] : Math.abs(yPlot[i]));
+      }
+    }
+    if (yHigh === -Infinity) break;
+    let yScale = logScale ? yHigh - yLow : yHigh;
+    let pxPerY = yScale > 0 ? height / yScale : 1.0;
 
-""",
-    "dot": """
-function dot(v1, v2) {
-  const n = v1.length;
-  let result = 0.0;
-  for (let i = 0; i < n; i++) result += v1[i] * v2[i];
+    let intervalErr = new Array(x.length - 1).fill(0.0);
+    for (let i = 1; i < x.length - 1; i++) {
+      let err;
+      if (finite[i - 1] && finite[i] && finite[i + 1]) {
+        let chord = yPlot[i - 1] + (yPlot[i + 1] - yPlot[i - 1]) * (x[i] - x[i - 1]) / (x[i + 1] - x[i - 1]);
+        err = Math.abs(yPlot[i] - chord) * pxPerY;
+      }
+      else if (finite[i - 1] || finite[i] || finite[i + 1]) {
+        err = Infinity;
+      }
+      else {
+        err = 0.0;
+      }
+      intervalErr[i - 1] = Math.max(intervalErr[i - 1], err);
+      intervalErr[i] = Math.max(intervalErr[i], err);
+    }
 
-  return result;
-}
+    let refine = [];
+    for (let i = 0; i < intervalErr.length; i++) {
+      if (x[i + 1] - x[i] > minDx && intervalErr[i] > tol) refine.push(i);
+    }
+    if (refine.length === 0) break;
 
-""",
-    "norm": """
-function norm(v) {
-  return Math.sqrt(dot(v, v));
-}
+    
+    let nLeft = maxPoints - x.length;
+    if (refine.length > nLeft) {
+      refine = refine.sort((a, b) => intervalErr[b] - intervalErr[a]).slice(0, nLeft).sort((a, b) => a - b);
+    }
 
-""",
-    "quadForm": """
-function quadForm(A, x) {
-   return dot(x, mvMult(A, x)); 
-}
+    let xNew = refine.map(i => (x[i] + x[i + 1]) / 2);
+    let yNew = f(xNew);
 
-""",
-    "shallowCopyMatrix": """
-function shallowCopyMatrix(A) {
-  var Ac = [];
-  var n = A.length;
-  for (i = 0; i < n; i++) {
-      Ac.push([...A[i]]);
+    
+    let xMerged = [];
+    let yMerged = [];
+    let j = 0;
+    for (let i = 0; i < x.length; i++) {
+      xMerged.push(x[i]);
+      yMerged.push(y[i]);
+      if (j < refine.length && refine[j] === i) {
+        xMerged.push(xNew[j]);
+        yMerged.push(yNew[j]);
+        j++;
+      }
+    }
+    x = xMerged;
+    y = yMerged;
   }
 
-  return Ac;
+  return [x, y];
 }
 
 """,
-    "deepCopy": """
-function deepCopy(x) {
-  return JSON.parse(JSON.stringify(x));
+    "log10PDF": """
+function log10PDF(x, params) {
+  return dist.logpdf(x, params).map(val => val / Math.LN10);
 }
 
 """,
-    "zeros": """
-function zeros(...dims) {
-  let A = [];
+    "computeContinuousPDFandCDF": """
+function computeContinuousPDFandCDF(xRange, params, width, height, logDensity) {
+  let [xRangeMin, xRangeMax] = xRange;
 
   
-  for (let i = dims.length - 1; i >= 0; i--) {
-    let size = dims[i];
-    if (i === dims.length - 1) {
-      
-      A = new Array(size).fill(0.0);
-    } else {
-      
-      A = new Array(size).fill().map(() => deepCopy(A));
-    }
-  }
-
-  return A;
-}
-
-""",
-    "lowerTriSolve": """
-function lowerTriSolve(L, b) {
-    const floatEps = 1.0e-14;
-    const n = L.length;
+  let cdfQuadrature = cdfStrategy === 'quadrature' || (cdfStrategy === 'auto' && dist.expensiveCdf);
 
-    
-    let x = Array.from(b);
+  const pdfFun = (x, params) => logDensity ? log10PDF(x, params) : dist.pdf(x, params);
 
+  let x_p, x_c, pdf, cdf;
+  if (n === 'auto') {
     
-    for (let j = 0; j < n - 1; j++) {
-        if (Math.abs(L[j][j]) > floatEps) {
-            x[j] /= L[j][j];
-            for (let i = j + 1; i < n; i++) {
-                x[i] -= x[j] * L[i][j];
-            }
-        } else {
-            x[j] = 0.0;
-        }
+    [x_p, pdf] = adaptiveGrid(x => pdfFun(x, params), xRangeMin, xRangeMax, width, height);
+    if (cdfQuadrature) {
+      x_c = x_p;
     }
-
-    if (n > 0) {
-        if (Math.abs(L[n - 1][n - 1]) > floatEps) {
-            x[n - 1] /= L[n - 1][n - 1];
-        } else {
-            x[n - 1] = 0.0;
-        }
+    else {
+      [x_c, cdf] = adaptiveGrid(x => dist.cdf(x, params), xRangeMin, xRangeMax, width, height);
     }
+  }
+  else {
+    
+    x_p = linspace(xRangeMin, xRangeMax, n);
+    x_c = x_p;
 
-    return x;
+    pdf = pdfFun(x_p, params);
+    if (!cdfQuadrature) cdf = dist.cdf(x_c, params);
+  }
+
+  if (cdfQuadrature) cdf = dist.cdfFromPDF(x_c, logDensity ? pdf.map(val => 10 ** val) : pdf, params);
+
+  
+  pdf = pdf.map(val => (val === Infinity || val === -Infinity) ? NaN : val);
+
+  return [x_p, pdf, x_c, cdf];
 }
 
 """,
-    "upperTriSolve": """
-function upperTriSolve(U, b) {
-    const floatEps = 1.0e-14;
-    const n = U.length;
+    "computeBucketedPMFandCDF": """
+function computeBucketedPMFandCDF(xRange, params, nBuckets, logDensity) {
+  let xRangeMin = Math.ceil(xRange[0]);
+  let xRangeMax = Math.floor(xRange[1]);
+  let nInts = xRangeMax - xRangeMin + 1;
 
-    
-    let x = Array.from(b);
+  
+  let edges = [];
+  for (let k = 0; k < nBuckets; k++) {
+    edges.push(xRangeMin + Math.floor(k * nInts / nBuckets));
+  }
+  edges.push(xRangeMax + 1);
 
-    
-    for (let j = n - 1; j > 0; j--) {
-        if (Math.abs(U[j][j]) > floatEps) {
-            x[j] /= U[j][j];
-            for (let i = 0; i < j; i++) {
-                x[i] -= x[j] * U[i][j];
-            }
-        } else {
-            x[j] = 0.0;
-        }
-    }
+  let [x_p, y_p, cdfVals] = dist.bucketedPMFandCDF(edges, params, discreteLod, logDensity);
+  if (logDensity) y_p = y_p.map(val => isFinite(val) ? val / Math.LN10 : NaN);
 
-    if (n > 0) {
-        if (Math.abs(U[0][0]) > floatEps) {
-            x[0] /= U[0][0];
-        } else {
-            x[0] = 0.0;
-        }
-    }
+  
+  let x_c = [xRange[0], ...edges.slice(1).map(x => x - 1), xRange[1]];
+  let y_c = [...cdfVals, cdfVals[cdfVals.length - 1]];
 
-    return x;
+  return [x_p, y_p, x_c, y_c];
 }
 
 """,
-    "modifiedCholesky": """
-function modifiedCholesky(A) {
-    const floatEps = 1.0e-14;
-    const n = A.length;
+    "computeDiscretePMFandCDF": """
+function computeDiscretePMFandCDF(xRange, params, width, logDensity) {
+  
+  let xRangeMin = Math.ceil(xRange[0]);
+  let xRangeMax = Math.floor(xRange[1]);
 
-    
-    let L = deepCopy(A); 
-    let p = arange(0, n);
+  
+  if (discreteLod && xRangeMax - xRangeMin + 1 > width) {
+    return computeBucketedPMFandCDF(xRange, params, Math.floor(width), logDensity);
+  }
 
-    
-    let success = true;
+  
+  let x_p = arange(xRangeMin, xRangeMax + 1);
 
-    let xi = 0;
-    for (let i = 0; i < n; i++) {
-        for (let j = 0; j < i; j++) {
-            let temp = Math.abs(L[i][j]);
-            xi = Math.max(xi, temp);
-        }
+  
+  let x_c;
+  if (Number.isInteger(xRange[0])) {
+    if (Number.isInteger(xRange[1])) {
+      x_c = x_p.flatMap(x => [x, x]);
     }
-
-    let eta = 0;
-    for (let i = 0; i < n; i++) {
-        let temp = Math.abs(L[i][i]);
-        eta = Math.max(eta, temp);
+    else {
+      x_c = [...x_p.flatMap(x => [x, x]), xRange[1]];
+    }
+  }
+  else {
+    if (Number.isInteger(xRange[1])) {
+      x_c = [xRange[0], ...x_p.flatMap(x => [x, x])];
     }
+    else {
+      x_c = [xRange[0], ...x_p.flatMap(x => [x, x]), xRange[1]];
+    }    
+  }
 
-    let beta;
-    if (n > 1) {
-        beta = Math.sqrt(Math.max(eta, xi / Math.sqrt(n * n - 1)));
-    } else {
-        beta = Math.sqrt(eta);
+  
+  let y_p = logDensity
+    ? dist.logpmf(x_p, params).map(val => isFinite(val) ? val / Math.LN10 : NaN)
+    : dist.pmf(x_p, params);
+  let y_c = dist.cdfForPlotting(x_c[0], x_c[x_c.length - 1], params);
+
+  
+  if (stepCdf) [x_c, y_c] = staircaseToSteps(x_c, y_c);
+
+  return [x_p, y_p, x_c, y_c];
+}
+
+""",
+    "staircaseToSteps": """
+function staircaseToSteps(x_c, y_c) {
+  let x = [x_c[0]];
+  let y = [y_c[0]];
+  for (let i = 1; i < x_c.length; i++) {
+    if (x_c[i] === x_c[i - 1] || i === x_c.length - 1) {
+      x.push(x_c[i]);
+      y.push(y_c[i]);
     }
-    beta = Math.max(beta, floatEps);
+  }
 
-    for (let k = 0; k < n; k++) {
-        
-        let muVal = L[k][k];
-        let mu = k;
-        for (let i = k + 1; i < n; i++) {
-            let temp = L[i][i];
-            if (muVal < temp) {
-                mu = i;
-                muVal = temp;
-            }
-        }
+  return [x, y];
+}
+
+""",
+    "computeData": """
+function computeData(xRange, params, discrete, width, height, logDensity) {
+  if (discrete) {
+    return computeDiscretePMFandCDF(xRange, params, width, logDensity);
+  }
+  else {
+    return computeContinuousPDFandCDF(xRange, params, width, height, logDensity);
+  }
+}
 
-        
-        let iTemp = p[mu];
-        p[mu] = p[k];
-        p[k] = iTemp;
+""",
+    "setSourceData": """
+function setSourceData(source_p, source_c, x_p, y_p, x_c, y_c) {
+  source_p.data['x'] = x_p;
+  source_p.data['y_p'] = y_p;
+  source_c.data['x'] = x_c;
+  source_c.data['y_c'] = y_c;
 
-        for (let i = 0; i < k; i++) {
-            let temp = L[k][i];
-            L[k][i] = L[mu][i];
-            L[mu][i] = temp;
-        }
+  source_p.change.emit();
+  source_c.change.emit();
+}
 
-        let temp = L[k][k];
-        L[k][k] = L[mu][mu];
-        L[mu][mu] = temp;
-        for (let i = k + 1; i < mu; i++) {
-            let temp = L[i][k];
-            L[i][k] = L[mu][i];
-            L[mu][i] = temp;
-        }
+""",
+    "workerState": """
+function workerState(workerScript) {
+  if (globalThis.distributionExplorerWorkers === undefined) {
+    globalThis.distributionExplorerWorkers = {};
+  }
+  let states = globalThis.distributionExplorerWorkers;
 
-        for (let i = mu + 1; i < n; i++) {
-            let temp = L[i][k];
-            L[i][k] = L[i][mu];
-            L[i][mu] = temp;
-        }
+  if (!(workerScript.id in states)) {
+    let state = {worker: null, nextId: 0, latestIds: {}, onResult: {}};
 
-        
-        let cSum = 0;
-        for (let i = k + 1; i < n; i++) {
-            cSum = Math.max(cSum, Math.abs(L[i][k]));
-        }
-        cSum /= beta;
-        cSum = cSum * cSum;
+    try {
+      let url = URL.createObjectURL(new Blob([workerScript.code], {type: 'text/javascript'}));
+      state.worker = new Worker(url);
 
-        
-        if (L[k][k] < 0) {
-            success = false;
+      
+      state.worker.onmessage = event => {
+        let response = event.data;
+        if (response.id !== state.latestIds[response.kind]) return;
+        if (response.error !== undefined) {
+          console.warn('Distribution explorer worker: ' + response.error);
+          return;
         }
+        state.onResult[response.kind](response.result);
+      };
 
-        temp = Math.abs(L[k][k]);
-        temp = Math.max(temp, floatEps * eta);
-        temp = Math.max(temp, cSum);
-        L[k][k] = Math.sqrt(temp);
+      state.worker.onerror = event => {
+        console.warn('Distribution explorer worker failed; computing on the main thread.');
+        state.worker = null;
+      };
+    }
+    catch (e) {
+      state.worker = null;
+    }
 
-        
-        for (let i = k + 1; i < n; i++) {
-            L[i][k] /= L[k][k];
-        }
+    states[workerScript.id] = state;
+  }
 
-        
-        for (let j = k + 1; j < n; j++) {
-            for (let i = j; i < n; i++) {
-                L[i][j] -= L[i][k] * L[j][k];
-            }
-        }
+  return states[workerScript.id];
+}
 
-        
-        for (let i = 0; i < n - 1; i++) {
-            for (let j = i + 1; j < n; j++) {
-                L[i][j] = 0.0;
-            }
-        }
+""",
+    "postToWorker": """
+function postToWorker(workerScript, kind, request, onResult) {
+  if (workerScript === null) return false;
+
+  let state = workerState(workerScript);
+  if (state.worker === null) return false;
+
+  state.nextId += 1;
+  state.latestIds[kind] = state.nextId;
+  state.onResult[kind] = onResult;
+
+  request.kind = kind;
+  request.id = state.nextId;
+  request.n = n;
+  request.discreteLod = discreteLod;
+  request.cdfStrategy = cdfStrategy;
+  request.stepCdf = stepCdf;
+  request.solverTimeLimit = solverTimeLimit;
+  state.worker.postMessage(request);
+
+  return true;
+}
+
+""",
+    "decodePrecomputedFrame": """
+function decodePrecomputedFrame(precomputed, k) {
+  let lengths = precomputed.x_p === null ? [precomputed.nP, precomputed.nP, precomputed.nC] : [precomputed.nP, precomputed.nC];
+  let frameLen = lengths.reduce((a, b) => a + b, 0);
+  let offset = k * frameLen;
+
+  let segments = [];
+  for (let len of lengths) {
+    let segment = new Array(len);
+    let acc = 0.0;
+    for (let i = 0; i < len; i++) {
+      let delta = precomputed.frames[offset + i];
+      if (isNaN(delta)) {
+        segment[i] = NaN;
+      }
+      else {
+        acc += delta;
+        segment[i] = acc;
+      }
     }
+    segments.push(segment);
+    offset += len;
+  }
 
-    return [L, p, success];
+  return segments.length === 3 ? segments : [precomputed.x_p, ...segments];
 }
 
 """,
-    "modifiedCholeskySolve": """
-function modifiedCholeskySolve(L, p, b) {
-    const n = L.length;
+    "precomputedData": """
+function precomputedData(precomputed, xRange, params, tol = 0.01) {
+  if (precomputed === null) return null;
 
-    let U = transpose(L);
-    let xp = new Array(n).fill(0);
-    for (let i = 0; i < n; i++) {
-        xp[i] = b[p[i]];
+  let xTol = 1e-9 * (precomputed.xRange[1] - precomputed.xRange[0]);
+  if (Math.abs(xRange[0] - precomputed.xRange[0]) > xTol || Math.abs(xRange[1] - precomputed.xRange[1]) > xTol) return null;
+
+  
+  let inds = [];
+  let weights = [];
+  for (let i = 0; i < params.length; i++) {
+    let grid = precomputed.grids[i];
+    let tol = 1e-6 * (grid.length > 1 ? grid[1] - grid[0] : Math.max(1, Math.abs(grid[0])));
+    if (params[i] < grid[0] - tol || params[i] > grid[grid.length - 1] + tol) return null;
+
+    if (grid.length === 1) {
+      inds.push(0);
+      weights.push(0.0);
+      continue;
     }
 
-    
-    let x = lowerTriSolve(L, xp);
+    let j = 0;
+    while (j < grid.length - 2 && params[i] > grid[j + 1]) j++;
+    let t = (params[i] - grid[j]) / (grid[j + 1] - grid[j]);
+    if (Math.abs(params[i] - grid[j]) <= tol) t = 0.0;
+    if (Math.abs(params[i] - grid[j + 1]) <= tol) t = 1.0;
 
     
-    xp = upperTriSolve(U, x);
+    if (precomputed.x_p === null && t !== 0.0 && t !== 1.0) return null;
 
-    for (let i = 0; i < n; i++) {
-        x[p[i]] = xp[i];
+    inds.push(j);
+    weights.push(t);
+  }
+
+  
+  let corners = [];
+  for (let corner = 0; corner < (1 << params.length); corner++) {
+    let weight = 1.0;
+    let k = 0;
+    for (let i = 0; i < params.length; i++) {
+      let upper = (corner >> i) & 1;
+      weight *= upper ? weights[i] : 1.0 - weights[i];
+      k = k * precomputed.grids[i].length + inds[i] + upper;
     }
+    if (weight > 0.0) corners.push([weight, decodePrecomputedFrame(precomputed, k)]);
+  }
 
-    return x;
+  if (corners.length === 1) {
+    let [x_p, y_p, y_c] = corners[0][1];
+    return [x_p, y_p, Array.from(precomputed.x_c), y_c];
+  }
+
+  for (let j of [1, 2]) {
+    if (!framesAgree(corners.map(([weight, frame]) => frame[j]), tol)) return null;
+  }
+
+  let y_p = corners[0][1][1].map((_, i) => corners.reduce((sum, [weight, frame]) => sum + weight * frame[1][i], 0.0));
+  let y_c = corners[0][1][2].map((_, i) => corners.reduce((sum, [weight, frame]) => sum + weight * frame[2][i], 0.0));
+
+  return [corners[0][1][0], y_p, Array.from(precomputed.x_c), y_c];
 }
 
 """,
-    "solvePosDef": """
-function solvePosDef(A, b) {
-  let [L, p, success] = modifiedCholesky(A);
+    "framesAgree": """
+function framesAgree(ys, tol) {
+  let scale = 0.0;
+  for (let y of ys) {
+    for (let val of y) {
+      if (isNaN(val)) return false;
+      scale = Math.max(scale, Math.abs(val));
+    }
+  }
 
-  if (!success) {
-    return [zeros(b.length), success];
+  for (let i = 0; i < ys[0].length; i++) {
+    let yMin = Infinity;
+    let yMax = -Infinity;
+    for (let y of ys) {
+      yMin = Math.min(yMin, y[i]);
+      yMax = Math.max(yMax, y[i]);
+    }
+    if (yMax - yMin > tol * scale) return false;
   }
 
-  return [modifiedCholeskySolve(L, p, b), success];
+  return true;
 }
 
 """,
-    "LUPDecompose": """
-function LUPDecompose(A, eps) {
-    var i, j, k, imax;
-    var maxA, absA;
-    var Arow;
-    var p = [];
-    var n = A.length;
-    var LU = shallowCopyMatrix(A);
+    "appState": """
+function appState() {
+  if (globalThis.distributionExplorerApps === undefined) {
+    globalThis.distributionExplorerApps = {};
+  }
+  let states = globalThis.distributionExplorerApps;
 
-    
-    for (i = 0; i <= n; i++) p.push(i);
+  if (!(triggerCallbacks.id in states)) {
+    states[triggerCallbacks.id] = {batchDepth: 0, drawnKey: null, samples: null, observedKey: null, sweepKey: null};
+  }
 
-    for (i = 0; i < n; i++) {
-        maxA = 0.0;
-        imax = i;
+  return states[triggerCallbacks.id];
+}
 
-        for (k = i; k < n; k++) {
-            absA = Math.abs(LU[k][i]);
-            if (absA > maxA) {
-                maxA = absA;
-                imax = k;
-            }
-        }
+""",
+    "beginBatch": """
+function beginBatch() {
+  appState().batchDepth += 1;
+  triggerCallbacks.active = false;
+}
 
-        
-        if (maxA < eps) return [null, null];
+""",
+    "commitBatch": """
+function commitBatch(redraw = null) {
+  let state = appState();
+  state.batchDepth -= 1;
+  if (state.batchDepth > 0) return;
 
-        if (imax != i) {
-            
-            j = p[i];
-            p[i] = p[imax];
-            p[imax] = j;
+  if (redraw !== null) redraw();
 
-            
-            Arow = LU[i];
-            LU[i] = LU[imax];
-            LU[imax] = Arow;
+  setTimeout(() => {
+    if (state.batchDepth === 0) triggerCallbacks.active = true;
+  }, 0);
+}
 
-            
-            p[n]++;
-        }
+""",
+    "updateData": """
+function updateData(source_p, source_c, p_p, sliders, discrete, onUpdated = null) {
+  let params = paramsFromSliders(sliders);
+  let xRange = [p_p.x_range.start, p_p.x_range.end];
+  let [width, height] = plotFrameSize(p_p);
 
-        for (j = i + 1; j < n; j++) {
-            LU[j][i] /= LU[i][i];
+  let state = appState();
+  let key = JSON.stringify([xRange, params, width, height]);
+  if (onUpdated === null && key === state.drawnKey) return;
+  state.drawnKey = key;
 
-            for (k = i + 1; k < n; k++) LU[j][k] -= LU[j][i] * LU[i][k];
-        }
-    }
+  
+  if (sampleSwitch !== null && sampleSwitch.active) {
+    updateSamples(source_hist, source_ecdf, p_p, sliders, discrete);
+  }
 
-    return [LU, p];
+  
+  if (observed !== null) updateObservedHistogram(source_observed, p_p);
+
+  
+  if (sweep !== null) updateSweep(source_sweep, p_p, sliders, discrete);
+
+  const onResult = data => {
+    setSourceData(source_p, source_c, ...data);
+    if (onUpdated !== null) onUpdated();
+  };
+
+  let data = precomputedData(precomputed, xRange, params);
+  if (data !== null) {
+    onResult(data);
+    return;
+  }
+
+  let request = {xRange: xRange, params: params, discrete: discrete, width: width, height: height, logDensity: logDensity};
+  if (!postToWorker(workerScript, 'data', request, onResult)) {
+    onResult(computeData(xRange, params, discrete, width, height, logDensity));
+  }
 }
 
 """,
-    "LUPSolve": """
-function LUPSolve(LU, p, b) {
-    var n = b.length;
-    var x = [];
-
-    for (var i = 0; i < n; i++) {
-        x.push(b[p[i]]);
-        for (var k = 0; k < i; k++) x[i] -= LU[i][k] * x[k];
-    }
+    "sampleBins": """
+function sampleBins(xRange, discrete, width) {
+  if (discrete) {
+    let first = Math.ceil(xRange[0]);
+    let nInts = Math.max(1, Math.floor(xRange[1]) - first + 1);
+    let binWidth = Math.ceil(nInts / Math.max(1, Math.round(width)));
 
-    for (i = n - 1; i >= 0; i--) {
-        for (k = i + 1; k < n; k++) x[i] -= LU[i][k] * x[k];
+    return {start: first - 0.5, binWidth: binWidth, nBins: Math.ceil(nInts / binWidth), perBar: 1};
+  }
 
-        x[i] /= LU[i][i];
-    }
+  let nBars = Math.max(10, Math.round(width / 6));
+  let perBar = 8;
 
-    return x;
+  return {start: xRange[0], binWidth: (xRange[1] - xRange[0]) / (nBars * perBar), nBins: nBars * perBar, perBar: perBar};
 }
 
 """,
-    "solve": """
-function solvePosDef(A, b) {
-  let [L, p, success] = modifiedCholesky(A);
+    "sampleCounts": """
+function sampleCounts(counts, bins, params, sampleSize) {
+  if (globalThis.distributionExplorerSampling === undefined) {
+    globalThis.distributionExplorerSampling = {rng: makeRng(), buffer: new Float64Array(65536)};
+  }
+  let {rng, buffer} = globalThis.distributionExplorerSampling;
 
-  if (!success) {
-    return [zeros(b.length), success];
+  let nBins = bins.nBins;
+  let start = bins.start;
+  let scale = 1 / bins.binWidth;
+
+  counts.fill(0);
+  for (let drawn = 0; drawn < sampleSize; drawn += buffer.length) {
+    let chunk = sampleSize - drawn < buffer.length ? buffer.subarray(0, sampleSize - drawn) : buffer;
+    dist.sample(chunk, params, rng);
+
+    for (let i = 0; i < chunk.length; i++) {
+      let j = Math.floor((chunk[i] - start) * scale);
+      if (j < 0) counts[0] += 1;
+      else if (j >= nBins) counts[nBins + 1] += 1;
+      else counts[j + 1] += 1;
+    }
   }
 
-  return [modifiedCholeskySolve(L, p, b), success];
+  return counts;
 }
 
 """,
-    "paramsFromSliders": """
-function paramsFromSliders(sliders) {
-  let params = [];
-  for (let slider of sliders) {
-    params.push(slider.value);
+    "sampleArrays": """
+function sampleArrays(source_hist, source_ecdf, bins) {
+  let state = appState();
+  let nBins = bins.nBins;
+  let nBars = nBins / bins.perBar;
+
+  if (state.samples === null || state.samples.counts.length !== nBins + 2 || state.samples.top.length !== nBars) {
+    state.samples = {
+      counts: new Float64Array(nBins + 2),
+      left: new Float64Array(nBars),
+      right: new Float64Array(nBars),
+      top: new Float64Array(nBars),
+      x: new Float64Array(nBins + 1),
+      y: new Float64Array(nBins + 1),
+    };
+    source_hist.data = {left: state.samples.left, right: state.samples.right, top: state.samples.top};
+    source_ecdf.data = {x: state.samples.x, y: state.samples.y};
   }
 
-  return params;
+  return state.samples;
 }
 
 """,
-    "paramsFromBoxes": """
-function paramsFromBoxes(boxes) {
-  let params = [];
-  for (let box of boxes) {
-    if (isNaN(box.value)) {
-      throw new Error(box.value + ' is not a valid number.');
+    "setSampleData": """
+function setSampleData(source_hist, source_ecdf, counts, bins, discrete) {
+  let {left, right, top, x, y} = sampleArrays(source_hist, source_ecdf, bins);
+  let nBins = bins.nBins;
+
+  let total = 0;
+  for (let j = 0; j < nBins + 2; j++) total += counts[j];
+  let norm = total > 0 ? 1 / total : NaN;
+
+  let cumsum = counts[0];
+  x[0] = bins.start;
+  y[0] = cumsum * norm;
+  for (let j = 0; j < nBins; j++) {
+    cumsum += counts[j + 1];
+    x[j + 1] = discrete ? bins.start + 0.5 + j * bins.binWidth : bins.start + (j + 1) * bins.binWidth;
+    y[j + 1] = cumsum * norm;
+  }
+
+  let barWidth = bins.perBar * bins.binWidth;
+  for (let k = 0; k < top.length; k++) {
+    let count = 0;
+    for (let j = k * bins.perBar; j < (k + 1) * bins.perBar; j++) count += counts[j + 1];
+
+    if (discrete && bins.binWidth === 1) {
+      left[k] = bins.start + 0.5 + k - 0.4;
+      right[k] = bins.start + 0.5 + k + 0.4;
     }
-    params.push(Number(box.value));
+    else {
+      left[k] = bins.start + k * barWidth;
+      right[k] = left[k] + barWidth;
+    }
+    top[k] = count * norm / barWidth;
+    if (logDensity) top[k] = count > 0 ? Math.log10(top[k]) : NaN;
   }
 
-  return params;
+  source_hist.change.emit();
+  source_ecdf.change.emit();
 }
 
 """,
-    "setYRanges": """
-function setYRanges(p_p, p_c, source_p) {
-    p_c.y_range.start = 0.0;
-    p_c.y_range.end = 1.0;        
+    "updateSamples": """
+function updateSamples(source_hist, source_ecdf, p_p, sliders, discrete) {
+  let params = paramsFromSliders(sliders);
+  let [width, height] = plotFrameSize(p_p);
+  let bins = sampleBins([p_p.x_range.start, p_p.x_range.end], discrete, width);
 
-    let pdfMax = source_p.data['y_p'];
-    p_p.y_range.start = 0.0;
-    p_p.y_range.end = 1.04 * pdfMax;
+  const onResult = counts => setSampleData(source_hist, source_ecdf, counts, bins, discrete);
 
+  let request = {bins: bins, params: params, sampleSize: sampleSize};
+  if (!postToWorker(workerScript, 'samples', request, onResult)) {
+    onResult(sampleCounts(sampleArrays(source_hist, source_ecdf, bins).counts, bins, params, sampleSize));
+  }
 }
 
 """,
-    "checkQuantileInput": """
-function checkQuantileInput(x, p, xMin, xMax, varName, quantileSetterDiv) {
-  for (let i = 0; i < x.length; i++) {
-    if (p[i] <= 0 || p[i] >= 1) {
-      quantileSetterDiv.text = '<p style="color:tomato;">Must have 0 < quantile < 1.</p>';
-      return false; 
-    }
+    "clearSamples": """
+function clearSamples(source_hist, source_ecdf) {
+  appState().samples = null;
+  source_hist.data = {left: [], right: [], top: []};
+  source_ecdf.data = {x: [], y: []};
+}
 
-    if (x[i] < xMin || x[i] > xMax) {
-      let qStr = '<p style="color:tomato;">Must have ' + xMin.toString() + ' ≤ yy ≤ ' + xMax.toString() + '.</p>';
-      quantileSetterDiv.text = qStr.replace(/yy/g, varName);
-      return false;
-    }
+""",
+    "observedHistogram": """
+function observedHistogram(observed, xRange, width) {
+  let nBars = Math.max(10, Math.round(width / 6));
+  let target = (xRange[1] - xRange[0]) / nBars;
+  let level = Math.round(Math.log2(target / observed.binWidth));
+  level = isNaN(level) ? 0 : Math.max(0, Math.min(observed.nLevels - 1, level));
+
+  let offset = 0;
+  for (let k = 0; k < level; k++) offset += observed.nBins >> k;
+  let nBins = observed.nBins >> level;
+  let binWidth = observed.binWidth * 2 ** level;
+
+  let i0 = Math.max(0, Math.floor((xRange[0] - observed.start) / binWidth));
+  let i1 = Math.min(nBins, Math.ceil((xRange[1] - observed.start) / binWidth));
+  let nVisible = Math.max(0, i1 - i0);
+
+  let left = new Float64Array(nVisible);
+  let right = new Float64Array(nVisible);
+  let top = new Float64Array(nVisible);
+  let narrow = observed.discrete && binWidth === 1;
+  for (let i = 0; i < nVisible; i++) {
+    let edge = observed.start + (i0 + i) * binWidth;
+    left[i] = narrow ? edge + 0.1 : edge;
+    right[i] = narrow ? edge + 0.9 : edge + binWidth;
+    top[i] = observed.counts[offset + i0 + i] / (observed.total * binWidth);
+  }
+
+  return [left, right, top];
+}
+
+""",
+    "updateObservedHistogram": """
+function updateObservedHistogram(source_observed, p_p) {
+  let xRange = [p_p.x_range.start, p_p.x_range.end];
+  let [width, height] = plotFrameSize(p_p);
+
+  let state = appState();
+  let key = JSON.stringify([xRange, width]);
+  if (key === state.observedKey) return;
+  state.observedKey = key;
+
+  let [left, right, top] = observedHistogram(observed, xRange, width);
+  if (logDensity) top = top.map(val => val > 0 ? Math.log10(val) : NaN);
+  source_observed.data = {left: left, right: right, top: top};
+}
+
+""",
+    "sweepGrid": """
+function sweepGrid(xRange, discrete, width) {
+  if (discrete) {
+    let first = Math.ceil(xRange[0]);
+    let last = Math.floor(xRange[1]);
+    let stride = Math.max(1, Math.ceil((last - first + 1) / Math.max(1, Math.round(width))));
+
+    let x = [];
+    for (let k = first; k <= last; k += stride) x.push(k);
+
+    return x;
   }
 
+  return linspace(xRange[0], xRange[1], n === 'auto' ? 2 * Math.round(width) : n);
+}
+
+""",
+    "computeSweepData": """
+function computeSweepData(xRange, params, sweepInd, sweepValues, discrete, width, logDensity) {
+  let x = sweepGrid(xRange, discrete, width);
+  let nX = x.length;
+  let strided = discrete && nX > 1 && x[1] - x[0] > 1;
+  let cdfQuadrature = !discrete && (cdfStrategy === 'quadrature' || (cdfStrategy === 'auto' && dist.expensiveCdf));
+
+  let x_c = discrete ? x.flatMap((val, i) => i === 0 ? [val] : [val, val]) : x;
 
-  if (p.length === 2) {
-    if (p[1] <= 0 || p[1] >= 1) {
-        quantileSetterDiv.text = '<p style="color:tomato;">Must have 0 < quantile < 1.</p>';
-        return false;
-    }
+  let ys_p = [];
+  let ys_c = [];
+  let member = params.slice();
+  for (let value of sweepValues) {
+    member[sweepInd] = value;
 
-    if (p[0] >= p[1]) {
-        quantileSetterDiv.text = '<p style="color:tomato;">Lower quantile must be less than upper quantile.</p>';
-        return false;
+    
+    let density, log10Density;
+    if (logDensity) {
+      log10Density = discrete ? dist.logpmf(x, member).map(val => val / Math.LN10) : log10PDF(x, member);
+      density = log10Density.map(val => 10 ** val);
     }
-
-    if (x[0] >= x[1]) {
-        quantileSetterDiv.text = '<p style="color:tomato;">Lower yy must be less than upper yy.</p>'.replace(/yy/g, varName);
-        return false;        
+    else {
+      density = discrete ? dist.pmf(x, member) : dist.pdf(x, member);
     }
-  }
 
-  if (p.length === 3) {
-    if (p[2] <= 0 || p[2] >= 1 || p[1] <= 0 || p[1] >= 1) {
-        quantileSetterDiv.text = '<p style="color:tomato;">Must have 0 < quantile < 1.</p>';
-        return false;
+    let cdf;
+    if (cdfQuadrature) {
+      cdf = dist.cdfFromPDF(x, density, member);
+    }
+    else if (discrete && !strided && nX > 0) {
+      
+      cdf = new Array(nX);
+      let cumsum = dist.cdfSingleValue(x[0] - 1, member);
+      for (let i = 0; i < nX; i++) {
+        if (!isNaN(density[i])) cumsum += density[i];
+        cdf[i] = cumsum;
+      }
+    }
+    else {
+      cdf = dist.cdf(x, member);
     }
 
-    if (p[0] >= p[1] || p[1] >= p[2]) {
-        quantileSetterDiv.text = '<p style="color:tomato;">Quantiles must be ordered lower, middle, upper.</p>';
-        return false;
+    let y_p = new Float64Array(nX);
+    for (let i = 0; i < nX; i++) {
+      let val = logDensity ? log10Density[i] : density[i];
+      y_p[i] = isFinite(val) ? val : NaN;
     }
+    ys_p.push(y_p);
 
-    if (x[0] >= x[1] || x[1] >= x[2]) {
-        quantileSetterDiv.text = '<p style="color:tomato;">yy values must be ordered, lower, middle, upper.</p>'.replace(/yy/g, varName);
-        return false;
+    if (discrete) {
+      let y_c = new Float64Array(x_c.length);
+      for (let i = 0; i < nX; i++) {
+        if (i > 0) y_c[2 * i - 1] = cdf[i - 1];
+        y_c[2 * i] = cdf[i];
+      }
+      ys_c.push(y_c);
+    }
+    else {
+      ys_c.push(Float64Array.from(cdf));
     }
   }
 
-    return true;
+  return [x, ys_p, x_c, ys_c];
 }
 
 """,
-    "updateContinuousPDFandCDF": """
-function updateContinuousPDFandCDF(source_p, source_c, xRange, sliders) {
-  
-  let x_p = source_p.data['x'];
-  let y_p = source_p.data['y_p'];
-  let x_c = source_c.data['x'];
-  let y_c = source_c.data['y_c'];
-  let xRangeMin = xRange.start;
-  let xRangeMax = xRange.end;
+    "updateSweep": """
+function updateSweep(source_sweep, p_p, sliders, discrete) {
+  let params = paramsFromSliders(sliders);
+  let xRange = [p_p.x_range.start, p_p.x_range.end];
+  let [width, height] = plotFrameSize(p_p);
+
+  let state = appState();
+  let key = JSON.stringify([xRange, params.filter((val, i) => i !== sweep.ind), width]);
+  if (key === state.sweepKey) return;
+  state.sweepKey = key;
+
+  const onResult = ([x, ys_p, x_c, ys_c]) => {
+    source_sweep.data['xs_p'] = ys_p.map(() => x);
+    source_sweep.data['ys_p'] = ys_p;
+    source_sweep.data['xs_c'] = ys_c.map(() => x_c);
+    source_sweep.data['ys_c'] = ys_c;
+    source_sweep.change.emit();
+  };
+
+  let request = {xRange: xRange, params: params, sweepInd: sweep.ind, sweepValues: sweep.values, discrete: discrete, width: width, logDensity: logDensity};
+  if (!postToWorker(workerScript, 'sweep', request, onResult)) {
+    onResult(computeSweepData(xRange, params, sweep.ind, sweep.values, discrete, width, logDensity));
+  }
+}
 
-  
-  x_p = linspace(xRangeMin, xRangeMax, n);
-  x_c = x_p;
+""",
+    "computeQuantiles": """
+function computeQuantiles(pVals, params) {
+  return pVals.map(p => dist.ppfSingleValue(p, params).toPrecision(4));
+}
 
-  
-  source_p.data['x'] = x_p;
-  source_c.data['x'] = x_c;
+""",
+    "updateQuantiles": """
+function updateQuantiles(quantileSetterSwitch, sliders, xBoxes, pBoxes) {
+  if (!quantileSetterSwitch.active) {
+    let params = paramsFromSliders(sliders);
+    let pVals = pBoxes.map(pBox => Number(pBox.value));
 
-  
-  let params = paramsFromSliders(sliders);
+    const onResult = xVals => {
+      for (let i = 0; i < xBoxes.length; i++) {
+        xBoxes[i].value = xVals[i];
+      }
+    };
 
-  
-  let pdf = dist.pdf(x_p, params);
+    if (!postToWorker(workerScript, 'quantiles', {pVals: pVals, params: params}, onResult)) {
+      onResult(computeQuantiles(pVals, params));
+    }
+  }
+}
 
+""",
+    "solveQuantileSet": """
+function solveQuantileSet(x, p, extraParams) {
   
-  pdf = pdf.map(val => (val === Infinity || val === -Infinity) ? NaN : val);
+  let errText = '<p style="color:tomato;">Failed to find parameters to match quantiles.</p>';
+
+  let budget = makeSolverBudget(solverTimeLimit === null ? Infinity : 1000 * solverTimeLimit);
 
   
-  source_p.data['y_p'] = pdf;
-  source_c.data['y_c'] = dist.cdf(x_c, params);
+  let optimParams, optimSuccess;
+  try {
+    [optimParams, optimSuccess] = withSolverBudget(budget, () => dist.quantileSet(x, p, extraParams));
+  } catch(e) {
+    optimSuccess = false;
+    errText = '<p style="color:tomato;">' + e.message + '</p>';
+  }
 
-  source_p.change.emit();
-  source_c.change.emit();
+  return [optimParams, optimSuccess, errText, budget.status];
 }
 
 """,
-    "updateDiscretePMFandCDF": """
-function updateDiscretePMFandCDF(source_p, source_c, xRange, sliders) {
+    "applyQuantileSetResult": """
+function applyQuantileSetResult(optimParams, optimSuccess, errText, status, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p) {
   
-  let xRangeMin = Math.ceil(xRange.start);
-  let xRangeMax = Math.floor(xRange.end);
-
   
-  let x_p = arange(xRangeMin, xRangeMax + 1);
+  beginBatch();
 
-  
-  let x_c;
-  if (Number.isInteger(xRange.start)) {
-    if (Number.isInteger(xRange.end)) {
-      x_c = x_p.flatMap(x => [x, x]);
-    }
-    else {
-      x_c = [...x_p.flatMap(x => [x, x]), xRange.end];
-    }
-  }
-  else {
-    if (Number.isInteger(xRange.end)) {
-      x_c = [xRange.start, ...x_p.flatMap(x => [x, x])];
+  let partial = status !== 'ok' && optimParams !== undefined && optimParams.every((param, i) => {
+    let j = dist.activeParamsInds[i];
+    return isFinite(param) && !(param <= dist.paramMin[j]) && !(param >= dist.paramMax[j]);
+  });
+
+  let text;
+  if (optimSuccess || partial) {
+    
+    text = partial ? '<p style="color:orange;">Stopped at time limit; best parameters found: ' : '<p>';
+    for (let i = 0; i < optimParams.length - 1; i++) {
+      text += dist.paramNames[dist.activeParamsInds[i]] + ' = ' + optimParams[i].toPrecision(4) + ', ';
     }
-    else {
-      x_c = [xRange.start, ...x_p.flatMap(x => [x, x]), xRange.end];
-    }    
+    let i = optimParams.length - 1;
+    text += dist.paramNames[dist.activeParamsInds[i]] + ' = ' + optimParams[i].toPrecision(4) + '</p>';
+  } else if (status !== 'ok') {
+    text = '<p style="color:tomato;">Timed out before finding parameters to match quantiles.</p>';
+  } else{
+    text = errText;
   }
 
-  
-  source_p.data['x'] = x_p;
-  source_c.data['x'] = x_c;
+  quantileSetterDiv.text = text;
 
-  
-  let params = paramsFromSliders(sliders);
+  if (optimSuccess || partial) {
+    
+    let params = [];
+    let aInd = 0;
+    for (let i = 0; i < sliders.length; i++) {
+      if (dist.activeParamsInds.includes(i)) {
+        params.push(optimParams[aInd]);
 
-  
-  source_p.data['y_p'] = dist.pmf(x_p, params);
-  source_c.data['y_c'] = dist.cdfForPlotting(x_c[0], x_c[x_c.length - 1], params);
+        
+        sliders[i].value = optimParams[aInd];
 
-  source_p.change.emit();
-  source_c.change.emit();
-}
+        aInd += 1;
+      } else { 
+        params.push(sliders[i].value);
+      }
+    }
 
-""",
-    "updateData": """
-function updateData(source_p, source_c, p_p, sliders, discrete) {
-  if (discrete) {
-    updateDiscretePMFandCDF(source_p, source_c, p_p.x_range, sliders);
-  }
-  else {
-    updateContinuousPDFandCDF(source_p, source_c, p_p.x_range, sliders);
-  }
-}
+    
+    for (let i = 0; i < optimParams.length; i++ ) {
+      if (sliders[dist.activeParamsInds[i]].start > optimParams[i] || sliders[dist.activeParamsInds[i]].end < optimParams[i]) {
+        
+        if (dist.locationParamInd === dist.activeParamsInds[i] || dist.paramMin[dist.activeParamsInds[i]] < 0) {
+          let width = (dist.ppf(0.975, params) - dist.ppf(0.025, params)) / 2;
+          startBoxes[dist.activeParamsInds[i]].value = (optimParams[i] - width).toPrecision(4);
+          endBoxes[dist.activeParamsInds[i]].value = (optimParams[i] + width).toPrecision(4);
+        } else {
+          startBoxes[dist.activeParamsInds[i]].value = (4 * optimParams[i] / 1001).toPrecision(4);
+          endBoxes[dist.activeParamsInds[i]].value = (4 * optimParams[i]).toPrecision(4);
+        }
+      }
+      
+      sliders[dist.activeParamsInds[i]].start = Number(startBoxes[dist.activeParamsInds[i]].value);
+      sliders[dist.activeParamsInds[i]].end = Number(endBoxes[dist.activeParamsInds[i]].value);
+    }
 
-""",
-    "updateQuantiles": """
-function updateQuantiles(quantileSetterSwitch, sliders, xBoxes, pBoxes) {
-  if (!quantileSetterSwitch.active) {
-    let params = paramsFromSliders(sliders);
+    
+    let [x1, x2] = dist.defaultXRange(params);
 
-    for (let i = 0; i < xBoxes.length; i++) {
-      xBoxes[i].value = dist.ppfSingleValue(Number(pBoxes[i].value), params).toPrecision(4);
-    }
+    p_p.x_range.start = x1;
+    p_p.x_range.end = x2;
+
+    
+    commitBatch(() => updateData(source_p, source_c, p_p, sliders, discrete, () => setYRanges(p_p, p_c, source_p)));
+  }
+  else {
+    commitBatch();
   }
 }
 
@@ -5152,9 +7651,6 @@ function updateQuantiles(quantileSetterSwitch, sliders, xBoxes, pBoxes) {
     "quantileSetter": """
 function quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p) {
   
-  triggerCallbacks.active = false;
-
-  
   let inputOk;
   try {
     var x = paramsFromBoxes(xBoxes);
@@ -5166,7 +7662,7 @@ function quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes,
     
     inputOk = checkQuantileInput(x, p, dist.hardMin, dist.hardMax, dist.varName, quantileSetterDiv);
   } catch (e) {
-    quantileSetterDiv.text = '<p style="color:tomato;">' + e.message; + '</p>';
+    quantileSetterDiv.text = '<p style="color:tomato;">' + e.message + '</p>';
     inputOk = false;
   }
 
@@ -5179,84 +7675,62 @@ function quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes,
       }
     }
 
-    
-    let errText = '<p style="color:tomato;">Failed to find parameters to match quantiles.</p>';
+    const onResult = ([optimParams, optimSuccess, errText, status]) => {
+      applyQuantileSetResult(optimParams, optimSuccess, errText, status, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p);
+    };
 
-    
-    let optimParams, optimSuccess;
-    try {
-      [optimParams, optimSuccess] = dist.quantileSet(x, p, extraParams);
-    } catch(e) {
-      optimSuccess = false;
-      errText = '<p style="color:tomato;">' + e.message; + '</p>';
+    if (postToWorker(workerScript, 'quantileSet', {x: x, p: p, extraParams: extraParams}, onResult)) {
+      quantileSetterDiv.text = '<p>Computing...</p>';
     }
-
-    let text;
-    if (optimSuccess) {
-      
-      text = '<p>';
-      for (let i = 0; i < optimParams.length - 1; i++) {
-        text += dist.paramNames[dist.activeParamsInds[i]] + ' = ' + optimParams[i].toPrecision(4) + ', ';
-      }
-      let i = optimParams.length - 1;
-      text += dist.paramNames[dist.activeParamsInds[i]] + ' = ' + optimParams[i].toPrecision(4) + '</p>';
-    } else{
-      text = errText;
+    else {
+      onResult(solveQuantileSet(x, p, extraParams));
     }
+  }
+}
 
-    quantileSetterDiv.text = text;
-
-    if (optimSuccess) {
-      
-      let params = [];
-      let aInd = 0;
-      for (let i = 0; i < sliders.length; i++) {
-        if (dist.activeParamsInds.includes(i)) {
-          params.push(optimParams[aInd]);
-
-          
-          sliders[i].value = optimParams[aInd];
-
-          aInd += 1;
-        } else { 
-          params.push(sliders[i].value);
-        }
-      }
-
-      
-      for (let i = 0; i < optimParams.length; i++ ) {
-        if (sliders[dist.activeParamsInds[i]].start > optimParams[i] || sliders[dist.activeParamsInds[i]].end < optimParams[i]) {
-          
-          if (dist.locationParamInd === dist.activeParamsInds[i] || dist.paramMin[dist.activeParamsInds[i]] < 0) {
-            let width = (dist.ppf(0.975, params) - dist.ppf(0.025, params)) / 2;
-            startBoxes[dist.activeParamsInds[i]].value = (optimParams[i] - width).toPrecision(4);
-            endBoxes[dist.activeParamsInds[i]].value = (optimParams[i] + width).toPrecision(4);
-          } else {
-            startBoxes[dist.activeParamsInds[i]].value = (4 * optimParams[i] / 1001).toPrecision(4);
-            endBoxes[dist.activeParamsInds[i]].value = (4 * optimParams[i]).toPrecision(4);
-          }
-        }
-        
-        sliders[dist.activeParamsInds[i]].start = Number(startBoxes[dist.activeParamsInds[i]].value);
-        sliders[dist.activeParamsInds[i]].end = Number(endBoxes[dist.activeParamsInds[i]].value);
-      }
+""",
+    "makeSolverBudget": """
+function makeSolverBudget(timeLimit=Infinity, token=null) {
+	return {
+		deadline: performance.now() + timeLimit,
+		token: token,
+		status: 'ok',
+	};
+}
 
-      
-      let [x1, x2] = dist.defaultXRange(params);
+""",
+    "solverBudgetExhausted": """
+function solverBudgetExhausted(budget) {
+	if (budget === null) return false;
+	if (budget.status !== 'ok') return true;
 
-      p_p.x_range.start = x1;
-      p_p.x_range.end = x2;
+	if (budget.token !== null && budget.token.cancelled) {
+		budget.status = 'cancelled';
+	}
+	else if (performance.now() > budget.deadline) {
+		budget.status = 'timeout';
+	}
 
-      
-      updateData(source_p, source_c, p_p, sliders, discrete);
+	return budget.status !== 'ok';
+}
 
-      
-      setYRanges(p_p, p_c, source_p);  
-    }
-  }
+""",
+    "withSolverBudget": """
+function withSolverBudget(budget, fn) {
+	let previous = defaultSolverBudget();
+	withSolverBudget.active = budget;
+	try {
+		return fn();
+	}
+	finally {
+		withSolverBudget.active = previous;
+	}
+}
 
-  
-  triggerCallbacks.active = true;  
+""",
+    "defaultSolverBudget": """
+function defaultSolverBudget() {
+	return withSolverBudget.active === undefined ? null : withSolverBudget.active;
 }
 
 """,
@@ -5307,7 +7781,8 @@ function findRootTrustRegion(
 		maxIters=10000, 
 		deltaBar=1000.0, 
 		eta=0.125, 
-		minDelta=1e-12
+		minDelta=1e-12,
+		budget=defaultSolverBudget()
   ) {
 	
 	let x = deepCopy(x0);
@@ -5331,7 +7806,7 @@ function findRootTrustRegion(
 	let normJTr = norm(JTr);
 
 	let iters = 0;
-	while (iters < maxIters && checkTol(r, tol) && delta >= minDelta) {
+	while (iters < maxIters && checkTol(r, tol) && delta >= minDelta && !solverBudgetExhausted(budget)) {
 		
 		let p = doglegStep(JTJ, JTr, normJTr, delta);
 
@@ -5435,12 +7910,14 @@ function doglegStep(JTJ, JTr, normJTr, delta) {
 
 """,
     "bisectionSolve": """
-function bisectionSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000) {
+function bisectionSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000, budget=defaultSolverBudget()) {
 	
   if (f(lower, ...args) * f(upper, ...args) >= 0) return null;
 
   let mid = lower;
   for (let i = 0; i < maxIter; i++) {
+    if (solverBudgetExhausted(budget)) return (lower + upper) / 2;
+
     mid = (lower + upper) / 2;
     let fMid = f(mid, ...args);
 
@@ -5455,11 +7932,13 @@ function bisectionSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000) {
 
 """,
     "newtonSolve": """
-function newtonSolve(x0, f, df, args=[], tol=1e-8, maxIter=200, epsilon=1e-14) {
+function newtonSolve(x0, f, df, args=[], tol=1e-8, maxIter=200, epsilon=1e-14, budget=defaultSolverBudget()) {
 	let x = Infinity;
 	let solved = false;
 
   for (let i = 0; i < maxIter; i++) {
+      if (solverBudgetExhausted(budget)) return x0;
+
       let y = f(x0, ...args);
       let yprime = df(x0, ...args);
 
@@ -5483,7 +7962,7 @@ function newtonSolve(x0, f, df, args=[], tol=1e-8, maxIter=200, epsilon=1e-14) {
 
 """,
     "secantSolve": """
-function secantSolve(x0, f, args=[], tol=1e-8, maxIter=200, epsilon=1e-14, h=1e-4) {
+function secantSolve(x0, f, args=[], tol=1e-8, maxIter=200, epsilon=1e-14, h=1e-4, budget=defaultSolverBudget()) {
 	let x = Infinity;
 	let solved = false;
 
@@ -5498,6 +7977,8 @@ function secantSolve(x0, f, args=[], tol=1e-8, maxIter=200, epsilon=1e-14, h=1e-
 	}
 
 	for (let i = 0; i < maxIter; i++) {
+		if (solverBudgetExhausted(budget)) return x1;
+
 		if (q0 == q1) {
 			solved = x0 == x1;
 			x = (x0 + x1) / 2.0;
@@ -5526,7 +8007,7 @@ function secantSolve(x0, f, args=[], tol=1e-8, maxIter=200, epsilon=1e-14, h=1e-
 
 """,
     "brentSolve": """
-function brentSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000) {
+function brentSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000, budget=defaultSolverBudget()) {
 	let a = lower;
 	let b = upper;
   let fa = f(a, ...args);
@@ -5547,6 +8028,10 @@ function brentSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000) {
 
 	let iter = 0;
   while (iter++ < maxIter) {
+  	if (solverBudgetExhausted(budget)) {
+  		return Math.abs(fb) <= Math.abs(fc) ? b : c;
+  	}
+
   	let prevStep = b - a;
 
     
@@ -5637,115 +8122,319 @@ slider.start = Math.max(Math.floor(minValue), Math.floor(Number(cb_obj.value)));
 
 
 slider.end = Math.min(Math.floor(maxValue), Math.floor(Number(cb_obj.value)));""",
-    "quantile_setter_switch_callback": """
+    "dispatch_callback": """
 
-if (cb_obj.active) {
-  for (let i = 0; i < sliders.length; i++) {
-    if (!dist.fixedParamsInds.includes(i)) {
-      sliders[i].title = dist.paramNames[i] + ' (computed)';
-      sliders[i].disabled = true;
+if (sliders.includes(cb_obj)) {
+  
+  if (triggerCallbacks.active && !cb_obj.disabled) {
+    if (quantileSetterSwitch.active) {
+      quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p);
+    }
+    else {
+      updateData(source_p, source_c, p_p, sliders, discrete);
+      updateQuantiles(quantileSetterSwitch, sliders, xBoxes, pBoxes);
     }
   }
-  for (let xBox of xBoxes) {
-    xBox.disabled = false;
-  }
-  for (let pBox of pBoxes) {
-    pBox.disabled = false;
+}
+else if (cb_obj === p_p.x_range) {
+  if (triggerCallbacks.active) {
+    updateData(source_p, source_c, p_p, sliders, discrete);
   }
-} else {
-  for (let i = 0; i < sliders.length; i++) {
-    if (!dist.fixedParamsInds.includes(i)) {
-      sliders[i].title = dist.paramNames[i];
-      sliders[i].disabled = false;
+}
+else if (cb_obj === quantileSetterSwitch) {
+  if (cb_obj.active) {
+    for (let i = 0; i < sliders.length; i++) {
+      if (!dist.fixedParamsInds.includes(i)) {
+        sliders[i].title = dist.paramNames[i] + ' (computed)';
+        sliders[i].disabled = true;
+      }
+    }
+    for (let xBox of xBoxes) {
+      xBox.disabled = false;
+    }
+    for (let pBox of pBoxes) {
+      pBox.disabled = false;
+    }
+  } else {
+    for (let i = 0; i < sliders.length; i++) {
+      if (!dist.fixedParamsInds.includes(i)) {
+        sliders[i].title = dist.paramNames[i];
+        sliders[i].disabled = false;
+      }
+    }
+    for (let xBox of xBoxes) {
+      xBox.disabled = true;
     }
+    for (let pBox of pBoxes) {
+      pBox.disabled = true;
+    }
+    quantileSetterDiv.text = '';
+  }
+}
+else if (xBoxes.includes(cb_obj) || pBoxes.includes(cb_obj)) {
+  if (quantileSetterSwitch.active) {
+    quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p);
   }
-  for (let xBox of xBoxes) {
-    xBox.disabled = true;
+}
+else if (cb_obj === sampleSwitch) {
+  if (cb_obj.active) {
+    updateSamples(source_hist, source_ecdf, p_p, sliders, discrete);
   }
-  for (let pBox of pBoxes) {
-    pBox.disabled = true;
+  else {
+    clearSamples(source_hist, source_ecdf);
   }
-  quantileSetterDiv.text = '';
-}""",
-    "quantile_setter_callback": """
+}
+else if (cb_obj.event_name === 'reset') {
+  
+  let params = paramsFromSliders(sliders);
 
-if (quantileSetterSwitch.active) {
-  quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p);
-}""",
-    "reset_button_callback": """
+  
+  let [x1, x2] = dist.defaultXRange(params);
 
-let params = paramsFromSliders(sliders); 
+  
+  beginBatch();
+  p_p.x_range.start = x1;
+  p_p.x_range.end = x2;
 
+  
+  commitBatch(() => updateData(source_p, source_c, p_p, sliders, discrete, () => setYRanges(p_p, p_c, source_p)));
+}
+""",
+    "worker_handler": """
 
-let [x1, x2] = dist.defaultXRange(params);
+var n, discreteLod, cdfStrategy, stepCdf, solverTimeLimit;
 
+var workerPending = {};
+var workerScheduled = false;
 
-triggerCallbacks.active = false;
+function handleWorkerRequest(request) {
+  n = request.n;
+  discreteLod = request.discreteLod;
+  cdfStrategy = request.cdfStrategy;
+  stepCdf = request.stepCdf;
+  solverTimeLimit = request.solverTimeLimit;
 
+  let response = {kind: request.kind, id: request.id};
+  try {
+    if (request.kind === 'data') {
+      response.result = computeData(request.xRange, request.params, request.discrete, request.width, request.height, request.logDensity);
+    }
+    else if (request.kind === 'sweep') {
+      response.result = computeSweepData(request.xRange, request.params, request.sweepInd, request.sweepValues, request.discrete, request.width, request.logDensity);
+    }
+    else if (request.kind === 'quantiles') {
+      response.result = computeQuantiles(request.pVals, request.params);
+    }
+    else if (request.kind === 'samples') {
+      response.result = sampleCounts(new Float64Array(request.bins.nBins + 2), request.bins, request.params, request.sampleSize);
+    }
+    else if (request.kind === 'quantileSet') {
+      response.result = solveQuantileSet(request.x, request.p, request.extraParams);
+    }
+    else {
+      response.error = 'Unknown request ' + request.kind + '.';
+    }
+  }
+  catch (e) {
+    response.error = e.message;
+  }
 
-p_p.x_range.start = x1;
-p_p.x_range.end = x2;
+  return response;
+}
 
-updateData(source_p, source_c, p_p, sliders, discrete);
+function processWorkerRequests() {
+  workerScheduled = false;
 
+  
+  for (let kind of ['quantileSet', 'data', 'sweep', 'samples', 'quantiles']) {
+    if (kind in workerPending) {
+      let request = workerPending[kind];
+      delete workerPending[kind];
+      self.postMessage(handleWorkerRequest(request));
+    }
+  }
+}
 
-setYRanges(p_p, p_c, source_p);  
+self.onmessage = (event) => {
+  
+  workerPending[event.data.kind] = event.data;
 
-triggerCallbacks.active = true;
+  
+  if (!workerScheduled) {
+    workerScheduled = true;
+    setTimeout(processWorkerRequests, 0);
+  }
+};
 """,
-    "slider_callback": """
+    "profiler": """
 
-if (triggerCallbacks.active && !cb_obj.disabled) {
-	if (quantileSetterSwitch.active) {
-		quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p);
-	}
-	else {
-		updateData(source_p, source_c, p_p, sliders, discrete);
-		updateQuantiles(quantileSetterSwitch, sliders, xBoxes, pBoxes);
-	}
-}""",
-    "xaxis_change_callback": """
-if (triggerCallbacks.active) {
-  updateData(source_p, source_c, p_p, sliders, discrete);
-}""",
+var profileWindow = 50;
+
+
+function profileState(profileDiv) {
+  if (globalThis.distributionExplorerProfiles === undefined) {
+    globalThis.distributionExplorerProfiles = {};
+  }
+  let states = globalThis.distributionExplorerProfiles;
+
+  if (!(profileDiv.id in states)) {
+    states[profileDiv.id] = {stats: {}, depth: 0, distDepth: 0, points: 0, solverEvals: 0, renderScheduled: false};
+  }
+
+  return states[profileDiv.id];
+}
+
+
+function profileRecord(state, name, elapsed, points, solverEvals) {
+  if (!(name in state.stats)) {
+    state.stats[name] = {calls: 0, last: 0, max: 0, total: 0, recent: [], points: 0, solverEvals: 0};
+  }
+  let entry = state.stats[name];
+
+  entry.calls += 1;
+  entry.last = elapsed;
+  entry.max = Math.max(entry.max, elapsed);
+  entry.total += elapsed;
+  entry.recent.push(elapsed);
+  if (entry.recent.length > profileWindow) entry.recent.shift();
+  entry.avg = entry.recent.reduce((a, b) => a + b, 0) / entry.recent.length;
+  entry.points = points;
+  entry.solverEvals = solverEvals;
+}
+
+function profileRender(state, profileDiv) {
+  if (state.renderScheduled) return;
+  state.renderScheduled = true;
+
+  setTimeout(() => {
+    state.renderScheduled = false;
+
+    let names = Object.keys(state.stats).sort((a, b) => state.stats[b].total - state.stats[a].total);
+    let cell = 'style="padding: 0 8px; text-align: right;"';
+    let text = '<table style="font-family: monospace; font-size: 11px;"><tr><th></th>'
+               + ['calls', 'last ms', 'avg ms', 'max ms', 'points', 'solver evals'].map(h => '<th ' + cell + '>' + h + '</th>').join('')
+               + '</tr>';
+    for (let name of names.slice(0, 10)) {
+      let entry = state.stats[name];
+      text += '<tr><td>' + name + '</td>'
+              + [entry.calls, entry.last.toFixed(2), entry.avg.toFixed(2), entry.max.toFixed(2), entry.points, entry.solverEvals].map(v => '<td ' + cell + '>' + v + '</td>').join('')
+              + '</tr>';
+    }
+    profileDiv.text = text + '</table>';
+  }, 0);
+}
+
+function profileWrap(state, name, fn, profileDiv, isDistMethod = false) {
+  return function (...args) {
+    let points = state.points;
+    let solverEvals = state.solverEvals;
+    if (isDistMethod) {
+      if (state.distDepth === 0) state.points += Array.isArray(args[0]) ? args[0].length : 1;
+      state.distDepth += 1;
+    }
+    state.depth += 1;
+
+    let start = performance.now();
+    try {
+      return fn.apply(this, args);
+    }
+    finally {
+      let elapsed = performance.now() - start;
+      state.depth -= 1;
+      if (isDistMethod) state.distDepth -= 1;
+
+      profileRecord(state, name, elapsed, state.points - points, state.solverEvals - solverEvals);
+      if (state.depth === 0) profileRender(state, profileDiv);
+    }
+  };
+}
+
+function profileWrapSolver(state, name, solver, fInd, profileDiv) {
+  let wrapped = profileWrap(state, name, solver, profileDiv);
+
+  return function (...args) {
+    let f = args[fInd];
+    args[fInd] = (...fArgs) => {
+      state.solverEvals += 1;
+      return f(...fArgs);
+    };
+
+    return wrapped.apply(this, args);
+  };
+}
+
+
+function profileDist(state, dist, profileDiv) {
+  let names = new Set();
+  for (let proto = Object.getPrototypeOf(dist); proto !== null && proto !== Object.prototype; proto = Object.getPrototypeOf(proto)) {
+    for (let name of Object.getOwnPropertyNames(proto)) {
+      let descriptor = Object.getOwnPropertyDescriptor(proto, name);
+      if (name !== 'constructor' && typeof descriptor.value === 'function') names.add(name);
+    }
+  }
+
+  for (let name of names) {
+    dist[name] = profileWrap(state, 'dist.' + name, dist[name], profileDiv, true);
+  }
+}
+
+
+var profile = profileState(profileDiv);
+
+
+if (typeof updateData === 'function') updateData = profileWrap(profile, 'updateData', updateData, profileDiv);
+if (typeof updateSamples === 'function') updateSamples = profileWrap(profile, 'updateSamples', updateSamples, profileDiv);
+if (typeof updateSweep === 'function') updateSweep = profileWrap(profile, 'updateSweep', updateSweep, profileDiv);
+if (typeof updateQuantiles === 'function') updateQuantiles = profileWrap(profile, 'updateQuantiles', updateQuantiles, profileDiv);
+if (typeof quantileSetter === 'function') quantileSetter = profileWrap(profile, 'quantileSetter', quantileSetter, profileDiv);
+if (typeof findRootTrustRegion === 'function') findRootTrustRegion = profileWrapSolver(profile, 'findRootTrustRegion', findRootTrustRegion, 0, profileDiv);
+if (typeof bisectionSolve === 'function') bisectionSolve = profileWrapSolver(profile, 'bisectionSolve', bisectionSolve, 0, profileDiv);
+if (typeof newtonSolve === 'function') newtonSolve = profileWrapSolver(profile, 'newtonSolve', newtonSolve, 1, profileDiv);
+if (typeof secantSolve === 'function') secantSolve = profileWrapSolver(profile, 'secantSolve', secantSolve, 1, profileDiv);
+if (typeof brentSolve === 'function') brentSolve = profileWrapSolver(profile, 'brentSolve', brentSolve, 0, profileDiv);
+profileDist(profile, dist, profileDiv);
+""",
 }
 
 _dependencies = {
     "UnivariateDistribution": [],
-    "DiscreteUnivariateDistribution": ['UnivariateDistribution', 'isclose'],
+    "DiscreteUnivariateDistribution": ['UnivariateDistribution', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'log1p'],
     "ContinuousUnivariateDistribution": ['UnivariateDistribution'],
-    "TemplateDiscreteUnivariateDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'isclose'],
+    "TemplateDiscreteUnivariateDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'log1p'],
     "TemplateContinuousUnivariateDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution'],
-    "BernoulliDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'isclose'],
-    "BetaBinomialDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'lnchoice', 'lnbeta', 'lnfactorial', 'lngamma', 'isclose'],
-    "BinomialDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'lnchoice', 'regularizedIncompleteBeta', 'brentSolve', 'lnfactorial', 'log1p', 'betacf', 'lngamma', 'isclose'],
-    "CategoricalDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'isclose'],
-    "DiscreteUniformDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'isclose'],
-    "GeometricDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'isclose'],
-    "HypergeometricDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'lnchoice', 'lnfactorial', 'isclose'],
-    "NegativeBinomialDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'BinomialDistribution', 'PoissonDistribution', 'regularizedIncompleteBeta', 'lngamma', 'lnfactorial', 'findRootTrustRegion', 'bisectionSolve', 'brentSolve', 'lnchoice', 'log1p', 'betacf', 'isclose', 'gammaincU', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'gammaincL', 'dot', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
-    "NegativeBinomialMuPhiDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'NegativeBinomialDistribution', 'BinomialDistribution', 'PoissonDistribution', 'regularizedIncompleteBeta', 'lngamma', 'lnfactorial', 'findRootTrustRegion', 'bisectionSolve', 'brentSolve', 'lnchoice', 'log1p', 'betacf', 'isclose', 'gammaincU', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'gammaincL', 'dot', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
+    "BernoulliDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'log1p'],
+    "BetaBinomialDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'lnchoice', 'lnbeta', 'lnfactorial', 'lngamma', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'log1p'],
+    "BinomialDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'lnchoice', 'regularizedIncompleteBeta', 'betaincAsymptotic', 'betaincAsymptoticError', 'brentSolve', 'lnfactorial', 'log1p', 'betacf', 'lngamma', 'log1pmx', 'erfc', 'solverBudgetExhausted', 'defaultSolverBudget', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'withSolverBudget'],
+    "CategoricalDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'log1p'],
+    "DiscreteUniformDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'log1p'],
+    "GeometricDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'log1p', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample'],
+    "HypergeometricDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'lnchoice', 'lnfactorial', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'log1p'],
+    "NegativeBinomialDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'BinomialDistribution', 'PoissonDistribution', 'regularizedIncompleteBeta', 'betaincAsymptotic', 'betaincAsymptoticError', 'lngamma', 'lnfactorial', 'findRootTrustRegion', 'bisectionSolve', 'brentSolve', 'lnchoice', 'log1p', 'betacf', 'log1pmx', 'erfc', 'solverBudgetExhausted', 'defaultSolverBudget', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'withSolverBudget', 'gammaincU', 'gammaincAsymptotic', 'gammaincAsymptoticError', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'gammaincL', 'dot', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
+    "NegativeBinomialMuPhiDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'NegativeBinomialDistribution', 'BinomialDistribution', 'PoissonDistribution', 'regularizedIncompleteBeta', 'betaincAsymptotic', 'betaincAsymptoticError', 'lngamma', 'lnfactorial', 'findRootTrustRegion', 'bisectionSolve', 'brentSolve', 'lnchoice', 'log1p', 'betacf', 'log1pmx', 'erfc', 'solverBudgetExhausted', 'defaultSolverBudget', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'withSolverBudget', 'gammaincU', 'gammaincAsymptotic', 'gammaincAsymptoticError', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'gammaincL', 'dot', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
     "NegativeBinomialAlphaPDistribution": [],
-    "NegativeBinomialRBDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'NegativeBinomialDistribution', 'BinomialDistribution', 'PoissonDistribution', 'regularizedIncompleteBeta', 'lngamma', 'lnfactorial', 'findRootTrustRegion', 'bisectionSolve', 'brentSolve', 'lnchoice', 'log1p', 'betacf', 'isclose', 'gammaincU', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'gammaincL', 'dot', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
-    "PoissonDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'gammaincU', 'lnfactorial', 'brentSolve', 'lngamma', 'gammaincL', 'isclose'],
-    "TelegraphRNADistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'lngamma', 'hyp1f1', 'lnfactorial', 'brentSolve', 'isclose'],
-    "BetaDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'isone', 'iszero', 'lnbeta', 'regularizedIncompleteBeta', 'findRootTrustRegion', 'brentSolve', 'isclose', 'lngamma', 'log1p', 'betacf', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'dot', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
-    "BetaPhiKappaDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'BetaDistribution', 'isone', 'iszero', 'lnbeta', 'regularizedIncompleteBeta', 'findRootTrustRegion', 'brentSolve', 'isclose', 'lngamma', 'log1p', 'betacf', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'dot', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
+    "NegativeBinomialRBDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'NegativeBinomialDistribution', 'BinomialDistribution', 'PoissonDistribution', 'regularizedIncompleteBeta', 'betaincAsymptotic', 'betaincAsymptoticError', 'lngamma', 'lnfactorial', 'findRootTrustRegion', 'bisectionSolve', 'brentSolve', 'lnchoice', 'log1p', 'betacf', 'log1pmx', 'erfc', 'solverBudgetExhausted', 'defaultSolverBudget', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'withSolverBudget', 'gammaincU', 'gammaincAsymptotic', 'gammaincAsymptoticError', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'gammaincL', 'dot', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
+    "PoissonDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'gammaincU', 'gammaincAsymptotic', 'gammaincAsymptoticError', 'lnfactorial', 'brentSolve', 'lngamma', 'gammaincL', 'log1pmx', 'erfc', 'solverBudgetExhausted', 'defaultSolverBudget', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'log1p', 'withSolverBudget'],
+    "TelegraphRNADistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'lngamma', 'hyp1f1', 'lnfactorial', 'brentSolve', 'solverBudgetExhausted', 'defaultSolverBudget', 'isclose', 'logSumExp', 'aliasTable', 'aliasSample', 'log1p', 'withSolverBudget'],
+    "BetaDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'isone', 'iszero', 'logit', 'erfinv', 'lnbeta', 'regularizedIncompleteBeta', 'regularizedIncompleteBetaInv', 'betaincAsymptotic', 'betaincAsymptoticError', 'bilinearInterp', 'zigguratNormalTables', 'standardGamma', 'betaQuantileSetTable', 'findRootTrustRegion', 'brentSolve', 'isclose', 'lngamma', 'log1p', 'betacf', 'log1pmx', 'erfc', 'standardNormal', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'solverBudgetExhausted', 'defaultSolverBudget', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'dot', 'zeros', 'withSolverBudget', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
+    "BetaPhiKappaDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'BetaDistribution', 'isone', 'iszero', 'logit', 'erfinv', 'lnbeta', 'regularizedIncompleteBeta', 'regularizedIncompleteBetaInv', 'betaincAsymptotic', 'betaincAsymptoticError', 'bilinearInterp', 'zigguratNormalTables', 'standardGamma', 'betaQuantileSetTable', 'findRootTrustRegion', 'brentSolve', 'isclose', 'lngamma', 'log1p', 'betacf', 'log1pmx', 'erfc', 'standardNormal', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'solverBudgetExhausted', 'defaultSolverBudget', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'dot', 'zeros', 'withSolverBudget', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
     "CauchyDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution'],
     "ExponentialDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution'],
-    "GammaDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'lngamma', 'gammaincL', 'norm', 'findRootTrustRegion', 'secantSolve', 'brentSolve', 'gammaincU', 'dot', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
+    "GammaDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'erfinv', 'lngamma', 'gammaincL', 'gammaincLInv', 'gammaincAsymptotic', 'gammaincAsymptoticError', 'bilinearInterp', 'zigguratNormalTables', 'standardGamma', 'norm', 'gammaQuantileSetTable', 'findRootTrustRegion', 'secantSolve', 'brentSolve', 'gammaincU', 'log1pmx', 'erfc', 'standardNormal', 'dot', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'deepCopy', 'solverBudgetExhausted', 'defaultSolverBudget', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'log1p', 'zeros', 'withSolverBudget', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
     "HalfCauchyDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution'],
-    "HalfNormalDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'erf', 'erfinv'],
-    "HalfStudentTDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'CauchyDistribution', 'HalfCauchyDistribution', 'HalfNormalDistribution', 'NormalDistribution', 'StudentTDistribution', 'log1p', 'regularizedIncompleteBeta', 'lngamma', 'norm', 'findRootTrustRegion', 'erf', 'erfinv', 'betacf', 'dot', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
-    "InverseGammaDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'GammaDistribution', 'lngamma', 'gammaincU', 'gammaincL', 'norm', 'findRootTrustRegion', 'secantSolve', 'brentSolve', 'dot', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
-    "InverseGaussianDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'logSumExp', 'lnStdNormCdf', 'findRootTrustRegion', 'newtonSolve', 'log1p', 'erfc', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'dot', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
-    "LogNormalDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'erf', 'erfinv'],
-    "NormalDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'erf', 'erfinv'],
+    "HalfNormalDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'erf', 'erfinv', 'zigguratNormalTables', 'standardNormal'],
+    "HalfStudentTDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'CauchyDistribution', 'HalfCauchyDistribution', 'HalfNormalDistribution', 'NormalDistribution', 'StudentTDistribution', 'log1p', 'regularizedIncompleteBeta', 'studentTCdfAsymptotic', 'studentTCdfAsymptoticError', 'lnGammaHalfRatio', 'zigguratNormalTables', 'standardNormal', 'standardGamma', 'norm', 'findRootTrustRegion', 'erf', 'erfinv', 'regularizedIncompleteBetaInv', 'betacf', 'lngamma', 'erfc', 'dot', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'deepCopy', 'solverBudgetExhausted', 'defaultSolverBudget', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'lnbeta', 'zeros', 'withSolverBudget', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
+    "InverseGammaDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'GammaDistribution', 'lngamma', 'gammaincU', 'gammaincAsymptotic', 'gammaincAsymptoticError', 'zigguratNormalTables', 'standardGamma', 'erfinv', 'gammaincL', 'gammaincLInv', 'bilinearInterp', 'norm', 'gammaQuantileSetTable', 'findRootTrustRegion', 'secantSolve', 'brentSolve', 'log1pmx', 'erfc', 'standardNormal', 'dot', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'deepCopy', 'solverBudgetExhausted', 'defaultSolverBudget', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'log1p', 'zeros', 'withSolverBudget', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
+    "InverseGaussianDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'logSumExp', 'lnStdNormCdf', 'zigguratNormalTables', 'standardNormal', 'findRootTrustRegion', 'newtonSolve', 'log1p', 'erfc', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'solverBudgetExhausted', 'defaultSolverBudget', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'dot', 'zeros', 'withSolverBudget', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
+    "LogNormalDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'erf', 'erfinv', 'zigguratNormalTables', 'standardNormal'],
+    "NormalDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'erf', 'erfinv', 'zigguratNormalTables', 'standardNormal'],
     "ParetoDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution'],
-    "StudentTDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'CauchyDistribution', 'NormalDistribution', 'log1p', 'erfinv', 'regularizedIncompleteBeta', 'lngamma', 'norm', 'findRootTrustRegion', 'erf', 'betacf', 'dot', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
+    "StudentTDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'CauchyDistribution', 'NormalDistribution', 'log1p', 'erfinv', 'regularizedIncompleteBeta', 'regularizedIncompleteBetaInv', 'studentTCdfAsymptotic', 'studentTCdfAsymptoticError', 'lnGammaHalfRatio', 'zigguratNormalTables', 'standardNormal', 'standardGamma', 'norm', 'findRootTrustRegion', 'erf', 'betacf', 'lngamma', 'lnbeta', 'erfc', 'dot', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'deepCopy', 'solverBudgetExhausted', 'defaultSolverBudget', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'zeros', 'withSolverBudget', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
     "UniformDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution'],
-    "VonMisesDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'NormalDistribution', 'isclose', 'erf', 'besseli0', 'cosm1', 'clenshawCurtisIntegrate', 'findRootTrustRegion', 'brentSolve', 'erfinv', 'chbevl', 'polevl', 'chebPoints', 'clenshawCurtisWeights', 'dot', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
+    "VonMisesDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'NormalDistribution', 'isclose', 'erf', 'besseli0', 'cosm1', 'clenshawCurtisIntegrate', 'zigguratNormalTables', 'standardNormal', 'findRootTrustRegion', 'brentSolve', 'erfinv', 'chbevl', 'polevl', 'chebPoints', 'clenshawCurtisWeights', 'dot', 'transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'solverBudgetExhausted', 'defaultSolverBudget', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'zeros', 'withSolverBudget', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
     "WeibullDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution'],
+    "SumDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'isclose', 'subscript', 'fftConvolve', 'componentParams', 'fftRadix2', 'logSumExp', 'aliasTable', 'aliasSample', 'log1p', 'fftTwiddles'],
+    "DiscreteMixtureDistribution": ['UnivariateDistribution', 'DiscreteUnivariateDistribution', 'isclose', 'logSumExp', 'subscript', 'componentParams', 'mixtureWeights', 'sampleMixture', 'log1p', 'aliasTable', 'aliasSample'],
+    "ContinuousMixtureDistribution": ['UnivariateDistribution', 'ContinuousUnivariateDistribution', 'logSumExp', 'subscript', 'componentParams', 'mixtureWeights', 'sampleMixture', 'brentSolve', 'log1p', 'solverBudgetExhausted', 'defaultSolverBudget', 'withSolverBudget'],
     "isclose": [],
     "isone": ['isclose'],
     "iszero": [],
@@ -5755,6 +8444,7 @@ _dependencies = {
     "meshgrid": [],
     "logit": [],
     "log1p": [],
+    "log1pmx": ['log1p'],
     "logSumExp": ['log1p'],
     "erf": [],
     "erfc": [],
@@ -5764,19 +8454,42 @@ _dependencies = {
     "lnbeta": ['lngamma'],
     "betacf": [],
     "regularizedIncompleteBeta": ['log1p', 'betacf', 'lngamma'],
+    "regularizedIncompleteBetaInv": ['log1p', 'lnbeta', 'regularizedIncompleteBeta', 'lngamma', 'betacf'],
+    "betaincAsymptotic": ['log1pmx', 'erfc', 'log1p'],
+    "betaincAsymptoticError": [],
+    "studentTCdfAsymptotic": ['erfc'],
+    "studentTCdfAsymptoticError": [],
+    "lnGammaHalfRatio": ['lngamma'],
     "incompleteBeta": ['lnbeta', 'regularizedIncompleteBeta', 'lngamma', 'log1p', 'betacf'],
     "lngamma": [],
     "gammaincU": ['lngamma', 'gammaincL', 'gammaincU'],
     "gammaincL": ['lngamma', 'gammaincU', 'gammaincL'],
+    "gammaincLInv": ['lngamma', 'gammaincU', 'gammaincL'],
+    "gammaincAsymptotic": ['log1pmx', 'erfc', 'log1p'],
+    "gammaincAsymptoticError": [],
     "hyp1f1": ['lngamma'],
     "chbevl": [],
     "polevl": [],
     "besseli0": ['chbevl'],
     "cosm1": ['polevl'],
+    "bilinearInterp": [],
     "chebPoints": [],
     "clenshawCurtisWeights": [],
     "clenshawCurtisIntegrate": ['chebPoints', 'clenshawCurtisWeights', 'dot'],
     "lnfactorial": [],
+    "makeRng": [],
+    "zigguratNormalTables": [],
+    "standardNormal": [],
+    "standardGamma": ['standardNormal'],
+    "aliasTable": [],
+    "aliasSample": [],
+    "subscript": [],
+    "fftTwiddles": [],
+    "fftRadix2": ['fftTwiddles'],
+    "fftConvolve": ['fftRadix2', 'fftTwiddles'],
+    "componentParams": [],
+    "mixtureWeights": [],
+    "sampleMixture": [],
     "transpose": [],
     "mvMult": ['dot'],
     "svMult": [],
@@ -5802,31 +8515,64 @@ _dependencies = {
     "LUPDecompose": ['shallowCopyMatrix'],
     "LUPSolve": [],
     "solve": ['zeros', 'modifiedCholesky', 'modifiedCholeskySolve', 'solvePosDef', 'deepCopy', 'arange', 'transpose', 'lowerTriSolve', 'upperTriSolve'],
+    "gammaQuantileSetTable": [],
+    "betaQuantileSetTable": [],
     "paramsFromSliders": [],
     "paramsFromBoxes": [],
     "setYRanges": [],
     "checkQuantileInput": [],
-    "updateContinuousPDFandCDF": ['linspace', 'paramsFromSliders'],
-    "updateDiscretePMFandCDF": ['arange', 'paramsFromSliders'],
-    "updateData": ['updateContinuousPDFandCDF', 'updateDiscretePMFandCDF', 'linspace', 'paramsFromSliders', 'arange'],
-    "updateQuantiles": ['paramsFromSliders'],
-    "quantileSetter": ['paramsFromSliders', 'paramsFromBoxes', 'setYRanges', 'checkQuantileInput', 'updateData', 'updateContinuousPDFandCDF', 'updateDiscretePMFandCDF', 'linspace', 'arange'],
+    "plotFrameSize": [],
+    "adaptiveGrid": ['linspace'],
+    "log10PDF": [],
+    "computeContinuousPDFandCDF": ['linspace', 'adaptiveGrid', 'log10PDF'],
+    "computeBucketedPMFandCDF": [],
+    "computeDiscretePMFandCDF": ['arange', 'computeBucketedPMFandCDF', 'staircaseToSteps'],
+    "staircaseToSteps": [],
+    "computeData": ['computeContinuousPDFandCDF', 'computeDiscretePMFandCDF', 'linspace', 'adaptiveGrid', 'log10PDF', 'arange', 'computeBucketedPMFandCDF', 'staircaseToSteps'],
+    "setSourceData": [],
+    "workerState": [],
+    "postToWorker": ['workerState'],
+    "decodePrecomputedFrame": [],
+    "precomputedData": ['decodePrecomputedFrame', 'framesAgree'],
+    "framesAgree": [],
+    "appState": [],
+    "beginBatch": ['appState'],
+    "commitBatch": ['appState'],
+    "updateData": ['paramsFromSliders', 'plotFrameSize', 'computeData', 'setSourceData', 'postToWorker', 'precomputedData', 'appState', 'updateSamples', 'updateObservedHistogram', 'updateSweep', 'computeContinuousPDFandCDF', 'computeDiscretePMFandCDF', 'linspace', 'adaptiveGrid', 'log10PDF', 'arange', 'computeBucketedPMFandCDF', 'staircaseToSteps', 'workerState', 'decodePrecomputedFrame', 'framesAgree', 'sampleBins', 'sampleCounts', 'sampleArrays', 'setSampleData', 'observedHistogram', 'computeSweepData', 'makeRng', 'sweepGrid'],
+    "sampleBins": [],
+    "sampleCounts": ['makeRng'],
+    "sampleArrays": ['appState'],
+    "setSampleData": ['sampleArrays', 'appState'],
+    "updateSamples": ['paramsFromSliders', 'plotFrameSize', 'postToWorker', 'sampleBins', 'sampleCounts', 'sampleArrays', 'setSampleData', 'workerState', 'makeRng', 'appState'],
+    "clearSamples": ['appState'],
+    "observedHistogram": [],
+    "updateObservedHistogram": ['plotFrameSize', 'appState', 'observedHistogram'],
+    "sweepGrid": ['linspace'],
+    "computeSweepData": ['log10PDF', 'sweepGrid', 'linspace'],
+    "updateSweep": ['paramsFromSliders', 'plotFrameSize', 'postToWorker', 'appState', 'computeSweepData', 'workerState', 'log10PDF', 'sweepGrid', 'linspace'],
+    "computeQuantiles": [],
+    "updateQuantiles": ['paramsFromSliders', 'postToWorker', 'computeQuantiles', 'workerState'],
+    "solveQuantileSet": ['makeSolverBudget', 'withSolverBudget', 'defaultSolverBudget'],
+    "applyQuantileSetResult": ['setYRanges', 'beginBatch', 'commitBatch', 'updateData', 'appState', 'paramsFromSliders', 'plotFrameSize', 'computeData', 'setSourceData', 'postToWorker', 'precomputedData', 'updateSamples', 'updateObservedHistogram', 'updateSweep', 'computeContinuousPDFandCDF', 'computeDiscretePMFandCDF', 'linspace', 'adaptiveGrid', 'log10PDF', 'arange', 'computeBucketedPMFandCDF', 'staircaseToSteps', 'workerState', 'decodePrecomputedFrame', 'framesAgree', 'sampleBins', 'sampleCounts', 'sampleArrays', 'setSampleData', 'observedHistogram', 'computeSweepData', 'makeRng', 'sweepGrid'],
+    "quantileSetter": ['paramsFromSliders', 'paramsFromBoxes', 'checkQuantileInput', 'postToWorker', 'solveQuantileSet', 'applyQuantileSetResult', 'workerState', 'makeSolverBudget', 'withSolverBudget', 'defaultSolverBudget', 'setYRanges', 'beginBatch', 'commitBatch', 'updateData', 'appState', 'plotFrameSize', 'computeData', 'setSourceData', 'precomputedData', 'updateSamples', 'updateObservedHistogram', 'updateSweep', 'computeContinuousPDFandCDF', 'computeDiscretePMFandCDF', 'linspace', 'adaptiveGrid', 'log10PDF', 'arange', 'computeBucketedPMFandCDF', 'staircaseToSteps', 'decodePrecomputedFrame', 'framesAgree', 'sampleBins', 'sampleCounts', 'sampleArrays', 'setSampleData', 'observedHistogram', 'computeSweepData', 'makeRng', 'sweepGrid'],
+    "makeSolverBudget": [],
+    "solverBudgetExhausted": [],
+    "withSolverBudget": ['defaultSolverBudget', 'withSolverBudget'],
+    "defaultSolverBudget": ['withSolverBudget', 'defaultSolverBudget'],
     "jacCentralDiff": ['deepCopy', 'zeros'],
-    "findRootTrustRegion": ['transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'dot', 'zeros', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
+    "findRootTrustRegion": ['transpose', 'mvMult', 'mmMult', 'vectorAdd', 'norm', 'deepCopy', 'solverBudgetExhausted', 'defaultSolverBudget', 'computeRho', 'checkTol', 'doglegStep', 'jacCentralDiff', 'dot', 'zeros', 'withSolverBudget', 'svMult', 'quadForm', 'solvePosDef', 'modifiedCholesky', 'modifiedCholeskySolve', 'arange', 'lowerTriSolve', 'upperTriSolve'],
     "computeRho": ['mvMult', 'vectorAdd', 'norm', 'dot'],
     "checkTol": [],
     "doglegStep": ['svMult', 'vectorAdd', 'dot', 'norm', 'quadForm', 'solvePosDef', 'mvMult', 'zeros', 'modifiedCholesky', 'modifiedCholeskySolve', 'deepCopy', 'arange', 'transpose', 'lowerTriSolve', 'upperTriSolve'],
-    "bisectionSolve": [],
-    "newtonSolve": [],
-    "secantSolve": [],
-    "brentSolve": [],
+    "bisectionSolve": ['solverBudgetExhausted', 'defaultSolverBudget', 'withSolverBudget'],
+    "newtonSolve": ['solverBudgetExhausted', 'defaultSolverBudget', 'withSolverBudget'],
+    "secantSolve": ['solverBudgetExhausted', 'defaultSolverBudget', 'withSolverBudget'],
+    "brentSolve": ['solverBudgetExhausted', 'defaultSolverBudget', 'withSolverBudget'],
     "slider_start_callback": [],
     "slider_end_callback": [],
     "int_slider_start_callback": [],
     "int_slider_end_callback": [],
-    "quantile_setter_switch_callback": [],
-    "quantile_setter_callback": ['quantileSetter', 'paramsFromSliders', 'paramsFromBoxes', 'setYRanges', 'checkQuantileInput', 'updateData', 'updateContinuousPDFandCDF', 'updateDiscretePMFandCDF', 'linspace', 'arange'],
-    "reset_button_callback": ['paramsFromSliders', 'setYRanges', 'updateData', 'updateContinuousPDFandCDF', 'updateDiscretePMFandCDF', 'linspace', 'arange'],
-    "slider_callback": ['updateData', 'updateQuantiles', 'quantileSetter', 'updateContinuousPDFandCDF', 'updateDiscretePMFandCDF', 'linspace', 'paramsFromSliders', 'arange', 'paramsFromBoxes', 'setYRanges', 'checkQuantileInput'],
-    "xaxis_change_callback": ['updateData', 'updateContinuousPDFandCDF', 'updateDiscretePMFandCDF', 'linspace', 'paramsFromSliders', 'arange'],
+    "dispatch_callback": ['paramsFromSliders', 'setYRanges', 'beginBatch', 'commitBatch', 'updateData', 'updateSamples', 'clearSamples', 'updateQuantiles', 'quantileSetter', 'appState', 'plotFrameSize', 'computeData', 'setSourceData', 'postToWorker', 'precomputedData', 'updateObservedHistogram', 'updateSweep', 'computeContinuousPDFandCDF', 'computeDiscretePMFandCDF', 'linspace', 'adaptiveGrid', 'log10PDF', 'arange', 'computeBucketedPMFandCDF', 'staircaseToSteps', 'workerState', 'decodePrecomputedFrame', 'framesAgree', 'sampleBins', 'sampleCounts', 'sampleArrays', 'setSampleData', 'observedHistogram', 'computeSweepData', 'makeRng', 'sweepGrid', 'computeQuantiles', 'paramsFromBoxes', 'checkQuantileInput', 'solveQuantileSet', 'applyQuantileSetResult', 'makeSolverBudget', 'withSolverBudget', 'defaultSolverBudget'],
+    "worker_handler": ['computeData', 'sampleCounts', 'computeSweepData', 'computeQuantiles', 'solveQuantileSet', 'computeContinuousPDFandCDF', 'computeDiscretePMFandCDF', 'linspace', 'adaptiveGrid', 'log10PDF', 'arange', 'computeBucketedPMFandCDF', 'staircaseToSteps', 'makeRng', 'sweepGrid', 'makeSolverBudget', 'withSolverBudget', 'defaultSolverBudget'],
+    "profiler": [],
 }
\ No newline at end of file
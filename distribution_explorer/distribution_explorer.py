@@ -1,12 +1,18 @@
+import concurrent.futures
+import functools
+import os
+import time
 import warnings
 
 import numpy as np
+import scipy.optimize
 import scipy.special
 import scipy.stats as st
 
 import bokeh.events
 import bokeh.layouts
 import bokeh.models
+import bokeh.palettes
 import bokeh.plotting
 
 from . import callbacks
@@ -58,6 +64,11 @@ continuous_dists = [
 ]
 
 
+# Composite distributions, built from the distributions given as
+# `components` in explore()
+composite_dists = ["sum", "mixture"]
+
+
 def _to_camel_case(input_str):
     result = "".join(word.capitalize() for word in input_str.split("_"))
 
@@ -125,6 +136,13 @@ def _halfstudent_t_pdf(x, nu, mu, sigma):
     return out
 
 
+def _halfstudent_t_logpdf(x, nu, mu, sigma):
+    out = np.empty_like(x)
+    out[x >= mu] = np.log(2) + st.t.logpdf(x[x >= mu], nu, mu, sigma)
+    out[x < mu] = -np.inf
+    return out
+
+
 def _halfstudent_t_cdf(x, nu, mu, sigma):
     out = np.empty_like(x)
     out[x >= mu] = 2 * st.t.cdf(x[x >= mu], nu, mu, sigma) - 1
@@ -136,7 +154,7 @@ def _log_pochhammer(a, n):
     return scipy.special.gammaln(a + n) - scipy.special.gammaln(a)
 
 
-def _telegraph_rna_pmf_indiv(kon, koff, beta, n):
+def _telegraph_rna_logpmf_indiv(kon, koff, beta, n):
     log_res = n * np.log(beta)
     log_res -= scipy.special.loggamma(n + 1)
 
@@ -146,21 +164,67 @@ def _telegraph_rna_pmf_indiv(kon, koff, beta, n):
     # Hypergeometric
     log_res += np.log(scipy.special.hyp1f1(kon + n, kon + koff + n, -beta))
 
-    return np.exp(log_res)
+    return log_res
 
-def _telegraph_rna_pmf(x, kon, koff, beta):
+
+def _telegraph_rna_logpmf(x, kon, koff, beta):
     if np.isscalar(x):
-        return _telegraph_rna_pmf_indiv(kon, koff, beta, x)
+        return _telegraph_rna_logpmf_indiv(kon, koff, beta, x)
     else:
-        return np.array([_telegraph_rna_pmf_indiv(kon, koff, beta, n) for n in x])
+        return np.array([_telegraph_rna_logpmf_indiv(kon, koff, beta, n) for n in x])
+
+
+def _telegraph_rna_pmf(x, kon, koff, beta):
+    return np.exp(_telegraph_rna_logpmf(x, kon, koff, beta))
 
 
 def _telegraph_rna_cdf(x, kon, koff, beta):
-    _discrete_cdf(x, _telegraph_rna_pmf, 0, (kon, koff, beta))
+    return _discrete_cdf(x, _telegraph_rna_pmf, 0, (kon, koff, beta))
+
+
+def _von_mises_cdf(x, mu, kappa):
+    """CDF of the Von Mises distribution on the interval [-π, π]."""
+    return st.vonmises.cdf(x, kappa, loc=mu) - st.vonmises.cdf(-np.pi, kappa, loc=mu)
+
+
+def _canonical_dist_name(dist):
+    """Convert alternative name of a distribution to the name used
+    internally."""
+    if dist == "gaussian":
+        dist = "normal"
+    if dist == "invgamma" or dist == 'inverse-gamma':
+        dist = "inverse_gamma"
+    if dist == "wald" or dist == "invgaussian" or dist == "invgauss" or dist == 'inverse-gaussian':
+        dist = "inverse_gaussian"
+    if dist == "lognormal" or dist == 'log-normal':
+        dist = "log_normal"
+    if dist == "halfnormal" or dist == "half-normal":
+        dist = "half_normal"
+    if dist == "halfcauchy" or dist == 'half-cauchy':
+        dist = "half_cauchy"
+    if dist == "halfstudent_t" or dist == 'half-student-t' or dist == 'half_student_t' or dist == 'halfstudentt':
+        dist = "half_student_t"
+    if dist == "vonmises":
+        dist = "von_mises"
+
+    return dist
+
+
+def _dist_names():
+    """Names of all distributions, without alternative names."""
+    names = []
+    for dist in discrete_dists + continuous_dists:
+        dist = _canonical_dist_name(dist)
+        if dist not in names:
+            names.append(dist)
+
+    return names
 
 
 def _funs(dist):
-    if dist == "bernoulli":
+    if isinstance(dist, tuple):
+        return _composite_funs(dist)
+    elif dist == "bernoulli":
         return st.bernoulli.pmf, st.bernoulli.cdf
     elif dist == "binomial":
         return st.binom.pmf, st.binom.cdf
@@ -188,8 +252,8 @@ def _funs(dist):
         )
     elif dist == "negative_binomial_mu_phi":
         return (
-            lambda x, mu, phi: st.nbinom.pmf(x, phi, phi / mu),
-            lambda x, mu, phi: st.nbinom.cdf(x, phi, phi / mu),
+            lambda x, mu, phi: st.nbinom.pmf(x, phi, phi / (mu + phi)),
+            lambda x, mu, phi: st.nbinom.cdf(x, phi, phi / (mu + phi)),
         )
     elif dist == "negative_binomial_r_b":
         return (
@@ -256,8 +320,8 @@ def _funs(dist):
         )
     elif dist == "von_mises":
         return (
-            lambda x, mu, kappa: st.vonmises_line.pdf(x, kappa, loc=mu),
-            lambda x, mu, kappa: st.vonmises_line.cdf(x, kappa, loc=mu),
+            lambda x, mu, kappa: st.vonmises.pdf(x, kappa, loc=mu),
+            _von_mises_cdf,
         )
     elif dist == "weibull":
         return (
@@ -268,7 +332,381 @@ def _funs(dist):
         raise RuntimeError("Distribution not included.")
 
 
+def _log_funs(dist):
+    """Natural log of the PMF/PDF of a distribution. Where SciPy has it,
+    it is computed directly, and not as the log of the PMF/PDF, so that
+    it does not underflow in the tails."""
+    if isinstance(dist, tuple):
+        return _composite_log_fun(dist)
+    elif dist == "bernoulli":
+        return st.bernoulli.logpmf
+    elif dist == "binomial":
+        return st.binom.logpmf
+    elif dist == "categorical":
+        return lambda x, *thetas: np.log(_categorical_pmf(x, *thetas))
+    elif dist == "discrete_uniform":
+        return lambda x, low, high: st.randint.logpmf(x, low, high + 1)
+    elif dist == "geometric":
+        return lambda x, theta: st.geom.logpmf(x, theta, -1)
+    elif dist == "hypergeometric":
+        return lambda x, N, a, b: st.hypergeom.logpmf(x, a + b, a, N)
+    elif dist == "negative_binomial":
+        return lambda x, alpha, beta: st.nbinom.logpmf(x, alpha, beta / (1 + beta))
+    elif dist == "negative_binomial_mu_phi":
+        return lambda x, mu, phi: st.nbinom.logpmf(x, phi, phi / (mu + phi))
+    elif dist == "negative_binomial_r_b":
+        return lambda x, r, b: st.nbinom.logpmf(x, r, 1 / (1 + b))
+    elif dist == "poisson":
+        return st.poisson.logpmf
+    elif dist == "telegraph_rna":
+        return _telegraph_rna_logpmf
+    elif dist == "beta":
+        return st.beta.logpdf
+    elif dist == "beta_phi_kappa":
+        return lambda x, phi, kappa: st.beta.logpdf(x, phi * kappa, (1 - phi) * kappa)
+    elif dist == "cauchy":
+        return st.cauchy.logpdf
+    elif dist == "exponential":
+        return lambda x, beta: st.expon.logpdf(x, loc=0, scale=1 / beta)
+    elif dist == "gamma":
+        return lambda x, alpha, beta: st.gamma.logpdf(x, alpha, loc=0, scale=1 / beta)
+    elif dist == "half_cauchy":
+        return st.halfcauchy.logpdf
+    elif dist == "half_normal":
+        return st.halfnorm.logpdf
+    elif dist == "half_student_t":
+        return _halfstudent_t_logpdf
+    elif dist == "inverse_gamma":
+        return lambda x, alpha, beta: st.invgamma.logpdf(x, alpha, loc=0, scale=beta)
+    elif dist == "inverse_gaussian":
+        return lambda x, mu, lam: st.invgauss.logpdf(x, mu / lam, loc=0, scale=lam)
+    elif dist == "log_normal":
+        return lambda x, mu, sigma: st.lognorm.logpdf(
+            x, sigma, loc=0, scale=np.exp(mu)
+        )
+    elif dist == "normal":
+        return st.norm.logpdf
+    elif dist == "pareto":
+        return lambda x, y_min, alpha: st.pareto.logpdf(x, alpha, scale=y_min)
+    elif dist == "student_t":
+        return st.t.logpdf
+    elif dist == "uniform":
+        return lambda x, alpha, beta: st.uniform.logpdf(x, alpha, beta - alpha)
+    elif dist == "von_mises":
+        return lambda x, mu, kappa: st.vonmises.logpdf(x, kappa, loc=mu)
+    elif dist == "weibull":
+        return lambda x, alpha, sigma: st.weibull_min.logpdf(
+            x, alpha, loc=0, scale=sigma
+        )
+    else:
+        raise RuntimeError("Distribution not included.")
+
+
+def _log10_density_fun(dist):
+    """Log base 10 of the PMF/PDF, as plotted when the y-axis is
+    logarithmic, with non-finite values as NaN."""
+    log_fun = _log_funs(dist)
+
+    def fun(x, *param_vals):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = np.asarray(log_fun(x, *param_vals), dtype=float) / np.log(10)
+
+        return np.where(np.isfinite(out), out, np.nan)
+
+    return fun
+
+
+def _subscript(n):
+    """Subscript of a positive integer in Unicode digits, as made by
+    subscript() in the callbacks."""
+    return "".join("₀₁₂₃₄₅₆₇₈₉"[int(d)] for d in str(n))
+
+
+def _discrete_support_min(dist, param_vals):
+    """Smallest value of the support of a discrete distribution, as given
+    by the xMin() methods of the classes in prob_dists.js."""
+    if dist == "categorical":
+        return 1
+    elif dist == "discrete_uniform":
+        return param_vals[0]
+    elif dist == "hypergeometric":
+        N, a, b = param_vals
+        return max(0, N - b)
+
+    return 0
+
+
+def _component_params(components, param_vals):
+    """Split the parameters of a composite distribution into the
+    parameters of each of its components, in order."""
+    parts = []
+    offset = 0
+    for component in components:
+        n_params = len(_load_params(component, None, None, None, None, None)[0])
+        parts.append(tuple(param_vals[offset : offset + n_params]))
+        offset += n_params
+
+    return parts
+
+
+def _mixture_weights(param_vals, n_components):
+    """Weights of the components of a mixture, given by the last
+    `n_components - 1` parameters, with the weight of the last component
+    being what remains, as computed by mixtureWeights() in the callbacks.
+    Returns None if the weights are not a valid probability vector."""
+    weights = [float(w) for w in param_vals[len(param_vals) - n_components + 1 :]]
+    last = 1 - sum(weights)
+    if -1e-12 < last < 0:
+        last = 0.0
+    weights = np.array(weights + [last])
+
+    return weights if np.all((weights >= 0) & (weights <= 1)) else None
+
+
+def _fft_convolve(a, b, n_out):
+    """First `n_out` entries of the linear convolution of `a` and `b`,
+    computed by FFT on a power-of-two grid, as by fftConvolve() in the
+    callbacks."""
+    a = a[:n_out]
+    b = b[:n_out]
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros(n_out)
+
+    n = 1
+    while n < len(a) + len(b) - 1:
+        n *= 2
+
+    out = np.fft.irfft(np.fft.rfft(a, n) * np.fft.rfft(b, n), n)[:n_out]
+
+    return np.concatenate((out, np.zeros(n_out - len(out))))
+
+
+def _sum_lattice(components, funs, param_vals, hi, max_lattice=2**22):
+    """PMF of a sum of independent discrete random variables on the
+    integers from the smallest value of its support to `hi`, computed by
+    FFT convolution of the PMFs of the components, as by the lattice()
+    method of SumDistribution in prob_dists.js. Returns the smallest
+    value of the support and the PMF, which is NaN for invalid
+    parameters."""
+    parts = _component_params(components, param_vals)
+    lows = [_discrete_support_min(c, part) for c, part in zip(components, parts)]
+    start = int(sum(lows))
+    n_ints = int(min(max(hi, start), start + max_lattice - 1)) - start + 1
+
+    pmf = None
+    for (fun_p, _), low, part in zip(funs, lows, parts):
+        with np.errstate(all="ignore"):
+            component_pmf = np.asarray(
+                fun_p(low + np.arange(n_ints), *part), dtype=float
+            )
+        component_pmf = np.broadcast_to(component_pmf, (n_ints,)).copy()
+        if np.all(np.isnan(component_pmf)):
+            return start, np.full(n_ints, np.nan)
+        component_pmf[np.isnan(component_pmf)] = 0.0
+
+        if pmf is None:
+            pmf = component_pmf
+        else:
+            pmf = _fft_convolve(pmf, component_pmf, n_ints)
+
+    # Roundoff from the transforms can give small negative values
+    return start, np.maximum(pmf, 0.0)
+
+
+def _sum_funs(components):
+    """PMF and CDF of a sum of independent discrete random variables.
+    The lattice for the most recent parameters is kept and grown by
+    doubling, so that repeated evaluation, as in finding quantiles, is
+    cheap."""
+    funs = [_funs(component) for component in components]
+    cache = {}
+
+    def lattice(x, param_vals):
+        x = np.asarray(x, dtype=float)
+        hi = np.max(x[np.isfinite(x)], initial=0.0)
+        key = tuple(float(val) for val in param_vals)
+        if cache.get("key") != key or cache["hi"] < hi:
+            if cache.get("key") == key:
+                hi = max(hi, 2 * cache["hi"] - cache["start"] + 1)
+            start, pmf = _sum_lattice(components, funs, param_vals, hi)
+            cache.update(
+                key=key,
+                start=start,
+                hi=start + len(pmf) - 1,
+                pmf=pmf,
+                cdf=np.minimum(np.cumsum(pmf), 1.0),
+            )
+
+        return x, cache["start"], cache["pmf"], cache["cdf"]
+
+    def lookup(vals, inds, below, above):
+        out = np.full(inds.shape, float(below))
+        in_lattice = (inds >= 0) & (inds < len(vals))
+        out[in_lattice] = vals[inds[in_lattice].astype(int)]
+        out[inds >= len(vals)] = above
+        if np.isnan(vals[0]):
+            out[:] = np.nan
+
+        return out
+
+    def fun_p(x, *param_vals):
+        x, start, pmf, _ = lattice(x, param_vals)
+        out = lookup(pmf, x - start, 0.0, np.nan)
+        out[x != np.floor(x)] = 0.0
+
+        return out
+
+    def fun_c(x, *param_vals):
+        x, start, _, cdf = lattice(x, param_vals)
+        out = lookup(cdf, np.floor(x) - start, 0.0, np.nan)
+        out[(x == np.inf) & ~np.isnan(cdf[0])] = 1.0
+
+        return out
+
+    return fun_p, fun_c
+
+
+def _mixture_funs(components):
+    """PDF/PMF and CDF of a finite mixture, with the weights of all but
+    the last component following the parameters of the components."""
+    funs = [_funs(component) for component in components]
+
+    def mixture(which):
+        def fun(x, *param_vals):
+            weights = _mixture_weights(param_vals, len(components))
+            if weights is None:
+                return np.full(np.shape(x), np.nan)
+
+            out = np.zeros(np.shape(x))
+            parts = _component_params(components, param_vals)
+            for component_funs, weight, part in zip(funs, weights, parts):
+                if weight > 0:
+                    vals = np.asarray(component_funs[which](x, *part), dtype=float)
+                    vals = np.broadcast_to(vals, np.shape(x))
+
+                    # Discrete distributions may be NaN off of their support
+                    if not np.all(np.isnan(vals)):
+                        vals = np.nan_to_num(vals, nan=0.0)
+                    out += weight * vals
+
+            return out
+
+        return fun
+
+    return mixture(0), mixture(1)
+
+
+def _composite_funs(dist):
+    kind, components = dist
+    if kind == "sum":
+        return _sum_funs(components)
+
+    return _mixture_funs(components)
+
+
+def _composite_log_fun(dist):
+    """Log of the PMF/PDF of a composite distribution. For a mixture, it
+    is the log-sum-exp of the weighted log densities of the components.
+    The PMF of a sum is computed on a lattice, so its log is taken."""
+    kind, components = dist
+    if kind == "sum":
+        fun_p, _ = _sum_funs(components)
+        return lambda x, *param_vals: np.log(fun_p(x, *param_vals))
+
+    log_funs = [_log_funs(component) for component in components]
+
+    def fun(x, *param_vals):
+        weights = _mixture_weights(param_vals, len(components))
+        if weights is None:
+            return np.full(np.shape(x), np.nan)
+
+        out = np.full(np.shape(x), -np.inf)
+        parts = _component_params(components, param_vals)
+        for log_fun, weight, part in zip(log_funs, weights, parts):
+            if weight > 0:
+                with np.errstate(divide="ignore"):
+                    vals = np.asarray(log_fun(x, *part), dtype=float)
+                vals = np.broadcast_to(vals, np.shape(x))
+
+                # Discrete distributions may be NaN off of their support
+                if not np.all(np.isnan(vals)):
+                    vals = np.nan_to_num(vals, nan=-np.inf, posinf=np.inf)
+                out = np.logaddexp(out, np.log(weight) + vals)
+
+        return out
+
+    return fun
+
+
+def _composite_title(titles):
+    if len(titles) == 2:
+        return " and ".join(titles)
+
+    return ", ".join(titles[:-1]) + ", and " + titles[-1]
+
+
+def _load_composite_params(dist, _params, _x_min, _x_max, _x_axis_label, _title):
+    """Parameters, plotting range, axis label, and title of a composite
+    distribution, built from those of its components. The parameters of
+    each component are subscripted with its position. A mixture also has
+    the weights of all but its last component as parameters."""
+    kind, components = dist
+
+    params = []
+    x_mins = []
+    x_maxs = []
+    titles = []
+    for i, component in enumerate(components):
+        component_params, x_min, x_max, x_axis_label, title = _load_params(
+            component, None, None, None, None, None
+        )
+        if i == 0:
+            first_x_axis_label = x_axis_label
+        params += [
+            dict(param, name=param["name"] + _subscript(i + 1))
+            for param in component_params
+        ]
+        x_mins.append(x_min)
+        x_maxs.append(x_max)
+        titles.append(title)
+
+    if kind == "sum":
+        x_min = sum(x_mins)
+        x_max = sum(x_maxs)
+        title = "Sum of " + _composite_title(titles)
+    else:
+        x_min = min(x_mins)
+        x_max = max(x_maxs)
+        title = "Mixture of " + _composite_title(titles)
+        params += [
+            dict(
+                name="w" + _subscript(i + 1),
+                start=0,
+                end=1,
+                value=1 / len(components),
+                step=0.01,
+                is_int=False,
+                min_value="0",
+                max_value="1",
+            )
+            for i in range(len(components) - 1)
+        ]
+
+    params = params if _params is None else _params
+    x_min = x_min if _x_min is None else _x_min
+    x_max = x_max if _x_max is None else _x_max
+    x_axis_label = first_x_axis_label if _x_axis_label is None else _x_axis_label
+    title = title if _title is None else _title
+
+    return params, x_min, x_max, x_axis_label, title
+
+
 def _load_params(dist, _params, _x_min, _x_max, _x_axis_label, _title):
+    if isinstance(dist, tuple):
+        return _load_composite_params(
+            dist, _params, _x_min, _x_max, _x_axis_label, _title
+        )
+
     # DEBUG: This is a holder until all dists have quantile setter params
     quantile_setter_params = {}
 
@@ -1054,7 +1492,8 @@ def _compute_quantile_setter_params(dist, params, ptiles=None):
     Parameters
     ----------
     dist : str
-        Name of distribution
+        Name of distribution, or 'sum' or 'mixture' for a composite
+        distribution of the distributions given by `components`.
     params : list of dicts
         A list of parameter specifications. Each entry in the list gives
         specifications for a parameter of the distribution stored as a
@@ -1209,119 +1648,2181 @@ def _compute_quantile_setter_params(dist, params, ptiles=None):
     return x, p
 
 
-def explore(
-    dist=None,
-    params=None,
-    x_min=None,
-    x_max=None,
-    n=400,
-    **kwargs,
-):
-    """
-    Build interactive Bokeh app displaying a univariate
-    probability distribution.
+# Indices of parameters that are held fixed in quantile setting, as in the
+# fixedParamsInds of the classes in prob_dists.js
+_quantile_setter_fixed_params = {
+    "beta_binomial": [0],
+    "binomial": [0],
+    "hypergeometric": [0],
+    "negative_binomial": [0],
+    "negative_binomial_mu_phi": [1],
+    "negative_binomial_r_b": [0],
+    "telegraph_rna": [0, 1],
+    "half_cauchy": [0],
+    "half_normal": [0],
+    "half_student_t": [0, 1],
+    "student_t": [0],
+}
 
-    Parameters
-    ----------
-    dist : str
-        Name of distribution
-    params : list of dicts
-        A list of parameter specifications. Each entry in the list gives
-        specifications for a parameter of the distribution stored as a
-        dictionary. Each dictionary must have the following keys.
-            name : str, name of the parameter
-            start : float, starting point of slider for parameter (the
-                smallest allowed value of the parameter)
-            end : float, ending point of slider for parameter (the
-                largest allowed value of the parameter)
-            value : float, the value of the parameter that the slider
-                takes initially. Must be between start and end.
-            step : float, the step size for the slider
-    x_min : float, default dependent on dist
-        Minimum value that the random variable can take in plots.
-    x_max : float, default dependent on dist
-        Maximum value that the random variable can take in plots.
-    n : int, default 400
-        Number of points to use in making plots of PDF and CDF for
-        continuous distributions. This should be large enough to give
-        smooth plots.
-    kwargs : dict
-        Any kwargs to be passed to bokeh.plotting.figure().
 
-    Returns
-    -------
-    output : Bokeh app
-        An app to visualize the PDF/PMF and CDF. It can be displayed
-        with bokeh.io.show(). If it is displayed in a notebook, the
-        notebook_url kwarg should be specified.
-    """
-    dist = dist.lower()
-    if dist in discrete_dists:
-        discrete = True
-    elif dist in continuous_dists:
-        discrete = False
-    else:
-        dists = ", ".join(discrete_dists + continuous_dists)
-        raise RuntimeError(
-            f"distribution '{dist}' not supported. Allowed distributions are {dists}."
+def _root_rows(f, lo, hi, xtol=1e-12, max_iter=200):
+    """Roots of scalar functions, one for each row, bracketed by `lo` and
+    `hi`, found by the Illinois variant of regula falsi, falling back to
+    bisection when interpolation fails. `f(z, idx)` returns the values of
+    the functions of rows `idx` at `z`. Rows whose function does not
+    change sign over the bracket get NaN."""
+    a = np.array(lo, dtype=float)
+    b = np.array(hi, dtype=float)
+    idx = np.arange(len(a))
+    fa = f(a, idx)
+    fb = f(b, idx)
+
+    root = np.full(len(a), np.nan)
+    root[fa == 0] = a[fa == 0]
+    root[fb == 0] = b[fb == 0]
+    active = (fa * fb < 0) & np.isfinite(a) & np.isfinite(b)
+
+    # Side from which the bracket was last updated, for the Illinois step
+    side = np.zeros(len(a), dtype=int)
+    for _ in range(max_iter):
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            break
+
+        ai, bi, fai, fbi = a[idx], b[idx], fa[idx], fb[idx]
+        with np.errstate(all="ignore"):
+            c = (ai * fbi - bi * fai) / (fbi - fai)
+        bisect = ~((c > np.minimum(ai, bi)) & (c < np.maximum(ai, bi)))
+        c[bisect] = (ai[bisect] + bi[bisect]) / 2
+        fc = f(c, idx)
+
+        # Replace the end of the bracket with the same sign as fc
+        replace_b = np.sign(fc) == np.sign(fbi)
+        replace_a = ~replace_b
+        fa[idx] = np.where(
+            replace_b & (side[idx] == -1), fai / 2, np.where(replace_a, fc, fai)
         )
+        fb[idx] = np.where(
+            replace_a & (side[idx] == 1), fbi / 2, np.where(replace_b, fc, fbi)
+        )
+        a[idx] = np.where(replace_a, c, ai)
+        b[idx] = np.where(replace_b, c, bi)
+        side[idx] = np.where(replace_b, -1, 1)
 
-    if dist == "gaussian":
-        dist = "normal"
-    if dist == "invgamma" or dist == 'inverse-gamma':
-        dist = "inverse_gamma"
-    if dist == "wald" or dist == "invgaussian" or dist == "invgauss" or dist == 'inverse-gaussian':
-        dist = "inverse_gaussian"
-    if dist == "lognormal" or dist == 'log-normal':
-        dist = "log_normal"
-    if dist == "halfnormal" or dist == "half-normal":
-        dist = "half_normal"
-    if dist == "halfcauchy" or dist == 'half-cauchy':
-        dist = "half_cauchy"
-    if dist == "halfstudent_t" or dist == 'half-student-t' or dist == 'half_student_t' or dist == 'halfstudentt':
-        dist = "half_student_t"
-    if dist == "vonmises":
-        dist = "von_mises"
+        done = (fc == 0) | ~np.isfinite(c)
+        done |= np.abs(b[idx] - a[idx]) <= xtol * (1 + np.abs(c))
+        root[idx[done]] = c[done]
+        active[idx[done]] = False
 
-    # Name of JS class containing dist
-    distjs = f"{_to_camel_case(dist)}Distribution"
+    return root
 
-    # Parse figure kwargs
-    if "frame_height" not in kwargs and "height" not in kwargs:
-        kwargs["frame_height"] = 175
 
-    if "frame_width" not in kwargs and "width" not in kwargs:
-        kwargs["frame_width"] = 300
+def _newton_rows(f, z, tol=1e-12, max_iter=100):
+    """Roots of vector functions, one for each row, by Newton's method with
+    a finite difference Jacobian and backtracking. `f(z, idx)` returns the
+    residuals of rows `idx` at `z`, an array of the same shape as `z`.
+    Returns the roots and the maximum absolute residual of each row."""
+    z = np.array(z, dtype=float)
+    n, k = z.shape
+    r = f(z, np.arange(n))
+    err = np.max(np.abs(r), axis=1)
+    stuck = ~np.all(np.isfinite(z), axis=1)
 
-    x_axis_label = kwargs.pop("x_axis_label", None)
+    for _ in range(max_iter):
+        idx = np.flatnonzero(~(err < tol) & ~stuck)
+        if len(idx) == 0:
+            break
 
-    title = kwargs.pop("title", None)
+        zi, ri = z[idx], r[idx]
+        h = 1e-7 * np.maximum(1.0, np.abs(zi))
+        jac = np.empty((len(idx), k, k))
+        for j in range(k):
+            dz = zi.copy()
+            dz[:, j] += h[:, j]
+            jac[:, :, j] = (f(dz, idx) - ri) / h[:, j, None]
+        jac[~np.isfinite(jac)] = 0.0
+        ri_finite = np.where(np.isfinite(ri), ri, 0.0)
+        step = -(np.linalg.pinv(jac) @ ri_finite[:, :, None])[:, :, 0]
 
-    toolbar_location = kwargs.pop("toolbar_location", "right")
+        # Halve steps until the residual decreases
+        t = np.ones(len(idx))
+        z_new = zi + step
+        r_new = f(z_new, idx)
+        for _ in range(30):
+            worse = ~(np.max(np.abs(r_new), axis=1) < err[idx])
+            if not np.any(worse):
+                break
+            t[worse] /= 2
+            z_new[worse] = zi[worse] + t[worse, None] * step[worse]
+            r_new[worse] = f(z_new[worse], idx[worse])
 
-    if "y_axis_label" in kwargs:
-        del kwargs["y_axis_label"]
-        warnings.warn("kwargs `y_axis_label` is ignored.")
+        improved = np.max(np.abs(r_new), axis=1) < err[idx]
+        stuck[idx[~improved]] = True
+        z[idx[improved]] = z_new[improved]
+        r[idx[improved]] = r_new[improved]
+        err[idx[improved]] = np.max(np.abs(r_new[improved]), axis=1)
 
-    p_y_axis_type = kwargs.pop("y_axis_type", "linear")
+    return z, err
 
-    # Load parameters
-    params, x_min, x_max, x_axis_label, title = _load_params(
-        dist, params, x_min, x_max, x_axis_label, title
-    )
-    x_quantset, p_quantset = _compute_quantile_setter_params(dist, params)
 
-    for i, param in enumerate(params):
-        if "is_int" not in param:
-            params[i]["is_int"] = False
-        if params[i]["is_int"]:
-            params[i]["step"] = 1
-            params[i]["start"] = int(params[i]["start"])
+def _solve_rows(f, guesses, success_tol=1e-8):
+    """Solve root finding problems of rows with _newton_rows(), starting
+    from each array of initial guesses in `guesses` in turn for rows that
+    have not yet converged. Rows that still do not converge are retried,
+    one at a time, with SciPy's hybrid Powell method. Returns the roots
+    and whether each row converged."""
+    z = np.array(guesses[0], dtype=float)
+    err = np.full(len(z), np.inf)
+    for guess in guesses:
+        idx = np.flatnonzero(~(err < success_tol))
+        if len(idx) == 0:
+            break
+        z_new, err_new = _newton_rows(lambda zi, i: f(zi, idx[i]), guess[idx])
+        better = ~(err_new >= err[idx])
+        z[idx[better]] = z_new[better]
+        err[idx[better]] = err_new[better]
 
-    if discrete:
-        p_y_axis_label = "PMF"
-    else:
-        p_y_axis_label = "PDF"
+    for i in np.flatnonzero(~(err < success_tol)):
+        idx = np.array([i])
+        start = z[i] if np.all(np.isfinite(z[i])) else guesses[0][i]
+        if not np.all(np.isfinite(start)):
+            continue
+        with np.errstate(all="ignore"):
+            sol = scipy.optimize.root(
+                lambda zi: f(zi[None, :], idx)[0], start, method="hybr"
+            )
+            res = np.max(np.abs(f(sol.x[None, :], idx)))
+        if not res >= err[i]:
+            z[i], err[i] = sol.x, res
+
+    return z, err < success_tol
+
+
+def _normal_scores(p):
+    return np.sqrt(2) * scipy.special.erfinv(2 * p - 1)
+
+
+def _location_scale_quantile_set(x, z):
+    """Location and scale matching quantiles x with standard quantiles z."""
+    scale = (x[:, 1] - x[:, 0]) / (z[:, 1] - z[:, 0])
+    return np.stack([x[:, 1] - z[:, 1] * scale, scale], axis=1)
+
+
+def _bernoulli_quantile_set(x, p, fixed):
+    return 1 - p, x[:, 0] == 0
+
+
+def _binomial_quantile_set(x, p, fixed):
+    theta = scipy.special.bdtri(x[:, 0], fixed[:, 0], p[:, 0])
+    return theta[:, None], x[:, 0] < fixed[:, 0]
+
+
+def _geometric_quantile_set(x, p, fixed):
+    return 1.0 - (1.0 - p) ** (1.0 / (x + 1.0)), np.ones(len(x), dtype=bool)
+
+
+def _negative_binomial_prob(x, p, alpha):
+    """Success probability of the Negative Binomial distribution with
+    shape alpha whose CDF at x is p."""
+    return scipy.special.betaincinv(alpha, x[:, 0] + 1, p[:, 0])
+
+
+def _negative_binomial_quantile_set(x, p, fixed):
+    prob = _negative_binomial_prob(x, p, fixed[:, 0])
+    return (prob / (1 - prob))[:, None], np.ones(len(x), dtype=bool)
+
+
+def _negative_binomial_mu_phi_quantile_set(x, p, fixed):
+    phi = fixed[:, 0]
+    prob = _negative_binomial_prob(x, p, phi)
+    return (phi * (1 - prob) / prob)[:, None], np.ones(len(x), dtype=bool)
+
+
+def _negative_binomial_r_b_quantile_set(x, p, fixed):
+    prob = _negative_binomial_prob(x, p, fixed[:, 0])
+    return ((1 - prob) / prob)[:, None], np.ones(len(x), dtype=bool)
+
+
+def _poisson_quantile_set(x, p, fixed):
+    return scipy.special.pdtri(x, p), np.ones(len(x), dtype=bool)
+
+
+def _telegraph_rna_cdf_rows(x, kon, koff, beta):
+    """CDF of the Telegraph RNA distribution at x, vectorized over x and
+    parameters of the same length."""
+    n = np.arange(np.max(x) + 1)[None, :]
+    log_pmf = _telegraph_rna_logpmf_indiv(kon[:, None], koff[:, None], beta[:, None], n)
+    pmf = np.exp(log_pmf)
+
+    return np.sum(np.where(n <= x[:, None], pmf, 0.0), axis=1)
+
+
+def _telegraph_rna_quantile_set(x, p, fixed):
+    x1 = x[:, 0].astype(int)
+
+    def f(log_beta, idx):
+        kon, koff = fixed[idx].T
+        return p[idx, 0] - _telegraph_rna_cdf_rows(x1[idx], kon, koff, np.exp(log_beta))
+
+    log_beta = _root_rows(f, np.full(len(x), -20.0), np.full(len(x), 20.0))
+
+    return np.exp(log_beta)[:, None], np.isfinite(log_beta)
+
+
+def _beta_quantile_set(x, p, fixed):
+    # Initial guess from the logit of a Beta variate being roughly Normal
+    # with median log(alpha / beta) and variance 1 / alpha + 1 / beta
+    z = _normal_scores(p)
+    m, s = _location_scale_quantile_set(scipy.special.logit(x), z).T
+    guess = np.stack([np.logaddexp(0, m), np.logaddexp(0, -m)], axis=1)
+    guess -= 2 * np.log(s)[:, None]
+
+    # Residuals are differences of the logits of the quantiles, for which
+    # Newton steps are better behaved than for differences of the CDF
+    logit_x = scipy.special.logit(x)
+
+    def f(log_params, idx):
+        alpha, beta = np.exp(log_params).T
+        q = scipy.special.betaincinv(alpha[:, None], beta[:, None], p[idx])
+        return scipy.special.logit(q) - logit_x[idx]
+
+    # Bimodal Beta distributions, with both parameters below one, are
+    # often missed from the first guess
+    guesses = [guess, np.zeros_like(guess), np.full_like(guess, -1.5)]
+    log_params, success = _solve_rows(f, guesses)
+
+    return np.exp(log_params), success
+
+
+def _beta_phi_kappa_quantile_set(x, p, fixed):
+    params, success = _beta_quantile_set(x, p, fixed)
+    kappa = params[:, 0] + params[:, 1]
+    return np.stack([params[:, 0] / kappa, kappa], axis=1), success
+
+
+def _cauchy_quantile_set(x, p, fixed):
+    params = _location_scale_quantile_set(x, np.tan(np.pi * (p - 0.5)))
+    return params, np.ones(len(x), dtype=bool)
+
+
+def _exponential_quantile_set(x, p, fixed):
+    return -np.log1p(-p) / x, np.ones(len(x), dtype=bool)
+
+
+def _gamma_quantile_set(x, p, fixed):
+    # The ratio of the quantiles depends only on alpha, so alpha is found by
+    # one-dimensional root finding and beta matches the upper quantile
+    log_ratio = np.log(x[:, 1]) - np.log(x[:, 0])
+
+    def f(log_alpha, idx):
+        alpha = np.exp(log_alpha)[:, None]
+        log_q = np.log(scipy.special.gammaincinv(alpha, p[idx]))
+        spread = log_q[:, 1] - log_q[:, 0]
+        return np.where(np.isnan(spread), np.inf, spread) - log_ratio[idx]
+
+    alpha = np.exp(_root_rows(f, np.full(len(x), -12.0), np.full(len(x), 20.0)))
+    beta = scipy.special.gammaincinv(alpha, p[:, 1]) / x[:, 1]
+
+    return np.stack([alpha, beta], axis=1), np.isfinite(alpha)
+
+
+def _half_cauchy_quantile_set(x, p, fixed):
+    sigma = (x[:, 0] - fixed[:, 0]) / np.tan(np.pi * p[:, 0] / 2)
+    return sigma[:, None], sigma > 0
+
+
+def _half_normal_quantile_set(x, p, fixed):
+    sigma = (x[:, 0] - fixed[:, 0]) / np.sqrt(2) / scipy.special.erfinv(p[:, 0])
+    return sigma[:, None], sigma > 0
+
+
+def _half_student_t_quantile_set(x, p, fixed):
+    sigma = (x[:, 0] - fixed[:, 1]) / st.t.ppf((1 + p[:, 0]) / 2, fixed[:, 0])
+    return sigma[:, None], sigma > 0
+
+
+def _inverse_gamma_quantile_set(x, p, fixed):
+    # The reciprocal of an Inverse Gamma variate is Gamma distributed
+    return _gamma_quantile_set(1 / x[:, ::-1], 1 - p[:, ::-1], fixed)
+
+
+def _inverse_gaussian_quantile_set(x, p, fixed):
+    # Solve with quantiles rescaled by the upper one. The initial guess
+    # matches the mean and variance of a Log-Normal distribution with the
+    # same quantiles.
+    x_scaled = x / x[:, 1:]
+    z = _normal_scores(p)
+    mu_log, sigma_log = _location_scale_quantile_set(np.log(x_scaled), z).T
+    log_mean = mu_log + sigma_log**2 / 2
+    guess = np.stack([log_mean, log_mean - np.log(np.expm1(sigma_log**2))], axis=1)
+
+    def f(log_params, idx):
+        mu, lam = np.exp(log_params).T
+        cdf = st.invgauss.cdf(x_scaled[idx], (mu / lam)[:, None], scale=lam[:, None])
+        return cdf - p[idx]
+
+    log_params, success = _solve_rows(f, [guess])
+
+    return x[:, 1:] * np.exp(log_params), success
+
+
+def _log_normal_quantile_set(x, p, fixed):
+    params = _location_scale_quantile_set(np.log(x), _normal_scores(p))
+    return params, np.ones(len(x), dtype=bool)
+
+
+def _normal_quantile_set(x, p, fixed):
+    params = _location_scale_quantile_set(x, _normal_scores(p))
+    return params, np.ones(len(x), dtype=bool)
+
+
+def _pareto_quantile_set(x, p, fixed):
+    log_x = np.log(x)
+    log_q = np.log1p(-p)
+    alpha = (log_q[:, 0] - log_q[:, 1]) / (log_x[:, 1] - log_x[:, 0])
+    y_min = np.exp(log_q[:, 1] / alpha + log_x[:, 1])
+    return np.stack([y_min, alpha], axis=1), np.ones(len(x), dtype=bool)
+
+
+def _student_t_quantile_set(x, p, fixed):
+    z = st.t.ppf(p, fixed[:, :1])
+    return _location_scale_quantile_set(x, z), np.ones(len(x), dtype=bool)
+
+
+def _uniform_quantile_set(x, p, fixed):
+    alpha = (p[:, 1] * x[:, 0] - p[:, 0] * x[:, 1]) / (p[:, 1] - p[:, 0])
+    beta = alpha + (x[:, 1] - x[:, 0]) / (p[:, 1] - p[:, 0])
+    return np.stack([alpha, beta], axis=1), np.ones(len(x), dtype=bool)
+
+
+def _von_mises_quantile_set(x, p, fixed):
+    # Solve for a logit-scaled location and log kappa, starting from a
+    # Normal approximation
+    mu, sigma = _normal_quantile_set(x, p, fixed)[0].T
+    guess = np.stack([np.log((np.pi + mu) / (np.pi - mu)), -2 * np.log(sigma)], axis=1)
+    guess[~((mu > -np.pi) & (mu < np.pi))] = 0.0
+
+    def to_params(z):
+        return np.pi * (2 * scipy.special.expit(z[:, 0]) - 1), np.exp(z[:, 1])
+
+    def f(z, idx):
+        mu, kappa = to_params(z)
+        return _von_mises_cdf(x[idx], mu[:, None], kappa[:, None]) - p[idx]
+
+    z, success = _solve_rows(f, [guess])
+
+    return np.stack(to_params(z), axis=1), success
+
+
+def _weibull_quantile_set(x, p, fixed):
+    log_log = np.log(-np.log1p(-p))
+    alpha = (log_log[:, 1] - log_log[:, 0]) / (np.log(x[:, 1]) - np.log(x[:, 0]))
+    sigma = np.exp(np.log(x[:, 1]) - log_log[:, 1] / alpha)
+    return np.stack([alpha, sigma], axis=1), np.ones(len(x), dtype=bool)
+
+
+# Solvers for quantile setting in Python, with the number of quantiles
+# they match, the number of parameters they solve for, and the bounds of
+# allowed values of the quantiles, which are the hardMin and hardMax of
+# the classes in prob_dists.js
+_quantile_set_solvers = {
+    "bernoulli": (_bernoulli_quantile_set, 1, 1, (0, 1)),
+    "binomial": (_binomial_quantile_set, 1, 1, (0, np.inf)),
+    "geometric": (_geometric_quantile_set, 1, 1, (0, np.inf)),
+    "negative_binomial": (_negative_binomial_quantile_set, 1, 1, (0, np.inf)),
+    "negative_binomial_mu_phi": (
+        _negative_binomial_mu_phi_quantile_set,
+        1,
+        1,
+        (0, np.inf),
+    ),
+    "negative_binomial_r_b": (_negative_binomial_r_b_quantile_set, 1, 1, (0, np.inf)),
+    "poisson": (_poisson_quantile_set, 1, 1, (0, np.inf)),
+    "telegraph_rna": (_telegraph_rna_quantile_set, 1, 1, (0, np.inf)),
+    "beta": (_beta_quantile_set, 2, 2, (0, 1)),
+    "beta_phi_kappa": (_beta_phi_kappa_quantile_set, 2, 2, (0, 1)),
+    "cauchy": (_cauchy_quantile_set, 2, 2, (-np.inf, np.inf)),
+    "exponential": (_exponential_quantile_set, 1, 1, (0, np.inf)),
+    "gamma": (_gamma_quantile_set, 2, 2, (0, np.inf)),
+    "half_cauchy": (_half_cauchy_quantile_set, 1, 1, (-np.inf, np.inf)),
+    "half_normal": (_half_normal_quantile_set, 1, 1, (-np.inf, np.inf)),
+    "half_student_t": (_half_student_t_quantile_set, 1, 1, (-np.inf, np.inf)),
+    "inverse_gamma": (_inverse_gamma_quantile_set, 2, 2, (0, np.inf)),
+    "inverse_gaussian": (_inverse_gaussian_quantile_set, 2, 2, (0, np.inf)),
+    "log_normal": (_log_normal_quantile_set, 2, 2, (0, np.inf)),
+    "normal": (_normal_quantile_set, 2, 2, (-np.inf, np.inf)),
+    "pareto": (_pareto_quantile_set, 2, 2, (0, np.inf)),
+    "student_t": (_student_t_quantile_set, 2, 2, (-np.inf, np.inf)),
+    "uniform": (_uniform_quantile_set, 2, 2, (-np.inf, np.inf)),
+    "von_mises": (_von_mises_quantile_set, 2, 2, (-np.pi, np.pi)),
+    "weibull": (_weibull_quantile_set, 2, 2, (0, np.inf)),
+}
+
+
+def _quantile_set_rows(dist, x, p, fixed):
+    """Solve quantile setting problems for rows of x, p, and fixed, which
+    are 2D arrays of floats. Rows with input the quantile setter of the
+    app would reject get NaN parameters and fail."""
+    solver, _, n_active, (x_min, x_max) = _quantile_set_solvers[dist]
+
+    # Checks of checkQuantileInput() and of the quantileSet() methods
+    valid = np.all((p > 0) & (p < 1) & (x >= x_min) & (x <= x_max), axis=1)
+    valid &= np.all(np.diff(p, axis=1) > 0, axis=1)
+    valid &= np.all(np.diff(x, axis=1) > 0, axis=1)
+    if dist in discrete_dists:
+        valid &= np.all(x == np.round(x), axis=1)
+    if dist == "von_mises":
+        valid &= np.all((x > -np.pi) & (x < np.pi), axis=1)
+
+    params = np.full((len(x), n_active), np.nan)
+    success = np.zeros(len(x), dtype=bool)
+    if np.any(valid):
+        with np.errstate(all="ignore"):
+            params_valid, success_valid = solver(x[valid], p[valid], fixed[valid])
+        params[valid] = params_valid
+        success[valid] = success_valid & np.all(np.isfinite(params_valid), axis=1)
+
+    return params, success
+
+
+def quantile_set(dist, x, p, fixed_params=None, jobs=1, chunk_size=10000):
+    """Find parameters of a distribution that match quantiles, for many
+    problems at once. Each problem is solved as the quantile setter of an
+    app built with explore() solves it, with the same parameters held
+    fixed, but using closed forms or root finding vectorized over
+    problems.
+
+    Parameters
+    ----------
+    dist : str
+        Name of distribution.
+    x : array_like, shape (n_problems, n_quantiles)
+        Values of the quantiles, one problem per row. The number of
+        quantiles is one for distributions for which the quantile setter
+        matches a single quantile, and two otherwise.
+    p : array_like, shape (n_problems, n_quantiles) or (n_quantiles,)
+        Quantiles, given as values of the CDF, to be matched by `x`. If
+        1D, the same quantiles are used for all problems.
+    fixed_params : array_like, shape (n_problems, n_fixed) or (n_fixed,)
+        Values of the parameters that are held fixed in quantile setting,
+        in order, e.g., N for the Binomial distribution. If 1D, the same
+        values are used for all problems. Ignored if the distribution
+        has no fixed parameters.
+    jobs : int or None, default 1
+        Number of processes used to solve the problems. If None, the
+        number of CPUs is used. If 1, problems are solved in this
+        process.
+    chunk_size : int, default 10000
+        Number of problems solved together by each process.
+
+    Returns
+    -------
+    params : Numpy array, shape (n_problems, n_active)
+        Values of the parameters that are not held fixed, in order.
+        Problems whose input the quantile setter would reject have NaN
+        parameters.
+    success : Numpy array of bools, shape (n_problems,)
+        True for problems for which parameters were found.
+    """
+    dist = _canonical_dist_name(dist)
+    if dist not in _quantile_set_solvers:
+        raise RuntimeError(f"Quantile setting is not available for {dist}.")
+
+    n_quantiles = _quantile_set_solvers[dist][1]
+    n_fixed = len(_quantile_setter_fixed_params.get(dist, []))
+
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x.reshape(-1, n_quantiles)
+    if x.shape[1] != n_quantiles:
+        raise RuntimeError(
+            f"Quantile setting for {dist} requires {n_quantiles} quantile(s)."
+        )
+    p = np.broadcast_to(np.asarray(p, dtype=float), x.shape)
+
+    if n_fixed == 0:
+        fixed = np.empty((len(x), 0))
+    elif fixed_params is None:
+        raise RuntimeError(
+            f"Quantile setting for {dist} requires {n_fixed} fixed parameter(s)."
+        )
+    else:
+        fixed = np.broadcast_to(
+            np.asarray(fixed_params, dtype=float).reshape(-1, n_fixed),
+            (len(x), n_fixed),
+        )
+
+    starts = range(0, len(x), chunk_size)
+    if jobs == 1 or len(starts) <= 1:
+        return _quantile_set_rows(dist, x, p, fixed)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = list(
+            executor.map(
+                _quantile_set_rows,
+                [dist] * len(starts),
+                [x[i : i + chunk_size] for i in starts],
+                [p[i : i + chunk_size] for i in starts],
+                [fixed[i : i + chunk_size] for i in starts],
+            )
+        )
+
+    return (
+        np.concatenate([params for params, _ in results]),
+        np.concatenate([success for _, success in results]),
+    )
+
+
+class _StageTimer(object):
+    """Accumulate wall time spent in stages of building an app."""
+
+    def __init__(self):
+        self.times = {}
+        self._last = time.perf_counter()
+
+    def lap(self, stage):
+        """Attribute time since the previous lap to `stage`."""
+        now = time.perf_counter()
+        self.times[stage] = self.times.get(stage, 0.0) + now - self._last
+        self._last = now
+
+
+def _plot_size(kwargs):
+    """Width and height in pixels of the plotting frame from figure kwargs."""
+    width = kwargs.get("frame_width", kwargs.get("width", 300))
+    height = kwargs.get("frame_height", kwargs.get("height", 175))
+
+    return width, height
+
+
+def _adaptive_grid(f, x_min, x_max, width, height, tol=0.5, max_points=None, log=False):
+    """Adaptively choose points at which to evaluate a function for
+    plotting.
+
+    Parameters
+    ----------
+    f : function
+        Vectorized function to be plotted, called as f(x).
+    x_min : float
+        Minimum x-value of the plot.
+    x_max : float
+        Maximum x-value of the plot.
+    width : int
+        Width of the plotting frame in pixels.
+    height : int
+        Height of the plotting frame in pixels.
+    tol : float, default 0.5
+        Allowed deviation, in pixels, of a sampled point from the chord
+        connecting its neighbors. Intervals about points that deviate
+        more than this are bisected.
+    max_points : int or None, default None
+        Maximal number of points to evaluate. If None, four times the
+        width of the plotting frame.
+    log : bool, default False
+        If True, deviations are measured on a logarithmic y-axis.
+
+    Returns
+    -------
+    x : Numpy array
+        Points at which the function was evaluated, sorted.
+    y : Numpy array
+        Values of the function at `x`.
+
+    Notes
+    -----
+    We start with a point every four pixels and then repeatedly bisect
+    the intervals adjacent to points where the local linear
+    interpolation is off by more than `tol` pixels, or where the
+    function switches between finite and non-finite values, until
+    intervals are half a pixel wide or the budget is exhausted. Flat
+    regions therefore get few points and sharp peaks get many.
+    """
+    if max_points is None:
+        max_points = 4 * width
+
+    n_init = min(max(16, width // 4), max_points)
+    x = np.linspace(x_min, x_max, n_init)
+    y = np.asarray(f(x), dtype=float)
+
+    min_dx = (x_max - x_min) / width / 2
+
+    while len(x) < max_points:
+        y_plot = y.copy()
+        if log:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                y_plot = np.log10(y_plot)
+
+        finite = np.isfinite(y_plot)
+        if not finite.any():
+            break
+
+        # Pixels per unit of y
+        if log:
+            y_scale = np.max(y_plot[finite]) - np.min(y_plot[finite])
+        else:
+            y_scale = np.max(np.abs(y_plot[finite]))
+        px_per_y = height / y_scale if y_scale > 0 else 1.0
+
+        # Deviation of interior points from the chord joining their neighbors
+        x_l, x_m, x_r = x[:-2], x[1:-1], x[2:]
+        y_l, y_m, y_r = y_plot[:-2], y_plot[1:-1], y_plot[2:]
+        with np.errstate(invalid="ignore"):
+            chord = y_l + (y_r - y_l) * (x_m - x_l) / (x_r - x_l)
+            err = np.abs(y_m - chord) * px_per_y
+
+        all_finite = finite[:-2] & finite[1:-1] & finite[2:]
+        any_finite = finite[:-2] | finite[1:-1] | finite[2:]
+        err[~all_finite] = np.where(any_finite[~all_finite], np.inf, 0.0)
+
+        # Error attributed to each interval is the largest at either end
+        interval_err = np.zeros(len(x) - 1)
+        interval_err[:-1] = err
+        interval_err[1:] = np.maximum(interval_err[1:], err)
+        interval_err[np.diff(x) <= min_dx] = 0.0
+
+        refine = np.nonzero(interval_err > tol)[0]
+        if len(refine) == 0:
+            break
+
+        # Spend what is left of the budget on the worst intervals
+        n_left = max_points - len(x)
+        if len(refine) > n_left:
+            refine = np.sort(refine[np.argsort(interval_err[refine])[::-1][:n_left]])
+
+        x_new = (x[refine] + x[refine + 1]) / 2
+        y_new = np.asarray(f(x_new), dtype=float)
+        x = np.insert(x, refine + 1, x_new)
+        y = np.insert(y, refine + 1, y_new)
+
+    return x, y
+
+
+def _bucket_discrete(x, y, n_buckets, aggregate="max", log=False):
+    """Aggregate a PMF evaluated at consecutive integers into buckets.
+
+    Parameters
+    ----------
+    x : Numpy array
+        Consecutive integers at which the PMF was evaluated.
+    y : Numpy array
+        Values of the PMF at `x`.
+    n_buckets : int
+        Number of buckets, typically the width of the plot in pixels.
+    aggregate : str, default 'max'
+        Either 'max', in which case the maximal PMF value in each
+        bucket is used and placed where it is attained, or 'sum', in
+        which case the total probability mass in the bucket is used and
+        placed at the center of the bucket.
+    log : bool, default False
+        If True, `y` is the log base 10 of the PMF, and the aggregate is
+        computed from it without exponentiating.
+
+    Returns
+    -------
+    x_p : Numpy array
+        x-values of the aggregated PMF.
+    y_p : Numpy array
+        Aggregated PMF.
+    edges : Numpy array
+        Integer edges of the buckets, with bucket k containing the
+        integers edges[k] ≤ x < edges[k+1]. This has length
+        `n_buckets + 1`.
+    """
+    n_ints = len(x)
+    starts = np.floor(np.arange(n_buckets) * n_ints / n_buckets).astype(int)
+    edges = np.append(x[starts], x[-1] + 1)
+
+    y_finite = np.where(np.isnan(y), -np.inf if log else 0.0, y)
+
+    if aggregate == "sum":
+        x_p = (edges[:-1] + edges[1:] - 1) / 2
+        if log:
+            y_p = np.logaddexp.reduceat(y_finite * np.log(10), starts) / np.log(10)
+        else:
+            y_p = np.add.reduceat(y_finite, starts)
+    else:
+        argmax = np.array(
+            [i + np.argmax(y_finite[i:j]) for i, j in zip(starts, np.append(starts[1:], n_ints))]
+        )
+        x_p = x[argmax]
+        y_p = y[argmax]
+
+    return x_p, y_p, edges
+
+
+def _plot_data(
+    fun_p,
+    fun_c,
+    param_vals,
+    x_min,
+    x_max,
+    n,
+    discrete,
+    discrete_lod,
+    width,
+    height,
+    log,
+    step_cdf=False,
+):
+    """Compute data for plotting the PDF/PMF and CDF, as is done by
+    computeData() in the callbacks. If `log` is True, `fun_p` gives the
+    log base 10 of the PDF/PMF, which is plotted on a linear scale. If
+    `step_cdf` is True, the staircase of the CDF of a discrete
+    distribution is given as one point per step, to be drawn with a Step
+    glyph.
+
+    Returns
+    -------
+    x : Numpy array
+        x-values for the PDF/PMF.
+    y_p : Numpy array
+        Values of the PDF/PMF.
+    x_c : Numpy array
+        x-values for the CDF, including the steps of the staircase for
+        discrete distributions.
+    y_c : Numpy array
+        Values of the CDF.
+    """
+    if discrete:
+        x = np.arange(int(np.ceil(x_min)), int(np.floor(x_max)) + 1)
+        x_c = np.empty(2 * len(x))
+        x_c[::2] = x
+        x_c[1::2] = x
+        x_c = np.concatenate(
+            (
+                (x_min,),
+                x_c,
+                (x_max,),
+            )
+        )
+        x_cdf = np.concatenate(((x_c[0],), x))
+    elif n != "auto":
+        x = np.linspace(x_min, x_max, n)
+        x_c = x_cdf = x
+
+    if discrete and discrete_lod and len(x) > width:
+        x, y_p, edges = _bucket_discrete(
+            x, fun_p(x, *param_vals), width, aggregate=discrete_lod, log=log
+        )
+        x_c = np.concatenate(((x_min,), edges[1:] - 1, (x_max,)))
+        y_c = fun_c(np.concatenate(((edges[0] - 1,), edges[1:] - 1)), *param_vals)
+        y_c = np.append(y_c, y_c[-1])
+    elif not discrete and n == "auto":
+        x, y_p = _adaptive_grid(
+            lambda x: fun_p(x, *param_vals), x_min, x_max, width, height
+        )
+        x_c, y_c = _adaptive_grid(
+            lambda x: fun_c(x, *param_vals), x_min, x_max, width, height
+        )
+    else:
+        y_p = fun_p(x, *param_vals)
+        y_c = fun_c(x_cdf, *param_vals)
+        if discrete:
+            y_c_plot = np.empty_like(x_c)
+            y_c_plot[::2] = y_c
+            y_c_plot[1::2] = y_c
+            y_c = y_c_plot
+            if step_cdf:
+                x_c, y_c = _staircase_to_steps(x_c, y_c)
+
+    return x, y_p, x_c, y_c
+
+
+def _staircase_to_steps(x_c, y_c):
+    """Points of a staircase to be drawn with a Step glyph in 'after'
+    mode, keeping the first point, the top of each riser, and the end of
+    the last tread. This is done as by staircaseToSteps() in the
+    callbacks."""
+    keep = np.concatenate(((True,), x_c[1:] == x_c[:-1]))
+    keep[-1] = True
+
+    return x_c[keep], y_c[keep]
+
+
+def _compact_array(a, atol):
+    """`a` as float32 if that changes no finite entry by more than `atol`,
+    and otherwise `a` unchanged."""
+    a = np.asarray(a)
+    a32 = a.astype(np.float32)
+    finite = np.isfinite(a)
+    if np.all(np.abs(a32[finite].astype(float) - a[finite]) <= atol):
+        return a32
+
+    return a
+
+
+def _sample(dist, param_vals, size, rng):
+    """Draw `size` samples of a distribution with the vectorized
+    generators of NumPy, which, like the samplers of the callbacks, use
+    the ziggurat method for Normal variates and the method of Marsaglia
+    and Tsang for Gamma variates. Returns NaNs for invalid parameters."""
+    if isinstance(dist, tuple):
+        kind, components = dist
+        parts = _component_params(components, param_vals)
+        if kind == "sum":
+            return sum(
+                _sample(c, part, size, rng) for c, part in zip(components, parts)
+            )
+
+        weights = _mixture_weights(param_vals, len(components))
+        if weights is None:
+            return np.full(size, np.nan)
+
+        counts = rng.multinomial(size, weights)
+        return np.concatenate(
+            [_sample(c, part, k, rng) for c, part, k in zip(components, parts, counts)]
+        )
+
+    try:
+        if dist == "bernoulli":
+            (theta,) = param_vals
+            return (rng.random(size) < theta).astype(float)
+        elif dist == "binomial":
+            N, theta = param_vals
+            return rng.binomial(int(N), theta, size).astype(float)
+        elif dist == "categorical":
+            thetas = np.array([*param_vals, 1 - sum(param_vals)])
+            return rng.choice(np.arange(1.0, 5.0), size=size, p=thetas)
+        elif dist == "discrete_uniform":
+            low, high = param_vals
+            return rng.integers(int(low), int(high) + 1, size).astype(float)
+        elif dist == "geometric":
+            (theta,) = param_vals
+            return rng.geometric(theta, size) - 1.0
+        elif dist == "hypergeometric":
+            N, a, b = param_vals
+            return rng.hypergeometric(int(a), int(b), int(N), size).astype(float)
+        elif dist == "negative_binomial":
+            alpha, beta = param_vals
+            return rng.negative_binomial(alpha, beta / (1 + beta), size).astype(float)
+        elif dist == "negative_binomial_mu_phi":
+            mu, phi = param_vals
+            return rng.negative_binomial(phi, phi / (mu + phi), size).astype(float)
+        elif dist == "negative_binomial_r_b":
+            r, b = param_vals
+            return rng.negative_binomial(r, 1 / (1 + b), size).astype(float)
+        elif dist == "poisson":
+            (lam,) = param_vals
+            return rng.poisson(lam, size).astype(float)
+        elif dist == "telegraph_rna":
+            # Poisson with a Beta-distributed fraction of the maximal rate
+            kon, koff, beta = param_vals
+            return rng.poisson(beta * rng.beta(kon, koff, size)).astype(float)
+        elif dist == "beta":
+            alpha, beta = param_vals
+            return rng.beta(alpha, beta, size)
+        elif dist == "beta_phi_kappa":
+            phi, kappa = param_vals
+            return rng.beta(phi * kappa, (1 - phi) * kappa, size)
+        elif dist == "cauchy":
+            mu, sigma = param_vals
+            return mu + sigma * rng.standard_cauchy(size)
+        elif dist == "exponential":
+            (beta,) = param_vals
+            return rng.exponential(1 / beta, size)
+        elif dist == "gamma":
+            alpha, beta = param_vals
+            return rng.gamma(alpha, 1 / beta, size)
+        elif dist == "half_cauchy":
+            mu, sigma = param_vals
+            return mu + sigma * np.abs(rng.standard_cauchy(size))
+        elif dist == "half_normal":
+            mu, sigma = param_vals
+            return mu + sigma * np.abs(rng.standard_normal(size))
+        elif dist == "half_student_t":
+            nu, mu, sigma = param_vals
+            return mu + sigma * np.abs(rng.standard_t(nu, size))
+        elif dist == "inverse_gamma":
+            alpha, beta = param_vals
+            return beta / rng.gamma(alpha, 1.0, size)
+        elif dist == "inverse_gaussian":
+            mu, lam = param_vals
+            return rng.wald(mu, lam, size)
+        elif dist == "log_normal":
+            mu, sigma = param_vals
+            return rng.lognormal(mu, sigma, size)
+        elif dist == "normal":
+            mu, sigma = param_vals
+            return rng.normal(mu, sigma, size)
+        elif dist == "pareto":
+            # NumPy's Pareto distribution is shifted to start at zero
+            y_min, alpha = param_vals
+            return y_min * (1 + rng.pareto(alpha, size))
+        elif dist == "student_t":
+            nu, mu, sigma = param_vals
+            return mu + sigma * rng.standard_t(nu, size)
+        elif dist == "uniform":
+            alpha, beta = param_vals
+            return rng.uniform(alpha, beta, size)
+        elif dist == "von_mises":
+            mu, kappa = param_vals
+            return rng.vonmises(mu, kappa, size)
+        elif dist == "weibull":
+            alpha, sigma = param_vals
+            return sigma * rng.weibull(alpha, size)
+        else:
+            raise RuntimeError("Distribution not included.")
+    except ValueError:
+        return np.full(size, np.nan)
+
+
+def _sample_bins(x_range, discrete, width):
+    """Bins for counting samples over `x_range`, as given by
+    sampleBins() in the callbacks. Returns the left edge of the first
+    bin, the width of the bins, the number of bins, and the number of
+    bins making up a bar of the histogram."""
+    if discrete:
+        first = int(np.ceil(x_range[0]))
+        n_ints = max(1, int(np.floor(x_range[1])) - first + 1)
+        bin_width = int(np.ceil(n_ints / max(1, round(width))))
+
+        return first - 0.5, bin_width, int(np.ceil(n_ints / bin_width)), 1
+
+    n_bars = max(10, round(width / 6))
+    per_bar = 8
+
+    return (
+        x_range[0],
+        (x_range[1] - x_range[0]) / (n_bars * per_bar),
+        n_bars * per_bar,
+        per_bar,
+    )
+
+
+def _sample_counts(dist, param_vals, bins, size, rng, chunk_size=65536):
+    """Draw `size` samples in chunks and count them in `bins`, as given
+    by _sample_bins(). The first and last entries of the counts are the
+    numbers of samples below and above the bins. NaN samples are not
+    counted."""
+    start, bin_width, n_bins, _ = bins
+    counts = np.zeros(n_bins + 2, dtype=np.int64)
+    for drawn in range(0, size, chunk_size):
+        x = _sample(dist, param_vals, min(chunk_size, size - drawn), rng)
+        x = x[~np.isnan(x)]
+        inds = np.clip(np.floor((x - start) / bin_width), -1, n_bins) + 1
+        counts += np.bincount(inds.astype(np.int64), minlength=n_bins + 2)
+
+    return counts
+
+
+def _sample_overlay(counts, bins, discrete):
+    """Data for the histogram and the ECDF of counts of samples, as set
+    by setSampleData() in the callbacks."""
+    start, bin_width, n_bins, per_bar = bins
+    total = counts.sum()
+    norm = 1 / total if total > 0 else np.nan
+
+    # ECDF at the left edge of the range and at the right edge of each bin,
+    # or, for discrete distributions, at the first integer of each bin
+    if discrete:
+        x = np.concatenate(((start,), start + 0.5 + bin_width * np.arange(n_bins)))
+    else:
+        x = start + bin_width * np.arange(n_bins + 1)
+    y = np.cumsum(counts[:-1]) * norm
+
+    bar_counts = counts[1:-1].reshape(-1, per_bar).sum(axis=1)
+    bar_width = per_bar * bin_width
+    if discrete and bin_width == 1:
+        left = start + 0.1 + np.arange(len(bar_counts))
+        right = left + 0.8
+    else:
+        left = start + bar_width * np.arange(len(bar_counts))
+        right = left + bar_width
+
+    return (
+        dict(left=left, right=right, top=bar_counts * norm / bar_width),
+        dict(x=x, y=y),
+    )
+
+
+def _data_chunks(data, chunk_size):
+    """Finite values of `data` as float arrays of at most `chunk_size`
+    entries, read in order, so that memory-mapped data are never loaded
+    whole."""
+    for i in range(0, len(data), chunk_size):
+        chunk = np.asarray(data[i : i + chunk_size], dtype=float)
+        yield chunk[np.isfinite(chunk)]
+
+
+def _data_summary(
+    data, discrete, width, chunk_size=2**20, ecdf_tol=1e-3, alpha=0.05
+):
+    """Summaries of observed data for overlaying on the plots, made by
+    streaming over the data in chunks.
+
+    The data are counted in the bins of the finest level of a pyramid of
+    histograms, with about 16 bins per pixel across the plot over the
+    range of the data, or one bin per integer for discrete data, up to
+    2**16 bins. Each coarser level merges pairs of bins. The ECDF at the
+    bin edges is decimated, keeping points such that the ECDF changes by
+    less than `ecdf_tol` between them except across a single bin. The
+    bounds of the ECDF between each point and the next are widened by the
+    DKW bound for confidence level 1 - `alpha`, so that the CDF from which
+    the data were drawn lies between them with that probability.
+
+    Returns a dictionary with the pyramid, which is passed to the
+    callbacks, and a dictionary with columns `x`, `y`, `lower`, and
+    `upper` of the ECDF.
+    """
+    if isinstance(data, (str, os.PathLike)):
+        data = np.load(data, mmap_mode="r")
+    data = np.ravel(data)
+
+    # First pass for the range of the data
+    total = 0
+    data_min, data_max = np.inf, -np.inf
+    for chunk in _data_chunks(data, chunk_size):
+        if len(chunk) > 0:
+            total += len(chunk)
+            data_min = min(data_min, chunk.min())
+            data_max = max(data_max, chunk.max())
+
+    if total == 0:
+        raise RuntimeError("`data` has no finite values.")
+
+    # Finest bins, a power of two of them so that levels halve evenly
+    if discrete:
+        start = np.floor(data_min) - 0.5
+        n_ints = int(np.floor(data_max) - np.floor(data_min)) + 1
+        bin_width = int(np.ceil(n_ints / 2**16))
+        n_bins = 2 ** int(np.ceil(np.log2(np.ceil(n_ints / bin_width))))
+    else:
+        if data_max == data_min:
+            data_min, data_max = data_min - 0.5, data_max + 0.5
+        start = data_min
+        n_bins = 2 ** int(np.ceil(np.log2(16 * width)))
+        bin_width = (data_max - data_min) / n_bins
+
+    # Second pass for the counts
+    counts = np.zeros(n_bins, dtype=np.int64)
+    for chunk in _data_chunks(data, chunk_size):
+        inds = np.minimum(np.floor((chunk - start) / bin_width), n_bins - 1)
+        counts += np.bincount(inds.astype(np.int64), minlength=n_bins)
+
+    levels = [counts]
+    while len(levels[-1]) > 8:
+        levels.append(levels[-1].reshape(-1, 2).sum(axis=1))
+
+    # Decimated ECDF at bin edges, keeping the points on either side of
+    # each crossing of a multiple of ecdf_tol
+    cum = np.concatenate(((0,), np.cumsum(counts))) / total
+    quantized = np.floor(cum / ecdf_tol)
+    crossings = np.flatnonzero(np.diff(quantized) != 0)
+    keep = np.unique(np.concatenate(((0, n_bins), crossings, crossings + 1)))
+
+    x = start + bin_width * keep
+    if discrete:
+        # The ECDF steps at the integer just below each edge
+        x = x - 0.5
+    y = cum[keep]
+    eps = np.sqrt(np.log(2 / alpha) / (2 * total))
+
+    observed = dict(
+        discrete=discrete,
+        start=float(start),
+        binWidth=float(bin_width),
+        nBins=n_bins,
+        nLevels=len(levels),
+        total=total,
+        counts=np.concatenate(levels).astype(np.int32 if total < 2**31 else float),
+    )
+    ecdf = dict(
+        x=x,
+        y=y,
+        lower=np.maximum(y - eps, 0.0),
+        upper=np.minimum(np.concatenate((y[1:], (1.0,))) + eps, 1.0),
+    )
+
+    return observed, ecdf
+
+
+def _observed_histogram(observed, x_range, width):
+    """Histogram of observed data over `x_range` from the level of the
+    pyramid of `observed` whose bars are closest to 6 pixels wide, as
+    computed by observedHistogram() in the callbacks."""
+    n_bars = max(10, round(width / 6))
+    target = (x_range[1] - x_range[0]) / n_bars
+    with np.errstate(divide="ignore", invalid="ignore"):
+        level = np.round(np.log2(target / observed["binWidth"]))
+    level = int(np.clip(np.nan_to_num(level), 0, observed["nLevels"] - 1))
+
+    offset = sum(observed["nBins"] >> k for k in range(level))
+    n_bins = observed["nBins"] >> level
+    bin_width = observed["binWidth"] * 2**level
+
+    i0 = max(0, int(np.floor((x_range[0] - observed["start"]) / bin_width)))
+    i1 = min(n_bins, int(np.ceil((x_range[1] - observed["start"]) / bin_width)))
+    inds = np.arange(i0, max(i0, i1))
+
+    edges = observed["start"] + bin_width * inds
+    if observed["discrete"] and bin_width == 1:
+        left, right = edges + 0.1, edges + 0.9
+    else:
+        left, right = edges, edges + bin_width
+    top = observed["counts"][offset + inds] / (observed["total"] * bin_width)
+
+    return dict(left=left, right=right, top=top)
+
+
+def _log10_histogram(data):
+    """Histogram data with the heights of the bars as their log base 10,
+    for plotting the log density. Empty bars have NaN height."""
+    with np.errstate(divide="ignore"):
+        top = np.log10(np.asarray(data["top"], dtype=float))
+
+    return dict(data, top=np.where(np.isfinite(top), top, np.nan))
+
+
+def _sweep_spec(sweep, params):
+    """Index of the swept parameter and the values it takes, checking
+    the specification of a parameter sweep."""
+    if not isinstance(sweep, dict) or set(sweep) != {"param", "values"}:
+        raise RuntimeError('`sweep` must be a dict with keys "param" and "values".')
+
+    names = [param["name"] for param in params]
+    param = sweep["param"]
+    if isinstance(param, (int, np.integer)) and not isinstance(param, bool):
+        if not 0 <= param < len(params):
+            raise RuntimeError(f"Index {param} of swept parameter is out of range.")
+        ind = int(param)
+    elif param in names:
+        ind = names.index(param)
+    else:
+        raise RuntimeError(
+            f"Swept parameter must be one of {', '.join(names)}, or its index, "
+            f"not {param!r}."
+        )
+
+    try:
+        values = np.asarray(sweep["values"], dtype=float)
+    except (TypeError, ValueError):
+        values = None
+    if (
+        values is None
+        or values.ndim != 1
+        or len(values) == 0
+        or not np.all(np.isfinite(values))
+    ):
+        raise RuntimeError(
+            "Values of swept parameter must be a nonempty 1D array of finite numbers."
+        )
+
+    return ind, values
+
+
+def _sweep_grid(x_min, x_max, n, discrete, width):
+    """Shared x-values at which each member of a parameter sweep is
+    evaluated, as computed by sweepGrid() in the callbacks."""
+    if discrete:
+        first, last = int(np.ceil(x_min)), int(np.floor(x_max))
+        stride = max(1, int(np.ceil((last - first + 1) / max(1, round(width)))))
+        return np.arange(first, last + 1, stride)
+
+    return np.linspace(x_min, x_max, 2 * round(width) if n == "auto" else n)
+
+
+def _sweep_eval(fun, x, param_vals, ind, values):
+    """Evaluate `fun` on the grid `x` for each of `values` of parameter
+    `ind`, giving a row for each. All members are evaluated in a single
+    call, with the swept parameter broadcast along the first axis, so
+    that work that depends only on the parameters is vectorized over the
+    members along with that which depends on x. Functions that do not
+    broadcast over parameters, such as those of the Categorical and
+    telegraph distributions, are evaluated member by member."""
+    args = [np.asarray(val, dtype=float) for val in param_vals]
+    args[ind] = values[:, np.newaxis]
+    with np.errstate(all="ignore"):
+        try:
+            return np.array(
+                np.broadcast_to(fun(x, *args), (len(values), len(x))), dtype=float
+            )
+        except (IndexError, TypeError, ValueError):
+            pass
+
+        rows = []
+        for val in values:
+            args[ind] = val
+            rows.append(
+                np.broadcast_to(np.asarray(fun(x, *args), dtype=float), x.shape)
+            )
+
+    return np.array(rows)
+
+
+def _sweep_data(
+    fun_p, fun_c, param_vals, ind, values, x_min, x_max, n, discrete, width
+):
+    """PDF/PMF and CDF of each member of a parameter sweep on the grid
+    given by _sweep_grid(), as data for MultiLine glyphs. The CDF of a
+    discrete distribution is given as a staircase."""
+    x = _sweep_grid(x_min, x_max, n, discrete, width)
+    ys_p = _sweep_eval(fun_p, x, param_vals, ind, values)
+    ys_p = np.where(np.isfinite(ys_p), ys_p, np.nan)
+    ys_c = _sweep_eval(fun_c, x, param_vals, ind, values)
+
+    # Treads and risers, each integer but the first appearing twice
+    if discrete:
+        x_c = np.repeat(x, 2)[1:]
+        ys_c = np.repeat(ys_c, 2, axis=1)[:, :-1]
+    else:
+        x_c = x
+
+    return dict(
+        xs_p=[x] * len(values),
+        ys_p=list(ys_p),
+        xs_c=[x_c] * len(values),
+        ys_c=list(ys_c),
+    )
+
+
+def _slider_grid(param, n_points):
+    """At most `n_points` values of a slider, placed on its steps and
+    including its start and end. If `n_points` is one, the grid is the
+    initial value of the slider."""
+    if n_points == 1:
+        return np.array([float(param["value"])])
+
+    n_steps = int(round((param["end"] - param["start"]) / param["step"]))
+    if n_steps + 1 <= n_points:
+        inds = np.arange(n_steps + 1)
+    else:
+        inds = np.unique(np.round(np.linspace(0, n_steps, n_points)).astype(int))
+
+    return np.asarray(param["start"] + param["step"] * inds, dtype=float)
+
+
+def _precompute_grid_sizes(params, max_frames):
+    """Number of grid points for each slider, such that the total number
+    of frames is at most `max_frames`. Points are added one slider at a
+    time, to the slider with the fewest, until the budget is exhausted or
+    every step of every slider is on the grid."""
+    n_max = [
+        1 + int(round((param["end"] - param["start"]) / param["step"]))
+        if param["step"] > 0
+        else 1
+        for param in params
+    ]
+    sizes = [1] * len(params)
+
+    while True:
+        candidates = [i for i in range(len(params)) if sizes[i] < n_max[i]]
+        if len(candidates) == 0:
+            return sizes
+
+        i = min(candidates, key=lambda i: sizes[i])
+        n_frames = int(np.prod(sizes)) // sizes[i] * (sizes[i] + 1)
+        if n_frames > max_frames:
+            return sizes
+
+        sizes[i] += 1
+
+
+def _delta_encode(y):
+    """Encode rows of `y` as float32 differences between successive
+    entries. Differences are taken from the values that will be
+    reconstructed by cumulative summation in double precision, so that
+    rounding errors do not accumulate. Non-finite values are encoded as
+    NaN and skipped in the summation."""
+    out = np.empty(y.shape, dtype=np.float32)
+    acc = np.zeros(y.shape[0])
+    for j in range(y.shape[1]):
+        finite = np.isfinite(y[:, j])
+        delta = np.where(finite, y[:, j] - acc, np.nan).astype(np.float32)
+        out[:, j] = delta
+        acc = np.where(finite, acc + delta.astype(float), acc)
+
+    return out
+
+
+def _precompute_frames(
+    fun_p,
+    fun_c,
+    params,
+    x_min,
+    x_max,
+    n,
+    discrete,
+    discrete_lod,
+    width,
+    budget,
+    step_cdf,
+    log=False,
+):
+    """Evaluate the PDF/PMF and CDF for the default x-range on a grid of
+    slider values, for use by precomputedData() in the callbacks.
+
+    Returns
+    -------
+    output : dict or None
+        Dictionary with the grid of values of each slider, the x-range,
+        the x-values of the plots, and the frames, stored as a float32
+        array of delta-encoded values. Frames are ordered with the last
+        slider varying fastest. None if not even a single frame fits
+        within `budget` bytes.
+    """
+    # For n = 'auto', frames use a fixed grid, since they share x-values
+    if not discrete and n == "auto":
+        n = 2 * width
+
+    param_vals = [param["value"] for param in params]
+    x_p, y_p, x_c, y_c = _plot_data(
+        fun_p,
+        fun_c,
+        param_vals,
+        x_min,
+        x_max,
+        n,
+        discrete,
+        discrete_lod,
+        width,
+        None,
+        log,
+        step_cdf,
+    )
+
+    # Aggregating by maximum places stems where the maximum is attained,
+    # so the x-values of the PMF are stored with each frame
+    n_ints = int(np.floor(x_max)) - int(np.ceil(x_min)) + 1
+    x_p_varies = bool(discrete and discrete_lod == "max" and n_ints > width)
+    frame_len = len(y_p) + len(y_c) + (len(x_p) if x_p_varies else 0)
+
+    # Frames are serialized as base64
+    max_frames = int(budget // (4 * frame_len * 4 / 3))
+    if max_frames < 1:
+        return None
+
+    sizes = _precompute_grid_sizes(params, max_frames)
+    grids = [_slider_grid(param, size) for param, size in zip(params, sizes)]
+
+    segments = [[] for _ in range(3 if x_p_varies else 2)]
+    for vals in np.stack(np.meshgrid(*grids, indexing="ij"), axis=-1).reshape(-1, len(params)):
+        # Grids include the ends of the sliders, where parameters may be
+        # degenerate
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            x_p_frame, y_p, _, y_c = _plot_data(
+                fun_p,
+                fun_c,
+                vals,
+                x_min,
+                x_max,
+                n,
+                discrete,
+                discrete_lod,
+                width,
+                None,
+                log,
+                step_cdf,
+            )
+        # Some PMFs return a scalar NaN for invalid parameters
+        y_p = np.broadcast_to(np.asarray(y_p, dtype=float), np.shape(x_p_frame))
+        y_p = np.where(np.isinf(y_p), np.nan, y_p)
+        if x_p_varies:
+            segments[0].append(x_p_frame)
+        segments[-2].append(y_p)
+        segments[-1].append(y_c)
+
+    frames = np.concatenate(
+        [_delta_encode(np.array(segment, dtype=float)) for segment in segments], axis=1
+    )
+
+    return dict(
+        grids=[grid.tolist() for grid in grids],
+        xRange=[x_min, x_max],
+        x_p=None if x_p_varies else np.asarray(x_p, dtype=float),
+        x_c=np.asarray(x_c, dtype=float),
+        nP=len(x_p),
+        nC=len(x_c),
+        frames=frames.ravel(),
+    )
+
+
+# Percentiles of the default x-range of heavy-tailed distributions for
+# computing it in Python; others use the 0.1th and 99.9th percentiles
+_default_x_range_ptiles = {
+    "cauchy": (0.025, 0.975),
+    "half_cauchy": (1e-9, 0.9),
+    "half_student_t": (1e-9, 0.99),
+    "inverse_gamma": (0.001, 0.99),
+    "log_normal": (0.001, 0.99),
+    "pareto": (1e-9, 0.99),
+    "student_t": (0.01, 0.99),
+}
+
+
+def _param_bounds(params):
+    """Open bounds of the values of parameters as (lower, upper) tuples of
+    floats."""
+    return [(float(param["min_value"]), float(param["max_value"])) for param in params]
+
+
+def _cdf_single_value(fun_c, x, param_vals):
+    return float(np.ravel(fun_c(np.atleast_1d(x), *param_vals))[0])
+
+
+def _ppf(fun_c, p, param_vals, discrete, x_lo, x_hi):
+    """Quantile of a distribution found by root finding on its CDF,
+    starting with the bracket [x_lo, x_hi], which is expanded as needed.
+    For discrete distributions, this is the smallest integer at which
+    the CDF is at least `p`. Returns NaN if the CDF is not finite."""
+    cdf = lambda x: _cdf_single_value(fun_c, x, param_vals)
+
+    if not x_hi > x_lo:
+        x_hi = x_lo + 1.0
+
+    for _ in range(200):
+        cdf_lo = cdf(x_lo)
+        if not np.isfinite(cdf_lo):
+            return np.nan
+        if cdf_lo < p:
+            break
+        x_lo -= 2 * (x_hi - x_lo)
+
+    for _ in range(200):
+        cdf_hi = cdf(x_hi)
+        if not np.isfinite(cdf_hi):
+            return np.nan
+        if cdf_hi >= p:
+            break
+        x_hi += 2 * (x_hi - x_lo)
+
+    if discrete:
+        lo, hi = int(np.floor(x_lo)), int(np.ceil(x_hi))
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if cdf(mid) >= p:
+                hi = mid
+            else:
+                lo = mid
+        return float(hi)
+
+    return scipy.optimize.brentq(lambda x: cdf(x) - p, x_lo, x_hi, xtol=1e-12 * (x_hi - x_lo))
+
+
+def _default_x_range(dist, fun_c, param_vals, discrete, x_lo, x_hi):
+    """Default x-range for given parameters, from the quantiles of the
+    distribution. This is a generic version of the defaultXRange()
+    methods of the classes in prob_dists.js."""
+    p1, p2 = _default_x_range_ptiles.get(dist, (0.001, 0.999))
+    x1 = _ppf(fun_c, p1, param_vals, discrete, x_lo, x_hi)
+    x2 = _ppf(fun_c, p2, param_vals, discrete, x_lo, x_hi)
+
+    if discrete:
+        return x1 - 1, x2 + 1
+
+    # If lower bound is within 10% of the range of bounds to zero, make it zero
+    if 0 <= x1 < (x2 - x1) / 10.0:
+        x1 = 0.0
+
+    return x1, x2
+
+
+def _quantile_set(dist, fun_c, x, p, params, param_vals):
+    """Find values of the parameters that are not fixed in quantile
+    setting such that the CDF at `x` is `p`. The solvers of
+    quantile_set() are used if there is one for the distribution.
+    Otherwise, or if it fails, the search starts from `param_vals` and
+    is done by least squares over parameters transformed to be
+    unbounded.
+
+    Returns
+    -------
+    param_vals : Numpy array
+        Values of all parameters, including fixed ones.
+    success : bool
+        True if the quantiles were matched.
+    """
+    fixed = _quantile_setter_fixed_params.get(dist, [])
+    active = [i for i in range(len(params)) if i not in fixed]
+    bounds = [_param_bounds(params)[i] for i in active]
+    x = np.asarray(x, dtype=float)
+    p = np.asarray(p, dtype=float)
+
+    if dist in _quantile_set_solvers and len(x) == _quantile_set_solvers[dist][1]:
+        active_vals, success = quantile_set(
+            dist, x[None, :], p, fixed_params=[param_vals[i] for i in fixed]
+        )
+        if success[0]:
+            vals = np.array(param_vals, dtype=float)
+            vals[active] = active_vals[0]
+            return vals, True
+
+    def to_params(z):
+        vals = np.array(param_vals, dtype=float)
+        for i, zi, (lo, hi) in zip(active, z, bounds):
+            if np.isfinite(lo) and np.isfinite(hi):
+                vals[i] = lo + (hi - lo) * scipy.special.expit(zi)
+            elif np.isfinite(lo):
+                vals[i] = lo + np.exp(zi)
+            elif np.isfinite(hi):
+                vals[i] = hi - np.exp(zi)
+            else:
+                vals[i] = zi
+        return vals
+
+    def from_params(vals):
+        z = []
+        for i, (lo, hi) in zip(active, bounds):
+            v = vals[i]
+            if np.isfinite(lo) and np.isfinite(hi):
+                z.append(scipy.special.logit(np.clip((v - lo) / (hi - lo), 1e-12, 1 - 1e-12)))
+            elif np.isfinite(lo):
+                z.append(np.log(max(v - lo, 1e-300)))
+            elif np.isfinite(hi):
+                z.append(np.log(max(hi - v, 1e-300)))
+            else:
+                z.append(v)
+        return np.array(z)
+
+    def residuals(z):
+        with np.errstate(all="ignore"):
+            res = fun_c(x, *to_params(z)) - p
+        return np.where(np.isfinite(res), res, 1.0)
+
+    # Start from the current parameters, then from the defaults
+    best = None
+    for start in (param_vals, [param["value"] for param in params]):
+        sol = scipy.optimize.least_squares(
+            residuals, from_params(start), xtol=1e-14, ftol=1e-14, gtol=1e-14
+        )
+        if best is None or sol.cost < best.cost:
+            best = sol
+        if np.max(np.abs(sol.fun)) < 1e-6:
+            break
+
+    return to_params(best.x), bool(np.max(np.abs(best.fun)) < 1e-6)
+
+
+class _ServerCallbacks(object):
+    """Python callbacks for an app served by a Bokeh server.
+
+    PDF/PMF and CDF data are computed with the vectorized SciPy functions
+    of the distribution and cached. Updates done by a callback, such as
+    setting sliders after quantile setting, would trigger other
+    callbacks, which are ignored while the update is in progress, so
+    that each user interaction causes at most one redraw.
+    """
+
+    cache_size = 256
+
+    def __init__(
+        self,
+        dist,
+        discrete,
+        params,
+        plot_data_args,
+        models,
+        sample_size=None,
+        observed=None,
+        sweep=None,
+    ):
+        self.dist = dist
+        self.discrete = discrete
+        self.params = params
+        self.plot_data_args = plot_data_args
+        self.fun_c = plot_data_args["fun_c"]
+        self.sample_size = sample_size
+        self.observed = observed
+        self.sweep = sweep
+        self.rng = np.random.default_rng()
+        self.updating = False
+        self.drawn_key = None
+        self.sweep_key = None
+        for name, model in models.items():
+            setattr(self, name, model)
+
+        self.data = functools.lru_cache(maxsize=self.cache_size)(self._compute_data)
+
+    def _compute_data(self, param_vals, x_start, x_end):
+        with np.errstate(all="ignore"):
+            x, y_p, x_c, y_c = _plot_data(
+                param_vals=param_vals,
+                x_min=x_start,
+                x_max=x_end,
+                **self.plot_data_args,
+            )
+        y_p = np.where(np.isinf(y_p), np.nan, y_p)
+
+        return x, y_p, x_c, y_c
+
+    def param_vals(self):
+        return tuple(float(slider.value) for slider in self.sliders)
+
+    def redraw(self, force=False):
+        """Update the data sources for the current parameters and
+        x-range, sending only the columns that changed."""
+        param_vals = self.param_vals()
+        x_range = (float(self.p_p.x_range.start), float(self.p_p.x_range.end))
+        key = (param_vals, x_range)
+        if not force and key == self.drawn_key:
+            return
+        self.drawn_key = key
+
+        x, y_p, x_c, y_c = self.data(param_vals, *x_range)
+        for source, x_new, y_name, y_new in (
+            (self.source_p, x, "y_p", y_p),
+            (self.source_c, x_c, "y_c", y_c),
+        ):
+            if np.array_equal(source.data["x"], x_new):
+                source.data[y_name] = y_new
+            else:
+                source.data = {"x": x_new, y_name: y_new}
+
+        if self.sample_switch is not None and self.sample_switch.active:
+            self.draw_samples()
+
+        if self.observed is not None:
+            observed_hist = _observed_histogram(
+                self.observed, x_range, self.plot_data_args["width"]
+            )
+            if self.plot_data_args["log"]:
+                observed_hist = _log10_histogram(observed_hist)
+            self.source_observed.data = observed_hist
+
+        if self.sweep is not None:
+            self.draw_sweep(param_vals, x_range)
+
+    def draw_sweep(self, param_vals, x_range):
+        """Redraw the members of the parameter sweep, unless the other
+        parameters and the x-range are unchanged."""
+        ind = self.sweep["ind"]
+        key = (param_vals[:ind] + param_vals[ind + 1 :], x_range)
+        if key == self.sweep_key:
+            return
+        self.sweep_key = key
+
+        sweep_data = _sweep_data(
+            self.plot_data_args["fun_p"],
+            self.fun_c,
+            param_vals,
+            ind,
+            np.array(self.sweep["values"]),
+            *x_range,
+            self.plot_data_args["n"],
+            self.discrete,
+            self.plot_data_args["width"],
+        )
+        self.source_sweep.data = dict(self.source_sweep.data, **sweep_data)
+
+    def draw_samples(self):
+        """Draw samples for the current parameters and display their
+        histogram and ECDF over the x-range."""
+        bins = _sample_bins(
+            (float(self.p_p.x_range.start), float(self.p_p.x_range.end)),
+            self.discrete,
+            self.plot_data_args["width"],
+        )
+        counts = _sample_counts(
+            self.dist, self.param_vals(), bins, self.sample_size, self.rng
+        )
+        hist, self.source_ecdf.data = _sample_overlay(counts, bins, self.discrete)
+        if self.plot_data_args["log"]:
+            hist = _log10_histogram(hist)
+        self.source_hist.data = hist
+
+    def update_quantiles(self):
+        """Set the quantile setter x-boxes to the quantiles of the
+        current distribution."""
+        param_vals = self.param_vals()
+        x_lo, x_hi = self.p_p.x_range.start, self.p_p.x_range.end
+        for x_box, p_box in zip(self.x_boxes, self.p_boxes):
+            x_val = _ppf(self.fun_c, float(p_box.value), param_vals, self.discrete, x_lo, x_hi)
+            x_box.value = f"{x_val:.4g}"
+
+    def set_y_ranges(self):
+        self.p_c.y_range.start = 0.0
+        self.p_c.y_range.end = 1.0
+
+        # The range of the log density follows the data
+        if self.plot_data_args["log"]:
+            return
+
+        y_p = np.asarray(self.source_p.data["y_p"], dtype=float)
+        y_max = np.nanmax(np.where(np.isfinite(y_p), y_p, np.nan), initial=0.0)
+        self.p_p.y_range.start = 0.0
+        if y_max > 0:
+            self.p_p.y_range.end = 1.04 * y_max
+
+    def set_default_x_range(self):
+        x1, x2 = _default_x_range(
+            self.dist,
+            self.fun_c,
+            self.param_vals(),
+            self.discrete,
+            self.p_p.x_range.start,
+            self.p_p.x_range.end,
+        )
+        if np.isfinite(x1) and np.isfinite(x2) and x2 > x1:
+            self.p_p.x_range.start = x1
+            self.p_p.x_range.end = x2
+
+    def on_slider(self, attr, old, new):
+        if self.updating:
+            return
+
+        self.updating = True
+        try:
+            if self.quantile_setter_switch.active:
+                self.quantile_set()
+            else:
+                self.redraw()
+                self.update_quantiles()
+        finally:
+            self.updating = False
+
+    def on_x_range(self, attr, old, new):
+        if self.updating:
+            return
+
+        self.redraw()
+
+    def on_quantile_box(self, attr, old, new):
+        if self.updating or not self.quantile_setter_switch.active:
+            return
+
+        self.updating = True
+        try:
+            self.quantile_set()
+        finally:
+            self.updating = False
+
+    def on_switch(self, attr, old, new):
+        fixed = _quantile_setter_fixed_params.get(self.dist, [])
+        for i, (slider, param) in enumerate(zip(self.sliders, self.params)):
+            if i not in fixed:
+                slider.title = param["name"] + (" (computed)" if new else "")
+                slider.disabled = new
+        for box in self.x_boxes + self.p_boxes:
+            box.disabled = not new
+        if not new:
+            self.quantile_setter_div.text = ""
+
+    def on_sample_switch(self, attr, old, new):
+        if new:
+            self.draw_samples()
+        else:
+            self.source_hist.data = dict(left=[], right=[], top=[])
+            self.source_ecdf.data = dict(x=[], y=[])
+
+    def on_reset(self, event):
+        self.updating = True
+        try:
+            self.set_default_x_range()
+            self.redraw(force=True)
+            self.set_y_ranges()
+        finally:
+            self.updating = False
+
+    def quantile_set(self):
+        """Set the parameters to match the quantiles in the quantile
+        setter boxes, then adjust slider ranges and the x-range."""
+        try:
+            x = [float(box.value) for box in self.x_boxes]
+            p = [float(box.value) for box in self.p_boxes]
+        except ValueError:
+            self.quantile_setter_div.text = (
+                '<p style="color:tomato;">Quantiles must be numbers.</p>'
+            )
+            return
+
+        if not all(0 < p_val < 1 for p_val in p) or np.any(np.diff(p) <= 0) or np.any(
+            np.diff(x) <= 0
+        ):
+            self.quantile_setter_div.text = (
+                '<p style="color:tomato;">Quantiles and their values must be increasing, '
+                "with quantiles between 0 and 1.</p>"
+            )
+            return
+
+        param_vals, success = _quantile_set(
+            self.dist, self.fun_c, x, p, self.params, self.param_vals()
+        )
+        if not success:
+            self.quantile_setter_div.text = (
+                '<p style="color:tomato;">Failed to find parameters to match quantiles.</p>'
+            )
+            return
+
+        fixed = _quantile_setter_fixed_params.get(self.dist, [])
+        active = [i for i in range(len(self.params)) if i not in fixed]
+        self.quantile_setter_div.text = (
+            "<p>"
+            + ", ".join(f"{self.params[i]['name']} = {param_vals[i]:.4g}" for i in active)
+            + "</p>"
+        )
+
+        # Update slider ranges to put parameter values in middle
+        for i in active:
+            slider = self.sliders[i]
+            if not slider.start <= param_vals[i] <= slider.end:
+                if self.params[i]["min_value"] in ("-Infinity", -np.inf):
+                    x1 = _ppf(self.fun_c, 0.025, param_vals, self.discrete, x[0], x[-1])
+                    x2 = _ppf(self.fun_c, 0.975, param_vals, self.discrete, x[0], x[-1])
+                    width = (x2 - x1) / 2
+                    start, end = param_vals[i] - width, param_vals[i] + width
+                else:
+                    start, end = 4 * param_vals[i] / 1001, 4 * param_vals[i]
+                self.start_boxes[i].value = f"{start:.4g}"
+                self.end_boxes[i].value = f"{end:.4g}"
+                slider.start = float(self.start_boxes[i].value)
+                slider.end = float(self.end_boxes[i].value)
+            slider.value = param_vals[i]
+
+        self.set_default_x_range()
+        self.redraw(force=True)
+        self.set_y_ranges()
+
+
+def explore(
+    dist=None,
+    params=None,
+    x_min=None,
+    x_max=None,
+    n=400,
+    discrete_lod="max",
+    cdf_strategy="auto",
+    execution="main",
+    solver_time_limit=None,
+    profile=False,
+    timings=None,
+    precompute=None,
+    precompute_budget=1000000,
+    compact_sources=False,
+    backend="browser",
+    samples=None,
+    data=None,
+    components=None,
+    tol=None,
+    sweep=None,
+    **kwargs,
+):
+    """
+    Build interactive Bokeh app displaying a univariate
+    probability distribution.
+
+    Parameters
+    ----------
+    dist : str
+        Name of distribution, or 'sum' or 'mixture' for a composite
+        distribution of the distributions given by `components`.
+    params : list of dicts
+        A list of parameter specifications. Each entry in the list gives
+        specifications for a parameter of the distribution stored as a
+        dictionary. Each dictionary must have the following keys.
+            name : str, name of the parameter
+            start : float, starting point of slider for parameter (the
+                smallest allowed value of the parameter)
+            end : float, ending point of slider for parameter (the
+                largest allowed value of the parameter)
+            value : float, the value of the parameter that the slider
+                takes initially. Must be between start and end.
+            step : float, the step size for the slider
+    x_min : float, default dependent on dist
+        Minimum value that the random variable can take in plots.
+    x_max : float, default dependent on dist
+        Maximum value that the random variable can take in plots.
+    n : int or 'auto', default 400
+        Number of points to use in making plots of PDF and CDF for
+        continuous distributions. This should be large enough to give
+        smooth plots. If 'auto', points are placed adaptively based on
+        the pixel size of the plot and the curvature of the PDF and
+        CDF, so that flat regions get few points and sharp features
+        get many. Ignored for discrete distributions.
+    discrete_lod : str or None, default 'max'
+        How to display discrete distributions when there are more
+        integers in the plotting range than pixels across the plot. If
+        'max', the PMF is aggregated into one stem per pixel showing the
+        largest value of the PMF in that pixel. If 'sum', each stem
+        shows the total probability mass in that pixel. In both cases,
+        the staircase of the CDF is replaced by a line through its
+        values at the pixel edges. If None, every integer is plotted.
+        Exact stems are displayed upon zooming in.
+    cdf_strategy : str, default 'auto'
+        How the CDF of a continuous distribution is computed when the
+        plot is updated. If 'exact', the CDF is evaluated at each point.
+        If 'quadrature', it is computed by cumulative quadrature of the
+        PDF, which has already been evaluated, with exact evaluation of
+        the CDF when the error estimate exceeds a tolerance. If 'auto',
+        quadrature is used for distributions with CDFs that are
+        expensive to evaluate (Student-t, half-Student-t, and Von
+        Mises), and exact evaluation otherwise.
+    execution : str, default 'main'
+        Where computations for updating the plots and quantile setting
+        are done in the browser. If 'main', they are done in the
+        callbacks on the main thread. If 'worker', they are done in a
+        Web Worker that is created once per app from the same code as
+        the callbacks, so that the page stays responsive during long
+        computations; only the most recent of several pending requests
+        is processed. If the worker cannot be created, computations fall
+        back to the main thread.
+    solver_time_limit : float or None, default None
+        Maximum time in seconds to spend in root finding when setting
+        parameters to match quantiles. If the limit is reached, the best
+        parameters found so far are used and a warning is displayed. If
+        None, solvers run until they converge or reach their maximum
+        number of iterations.
+    profile : bool, default False
+        If True, the callbacks are instrumented with timers and call
+        counters, and a running summary of the time spent in updating
+        the plots, in quantile setting, in solvers, and in each method of
+        the distribution is displayed below the plots. The statistics
+        are also available in the browser as
+        `window.distributionExplorerProfiles`. With
+        `execution='worker'`, computations done in the worker are not
+        timed. If False, no instrumentation is included.
+    timings : callable or None, default None
+        If not None, called once the app is built as
+        `timings(stage_times)`, where `stage_times` is a dictionary
+        giving the wall time in seconds spent in each stage of building
+        the app. The keys are 'alias_normalization', 'load_params',
+        'quantile_setter_params', 'pdf_cdf_evaluation',
+        'figure_widget_construction', 'preamble_assembly', and
+        'customjs_creation'.
+    precompute : str or None, default None
+        If 'grid', the PDF/PMF and CDF over the default x-range are
+        evaluated with SciPy for a grid of values of each slider and
+        stored in the app as float32 frames. When the x-range is the
+        default, moving a slider then displays the stored frame, or
+        interpolates between neighboring frames, instead of evaluating
+        the distribution in the browser. Off the grid, or after
+        panning or zooming, the distribution is evaluated as usual.
+        This makes sliders fast in static exports, at the cost of size
+        of the document. If `n` is 'auto', frames have `2 * frame_width`
+        evenly spaced points. If None, nothing is precomputed.
+    precompute_budget : int, default 1000000
+        Maximum size in bytes of the serialized frames if
+        `precompute='grid'`. Grid points are added evenly across the
+        sliders until the budget is reached or every step of every
+        slider is on the grid.
+    compact_sources : bool, default False
+        If True, the data for the plots embedded in the document are
+        stored in single precision wherever that is accurate to well
+        below a pixel, and the staircase of the CDF of a discrete
+        distribution is stored as one point per step and drawn with a
+        Step glyph, instead of with every value repeated. This
+        roughly halves the size of documents with many apps.
+    backend : str, default 'browser'
+        Where the plots are updated and quantile setting is done. If
+        'browser', it is done by JavaScript callbacks, and the app works
+        in static HTML. If 'server', it is done by Python callbacks using
+        SciPy, so the app must be run by a Bokeh server, e.g., by adding
+        it to `bokeh.io.curdoc()` in a script run with `bokeh serve`.
+        Computed data are cached, and only columns that changed are sent
+        to the browser. Default x-ranges after resetting and quantile
+        setting are computed from percentiles of the distribution, and
+        may differ slightly from those in the browser. The `execution`,
+        `solver_time_limit`, `profile`, `precompute`, and `cdf_strategy`
+        kwargs are ignored.
+    samples : int or None, default None
+        If an int, a switch is added to the app which, when on, draws
+        that many samples from the distribution each time the plots are
+        updated and overlays their histogram on the plot of the PDF/PMF
+        and their ECDF on the plot of the CDF. Samples are binned as they
+        are drawn, so only the histogram and ECDF are sent to the plots;
+        drawing 10⁶ samples takes well under a second for all
+        distributions. With `execution='worker'`, samples are drawn in
+        the worker. If None, no switch is added.
+    data : array_like, str, or None, default None
+        Observed data to overlay on the plots, given as a 1D array,
+        including a memory-mapped one, or the name of a .npy file, which
+        is memory-mapped. Non-finite values are ignored. The data are not
+        embedded in the app. Instead, they are read in chunks to build
+        a pyramid of histograms at increasing bin widths, the finest
+        with about 16 bins per pixel across the plot, or one bin per
+        integer for discrete distributions, and an ECDF decimated to
+        within 0.001 of the exact ECDF. The histogram is drawn on the
+        plot of the PDF/PMF from the level of the pyramid that best fits
+        the x-range, and is rebinned upon zooming. The ECDF is drawn on
+        the plot of the CDF with a band that holds the CDF of the
+        distribution the data came from with 95% confidence.
+    components : list of str or None, default None
+        Names of the distributions that make up a composite
+        distribution, required if `dist` is 'sum' or 'mixture'. If
+        `dist` is 'sum', the distribution is that of the sum of
+        independent random variables with these distributions, which
+        must be discrete. Its PMF and CDF are computed by FFT
+        convolution of the PMFs of the components on the integers up to
+        the end of the x-range, in O(n log n) time. If `dist` is
+        'mixture', the distribution is a finite mixture of these
+        distributions, which must be all discrete or all continuous,
+        and the weights of all but the last component are parameters.
+        The parameters of each component are subscripted with its
+        position in `components`. There is no quantile setter for
+        composite distributions.
+    tol : float or None, default None
+        Allowed absolute error in the CDF computed in the browser. Where
+        a bound on the error of an asymptotic approximation of the CDF
+        is below `tol`, the approximation is used, which is faster and
+        more stable for extreme parameter values. These are Temme's
+        uniform expansion of the incomplete gamma function for the
+        Gamma, Inverse Gamma, and Poisson distributions with large
+        shape parameter or count, a saddle point approximation of the
+        incomplete beta function for the Beta, Binomial, and Negative
+        Binomial distributions when both of its parameters are large,
+        and Fisher's expansion about the Normal distribution for the
+        Student-t and half-Student-t distributions with large `nu`. If
+        None, the default of the JavaScript classes, 1e-8, is used. If
+        0, the approximations are never used. Ignored if `backend` is
+        'server'.
+    sweep : dict or None, default None
+        A parameter sweep, given as a dictionary with keys "param", the
+        name or index of a parameter, and "values", the values it takes.
+        If given, the PDF/PMF and CDF are also drawn for each of the
+        values, with the other parameters set by their sliders, as a
+        family of curves colored by the value of the swept parameter,
+        which is shown on hover. All members are evaluated together on
+        a shared grid of x-values and drawn by a single MultiLine glyph
+        for each plot. The family is redrawn when the other parameters
+        or the x-range change.
+    kwargs : dict
+        Any kwargs to be passed to bokeh.plotting.figure(). If
+        `y_axis_type` is "log", the log of the PDF/PMF is computed
+        directly and plotted on a linear scale with ticks labeled as
+        powers of ten, so that the tails do not underflow to zero.
+
+    Returns
+    -------
+    output : Bokeh app
+        An app to visualize the PDF/PMF and CDF. It can be displayed
+        with bokeh.io.show(). If it is displayed in a notebook, the
+        notebook_url kwarg should be specified.
+    """
+    timer = _StageTimer()
+
+    dist = dist.lower()
+    if cdf_strategy not in ("auto", "exact", "quadrature"):
+        raise RuntimeError(
+            f"`cdf_strategy` must be one of 'auto', 'exact', or 'quadrature', not '{cdf_strategy}'."
+        )
+
+    if execution not in ("main", "worker"):
+        raise RuntimeError(
+            f"`execution` must be either 'main' or 'worker', not '{execution}'."
+        )
+
+    if backend not in ("browser", "server"):
+        raise RuntimeError(
+            f"`backend` must be either 'browser' or 'server', not '{backend}'."
+        )
+
+    if precompute not in (None, "grid"):
+        raise RuntimeError(
+            f"`precompute` must be either None or 'grid', not '{precompute}'."
+        )
+
+    if samples is not None and (
+        isinstance(samples, bool)
+        or not isinstance(samples, (int, np.integer))
+        or samples < 1
+    ):
+        raise RuntimeError(f"`samples` must be None or a positive int, not {samples}.")
+
+    if tol is not None and (
+        isinstance(tol, bool)
+        or not isinstance(tol, (int, float, np.integer, np.floating))
+        or not 0 <= tol < np.inf
+    ):
+        raise RuntimeError(f"`tol` must be None or a finite nonnegative number, not {tol}.")
+
+    if dist in composite_dists:
+        if components is None or isinstance(components, str) or len(components) < 2:
+            raise RuntimeError(
+                f"`components` must be a list of at least two distributions for dist '{dist}'."
+            )
+
+        components = [component.lower() for component in components]
+        for component in components:
+            if component not in discrete_dists + continuous_dists:
+                dists = ", ".join(discrete_dists + continuous_dists)
+                raise RuntimeError(
+                    f"distribution '{component}' not supported. Allowed distributions are {dists}."
+                )
+
+        discrete = all(component in discrete_dists for component in components)
+        if dist == "sum" and not discrete:
+            raise RuntimeError("All `components` must be discrete for dist 'sum'.")
+        if dist == "mixture" and not discrete and any(
+            component in discrete_dists for component in components
+        ):
+            raise RuntimeError(
+                "`components` must be all discrete or all continuous for dist 'mixture'."
+            )
+
+        # Composite distributions are specified by their kind and components
+        components = tuple(_canonical_dist_name(component) for component in components)
+        dist = (dist, components)
+    elif components is not None:
+        raise RuntimeError("`components` may only be given for dist 'sum' or 'mixture'.")
+    elif dist in discrete_dists:
+        discrete = True
+    elif dist in continuous_dists:
+        discrete = False
+    else:
+        dists = ", ".join(discrete_dists + continuous_dists + composite_dists)
+        raise RuntimeError(
+            f"distribution '{dist}' not supported. Allowed distributions are {dists}."
+        )
+
+    if isinstance(dist, tuple):
+        timer.lap("alias_normalization")
+
+        # Name of JS class containing dist and the classes of its components
+        if dist[0] == "sum":
+            distjs = "SumDistribution"
+        elif discrete:
+            distjs = "DiscreteMixtureDistribution"
+        else:
+            distjs = "ContinuousMixtureDistribution"
+        componentjs = [f"{_to_camel_case(c)}Distribution" for c in dist[1]]
+    else:
+        dist = _canonical_dist_name(dist)
+        timer.lap("alias_normalization")
+
+        # Name of JS class containing dist
+        distjs = f"{_to_camel_case(dist)}Distribution"
+        componentjs = []
+
+    # Parse figure kwargs
+    if "frame_height" not in kwargs and "height" not in kwargs:
+        kwargs["frame_height"] = 175
+
+    if "frame_width" not in kwargs and "width" not in kwargs:
+        kwargs["frame_width"] = 300
+
+    x_axis_label = kwargs.pop("x_axis_label", None)
+
+    title = kwargs.pop("title", None)
+
+    toolbar_location = kwargs.pop("toolbar_location", "right")
+
+    if "y_axis_label" in kwargs:
+        del kwargs["y_axis_label"]
+        warnings.warn("kwargs `y_axis_label` is ignored.")
+
+    log_density = kwargs.pop("y_axis_type", "linear") == "log"
+
+    # Load parameters
+    params, x_min, x_max, x_axis_label, title = _load_params(
+        dist, params, x_min, x_max, x_axis_label, title
+    )
+    timer.lap("load_params")
+
+    x_quantset, p_quantset = _compute_quantile_setter_params(dist, params)
+    timer.lap("quantile_setter_params")
+
+    for i, param in enumerate(params):
+        if "is_int" not in param:
+            params[i]["is_int"] = False
+        if params[i]["is_int"]:
+            params[i]["step"] = 1
+            params[i]["start"] = int(params[i]["start"])
+
+    if sweep is not None:
+        sweep_ind, sweep_values = _sweep_spec(sweep, params)
+
+    if discrete:
+        p_y_axis_label = "PMF"
+    else:
+        p_y_axis_label = "PDF"
 
     # Lock axes for Bernoulli and Categorical
     # Panning and zooming seem to work with Bokeh 3.6.0 and above.
@@ -1334,7 +3835,7 @@ def explore(
     p_p = bokeh.plotting.figure(
         x_axis_label=x_axis_label,
         y_axis_label=p_y_axis_label,
-        y_axis_type=p_y_axis_type,
+        y_axis_type="linear",
         title=title,
         **kwargs,
     )
@@ -1358,10 +3859,18 @@ def explore(
 
     # We now set all y_ranges for continous distributions to start at 0
     # The only eay of doing it specifically only for a few dists is commented out below.
-    p_p.y_range.start = 0.0
+    # The log density is plotted on a linear scale, labeled as powers of ten,
+    # and its range follows the data.
+    if log_density:
+        p_p.yaxis.formatter = bokeh.models.CustomJSTickFormatter(
+            code="return Number.isInteger(tick) ? '1e' + tick "
+            ": (10 ** tick).toPrecision(2)"
+        )
+    else:
+        p_p.y_range.start = 0.0
 
     if dist in ("bernoulli", "categorical"):
-        p_p.y_range.end = 1.0
+        p_p.y_range.end = 0.0 if log_density else 1.0
 
     # # For a Beta or uniform distribution, we want to force zero for PDF axis
     # # to give appropriate scale
@@ -1386,48 +3895,122 @@ def explore(
     # Old way (commented out) with buffers
     # p_c.y_range = bokeh.models.Range1d(-0.04, 1.04)
 
+    timer.lap("figure_widget_construction")
+
     # Make array of parameter values
     param_vals = np.array([param["value"] for param in params])
 
-    # Set up data for plot
-    if discrete:
-        x = np.arange(int(np.ceil(x_min)), int(np.floor(x_max)) + 1)
-        x_c = np.empty(2 * len(x))
-        x_c[::2] = x
-        x_c[1::2] = x
-        x_c = np.concatenate(
-            (
-                (x_min,),
-                x_c,
-                (x_max,),
-            )
+    # Compute PDF and CDF
+    fun_p, fun_c = _funs(dist)
+    if log_density:
+        fun_p = _log10_density_fun(dist)
+    width, height = _plot_size(kwargs)
+    step_cdf = compact_sources and discrete
+    x, y_p, x_c, y_c = _plot_data(
+        fun_p,
+        fun_c,
+        param_vals,
+        x_min,
+        x_max,
+        n,
+        discrete,
+        discrete_lod,
+        width,
+        height,
+        log_density,
+        step_cdf,
+    )
+
+    # Frames for a grid of slider values
+    if precompute == "grid" and backend == "browser":
+        precomputed = _precompute_frames(
+            fun_p,
+            fun_c,
+            params,
+            x_min,
+            x_max,
+            n,
+            discrete,
+            discrete_lod,
+            width,
+            precompute_budget,
+            step_cdf,
+            log_density,
         )
-        x_cdf = np.concatenate(((x_c[0],), x))
+        if precomputed is None:
+            warnings.warn(
+                "`precompute_budget` is too small for a single frame; no frames are precomputed."
+            )
     else:
-        x = np.linspace(x_min, x_max, n)
-        x_c = x_cdf = x
+        precomputed = None
 
-    # Compute PDF and CDF
-    fun_p, fun_c = _funs(dist)
-    y_p = fun_p(x, *param_vals)
-    y_c = fun_c(x_cdf, *param_vals)
-    if discrete:
-        y_c_plot = np.empty_like(x_c)
-        y_c_plot[::2] = y_c
-        y_c_plot[1::2] = y_c
-        y_c = y_c_plot
+    timer.lap("pdf_cdf_evaluation")
+
+    # Store data in single precision where that is accurate to well below
+    # a pixel. The log density is left alone.
+    if compact_sources:
+        x_atol = 1e-3 * (x_max - x_min) / max(len(x), len(x_c))
+        x = _compact_array(x, x_atol)
+        x_c = _compact_array(x_c, x_atol)
+        y_c = _compact_array(y_c, 1e-6)
+        if not log_density:
+            y_p = _compact_array(y_p, 1e-6 * np.nanmax(np.abs(y_p), initial=0.0))
 
     # Set up data sources
     source_p = bokeh.models.ColumnDataSource(data={"x": x, "y_p": y_p})
     source_c = bokeh.models.ColumnDataSource(data={"x": x_c, "y_c": y_c})
 
+    # Family of curves of a parameter sweep, with a row of a single source
+    # for each member, drawn beneath the PDF/PMF and CDF
+    if sweep is not None:
+        sweep_data = _sweep_data(
+            fun_p,
+            fun_c,
+            param_vals,
+            sweep_ind,
+            sweep_values,
+            x_min,
+            x_max,
+            n,
+            discrete,
+            width,
+        )
+        sweep_data["value"] = sweep_values
+        sweep_data["color"] = [
+            bokeh.palettes.Viridis256[int(i)]
+            for i in np.linspace(0, 220, len(sweep_values))
+        ]
+        source_sweep = bokeh.models.ColumnDataSource(data=sweep_data)
+        for p, xs, ys in ((p_p, "xs_p", "ys_p"), (p_c, "xs_c", "ys_c")):
+            renderer = p.multi_line(
+                xs,
+                ys,
+                source=source_sweep,
+                line_color="color",
+                line_width=1.5,
+                line_alpha=0.7,
+                level="glyph",
+            )
+            p.add_tools(
+                bokeh.models.HoverTool(
+                    renderers=[renderer],
+                    tooltips=[(params[sweep_ind]["name"], "@value")],
+                )
+            )
+        sweep = dict(ind=sweep_ind, values=sweep_values.tolist())
+    else:
+        source_sweep = None
+
     # Plot PMF/PDF and CDF
-    p_c.line("x", "y_c", source=source_c, line_width=2, level="glyph")
+    if step_cdf:
+        p_c.step("x", "y_c", source=source_c, mode="after", line_width=2, level="glyph")
+    else:
+        p_c.line("x", "y_c", source=source_c, line_width=2, level="glyph")
     if discrete:
-        p_p.scatter(
+        renderer_p = p_p.scatter(
             "x", "y_p", source=source_p, size=5, marker="circle", level="glyph"
         )
-        if p_y_axis_type != "log":
+        if not log_density:
             p_p.segment(
                 x0="x",
                 x1="x",
@@ -1438,7 +4021,88 @@ def explore(
                 level="glyph",
             )
     else:
-        p_p.line("x", "y_p", source=source_p, line_width=2, level="glyph")
+        renderer_p = p_p.line(
+            "x", "y_p", source=source_p, line_width=2, level="glyph"
+        )
+
+    # Bars of histograms extend far below any plotted log density
+    if log_density:
+        p_p.y_range.renderers = [renderer_p]
+        hist_bottom = -1e4
+    else:
+        hist_bottom = 0
+
+    # Histogram and ECDF of samples, empty until the samples switch is on
+    if samples is not None:
+        source_hist = bokeh.models.ColumnDataSource(
+            data=dict(left=[], right=[], top=[])
+        )
+        source_ecdf = bokeh.models.ColumnDataSource(data=dict(x=[], y=[]))
+        p_p.quad(
+            left="left",
+            right="right",
+            top="top",
+            bottom=hist_bottom,
+            source=source_hist,
+            fill_color="orange",
+            fill_alpha=0.4,
+            line_color=None,
+            level="underlay",
+        )
+        p_c.step(
+            "x",
+            "y",
+            source=source_ecdf,
+            mode="after",
+            line_color="orange",
+            line_width=2,
+        )
+        sample_switch = bokeh.models.Switch(active=False)
+    else:
+        source_hist = None
+        source_ecdf = None
+        sample_switch = None
+
+    # Histogram and ECDF of observed data, summarized in Python
+    if data is not None:
+        observed, observed_ecdf = _data_summary(data, discrete, width)
+        observed_hist = _observed_histogram(observed, (x_min, x_max), width)
+        if log_density:
+            observed_hist = _log10_histogram(observed_hist)
+        source_observed = bokeh.models.ColumnDataSource(data=observed_hist)
+        source_observed_ecdf = bokeh.models.ColumnDataSource(data=observed_ecdf)
+        p_p.quad(
+            left="left",
+            right="right",
+            top="top",
+            bottom=hist_bottom,
+            source=source_observed,
+            fill_color="gray",
+            fill_alpha=0.4,
+            line_color=None,
+            level="underlay",
+        )
+        p_c.varea_step(
+            x="x",
+            y1="lower",
+            y2="upper",
+            source=source_observed_ecdf,
+            step_mode="after",
+            fill_color="gray",
+            fill_alpha=0.25,
+            level="underlay",
+        )
+        p_c.step(
+            "x",
+            "y",
+            source=source_observed_ecdf,
+            mode="after",
+            line_color="gray",
+            line_width=2,
+        )
+    else:
+        observed = None
+        source_observed = None
 
     # In previous versions, range padding was set to 0 for convenience.
     # Now, ranges are explicitly set.
@@ -1494,79 +4158,178 @@ def explore(
     # while resetting, quantile setting, etc.
     trigger_callbacks = bokeh.models.Switch(active=True)
 
-    # Build callback preamble, all necessary functions for calculations
-    callback_preamble = ""
-    for f in callbacks._dependencies["slider_callback"]:
-        callback_preamble += callbacks._callbacks[f]
+    timer.lap("figure_widget_construction")
+
+    if backend == "server":
+        # Python callbacks, run by the Bokeh server
+        server_callbacks = _ServerCallbacks(
+            dist,
+            discrete,
+            params,
+            dict(
+                fun_p=fun_p,
+                fun_c=fun_c,
+                n=n,
+                discrete=discrete,
+                discrete_lod=discrete_lod,
+                width=width,
+                height=height,
+                log=log_density,
+                step_cdf=step_cdf,
+            ),
+            dict(
+                p_p=p_p,
+                p_c=p_c,
+                source_p=source_p,
+                source_c=source_c,
+                sliders=sliders,
+                x_boxes=x_boxes,
+                p_boxes=p_boxes,
+                start_boxes=start_boxes,
+                end_boxes=end_boxes,
+                quantile_setter_switch=quantile_setter_switch,
+                quantile_setter_div=quantile_setter_div,
+                source_hist=source_hist,
+                source_ecdf=source_ecdf,
+                sample_switch=sample_switch,
+                source_observed=source_observed,
+                source_sweep=source_sweep,
+            ),
+            sample_size=samples,
+            observed=observed,
+            sweep=sweep,
+        )
+        for slider in sliders:
+            slider.on_change("value", server_callbacks.on_slider)
+        p_p.x_range.on_change("start", server_callbacks.on_x_range)
+        p_p.x_range.on_change("end", server_callbacks.on_x_range)
+        quantile_setter_switch.on_change("active", server_callbacks.on_switch)
+        for box in x_boxes + p_boxes:
+            box.on_change("value", server_callbacks.on_quantile_box)
+        if sample_switch is not None:
+            sample_switch.on_change("active", server_callbacks.on_sample_switch)
+        if dist not in ["bernoulli", "categorical"]:
+            p_c.on_event(bokeh.events.Reset, server_callbacks.on_reset)
+        profile_div = None
+        timer.lap("customjs_creation")
+    else:
+        # Build callback preamble, all necessary functions for calculations
+        callback_preamble = ""
+        for f in callbacks._dependencies["dispatch_callback"]:
+            callback_preamble += callbacks._callbacks[f]
+
+        # Classes of the components of composite distributions are also
+        # needed, and each dependency may only be defined once
+        dist_classes = []
+        for f in [
+            *callbacks._dependencies[distjs],
+            *[g for cls in componentjs for g in callbacks._dependencies[cls] + [cls]],
+        ]:
+            if f not in dist_classes:
+                dist_classes.append(f)
+        for f in dist_classes:
+            callback_preamble += callbacks._callbacks[f]
 
-    for f in callbacks._dependencies[distjs]:
-        callback_preamble += callbacks._callbacks[f]
+        callback_preamble += callbacks._callbacks[distjs] + "\n\n"
+        if len(componentjs) > 0:
+            new_components = ", ".join(f"new {cls}()" for cls in componentjs)
+            callback_preamble += f"\nvar dist = new {distjs}([{new_components}]);\n\n"
+        else:
+            callback_preamble += f"\nvar dist = new {distjs}();\n\n"
+        if tol is not None:
+            callback_preamble += f"dist.tol = {float(tol)!r};\n"
+            if len(componentjs) > 0:
+                callback_preamble += (
+                    "for (let component of dist.components) "
+                    f"component.tol = {float(tol)!r};\n"
+                )
+            callback_preamble += "\n"
 
-    callback_preamble += callbacks._callbacks[distjs] + "\n\n"
-    callback_preamble += f"\nvar dist = new {distjs}();\n\n"
+        timer.lap("preamble_assembly")
 
-    # Build code for callbacks that require the distribution
-    slider_callback_code = callback_preamble + callbacks._callbacks["slider_callback"]
-    xaxis_change_callback_code = (
-        callback_preamble + callbacks._callbacks["xaxis_change_callback"]
-    )
-    quantile_setter_switch_callback_code = (
-        callback_preamble + callbacks._callbacks["quantile_setter_switch_callback"]
-    )
-    quantile_setter_callback_code = (
-        callback_preamble + callbacks._callbacks["quantile_setter_callback"]
-    )
-    reset_button_callback_code = (
-        callback_preamble + callbacks._callbacks["reset_button_callback"]
-    )
+        # Code for the worker is held by a single model shared by all callbacks
+        if execution == "worker":
+            worker_script = bokeh.models.CustomJS(
+                code=callback_preamble + callbacks._callbacks["worker_handler"]
+            )
+        else:
+            worker_script = None
+        timer.lap("customjs_creation")
 
-    # Build the callback CustomJS objects from the code with args. Just pass all args
-    # to all callbacks for simplicity. Note also that when building callbacks, lists
-    # have to be rebuilt to avoid circular references in serialization and the args need
-    # to be created for each callback.
-    def _build_args():
-        return dict(
-            p_p=p_p,
-            p_c=p_c,
-            source_p=source_p,
-            source_c=source_c,
-            discrete=discrete,
-            n=n,
-            sliders=[slider for slider in sliders],
-            xBoxes=[x_box for x_box in x_boxes],
-            pBoxes=[p_box for p_box in p_boxes],
-            quantileSetterSwitch=quantile_setter_switch,
-            quantileSetterDiv=quantile_setter_div,
-            triggerCallbacks=trigger_callbacks,
-            startBoxes=[start_box for start_box in start_boxes],
-            endBoxes=[end_box for end_box in end_boxes],
-        )
-
-    # Now make callbacks
-    slider_callback = bokeh.models.CustomJS(
-        args=_build_args(),
-        code=slider_callback_code,
-    )
+        # Instrumentation for profiling goes between the preamble and the
+        # code of the callback
+        if profile:
+            profile_div = bokeh.models.Div(text="")
+            callback_preamble += callbacks._callbacks["profiler"]
+        else:
+            profile_div = None
 
-    xaxis_change_callback = bokeh.models.CustomJS(
-        args=_build_args(),
-        code=xaxis_change_callback_code,
-    )
+        timer.lap("preamble_assembly")
 
-    quantile_setter_switch_callback = bokeh.models.CustomJS(
-        args=_build_args(),
-        code=quantile_setter_switch_callback_code,
-    )
+        # A single callback, which dispatches on what triggered it, handles all
+        # widgets that require the distribution, so that the args and code are
+        # serialized once. Note that lists have to be rebuilt to avoid circular
+        # references in serialization.
+        dispatch_callback = bokeh.models.CustomJS(
+            args=dict(
+                p_p=p_p,
+                p_c=p_c,
+                source_p=source_p,
+                source_c=source_c,
+                discrete=discrete,
+                discreteLod=discrete_lod,
+                cdfStrategy=cdf_strategy,
+                workerScript=worker_script,
+                solverTimeLimit=solver_time_limit,
+                n=n,
+                sliders=[slider for slider in sliders],
+                xBoxes=[x_box for x_box in x_boxes],
+                pBoxes=[p_box for p_box in p_boxes],
+                quantileSetterSwitch=quantile_setter_switch,
+                quantileSetterDiv=quantile_setter_div,
+                triggerCallbacks=trigger_callbacks,
+                startBoxes=[start_box for start_box in start_boxes],
+                endBoxes=[end_box for end_box in end_boxes],
+                profileDiv=profile_div,
+                precomputed=precomputed,
+                stepCdf=step_cdf,
+                logDensity=log_density,
+                sampleSwitch=sample_switch,
+                sampleSize=samples,
+                source_hist=source_hist,
+                source_ecdf=source_ecdf,
+                observed=observed,
+                source_observed=source_observed,
+                sweep=sweep,
+                source_sweep=source_sweep,
+            ),
+            code=callback_preamble + callbacks._callbacks["dispatch_callback"],
+        )
 
-    quantile_setter_callback = bokeh.models.CustomJS(
-        args=_build_args(),
-        code=quantile_setter_callback_code,
-    )
+        # Link callback to sliders
+        for slider in sliders:
+            slider.js_on_change("value", dispatch_callback)
 
-    reset_button_callback = bokeh.models.CustomJS(
-        args=_build_args(),
-        code=reset_button_callback_code,
-    )
+        # Link callback upon changing x-axis ranges
+        p_p.x_range.js_on_change("start", dispatch_callback)
+        p_p.x_range.js_on_change("end", dispatch_callback)
+
+        # Link quantile setters switch
+        quantile_setter_switch.js_on_change("active", dispatch_callback)
+
+        # Link samples switch
+        if sample_switch is not None:
+            sample_switch.js_on_change("active", dispatch_callback)
+
+        # Link quantile setter boxes
+        for x_box in x_boxes:
+            x_box.js_on_change("value", dispatch_callback)
+        for p_box in p_boxes:
+            p_box.js_on_change("value", dispatch_callback)
+
+        # Link callbacks to reset button (not for Bernoulli and Categorical)
+        if dist not in ["bernoulli", "categorical"]:
+            p_c.js_on_event(bokeh.events.Reset, dispatch_callback)
 
     # Create and link callbacks for setting slider ranges
     for param, slider, start, end in zip(params, sliders, start_boxes, end_boxes):
@@ -1593,26 +4356,7 @@ def explore(
         start.js_on_change("value", cb_start)
         end.js_on_change("value", cb_end)
 
-    # Link callback to sliders
-    for slider in sliders:
-        slider.js_on_change("value", slider_callback)
-
-    # Link callback upon changing x-axis ranges
-    p_p.x_range.js_on_change("start", xaxis_change_callback)
-    p_p.x_range.js_on_change("end", xaxis_change_callback)
-
-    # Link quantile setters switch
-    quantile_setter_switch.js_on_change("active", quantile_setter_switch_callback)
-
-    # Link quantile setter boxes
-    for x_box in x_boxes:
-        x_box.js_on_change("value", quantile_setter_callback)
-    for p_box in p_boxes:
-        p_box.js_on_change("value", quantile_setter_callback)
-
-    # Link callbacks to reset button (not for Bernoulli and Categorical)
-    if dist not in ["bernoulli", "categorical"]:
-        p_c.js_on_event(bokeh.events.Reset, reset_button_callback)
+    timer.lap("customjs_creation")
 
     # Layout with label for switch
     quantile_setter_switch_with_label = bokeh.layouts.row(
@@ -1741,6 +4485,17 @@ def explore(
         toolbar_location=toolbar_location,
     )
 
+    # Samples switch goes directly above the plots
+    if sample_switch is not None:
+        grid = bokeh.layouts.column(
+            bokeh.layouts.row(
+                bokeh.models.Div(text=f"<p><b>Overlay {samples:,} samples</b></p>"),
+                bokeh.models.Spacer(width=2),
+                sample_switch,
+            ),
+            grid,
+        )
+
     # Put the layout together and return
     if len(x_boxes) > 0:
         return_layout = bokeh.layouts.column(
@@ -1765,4 +4520,11 @@ def explore(
             grid,
         )
 
+    if profile_div is not None:
+        return_layout = bokeh.layouts.column(return_layout, profile_div)
+
+    timer.lap("figure_widget_construction")
+    if timings is not None:
+        timings(timer.times)
+
     return return_layout
@@ -0,0 +1,320 @@
+"""Build a static site with an app for each distribution.
+
+Each page is a standalone HTML file with an app built by explore().
+Pages are built in parallel in a pool of processes. All pages load
+BokehJS from a single copy written to the `static/` directory of the
+site, or from the Bokeh CDN. A page is only rebuilt if its configuration,
+the code of the package, or the version of Bokeh have changed since it
+was last built, as recorded by content hashes in a manifest in the
+site directory.
+
+Usage from the command line:
+
+    distribution-explorer build-site site
+    distribution-explorer build-site site --config pages.json --jobs 8
+
+The config file is a JSON list of pages. Each page is a dictionary with
+keys "name", giving the name of the HTML file, and "dist", with all other
+entries passed as kwargs to explore(), e.g.,
+
+    [{"name": "normal_log", "dist": "normal", "y_axis_type": "log"}]
+"""
+
+import argparse
+import concurrent.futures
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import sys
+import time
+
+import bokeh
+import bokeh.embed
+import bokeh.resources
+import bokeh.util.paths
+
+from . import distribution_explorer as de
+
+
+_manifest_name = ".manifest.json"
+
+
+def default_pages():
+    """A page for each distribution with default settings."""
+    return [dict(name=dist, dist=dist) for dist in de._dist_names()]
+
+
+def load_pages(fname):
+    """Load page configurations from a JSON file."""
+    with open(fname, "r") as f:
+        pages = json.load(f)
+
+    for page in pages:
+        if "dist" not in page:
+            raise RuntimeError(f"Page {page} in {fname} does not specify a `dist`.")
+        if "name" not in page:
+            page["name"] = page["dist"]
+
+    return pages
+
+
+def _source_hash():
+    """Hash of the code of the package and the version of Bokeh, which
+    together determine the output for a given configuration."""
+    h = hashlib.sha256(bokeh.__version__.encode("utf-8"))
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for fname in sorted(os.listdir(package_dir)):
+        if fname.endswith(".py"):
+            with open(os.path.join(package_dir, fname), "rb") as f:
+                h.update(f.read())
+
+    return h.hexdigest()
+
+
+def _page_hash(page, source_hash, cdn):
+    """Hash of everything that determines the output for a page."""
+    config = json.dumps(dict(page=page, cdn=cdn), sort_keys=True)
+
+    return hashlib.sha256((source_hash + config).encode("utf-8")).hexdigest()
+
+
+def _file_hash(fname):
+    with open(fname, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _resources(cdn):
+    if cdn:
+        return bokeh.resources.CDN
+
+    return bokeh.resources.Resources(mode="server", root_url="./")
+
+
+def _build_page(page, out_dir, cdn):
+    """Build and write a single page. Returns the file name, the build
+    time in seconds, and the size of the page in bytes."""
+    start = time.perf_counter()
+
+    kwargs = {key: val for key, val in page.items() if key not in ("name", "dist")}
+    layout = de.explore(page["dist"], **kwargs)
+    page_html = bokeh.embed.file_html(
+        layout, _resources(cdn), title=page["name"].replace("_", " ")
+    )
+
+    fname = os.path.join(out_dir, page["name"] + ".html")
+    with open(fname, "w", encoding="utf-8") as f:
+        f.write(page_html)
+
+    return fname, time.perf_counter() - start, len(page_html.encode("utf-8"))
+
+
+def write_static(out_dir, page_fnames):
+    """Copy the BokehJS files loaded by the pages to the `static/js`
+    directory of the site, unless up to date copies are already there."""
+    js_dir = os.path.join(out_dir, "static", "js")
+    os.makedirs(js_dir, exist_ok=True)
+
+    used = set()
+    for page_fname in page_fnames:
+        with open(page_fname, "r", encoding="utf-8") as f:
+            used.update(re.findall(r'src="\./static/js/([^"?]+)', f.read()))
+
+    for fname in sorted(used):
+        src = os.path.join(bokeh.util.paths.bokehjs_path(), "js", fname)
+        dest = os.path.join(js_dir, fname)
+        if not os.path.exists(dest) or _file_hash(src) != _file_hash(dest):
+            shutil.copyfile(src, dest)
+
+
+def write_index(out_dir, pages):
+    """Write an index page linking to all pages."""
+    links = "\n".join(
+        f'    <li><a href="{html.escape(page["name"])}.html">'
+        f'{html.escape(page["name"].replace("_", " "))}</a></li>'
+        for page in sorted(pages, key=lambda page: page["name"])
+    )
+    index = (
+        "<!DOCTYPE html>\n<html>\n<head>\n  <meta charset=\"utf-8\">\n"
+        "  <title>Distribution explorer</title>\n</head>\n<body>\n"
+        f"  <h1>Distribution explorer</h1>\n  <ul>\n{links}\n  </ul>\n</body>\n</html>\n"
+    )
+
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(index)
+
+
+def _load_manifest(out_dir):
+    fname = os.path.join(out_dir, _manifest_name)
+    if not os.path.exists(fname):
+        return {}
+
+    with open(fname, "r") as f:
+        return json.load(f)
+
+
+def _save_manifest(out_dir, manifest):
+    with open(os.path.join(out_dir, _manifest_name), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def build_site(out_dir, pages=None, jobs=None, cdn=False, force=False, verbose=False):
+    """Build a static site with a page for each configuration.
+
+    Parameters
+    ----------
+    out_dir : str
+        Directory to write the site to. It is created if it does not
+        exist.
+    pages : list of dicts or None, default None
+        Configurations of pages. Each has keys "name", the name of the
+        HTML file without extension, and "dist", with all other entries
+        passed as kwargs to explore(). If None, the pages are given by
+        default_pages().
+    jobs : int or None, default None
+        Number of processes used to build pages. If None, the number of
+        CPUs is used. If 1, pages are built in this process.
+    cdn : bool, default False
+        If True, pages load BokehJS from the Bokeh CDN. Otherwise, they
+        load it from a copy in the `static/js` directory of the site.
+    force : bool, default False
+        If True, rebuild all pages, even those whose inputs have not
+        changed.
+    verbose : bool, default False
+        If True, print a line for each page as it is done.
+
+    Returns
+    -------
+    output : list of dicts
+        For each page, a dictionary with keys "name", "file", "status",
+        either "built" or "skipped", "seconds", the time to build the
+        page, and "bytes", the size of the page.
+    """
+    if pages is None:
+        pages = default_pages()
+
+    names = [page["name"] for page in pages]
+    if len(set(names)) < len(names):
+        raise RuntimeError("Pages must have unique names.")
+
+    os.makedirs(out_dir, exist_ok=True)
+
+    manifest = _load_manifest(out_dir)
+    source_hash = _source_hash()
+
+    # Only pages whose inputs or outputs changed are built
+    results = []
+    to_build = []
+    for page in pages:
+        page_hash = _page_hash(page, source_hash, cdn)
+        fname = os.path.join(out_dir, page["name"] + ".html")
+        entry = manifest.get(page["name"])
+        if (
+            not force
+            and entry is not None
+            and entry["input"] == page_hash
+            and os.path.exists(fname)
+            and _file_hash(fname) == entry["output"]
+        ):
+            result = dict(
+                name=page["name"],
+                file=fname,
+                status="skipped",
+                seconds=0.0,
+                bytes=os.path.getsize(fname),
+            )
+            results.append(result)
+            if verbose:
+                print(_format_result(result))
+        else:
+            to_build.append((page, page_hash))
+
+    def record(page, page_hash, fname, seconds, n_bytes):
+        manifest[page["name"]] = dict(input=page_hash, output=_file_hash(fname))
+        result = dict(
+            name=page["name"], file=fname, status="built", seconds=seconds, bytes=n_bytes
+        )
+        results.append(result)
+        if verbose:
+            print(_format_result(result))
+
+    if jobs == 1:
+        for page, page_hash in to_build:
+            record(page, page_hash, *_build_page(page, out_dir, cdn))
+    elif len(to_build) > 0:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(_build_page, page, out_dir, cdn): (page, page_hash)
+                for page, page_hash in to_build
+            }
+            for future in concurrent.futures.as_completed(futures):
+                record(*futures[future], *future.result())
+
+    # Drop pages that are no longer part of the site from the manifest
+    manifest = {name: entry for name, entry in manifest.items() if name in names}
+    _save_manifest(out_dir, manifest)
+    write_index(out_dir, pages)
+    if not cdn:
+        write_static(out_dir, [result["file"] for result in results])
+
+    return results
+
+
+def _format_result(result):
+    """One line summary of building a page."""
+    return (
+        f"{result['name']:30s} {result['status']:8s} "
+        f"{1000 * result['seconds']:9.1f} ms {result['bytes']:10d} bytes"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="distribution-explorer",
+        description="Tools for distribution_explorer.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser(
+        "build-site", help="build a static site with an app for each distribution"
+    )
+    build_parser.add_argument("out_dir", help="directory to write the site to")
+    build_parser.add_argument(
+        "--config",
+        help="JSON file with page configurations (default one page per distribution)",
+    )
+    build_parser.add_argument(
+        "--jobs", type=int, default=None, help="number of processes (default all CPUs)"
+    )
+    build_parser.add_argument(
+        "--cdn", action="store_true", help="load BokehJS from the Bokeh CDN"
+    )
+    build_parser.add_argument(
+        "--force", action="store_true", help="rebuild pages even if unchanged"
+    )
+    args = parser.parse_args(argv)
+
+    pages = load_pages(args.config) if args.config is not None else None
+
+    start = time.perf_counter()
+    results = build_site(
+        args.out_dir,
+        pages=pages,
+        jobs=args.jobs,
+        cdn=args.cdn,
+        force=args.force,
+        verbose=True,
+    )
+    n_built = sum(result["status"] == "built" for result in results)
+    print(
+        f"Built {n_built} and skipped {len(results) - n_built} page(s) "
+        f"in {time.perf_counter() - start:.1f} s."
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+// Micro-benchmarks for the distribution library.
+//
+// For each distribution class, times pdf/pmf and cdf evaluated on a grid
+// over the default x-range, cdfForPlotting (discrete distributions),
+// ppfSingleValue, defaultXRange, quantileSet, and drawing 10,000 samples,
+// for representative and extreme parameter sets. Special functions are also timed. Timings are the
+// median over several batches of the time per call in microseconds.
+//
+// Usage:
+//   node benchmark.js                          Run and print results
+//   node benchmark.js --save baseline.json     Also save results as a baseline
+//   node benchmark.js --compare baseline.json  Compare with a baseline, exiting
+//                                              with nonzero status on regressions
+//
+// Options:
+//   --threshold r   Relative slowdown flagged as a regression (default 0.25)
+//   --filter s      Only run benchmarks whose names contain s
+//   --quick         Fewer batches and shorter timing per batch
+
+const fs = require('fs');
+const os = require('os');
+const { loadBundle } = require('./load_bundle.js');
+
+
+// Parameter sets for each class. Quantile setting is benchmarked by
+// recovering the parameters from their own quantiles, unless quantiles are
+// given explicitly as [x, p].
+const paramSets = {
+  BernoulliDistribution: { representative: [0.3], extreme: [0.999], quantiles: [[0], [0.7]] },
+  BetaBinomialDistribution: { representative: [20, 2, 3], extreme: [2000, 0.05, 0.05] },
+  BinomialDistribution: { representative: [20, 0.3], extreme: [100000, 0.001] },
+  CategoricalDistribution: { representative: [0.1, 0.3, 0.4], extreme: [0.001, 0.001, 0.997] },
+  DiscreteUniformDistribution: { representative: [0, 20], extreme: [-100000, 100000] },
+  GeometricDistribution: { representative: [0.2], extreme: [0.0001] },
+  HypergeometricDistribution: { representative: [10, 20, 30], extreme: [5000, 10000, 20000] },
+  NegativeBinomialDistribution: { representative: [2, 0.5], extreme: [0.05, 0.0001] },
+  NegativeBinomialMuPhiDistribution: { representative: [10, 2], extreme: [10000, 0.05] },
+  NegativeBinomialAlphaPDistribution: { representative: [2, 0.3], extreme: [0.05, 0.0001] },
+  NegativeBinomialRBDistribution: { representative: [2, 5], extreme: [0.05, 10000] },
+  PoissonDistribution: { representative: [5], extreme: [50000] },
+  TelegraphRNADistribution: { representative: [2, 5, 20], extreme: [0.1, 0.1, 500] },
+  BetaDistribution: { representative: [2, 3], extreme: [0.01, 500] },
+  BetaPhiKappaDistribution: { representative: [0.4, 5], extreme: [0.001, 1000] },
+  CauchyDistribution: { representative: [0, 1], extreme: [0, 1e-4] },
+  ExponentialDistribution: { representative: [1], extreme: [1e-4] },
+  GammaDistribution: { representative: [2, 1], extreme: [0.01, 1000] },
+  HalfCauchyDistribution: { representative: [0, 1], extreme: [0, 1e-4] },
+  HalfNormalDistribution: { representative: [0, 1], extreme: [0, 1e-4] },
+  HalfStudentTDistribution: { representative: [3, 0, 1], extreme: [0.2, 0, 100] },
+  InverseGammaDistribution: { representative: [3, 2], extreme: [0.05, 1000] },
+  InverseGaussianDistribution: { representative: [1, 2], extreme: [100, 0.01] },
+  LogNormalDistribution: { representative: [0, 0.5], extreme: [5, 5] },
+  NormalDistribution: { representative: [0, 1], extreme: [1e6, 1e-6] },
+  ParetoDistribution: { representative: [1, 3], extreme: [0.001, 0.05] },
+  StudentTDistribution: { representative: [3, 0, 1], extreme: [0.2, 0, 100] },
+  UniformDistribution: { representative: [0, 1], extreme: [-1e8, 1e8] },
+  VonMisesDistribution: { representative: [0.5, 2], extreme: [3, 500] },
+  WeibullDistribution: { representative: [1.5, 1], extreme: [0.1, 1000] },
+};
+
+
+// Arguments for special functions
+const specialFunctionArgs = {
+  hyp1f1: { representative: [2.5, 4, 3], extreme: [50, 600, -400] },
+  regularizedIncompleteBeta: { representative: [0.3, 2, 3], extreme: [0.999, 0.01, 5000] },
+  gammaincU: { representative: [3, 2, true], extreme: [900, 1000, true] },
+  besseli0: { representative: [2, true], extreme: [700, true] },
+};
+
+
+function parseArgs(argv) {
+  let opts = { save: null, compare: null, threshold: 0.25, filter: null, quick: false };
+  for (let i = 2; i < argv.length; i++) {
+    if (argv[i] === '--save') opts.save = argv[++i];
+    else if (argv[i] === '--compare') opts.compare = argv[++i];
+    else if (argv[i] === '--threshold') opts.threshold = Number(argv[++i]);
+    else if (argv[i] === '--filter') opts.filter = argv[++i];
+    else if (argv[i] === '--quick') opts.quick = true;
+    else throw new Error('Unknown option ' + argv[i]);
+  }
+
+  return opts;
+}
+
+
+// Results of benchmarked calls are stored here so they cannot be optimized away
+let sink;
+
+
+/**
+ * Median time per call of fn() in microseconds. fn is called repeatedly in
+ * each batch until batchTime milliseconds have passed.
+ */
+function timeIt(fn, nBatches, batchTime) {
+  // Warm up so that the JIT has compiled fn
+  let start = performance.now();
+  while (performance.now() - start < batchTime) sink = fn();
+
+  let perCall = [];
+  for (let b = 0; b < nBatches; b++) {
+    let reps = 0;
+    start = performance.now();
+    let elapsed = 0;
+    while (elapsed < batchTime) {
+      sink = fn();
+      reps += 1;
+      elapsed = performance.now() - start;
+    }
+    perCall.push(1000 * elapsed / reps);
+  }
+  perCall.sort((a, b) => a - b);
+
+  return perCall[Math.floor(nBatches / 2)];
+}
+
+
+/**
+ * Benchmarks, as an array of [name, fn], for a distribution class.
+ */
+function distributionBenchmarks(lib, className) {
+  let benchmarks = [];
+  let dist = new lib[className]();
+  let discrete = dist instanceof lib.DiscreteUnivariateDistribution;
+  let definesQuantileSet = dist.quantileSet !== lib.UnivariateDistribution.prototype.quantileSet;
+  let samples = new Float64Array(10000);
+  let rng = lib.makeRng(42);
+
+  for (let [setName, params] of Object.entries(paramSets[className])) {
+    if (setName === 'quantiles') continue;
+
+    let name = className + '/' + setName + '/';
+    let [xMin, xMax] = dist.defaultXRange(params);
+    let x = discrete ? arangeInclusive(Math.ceil(xMin), Math.floor(xMax), 200) : lib.linspace(xMin, xMax, 200);
+
+    if (discrete) {
+      benchmarks.push([name + 'pmf', () => dist.pmf(x, params)]);
+      benchmarks.push([name + 'cdfForPlotting', () => dist.cdfForPlotting(x[0], x[x.length - 1], params)]);
+    }
+    else {
+      benchmarks.push([name + 'pdf', () => dist.pdf(x, params)]);
+    }
+    benchmarks.push([name + 'cdf', () => dist.cdf(x, params)]);
+    benchmarks.push([name + 'ppfSingleValue', () => {
+      dist.ppfSingleValue(0.01, params);
+      dist.ppfSingleValue(0.5, params);
+      dist.ppfSingleValue(0.99, params);
+    }]);
+    benchmarks.push([name + 'defaultXRange', () => dist.defaultXRange(params)]);
+    benchmarks.push([name + 'sample', () => dist.sample(samples, params, rng)]);
+
+    if (definesQuantileSet) {
+      let [xq, pq, extraParams] = quantileSetInput(dist, params);
+      if (paramSets[className].quantiles !== undefined) [xq, pq] = paramSets[className].quantiles;
+      benchmarks.push([name + 'quantileSet', () => dist.quantileSet(xq, pq, extraParams)]);
+    }
+  }
+
+  return benchmarks;
+}
+
+
+/**
+ * Quantiles of the distribution with given parameters, so that quantile
+ * setting should recover the active parameters.
+ */
+function quantileSetInput(dist, params) {
+  let nActive = dist.activeParamsInds.length;
+  let p = nActive === 1 ? [0.75] : [0.05, 0.95, 0.5].slice(0, nActive).sort();
+  let x = p.map(pVal => dist.ppfSingleValue(pVal, params));
+  let extraParams = dist.fixedParamsInds.map(i => params[i]);
+
+  return [x, p, extraParams];
+}
+
+
+/**
+ * At most nMax integers from start to end, inclusive, evenly spaced.
+ */
+function arangeInclusive(start, end, nMax) {
+  if (end - start + 1 <= nMax) {
+    let x = [];
+    for (let i = start; i <= end; i++) x.push(i);
+    return x;
+  }
+
+  let step = (end - start) / (nMax - 1);
+  let x = [];
+  for (let i = 0; i < nMax; i++) x.push(Math.round(start + i * step));
+  return x;
+}
+
+
+function specialFunctionBenchmarks(lib) {
+  let benchmarks = [];
+  for (let [funName, argSets] of Object.entries(specialFunctionArgs)) {
+    for (let [setName, args] of Object.entries(argSets)) {
+      benchmarks.push(['special/' + funName + '/' + setName, () => lib[funName](...args)]);
+    }
+  }
+
+  return benchmarks;
+}
+
+
+function compare(results, baseline, threshold) {
+  let regressions = [];
+  let lines = [];
+  for (let [name, result] of Object.entries(results)) {
+    let base = baseline.results[name];
+    if (base === undefined || result.error || base.error) continue;
+
+    let ratio = result.us / base.us;
+    let flag = '';
+    if (ratio > 1 + threshold) {
+      flag = 'REGRESSION';
+      regressions.push(name);
+    }
+    else if (ratio < 1 / (1 + threshold)) {
+      flag = 'improved';
+    }
+    lines.push(`${name.padEnd(64)} ${base.us.toPrecision(4).padStart(10)} ${result.us.toPrecision(4).padStart(10)} ${ratio.toFixed(2).padStart(6)}  ${flag}`);
+  }
+
+  console.log(`\n${'benchmark'.padEnd(64)} ${'base (µs)'.padStart(10)} ${'new (µs)'.padStart(10)} ${'ratio'.padStart(6)}`);
+  for (let line of lines) console.log(line);
+  console.log(`\n${regressions.length} regression(s) with threshold ${threshold}.`);
+
+  return regressions;
+}
+
+
+function main() {
+  let opts = parseArgs(process.argv);
+  let nBatches = opts.quick ? 3 : 7;
+  let batchTime = opts.quick ? 20 : 100;
+
+  let classNames = Object.keys(paramSets);
+  let lib = loadBundle([
+    ...classNames,
+    'UnivariateDistribution',
+    'DiscreteUnivariateDistribution',
+    'linspace',
+    'makeRng',
+    ...Object.keys(specialFunctionArgs),
+  ]);
+
+  let benchmarks = specialFunctionBenchmarks(lib);
+  for (let className of classNames) {
+    benchmarks.push(...distributionBenchmarks(lib, className));
+  }
+  if (opts.filter !== null) {
+    benchmarks = benchmarks.filter(([name, fn]) => name.includes(opts.filter));
+  }
+
+  let results = {};
+  for (let [name, fn] of benchmarks) {
+    try {
+      results[name] = { us: timeIt(fn, nBatches, batchTime) };
+      console.log(`${name.padEnd(64)} ${results[name].us.toPrecision(4).padStart(10)} µs`);
+    }
+    catch (e) {
+      results[name] = { error: e.message };
+      console.log(`${name.padEnd(64)} error: ${e.message}`);
+    }
+  }
+
+  let output = {
+    meta: {
+      date: new Date().toISOString(),
+      node: process.version,
+      platform: os.platform() + ' ' + os.arch(),
+      cpu: os.cpus().length > 0 ? os.cpus()[0].model : '',
+      nBatches: nBatches,
+      batchTime: batchTime,
+    },
+    results: results,
+  };
+
+  if (opts.save !== null) {
+    fs.writeFileSync(opts.save, JSON.stringify(output, null, 2) + '\n');
+    console.log(`\nSaved results to ${opts.save}.`);
+  }
+
+  if (opts.compare !== null) {
+    let baseline = JSON.parse(fs.readFileSync(opts.compare, 'utf8'));
+    let regressions = compare(results, baseline, opts.threshold);
+    if (regressions.length > 0) process.exitCode = 1;
+  }
+}
+
+
+main();
@@ -0,0 +1,434 @@
+// Headless harness for measuring the latency of the callbacks of an app
+// built with explore(), as users feel it.
+//
+// The app is built in Python with explore(), and the CustomJS callbacks,
+// with the full code explore() generates including the preamble, are run
+// in Node against lightweight mocks of the Bokeh models they touch
+// (ColumnDataSource, Slider, TextInput, Range1d, Switch, Div, and the
+// figures). As in BokehJS, setting a property of a mock to a new value
+// runs the callbacks attached to it as a microtask, so cascades of
+// callbacks, e.g., slider values set by the quantile setter, are included.
+//
+// Scripted interaction traces are replayed and, for each event, the time
+// from the event until the last callback it triggered finishes and the
+// growth of the heap are recorded. The heap is collected before each
+// event, so heap growth is the number of bytes allocated while handling
+// the event, unless the garbage collector ran in the meantime.
+//
+// Usage:
+//   node callback_latency.js dist [options]
+//
+// Options:
+//   --trace t       Trace to replay: drag, pan, zoom, quantile, or all
+//                   (default), or a JSON file with a list of events
+//   --steps k       Number of steps in built-in traces (default 50)
+//   --save f        Save per-event results as JSON
+//   --python p      Python executable used to build the app (default python)
+//   --kwarg k=v     Keyword argument passed to explore(), with v a Python
+//                   literal; may be given more than once
+//
+// Events in a trace file have the form
+//   {"target": "sliders.0", "set": {"value": 2.5}}
+// where target is the name of an arg of the callbacks, followed by list
+// indices and attributes separated by dots, e.g., "xBoxes.1" or
+// "p_p.x_range".
+
+const childProcess = require('child_process');
+const fs = require('fs');
+const path = require('path');
+const v8 = require('v8');
+const vm = require('vm');
+
+v8.setFlagsFromString('--expose-gc');
+const gc = vm.runInNewContext('gc');
+
+
+// Builds the app and prints the models relevant to callbacks as JSON
+const pythonScript = `
+import ast
+import json
+import sys
+
+import numpy as np
+import bokeh.models
+
+import distribution_explorer
+
+kwargs = {}
+for kwarg in sys.argv[2:]:
+    key, val = kwarg.split("=", 1)
+    kwargs[key] = ast.literal_eval(val)
+
+layout = distribution_explorer.explore(sys.argv[1], **kwargs)
+
+models = {}
+
+def encode(val):
+    if isinstance(val, bokeh.models.Model):
+        add_model(val)
+        return {"ref": val.id}
+    if isinstance(val, (list, tuple, np.ndarray)):
+        return [encode(v) for v in val]
+    if isinstance(val, dict):
+        return {key: encode(v) for key, v in val.items()}
+    if isinstance(val, (float, np.floating)) and not np.isfinite(val):
+        return {"float": str(float(val)).replace("inf", "Infinity").replace("nan", "NaN")}
+    if isinstance(val, np.generic):
+        return val.item()
+    return val
+
+def add_model(model):
+    if model.id in models:
+        return
+    spec = {"type": type(model).__name__, "props": {}, "callbacks": {}}
+    models[model.id] = spec
+
+    props = {
+        "Slider": ["value", "start", "end", "step", "title", "disabled"],
+        "TextInput": ["value", "disabled"],
+        "Switch": ["active"],
+        "Div": ["text"],
+        "Range1d": ["start", "end"],
+        "DataRange1d": ["start", "end"],
+        "ColumnDataSource": ["data"],
+        "CustomJS": ["code"],
+        "figure": ["x_range", "y_range", "frame_width", "frame_height", "width", "height"],
+    }.get(type(model).__name__, [])
+    for prop in props:
+        spec["props"][prop] = encode(getattr(model, prop))
+
+    if type(model).__name__ == "CustomJS":
+        spec["props"]["args"] = encode(dict(model.args))
+
+    for event, cbs in model.js_property_callbacks.items():
+        spec["callbacks"][event] = [encode(cb) for cb in cbs]
+    for event, cbs in model.js_event_callbacks.items():
+        spec["callbacks"][event] = [encode(cb) for cb in cbs]
+
+for model in layout.references():
+    if model.js_property_callbacks or model.js_event_callbacks:
+        add_model(model)
+
+print(json.dumps(models))
+`;
+
+
+function parseArgs(argv) {
+  let opts = { dist: null, trace: 'all', steps: 50, save: null, python: 'python', kwargs: [] };
+  for (let i = 2; i < argv.length; i++) {
+    if (argv[i] === '--trace') opts.trace = argv[++i];
+    else if (argv[i] === '--steps') opts.steps = Number(argv[++i]);
+    else if (argv[i] === '--save') opts.save = argv[++i];
+    else if (argv[i] === '--python') opts.python = argv[++i];
+    else if (argv[i] === '--kwarg') opts.kwargs.push(argv[++i]);
+    else if (argv[i].startsWith('--')) throw new Error('Unknown option ' + argv[i]);
+    else opts.dist = argv[i];
+  }
+  if (opts.dist === null) throw new Error('Usage: node callback_latency.js dist [options]');
+
+  return opts;
+}
+
+
+/**
+ * Mock of a Bokeh model. Setting a property to a new value queues the
+ * callbacks attached to it as microtasks, as BokehJS does.
+ */
+class MockModel {
+  constructor(app, id, type) {
+    this.id = id;
+    this.type = type;
+    this._app = app;
+    this._props = {};
+    this._callbacks = {};
+  }
+
+  _defineProp(name, value) {
+    this._props[name] = value;
+    Object.defineProperty(this, name, {
+      get: () => this._props[name],
+      set: newValue => {
+        if (this._props[name] === newValue) return;
+        this._props[name] = newValue;
+        this._app.trigger(this, 'change:' + name);
+      },
+      enumerable: true,
+    });
+  }
+}
+
+
+/**
+ * Mocks of the models of an app, built from the output of pythonScript.
+ */
+class MockApp {
+  constructor(specs) {
+    this.models = {};
+    this.callbacks = {};
+    this.stats = null;
+
+    for (let [id, spec] of Object.entries(specs)) {
+      this.models[id] = new MockModel(this, id, spec.type);
+    }
+    for (let [id, spec] of Object.entries(specs)) {
+      let model = this.models[id];
+      for (let [name, value] of Object.entries(spec.props)) {
+        if (name === 'args' || name === 'data') continue;
+        model._defineProp(name, this.decode(value));
+      }
+      for (let [event, cbs] of Object.entries(spec.callbacks)) {
+        model._callbacks[event] = cbs.map(cb => cb.ref);
+      }
+
+      if (spec.type === 'ColumnDataSource') {
+        model.data = this.decode(spec.props.data);
+        model.change = { emit: () => { if (this.stats !== null) this.stats.emits += 1; } };
+      }
+      if (spec.type === 'figure') {
+        // Rendered figures report the size of the frame
+        model.inner_width = model.frame_width;
+        model.inner_height = model.frame_height;
+      }
+    }
+
+    for (let [id, spec] of Object.entries(specs)) {
+      if (spec.type === 'CustomJS') {
+        this.callbacks[id] = { args: this.decode(spec.props.args), code: spec.props.code, fn: null };
+      }
+    }
+  }
+
+  decode(value) {
+    if (Array.isArray(value)) return value.map(v => this.decode(v));
+    if (value !== null && typeof value === 'object') {
+      if ('ref' in value) return this.models[value.ref];
+      if ('float' in value) return Number(value.float);
+      let out = {};
+      for (let [key, v] of Object.entries(value)) out[key] = this.decode(v);
+      return out;
+    }
+    return value;
+  }
+
+  trigger(model, event) {
+    for (let cbId of model._callbacks[event] || []) {
+      queueMicrotask(() => this.execute(cbId, model));
+    }
+  }
+
+  execute(cbId, cbObj) {
+    let callback = this.callbacks[cbId];
+    let start = performance.now();
+
+    // Callbacks are compiled on first use and run in strict mode, as in BokehJS
+    if (callback.fn === null) {
+      callback.fn = new Function(...Object.keys(callback.args), 'cb_obj', 'cb_data', '"use strict";\n' + callback.code);
+    }
+    try {
+      callback.fn(...Object.values(callback.args), cbObj, {});
+    }
+    catch (e) {
+      if (this.stats !== null) this.stats.errors.push(e.message);
+    }
+    if (this.stats !== null) {
+      this.stats.callbacks += 1;
+      this.stats.lastEnd = performance.now();
+      this.stats.busy += this.stats.lastEnd - start;
+    }
+  }
+
+  /**
+   * Args common to the callbacks, which explore() passes to all of them.
+   */
+  args() {
+    let largest = null;
+    for (let callback of Object.values(this.callbacks)) {
+      if (largest === null || Object.keys(callback.args).length > Object.keys(largest).length) {
+        largest = callback.args;
+      }
+    }
+    return largest;
+  }
+
+  resolve(target) {
+    let obj = this.args();
+    for (let part of target.split('.')) obj = obj[part];
+    if (obj === undefined) throw new Error('Unknown target ' + target);
+    return obj;
+  }
+}
+
+
+/**
+ * Apply an event and wait until all callbacks it triggered have run.
+ * Returns the latency in milliseconds, the time spent in callbacks, the
+ * number of callbacks run, and the heap growth in bytes.
+ */
+async function replayEvent(app, event) {
+  gc();
+  let target = app.resolve(event.target);
+  let heapBefore = process.memoryUsage().heapUsed;
+  app.stats = { callbacks: 0, emits: 0, busy: 0, lastEnd: null, errors: [] };
+
+  let start = performance.now();
+  for (let [prop, value] of Object.entries(event.set)) target[prop] = value;
+
+  // Macrotasks run after all microtasks, including those queued by
+  // callbacks. Timers set by callbacks, as when a batch of updates is
+  // committed, are also allowed to fire.
+  await new Promise(resolve => setImmediate(resolve));
+  await new Promise(resolve => setTimeout(resolve, 2));
+
+  let stats = app.stats;
+  app.stats = null;
+
+  return {
+    latency: stats.lastEnd === null ? 0 : stats.lastEnd - start,
+    busy: stats.busy,
+    callbacks: stats.callbacks,
+    emits: stats.emits,
+    heapGrowth: process.memoryUsage().heapUsed - heapBefore,
+    errors: stats.errors,
+  };
+}
+
+
+function dragTrace(app, steps) {
+  let events = [];
+  app.args().sliders.forEach((slider, i) => {
+    // Drag toward the farther end of the slider, snapping to its steps
+    let direction = slider.end - slider.value >= slider.value - slider.start ? 1 : -1;
+    let step = direction * Math.max(slider.step, (slider.end - slider.start) / (2 * steps));
+    for (let k = 1; k <= steps; k++) {
+      let value = slider.value + k * step;
+      value = Math.min(slider.end, Math.max(slider.start, slider.step * Math.round(value / slider.step)));
+      events.push({ target: 'sliders.' + i, set: { value: value } });
+    }
+  });
+
+  return events;
+}
+
+
+function panTrace(app, steps) {
+  let xRange = app.resolve('p_p.x_range');
+  let shift = 0.02 * (xRange.end - xRange.start);
+  let events = [];
+  for (let k = 1; k <= steps; k++) {
+    events.push({ target: 'p_p.x_range', set: { start: xRange.start + k * shift, end: xRange.end + k * shift } });
+  }
+
+  return events;
+}
+
+
+function zoomTrace(app, steps) {
+  let xRange = app.resolve('p_p.x_range');
+  let center = (xRange.start + xRange.end) / 2;
+  let halfWidth = (xRange.end - xRange.start) / 2;
+  let events = [];
+  for (let k = 1; k <= steps; k++) {
+    let w = halfWidth * Math.pow(0.97, k);
+    events.push({ target: 'p_p.x_range', set: { start: center - w, end: center + w } });
+  }
+
+  return events;
+}
+
+
+function quantileTrace(app, steps) {
+  let xBoxes = app.args().xBoxes;
+  if (xBoxes.length === 0) return [];
+
+  // Move the upper quantile toward the lower one, or toward zero if there
+  // is only one quantile. For discrete distributions, which have integer
+  // quantiles, it alternates between two neighboring values.
+  let last = xBoxes.length - 1;
+  let xLast = Number(xBoxes[last].value);
+  let shift = xBoxes.length > 1 ? (xLast - Number(xBoxes[0].value)) / (2 * steps) : xLast / (5 * steps);
+  let events = [{ target: 'quantileSetterSwitch', set: { active: true } }];
+  for (let k = 1; k <= steps; k++) {
+    let x = app.args().discrete ? xLast + (xLast >= 1 ? -1 : 1) * (k % 2) : xLast - k * shift;
+    events.push({ target: 'xBoxes.' + last, set: { value: x.toPrecision(6) } });
+  }
+
+  return events;
+}
+
+
+function percentile(sorted, q) {
+  return sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))];
+}
+
+
+function summarize(name, results) {
+  let latencies = results.map(r => r.latency).sort((a, b) => a - b);
+  let heap = results.map(r => r.heapGrowth).sort((a, b) => a - b);
+  let nCallbacks = results.reduce((s, r) => s + r.callbacks, 0);
+  let nEmits = results.reduce((s, r) => s + r.emits, 0);
+  let nErrors = results.reduce((s, r) => s + r.errors.length, 0);
+
+  return `${name.padEnd(10)} ${String(results.length).padStart(6)} `
+         + `${percentile(latencies, 0.5).toFixed(2).padStart(9)} `
+         + `${percentile(latencies, 0.99).toFixed(2).padStart(9)} `
+         + `${latencies[latencies.length - 1].toFixed(2).padStart(9)} `
+         + `${(nCallbacks / results.length).toFixed(1).padStart(9)} `
+         + `${(nEmits / results.length).toFixed(1).padStart(11)} `
+         + `${(percentile(heap, 0.5) / 1024).toFixed(0).padStart(10)} `
+         + `${(percentile(heap, 0.99) / 1024).toFixed(0).padStart(10)} `
+         + `${String(nErrors).padStart(6)}`;
+}
+
+
+async function main() {
+  let opts = parseArgs(process.argv);
+
+  let specs = JSON.parse(childProcess.execFileSync(
+    opts.python,
+    ['-c', pythonScript, opts.dist, ...opts.kwargs],
+    { cwd: path.join(__dirname, '..'), maxBuffer: 1 << 28, encoding: 'utf8' },
+  ));
+
+  let traces;
+  if (['drag', 'pan', 'zoom', 'quantile', 'all'].includes(opts.trace)) {
+    let builders = { drag: dragTrace, pan: panTrace, zoom: zoomTrace, quantile: quantileTrace };
+    let names = opts.trace === 'all' ? Object.keys(builders) : [opts.trace];
+    traces = names.map(name => [name, builders[name]]);
+  }
+  else {
+    let events = JSON.parse(fs.readFileSync(opts.trace, 'utf8'));
+    traces = [[path.basename(opts.trace), () => events]];
+  }
+
+  console.log(`${'trace'.padEnd(10)} ${'events'.padStart(6)} ${'p50 (ms)'.padStart(9)} ${'p99 (ms)'.padStart(9)} `
+              + `${'max (ms)'.padStart(9)} ${'cbs/event'.padStart(9)} ${'emits/event'.padStart(11)} ${'p50 (KiB)'.padStart(10)} `
+              + `${'p99 (KiB)'.padStart(10)} ${'errors'.padStart(6)}`);
+
+  let output = { dist: opts.dist, kwargs: opts.kwargs, node: process.version, traces: {} };
+  for (let [name, build] of traces) {
+    // Each trace starts from a freshly built app
+    let app = new MockApp(specs);
+    let results = [];
+    for (let event of build(app, opts.steps)) {
+      results.push({ event: event, ...(await replayEvent(app, event)) });
+    }
+    if (results.length === 0) continue;
+
+    console.log(summarize(name, results));
+    output.traces[name] = results;
+
+    for (let error of new Set(results.flatMap(r => r.errors))) {
+      console.log(`           error: ${error}`);
+    }
+  }
+
+  if (opts.save !== null) {
+    fs.writeFileSync(opts.save, JSON.stringify(output, null, 2) + '\n');
+  }
+}
+
+
+main().catch(e => {
+  console.error(e);
+  process.exitCode = 1;
+});
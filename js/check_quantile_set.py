@@ -0,0 +1,173 @@
+"""Check distribution_explorer.quantile_set() against the quantileSet()
+methods of the JavaScript distribution classes.
+
+For each distribution, problems are made by drawing parameters around
+their defaults and computing the quantiles used by the quantile setter
+of the app. The problems are solved in Python and, with
+quantile_set_rows.js, in JavaScript. For problems both solve, the
+largest relative difference between the parameters is reported, along
+with the largest error in the CDF at the quantiles of the Python
+solutions and the time per problem of each.
+
+Usage: python check_quantile_set.py [dists ...] [--rows N]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import scipy.special
+
+import distribution_explorer.distribution_explorer as de
+
+
+_js_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def _draw_params(params, rng):
+    """Draw parameter values around the defaults, within their bounds."""
+    vals = []
+    for param, (lo, hi) in zip(params, de._param_bounds(params)):
+        val = float(param["value"])
+        u = rng.uniform(-1, 1)
+        if np.isfinite(lo) and np.isfinite(hi):
+            val = lo + (hi - lo) * scipy.special.expit(
+                scipy.special.logit((val - lo) / (hi - lo)) + u
+            )
+        elif np.isfinite(lo):
+            val = lo + (val - lo) * np.exp(u)
+        else:
+            val = val + u * max(1.0, abs(val))
+        if param.get("is_int", False):
+            val = float(max(np.round(val), lo + 1))
+        vals.append(val)
+
+    return vals
+
+
+def make_problems(dist, n_rows, seed=0):
+    """Quantile setting problems as arrays x, p, and fixed params."""
+    rng = np.random.default_rng(seed)
+    params, x_min, x_max, _, _ = de._load_params(dist, None, None, None, None, None)
+    _, p = de._compute_quantile_setter_params(dist, params)
+    if len(p) == 0:
+        p = [0.5] if de._quantile_set_solvers[dist][1] == 1 else [0.025, 0.975]
+    fun_c = de._funs(dist)[1]
+    discrete = dist in de.discrete_dists
+    fixed_inds = de._quantile_setter_fixed_params.get(dist, [])
+
+    x, fixed = [], []
+    while len(x) < n_rows:
+        vals = _draw_params(params, rng)
+        try:
+            with np.errstate(all="ignore"):
+                xi = [
+                    de._ppf(fun_c, p_val, vals, discrete, float(x_min), float(x_max))
+                    for p_val in p
+                ]
+        except ValueError:
+            continue
+        if np.all(np.isfinite(xi)) and np.all(np.diff(xi) > 0):
+            x.append(xi)
+            fixed.append([vals[i] for i in fixed_inds])
+
+    return np.array(x), np.array(p), np.array(fixed)
+
+
+def solve_js(dist, x, p, fixed):
+    """Solve problems with quantile_set_rows.js."""
+    problems = dict(
+        className=f"{de._to_camel_case(dist)}Distribution",
+        rows=[[list(xi), list(p), list(fi)] for xi, fi in zip(x, fixed)],
+    )
+    script = os.path.join(_js_dir, "quantile_set_rows.js")
+    output = subprocess.run(
+        ["node", script],
+        input=json.dumps(problems),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    results = json.loads(output.stdout)
+
+    # Parameters are null if quantileSet() threw an error or, elementwise,
+    # if they are not finite
+    n_active = de._quantile_set_solvers[dist][2]
+    params = np.array(
+        [[np.nan] * n_active if r[0] is None else r[0] for r in results], dtype=float
+    )
+    success = np.array([r[1] for r in results])
+    seconds = sum(r[2] for r in results)
+
+    return params, success, seconds
+
+
+def cdf_error(dist, x, p, fixed, params):
+    """Largest absolute error in the CDF at the quantiles."""
+    fixed_inds = de._quantile_setter_fixed_params.get(dist, [])
+    fun_c = de._funs(dist)[1]
+    err = 0.0
+    for xi, fi, pi in zip(x, fixed, params):
+        vals = list(pi)
+        for i, val in zip(fixed_inds, fi):
+            vals.insert(i, val)
+        with np.errstate(all="ignore"):
+            err = max(err, np.max(np.abs(fun_c(xi, *vals) - p)))
+
+    return err
+
+
+def check(dist, n_rows):
+    x, p, fixed = make_problems(dist, n_rows)
+
+    start = time.perf_counter()
+    params, success = de.quantile_set(dist, x, p, fixed)
+    py_seconds = time.perf_counter() - start
+
+    params_js, success_js, js_seconds = solve_js(dist, x, p, fixed)
+
+    both = success & success_js
+    with np.errstate(all="ignore"):
+        rel_diff = np.abs(params - params_js) / np.maximum(np.abs(params_js), 1e-12)
+    max_rel_diff = np.max(rel_diff[both]) if np.any(both) else np.nan
+
+    return dict(
+        dist=dist,
+        rows=len(x),
+        py_success=int(success.sum()),
+        js_success=int(success_js.sum()),
+        max_rel_diff=max_rel_diff,
+        cdf_error=cdf_error(dist, x[success], p, fixed[success], params[success]),
+        py_us=1e6 * py_seconds / len(x),
+        js_us=1e6 * js_seconds / len(x),
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("dists", nargs="*", help="distributions to check (default all)")
+    parser.add_argument("--rows", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    dists = args.dists if len(args.dists) > 0 else list(de._quantile_set_solvers)
+    print(
+        f"{'dist':26s} {'rows':>5s} {'py ok':>6s} {'js ok':>6s} {'max rel diff':>13s} "
+        f"{'cdf error':>10s} {'py us/row':>10s} {'js us/row':>10s}"
+    )
+    for dist in dists:
+        r = check(dist, args.rows)
+        print(
+            f"{r['dist']:26s} {r['rows']:5d} {r['py_success']:6d} {r['js_success']:6d} "
+            f"{r['max_rel_diff']:13.2e} {r['cdf_error']:10.2e} "
+            f"{r['py_us']:10.1f} {r['js_us']:10.1f}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
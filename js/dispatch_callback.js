@@ -0,0 +1,86 @@
+// Single callback for all of the widgets of an app. It is triggered by
+// changes in slider values, the x-range of the plots, the quantile setter
+// switch, the quantile setter text boxes, and the samples switch, if
+// any, as well as by the reset event of the plots, and dispatches on what
+// triggered it, cb_obj.
+//
+// The code below assumes that dist is an instance of a
+// ContinuousUnivariateDistribution class or of a
+// DiscreteUnivariateDistribution and that all necessary
+// functions and classes have been loaded.
+
+if (sliders.includes(cb_obj)) {
+  // Don't trigger for disabled sliders
+  if (triggerCallbacks.active && !cb_obj.disabled) {
+    if (quantileSetterSwitch.active) {
+      quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p);
+    }
+    else {
+      updateData(source_p, source_c, p_p, sliders, discrete);
+      updateQuantiles(quantileSetterSwitch, sliders, xBoxes, pBoxes);
+    }
+  }
+}
+else if (cb_obj === p_p.x_range) {
+  if (triggerCallbacks.active) {
+    updateData(source_p, source_c, p_p, sliders, discrete);
+  }
+}
+else if (cb_obj === quantileSetterSwitch) {
+  if (cb_obj.active) {
+    for (let i = 0; i < sliders.length; i++) {
+      if (!dist.fixedParamsInds.includes(i)) {
+        sliders[i].title = dist.paramNames[i] + ' (computed)';
+        sliders[i].disabled = true;
+      }
+    }
+    for (let xBox of xBoxes) {
+      xBox.disabled = false;
+    }
+    for (let pBox of pBoxes) {
+      pBox.disabled = false;
+    }
+  } else {
+    for (let i = 0; i < sliders.length; i++) {
+      if (!dist.fixedParamsInds.includes(i)) {
+        sliders[i].title = dist.paramNames[i];
+        sliders[i].disabled = false;
+      }
+    }
+    for (let xBox of xBoxes) {
+      xBox.disabled = true;
+    }
+    for (let pBox of pBoxes) {
+      pBox.disabled = true;
+    }
+    quantileSetterDiv.text = '';
+  }
+}
+else if (xBoxes.includes(cb_obj) || pBoxes.includes(cb_obj)) {
+  if (quantileSetterSwitch.active) {
+    quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p);
+  }
+}
+else if (cb_obj === sampleSwitch) {
+  if (cb_obj.active) {
+    updateSamples(source_hist, source_ecdf, p_p, sliders, discrete);
+  }
+  else {
+    clearSamples(source_hist, source_ecdf);
+  }
+}
+else if (cb_obj.event_name === 'reset') {
+  // Obtain parameter values
+  let params = paramsFromSliders(sliders);
+
+  // Obtain limits of x-axis
+  let [x1, x2] = dist.defaultXRange(params);
+
+  // Set the new x_range without triggering redraws for each end
+  beginBatch();
+  p_p.x_range.start = x1;
+  p_p.x_range.end = x2;
+
+  // Recompute PDF/PMF and CDF once, then set y-ranges to the defaults
+  commitBatch(() => updateData(source_p, source_c, p_p, sliders, discrete, () => setYRanges(p_p, p_c, source_p)));
+}
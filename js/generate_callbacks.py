@@ -93,6 +93,7 @@ def _callback_class_and_function_dicts():
     for filename in (
         "utils_math.js",
         "utils_linalg.js",
+        "quantile_tables.js",
         "utils_interactive_plotting.js",
         "root_finding.js",
     ):
@@ -107,11 +108,9 @@ def _callback_class_and_function_dicts():
         "slider_end_callback",
         "int_slider_start_callback",
         "int_slider_end_callback",
-        "quantile_setter_switch_callback",
-        "quantile_setter_callback",
-        "reset_button_callback",
-        "slider_callback",
-        "xaxis_change_callback",
+        "dispatch_callback",
+        "worker_handler",
+        "profiler",
     ]:
         output_dict[fname] = _read_js_code(f"{fname}.js")
 
@@ -136,6 +135,9 @@ def _dependencies(code_dict):
     # A manual one: Trust region uses jacCentralDiff
     output["findRootTrustRegion"].append("jacCentralDiff")
 
+    # Another manual one: the default solver budget is stored with withSolverBudget
+    output["defaultSolverBudget"].append("withSolverBudget")
+
     # Another manual one, the superclasses for different parametrizations of
     # the Negative Binomial
     output["NegativeBinomialMuPhiDistribution"].append('NegativeBinomialDistribution')
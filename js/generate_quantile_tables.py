@@ -0,0 +1,190 @@
+"""Generate tables of initial guesses for quantile setting, written to
+quantile_tables.js.
+
+For the Gamma distribution, the ratio of two quantiles does not depend
+on the rate parameter, so the shape parameter is a function of the
+normalized spread of the log quantiles,
+
+    s = (log x2 - log x1) / (z2 - z1),
+
+where z1 and z2 are the standard normal quantiles of p1 and p2, and, more
+weakly, of the center (z1 + z2) / 2. The shape parameter is tabulated on
+a grid of log s and the center.
+
+For the Beta distribution, the logit of a Beta variate is roughly
+Normal, so we use the normalized spread of the logits of the quantiles,
+
+    s = (logit x2 - logit x1) / (z2 - z1),
+
+and the logit of the median implied by it, m = logit x1 - s z1. Both
+log alpha and log beta are tabulated on a grid of m and log s, computed
+with p1 = 0.025 and p2 = 0.975.
+
+Usage: python generate_quantile_tables.py
+"""
+
+import numpy as np
+import scipy.optimize
+import scipy.special
+import scipy.stats as st
+
+
+# Width in normal scores of the quantiles used to build the tables
+_w0 = 2 * st.norm.ppf(0.975)
+
+
+def _gamma_log_alpha(log_s, c):
+    """Log of the shape parameter of the Gamma distribution whose
+    quantiles at normal scores c - w0/2 and c + w0/2 have normalized log
+    spread exp(log_s)."""
+    p1 = st.norm.cdf(c - _w0 / 2)
+    p2 = st.norm.cdf(c + _w0 / 2)
+    target = np.exp(log_s) * _w0
+
+    def f(log_alpha):
+        alpha = np.exp(log_alpha)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_x1 = np.log(scipy.special.gammaincinv(alpha, p1))
+            log_x2 = np.log(scipy.special.gammaincinv(alpha, p2))
+            spread = log_x2 - log_x1
+        if not np.isfinite(spread):
+            spread = np.inf
+        return spread - target
+
+    lower, upper = -12.0, 20.0
+    if f(lower) < 0:
+        return lower
+    if f(upper) > 0:
+        return upper
+
+    return scipy.optimize.brentq(f, lower, upper, xtol=1e-10)
+
+
+def _beta_log_params(m, log_s, guess):
+    """Log of the parameters of the Beta distribution whose 2.5th and 97.5th
+    percentiles have logits m - s w0/2 and m + s w0/2, with s =
+    exp(log_s). Returns None if the solver fails."""
+    s = np.exp(log_s)
+    targets = np.array([m - s * _w0 / 2, m + s * _w0 / 2])
+
+    def f(log_params):
+        with np.errstate(over="ignore", divide="ignore"):
+            alpha, beta = np.exp(log_params)
+            x = scipy.special.betaincinv(alpha, beta, [0.025, 0.975])
+            return scipy.special.logit(x) - targets
+
+    sol = scipy.optimize.root(f, guess, method="hybr")
+    if sol.success and np.all(np.abs(f(sol.x)) < 1e-8 * (1 + np.abs(targets))):
+        return sol.x
+
+    return None
+
+
+def gamma_table():
+    log_s = np.linspace(-6.0, 6.0, 49)
+    c = np.linspace(-2.0, 2.0, 9)
+    log_alpha = np.array([[_gamma_log_alpha(u, v) for v in c] for u in log_s])
+
+    return dict(
+        uMin=log_s[0], uMax=log_s[-1], nU=len(log_s),
+        vMin=c[0], vMax=c[-1], nV=len(c),
+        logAlpha=log_alpha.ravel(),
+    )
+
+
+def beta_table():
+    m = np.linspace(-8.0, 8.0, 17)
+    log_s = np.linspace(-5.0, 2.0, 15)
+    log_params = np.full((len(m), len(log_s), 2), np.nan)
+
+    # Sweep outward from the center of the grid so that each solve starts
+    # from the solution at a neighboring node
+    order = sorted(
+        ((i, j) for i in range(len(m)) for j in range(len(log_s))),
+        key=lambda ij: abs(m[ij[0]]) + abs(log_s[ij[1]] + 0.5),
+    )
+    for i, j in order:
+        guesses = [
+            log_params[i2, j2]
+            for i2, j2 in ((i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1))
+            if 0 <= i2 < len(m) and 0 <= j2 < len(log_s)
+            and np.all(np.isfinite(log_params[i2, j2]))
+        ]
+
+        # Moment-based guess: logit of Beta variate has variance roughly
+        # 1/alpha + 1/beta and median roughly log(alpha/beta)
+        guesses.append(
+            np.array(
+                [
+                    np.logaddexp(0, m[i]) - 2 * log_s[j],
+                    np.logaddexp(0, -m[i]) - 2 * log_s[j],
+                ]
+            )
+        )
+
+        for guess in guesses:
+            sol = _beta_log_params(m[i], log_s[j], guess)
+            if sol is not None:
+                log_params[i, j] = sol
+                break
+
+    # Fill nodes where the solver failed with the nearest successful node
+    ok = np.all(np.isfinite(log_params), axis=2)
+    ok_inds = np.argwhere(ok)
+    for i, j in np.argwhere(~ok):
+        dist = np.abs(ok_inds[:, 0] - i) + np.abs(ok_inds[:, 1] - j)
+        log_params[i, j] = log_params[tuple(ok_inds[np.argmin(dist)])]
+
+    return dict(
+        uMin=m[0], uMax=m[-1], nU=len(m),
+        vMin=log_s[0], vMax=log_s[-1], nV=len(log_s),
+        logAlpha=log_params[:, :, 0].ravel(),
+        logBeta=log_params[:, :, 1].ravel(),
+    ), int((~ok).sum())
+
+
+def _format_table(fun_name, description, table):
+    lines = [f"function {fun_name}() {{", f"  {description}", "  return {"]
+    for key, val in table.items():
+        if isinstance(val, np.ndarray):
+            vals = ", ".join(f"{v:.5g}" for v in val)
+            lines.append(f"    {key}: [{vals}],")
+        else:
+            lines.append(f"    {key}: {val:.6g},")
+    lines += ["  };", "}"]
+
+    return "\n".join(lines)
+
+
+def write_tables(fname):
+    gamma = gamma_table()
+    beta, n_failed = beta_table()
+    if n_failed > 0:
+        print(f"Beta table: filled {n_failed} nodes from neighbors.")
+
+    code = "\n\n\n".join(
+        [
+            "// THIS FILE IS AUTOGENERATED BY generate_quantile_tables.py. DO NOT EDIT.\n"
+            "//\n"
+            "// Tables of initial guesses for quantile setting. Values are on a\n"
+            "// regular grid of u and v, stored with v varying fastest, and are\n"
+            "// interpolated with bilinearInterp().",
+            _format_table(
+                "gammaQuantileSetTable",
+                "// log alpha vs. u = log normalized log-quantile spread, v = center of normal scores",
+                gamma,
+            ),
+            _format_table(
+                "betaQuantileSetTable",
+                "// log alpha and log beta vs. u = logit of median, v = log normalized logit-quantile spread",
+                beta,
+            ),
+        ]
+    )
+
+    with open(fname, "w") as f:
+        f.write(code + "\n")
+
+
+if __name__ == "__main__":
+    write_tables("quantile_tables.js")
@@ -0,0 +1,55 @@
+// Load the distribution library as a single piece of code, in the same way
+// the callbacks see it, for use in Node. The library files do not require
+// each other, so they are concatenated with their require and export
+// statements removed.
+
+const fs = require('fs');
+const path = require('path');
+
+const libraryFiles = [
+  'utils_math.js',
+  'utils_linalg.js',
+  'quantile_tables.js',
+  'root_finding.js',
+  'utils_interactive_plotting.js',
+  'prob_dists.js',
+];
+
+
+/**
+ * Concatenate the code of the library files.
+ */
+function bundleCode(files = libraryFiles) {
+  let code = '';
+  for (let fname of files) {
+    let fileCode = fs.readFileSync(path.join(__dirname, fname), 'utf8');
+
+    // Everything from the export statement on is dropped
+    fileCode = fileCode.split('module.exports')[0];
+    fileCode = fileCode.split('\n').filter(line => !line.includes('require(')).join('\n');
+
+    code += fileCode + '\n';
+  }
+
+  return code;
+}
+
+
+/**
+ * Evaluate the library and return an object containing the requested
+ * functions and classes. globals is an object whose entries are made
+ * available to the library as variables, as the args of the callbacks
+ * are; for example, {n: 400, dist: null}. If globals has an entry
+ * distClass, dist is set to a new instance of that class.
+ */
+function loadBundle(names, globals = {}) {
+  let globalNames = Object.keys(globals).filter(name => name !== 'distClass' && name !== 'dist');
+  let code = bundleCode();
+  code += '\nvar dist = ' + (globals.distClass ? 'new ' + globals.distClass + '();' : 'null;') + '\n';
+  code += 'return {dist: dist, ' + names.map(name => name + ': ' + name).join(', ') + '};\n';
+
+  return new Function(...globalNames, code)(...globalNames.map(name => globals[name]));
+}
+
+
+module.exports = { libraryFiles, bundleCode, loadBundle };
@@ -36,6 +36,15 @@ class UnivariateDistribution {
 
     // Small number for nudging parameters
     this.epsilon = 1.0e-8;
+
+    // Whether the CDF is much more expensive to compute than the PDF, in
+    // which case it is computed from the PDF by quadrature for plotting
+    this.expensiveCdf = false;
+
+    // Allowed absolute error in the CDF. Where the error bound of an
+    // asymptotic approximation of the CDF is below it, e.g., for large
+    // shape parameters, the approximation is used instead
+    this.tol = 1.0e-8;
   }
 
   generateLocationParamIndex() {
@@ -135,6 +144,43 @@ class UnivariateDistribution {
   scalarToArrayParams(params) {
     return params instanceof Array ? params : [params]
   }
+
+  logNormalizer(params) {
+    // Log of the normalizing constant of the PDF/PMF, or any other part of
+    // its log that depends only on the parameters. Overridden by
+    // distributions for which it is expensive and then used through
+    // cachedLogNormalizer().
+    return 0.0;
+  }
+
+  cachedLogNormalizer(params) {
+    // logNormalizer(params), computed only once while the distribution is
+    // evaluated repeatedly at the same parameters, as over the x-values of
+    // a plot or each member of a parameter sweep
+    let cache = this.logNormalizerCache;
+    if (cache !== undefined && cache.params.length === params.length) {
+      let i = 0;
+      while (i < params.length && cache.params[i] === params[i]) i++;
+      if (i === params.length) return cache.value;
+    }
+
+    this.logNormalizerCache = {params: params.slice(), value: this.logNormalizer(params)};
+
+    return this.logNormalizerCache.value;
+  }
+
+  sample(out, params, rng, parametrization = this.parametrization) {
+    // Fill out, an array or typed array, with draws by inverse transform
+    // sampling. rng gives uniform draws, as made by makeRng(). Overridden
+    // with faster samplers for each distribution.
+    params = this.scalarToArrayParams(params);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = this.ppfSingleValue(rng(), params, parametrization);
+    }
+
+    return out;
+  }
 }
 
 
@@ -156,6 +202,21 @@ class DiscreteUnivariateDistribution extends UnivariateDistribution {
       params);
   }
 
+  logpmfSingleValue(x, params, parametrization = this.parametrization) {
+    // Log of the PMF. Overridden for distributions whose PMF is computed
+    // from its log, so that it does not underflow in the tails.
+    return Math.log(this.pmfSingleValue(x, params, parametrization));
+  }
+
+  logpmf(x, params, parametrization = this.parametrization) {
+    params = this.scalarToArrayParams(params);
+
+    return this.scalarOrArrayCompute(
+      (x, params) => this.logpmfSingleValue(x, params, parametrization),
+      x,
+      params);
+  }
+
   cdfSingleValue(x, params, parametrization = this.parametrization) {
     params = this.scalarToArrayParams(params);
 
@@ -233,6 +294,78 @@ class DiscreteUnivariateDistribution extends UnivariateDistribution {
     return y_c;
   }
 
+  bucketedPMFandCDF(edges, params, aggregate = 'max', log = false, parametrization = this.parametrization) {
+    // PMF and CDF aggregated into buckets for plotting when there are
+    // more integers in the plotting range than pixels. Bucket k contains
+    // the integers edges[k] ≤ x < edges[k+1]. Returns x-values and
+    // values for the PMF, one per bucket, being either the maximal PMF
+    // value in the bucket (and where it is attained) or the total
+    // probability mass of the bucket (placed at its center), and the
+    // value of the CDF just before the first bucket and at the last
+    // integer of each bucket. If log is true, the PMF values are natural
+    // logs, aggregated from the log PMF so that they do not underflow.
+    params = this.scalarToArrayParams(params);
+
+    let nBuckets = edges.length - 1;
+    let x_p = [];
+    let y_p = [];
+    let y_c = [];
+
+    // If the CDF does not need to be computed by summing, sums over
+    // buckets cost one CDF evaluation each.
+    if (aggregate === 'sum' && !log && this.cdfSingleValue !== DiscreteUnivariateDistribution.prototype.cdfSingleValue) {
+      let cdfPrev = this.cdfSingleValue(edges[0] - 1, params, parametrization);
+      y_c.push(cdfPrev);
+      for (let k = 0; k < nBuckets; k++) {
+        let cdfVal = this.cdfSingleValue(edges[k + 1] - 1, params, parametrization);
+        x_p.push((edges[k] + edges[k + 1] - 1) / 2);
+        y_p.push(cdfVal - cdfPrev);
+        y_c.push(cdfVal);
+        cdfPrev = cdfVal;
+      }
+
+      return [x_p, y_p, y_c];
+    }
+
+    let cumsum = this.cdfSingleValue(edges[0] - 1, params, parametrization);
+    y_c.push(cumsum);
+    for (let k = 0; k < nBuckets; k++) {
+      let bucketMax = NaN;
+      let xArgMax = edges[k];
+      let bucketSum = 0.0;
+      let bucketLogSum = -Infinity;
+      for (let x = edges[k]; x < edges[k + 1]; x++) {
+        let val = log ? this.logpmfSingleValue(x, params, parametrization) : this.pmfSingleValue(x, params, parametrization);
+        if (!isNaN(val)) {
+          if (log) {
+            bucketSum += Math.exp(val);
+            bucketLogSum = bucketLogSum === -Infinity ? val : logSumExp(bucketLogSum, val);
+          }
+          else {
+            bucketSum += val;
+          }
+          if (!(val <= bucketMax)) {
+            bucketMax = val;
+            xArgMax = x;
+          }
+        }
+      }
+      cumsum += bucketSum;
+
+      if (aggregate === 'sum') {
+        x_p.push((edges[k] + edges[k + 1] - 1) / 2);
+        y_p.push(log ? bucketLogSum : bucketSum);
+      }
+      else {
+        x_p.push(xArgMax);
+        y_p.push(bucketMax);
+      }
+      y_c.push(cumsum);
+    }
+
+    return [x_p, y_p, y_c];
+  }
+
   ppfSingleValue(p, params, parametrization = this.parametrization) {
     if (p < 0 || p > 1) throw new Error('p must be between 0 and 1.')
 
@@ -263,6 +396,44 @@ class DiscreteUnivariateDistribution extends UnivariateDistribution {
     return n;
   }
 
+  aliasTableForParams(params, parametrization = this.parametrization) {
+    // Alias table over the support, leaving out tails with negligible
+    // probability mass, with the value of the first entry. The most
+    // recently built table is kept, since samples are drawn in chunks.
+    let key = JSON.stringify([params, parametrization]);
+    if (this.aliasCache !== undefined && this.aliasCache.key === key) return this.aliasCache;
+
+    let maxSupport = 1048576;
+    let xMin = this.xMin(params, parametrization);
+    let xMax = this.xMax(params, parametrization);
+    let probs = [];
+    let start = xMin;
+    let cumsum = 0.0;
+    for (let x = xMin; x <= xMax && x - xMin < maxSupport && cumsum < 1 - 1e-10; x++) {
+      let prob = this.pmfSingleValue(x, params, parametrization);
+      if (!(prob > 0)) prob = 0.0;
+      cumsum += prob;
+
+      if (probs.length === 0 && cumsum < 1e-12) start = x + 1;
+      else probs.push(prob);
+    }
+
+    this.aliasCache = {key: key, start: start, table: cumsum > 0 ? aliasTable(probs) : null};
+
+    return this.aliasCache;
+  }
+
+  sample(out, params, rng, parametrization = this.parametrization) {
+    params = this.scalarToArrayParams(params);
+    let {start, table} = this.aliasTableForParams(params, parametrization);
+    if (table === null) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = start + aliasSample(table, rng);
+    }
+
+    return out;
+  }
 }
 
 
@@ -285,6 +456,116 @@ class ContinuousUnivariateDistribution extends UnivariateDistribution {
     );
   }
 
+  logpdfSingleValue(x, params, parametrization = this.parametrization) {
+    // Log of the PDF. Overridden for distributions whose PDF is computed
+    // from its log, so that it does not underflow in the tails.
+    return Math.log(this.pdfSingleValue(x, params, parametrization));
+  }
+
+  logpdf(x, params, parametrization = this.parametrization) {
+    params = this.scalarToArrayParams(params);
+
+    return this.scalarOrArrayCompute(
+      (x, params) => this.logpdfSingleValue(x, params, parametrization),
+      x,
+      params
+    );
+  }
+
+  cdfFromPDF(x, pdfVals, params, tol = 1.0e-6, stride = 16, parametrization = this.parametrization) {
+    // CDF on a sorted grid x computed by cumulative quadrature of the
+    // PDF values pdfVals already evaluated on that grid. Each interval
+    // is integrated with the cubic interpolating the PDF at the four
+    // nearest grid points (exactly, using two-point Gauss-Legendre
+    // quadrature), and the difference from the quadratic interpolant
+    // serves as an error estimate. The CDF is computed exactly at x[0],
+    // at least every stride grid points, and whenever the error estimate
+    // accumulated since the last exact value exceeds tol or there are not
+    // enough finite PDF values about an interval. If the quadrature
+    // disagrees with an exact value by more than tol, as happens when the
+    // grid does not resolve the PDF, the CDF is computed exactly for every
+    // point since the previous exact value. This is much cheaper than
+    // computing the CDF at each point for distributions where the CDF is
+    // expensive.
+    params = this.scalarToArrayParams(params);
+
+    let nPts = x.length;
+    let cdfVals = new Array(nPts);
+    if (nPts === 0) return cdfVals;
+
+    const g = 1.0 / Math.sqrt(3.0);
+    const usable = j => j >= 0 && j < nPts && isFinite(x[j]) && isFinite(pdfVals[j]);
+    const exact = j => this.cdfSingleValue(x[j], params, parametrization);
+
+    // Integral over [x[i], x[i+1]] of polynomial interpolating PDF at
+    // the m consecutive grid points starting at j0
+    const intervalIntegral = (i, j0, m) => {
+      let mid = (x[i] + x[i + 1]) / 2;
+      let halfWidth = (x[i + 1] - x[i]) / 2;
+      let t1 = mid - g * halfWidth;
+      let t2 = mid + g * halfWidth;
+      let result = 0.0;
+      for (let j = j0; j < j0 + m; j++) {
+        let l1 = 1.0;
+        let l2 = 1.0;
+        for (let k = j0; k < j0 + m; k++) {
+          if (k !== j) {
+            l1 *= (t1 - x[k]) / (x[j] - x[k]);
+            l2 *= (t2 - x[k]) / (x[j] - x[k]);
+          }
+        }
+        result += pdfVals[j] * (l1 + l2);
+      }
+
+      return halfWidth * result;
+    };
+
+    // Compute CDF exactly at point j. If the quadrature approximation
+    // there is off, recompute all points since the last exact one.
+    let lastExact = 0;
+    let errEst = 0.0;
+    const anchor = (j, approx) => {
+      let val = exact(j);
+      if (approx !== null && !(Math.abs(approx - val) <= tol)) {
+        for (let k = lastExact + 1; k < j; k++) cdfVals[k] = exact(k);
+      }
+      cdfVals[j] = val;
+      lastExact = j;
+      errEst = 0.0;
+    };
+
+    cdfVals[0] = exact(0);
+    for (let i = 0; i < nPts - 1; i++) {
+      // Four-point stencil, centered on the interval if possible
+      let j0 = null;
+      for (let first of [i - 1, i, i - 2]) {
+        if (usable(first) && usable(first + 1) && usable(first + 2) && usable(first + 3)) {
+          j0 = first;
+          break;
+        }
+      }
+
+      if (j0 === null) {
+        anchor(i + 1, null);
+        continue;
+      }
+
+      // Quadratic drops the stencil point farthest from the interval
+      let integral = intervalIntegral(i, j0, 4);
+      errEst += Math.abs(integral - intervalIntegral(i, j0 === i - 2 ? j0 + 1 : j0, 3));
+
+      let approx = cdfVals[i] + integral;
+      if (errEst > tol || i + 1 - lastExact >= stride || i + 1 === nPts - 1) {
+        anchor(i + 1, approx);
+      }
+      else {
+        cdfVals[i + 1] = approx;
+      }
+    }
+
+    return cdfVals.map(val => Math.min(1.0, Math.max(0.0, val)));
+  }
+
 }
 
 
@@ -533,11 +814,21 @@ class BetaBinomialDistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(n, params) {
+    return Math.exp(this.logpmfSingleValue(n, params));
+  }
+
+  logpmfSingleValue(n, params) {
     let [N, alpha, beta] = params.slice(0, 3);
 
     if (n > N || n < 0) return NaN;
 
-    return Math.exp(lnchoice(N, n) + lnbeta(n + alpha, N - n + beta) - lnbeta(alpha, beta));
+    return lnchoice(N, n) + lnbeta(n + alpha, N - n + beta) + this.cachedLogNormalizer(params);
+  }
+
+  logNormalizer(params) {
+    let [alpha, beta] = params.slice(1, 3);
+
+    return -lnbeta(alpha, beta);
   }
 
   ppfSingleValue(p, params) {
@@ -594,23 +885,27 @@ class BinomialDistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(n, params) {
+    return Math.exp(this.logpmfSingleValue(n, params));
+  }
+
+  logpmfSingleValue(n, params) {
     let [N, theta] = params.slice(0, 2);
 
     if (n > N || n < 0) return NaN;
 
     if (theta == 0) {
-      if (n == 0) return 1.0;
-      return 0.0;
+      if (n == 0) return 0.0;
+      return -Infinity;
     }
 
     if (theta == 1) {
-      if (n == N) return 1.0;
-      return 0.0;
+      if (n == N) return 0.0;
+      return -Infinity;
     }
 
-    return Math.exp(lnchoice(N, n) +
+    return lnchoice(N, n) +
       n * Math.log(theta) +
-      (N - n) * Math.log(1 - theta));
+      (N - n) * Math.log(1 - theta);
   }
 
   cdfSingleValue(n, params) {
@@ -618,6 +913,9 @@ class BinomialDistribution extends DiscreteUnivariateDistribution {
 
     if (n < 0) return 0.0;
     if (n >= N) return 1.0;
+    if (betaincAsymptoticError(N - n, n + 1) <= this.tol) {
+      return betaincAsymptotic(1.0 - theta, N - n, n + 1);
+    }
     return regularizedIncompleteBeta(1.0 - theta, N - n, n + 1);
   }
 
@@ -799,6 +1097,17 @@ class DiscreteUniformDistribution extends DiscreteUnivariateDistribution {
     return [low - 1, high + 1];
   }
 
+  sample(out, params, rng) {
+    let [low, high] = params.slice(0, 2);
+    if (!(high >= low)) return out.fill(NaN);
+
+    let nVals = high - low + 1;
+    for (let i = 0; i < out.length; i++) {
+      out[i] = low + Math.floor(rng() * nVals);
+    }
+
+    return out;
+  }
 }
 
 
@@ -841,18 +1150,22 @@ class GeometricDistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(x, params) {
+    return Math.exp(this.logpmfSingleValue(x, params));
+  }
+
+  logpmfSingleValue(x, params) {
     let theta = params[0];
 
     if (theta == 1) {
-      if (x == 0) return 1.0;
-      return 0.0;
+      if (x == 0) return 0.0;
+      return -Infinity;
     }
 
-    if (theta == 0) return 0.0;
+    if (theta == 0) return -Infinity;
 
     if (x < 0) return NaN;
 
-    return Math.exp(x * Math.log(1.0 - theta) + Math.log(theta));
+    return x * Math.log(1.0 - theta) + Math.log(theta);
   }
 
   cdfSingleValue(x, params) {
@@ -897,6 +1210,19 @@ class GeometricDistribution extends DiscreteUnivariateDistribution {
     return [[1.0 - Math.pow(1.0 - p1, 1.0 / (x1 + 1.0))], true];
   }
 
+  sample(out, params, rng) {
+    // Inverse transform, number of failures before the first success
+    let theta = params[0];
+    if (!(theta > 0 && theta <= 1)) return out.fill(NaN);
+    if (theta === 1) return out.fill(0);
+
+    let logq = Math.log1p(-theta);
+    for (let i = 0; i < out.length; i++) {
+      out[i] = Math.floor(Math.log(rng()) / logq);
+    }
+
+    return out;
+  }
 }
 
 
@@ -942,11 +1268,15 @@ class HypergeometricDistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(n, params) {
+    return Math.exp(this.logpmfSingleValue(n, params));
+  }
+
+  logpmfSingleValue(n, params) {
     let [N, a, b] = params.slice(0, 3);
 
     if (n < Math.max(0, N - b) || n > Math.min(N, a)) return NaN;
 
-    return Math.exp(lnchoice(a, n) + lnchoice(b, N - n) - lnchoice(a + b, N));
+    return lnchoice(a, n) + lnchoice(b, N - n) - lnchoice(a + b, N);
   }
 
   ppfSingleValue(p, params) {
@@ -1079,6 +1409,10 @@ class NegativeBinomialDistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(y, params, parametrization = this.parametrization) {
+    return Math.exp(this.logpmfSingleValue(y, params, parametrization));
+  }
+
+  logpmfSingleValue(y, params, parametrization = this.parametrization) {
     if (y < 0) return NaN;
 
     // Grab parameters in alpha-beta form
@@ -1086,11 +1420,16 @@ class NegativeBinomialDistribution extends DiscreteUnivariateDistribution {
 
     if (alpha <= 0 || beta <= 0) return NaN;
 
-    return Math.exp(lngamma(y + alpha)
-                    - lngamma(alpha)
-                    - lnfactorial(y)
-                    + alpha * Math.log(beta / (1 + beta))
-                    - y * Math.log(1 + beta));
+    return lngamma(y + alpha)
+           - lnfactorial(y)
+           - y * Math.log(1 + beta)
+           + this.cachedLogNormalizer([alpha, beta]);
+  }
+
+  logNormalizer(params) {
+    let [alpha, beta] = params;
+
+    return alpha * Math.log(beta / (1 + beta)) - lngamma(alpha);
   }
 
   cdfSingleValue(y, params, parametrization = this.parametrization) {
@@ -1099,9 +1438,12 @@ class NegativeBinomialDistribution extends DiscreteUnivariateDistribution {
     if (alpha === 0 || beta === Infinity) return 1.0;
     if (alpha === Infinity) return y === Infinity ? 1.0 : 0.0; 
 
-    if (y <= 0) return 0.0;
+    if (y < 0) return 0.0;
     if (y === Infinity) return 1.0;
 
+    if (betaincAsymptoticError(alpha, y + 1) <= this.tol) {
+      return betaincAsymptotic(beta / (1 + beta), alpha, y + 1);
+    }
     return regularizedIncompleteBeta(beta / (1 + beta), alpha, y + 1);
   }
 
@@ -1336,16 +1678,20 @@ class PoissonDistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(n, params) {
+    return Math.exp(this.logpmfSingleValue(n, params));
+  }
+
+  logpmfSingleValue(n, params) {
     let lam = params[0];
 
     if (lam < 0) {
       return NaN;
     } else if (lam == 0) {
-      if (n == 0) return 1.0;
-      return 0.0;
+      if (n == 0) return 0.0;
+      return -Infinity;
     }
 
-    return Math.exp(n * Math.log(lam) - lnfactorial(n) - lam);
+    return n * Math.log(lam) - lnfactorial(n) - lam;
   }
 
   cdfSingleValue(n, params) {
@@ -1356,6 +1702,7 @@ class PoissonDistribution extends DiscreteUnivariateDistribution {
 
     if (lam === 0) return 1.0;
 
+    if (gammaincAsymptoticError(n + 1) <= this.tol) return gammaincAsymptotic(lam, n + 1, true);
     return gammaincU(lam, n + 1, true);
   }
 
@@ -1431,42 +1778,43 @@ class TelegraphRNADistribution extends DiscreteUnivariateDistribution {
   }
 
   pmfSingleValue(n, params) {
+    return Math.exp(this.logpmfSingleValue(n, params));
+  }
+
+  logpmfSingleValue(n, params) {
     let kon = params[0];
     let koff = params[1];
     let beta = params[2];
-    let result;
 
     // If beta is zero or kon is zero, result is zero unless n = 0
     if (beta == 0 || koff == 0) {
-      result = n == 0 ? 1.0 : 0.0;
+      return n == 0 ? 0.0 : -Infinity;
     }
     else if (n == 0) {
-      result = hyp1f1(kon, kon + koff, -beta); 
+      return Math.log(hyp1f1(kon, kon + koff, -beta));
     }
-    else {
-      // Prefactor
-      let logpmf = n * Math.log(beta) - lnfactorial(n);
 
-      // Two Pochhammers
-      logpmf += lngamma(kon + n) - lngamma(kon);
-      logpmf -= lngamma(kon + koff + n) - lngamma(kon + koff);
+    // Prefactor
+    let logpmf = n * Math.log(beta) - lnfactorial(n);
 
-      // 1F1 part
-      logpmf += Math.log(hyp1f1(kon + n, kon + koff + n, -beta));
+    // Two Pochhammers
+    logpmf += lngamma(kon + n) - lngamma(kon);
+    logpmf -= lngamma(kon + koff + n) - lngamma(kon + koff);
 
-      result = Math.exp(logpmf);
-    }
+    // 1F1 part
+    logpmf += Math.log(hyp1f1(kon + n, kon + koff + n, -beta));
 
-    return result;
+    return logpmf;
   }
 
   defaultXRange(params, parametrization = this.parametrization) {
     return [0.0, super.ppfSingleValue(0.999, params)];
   }
 
-  quantileSet(x, p) {
+  quantileSet(x, p, extraParams) {
     let x1 = x[0];
     let p1 = p[0];
+    let [kon, koff] = extraParams;
 
     if (!Number.isInteger(x1)) {
       throw new Error(this.varName + ' must be integer.')
@@ -1481,7 +1829,7 @@ class TelegraphRNADistribution extends DiscreteUnivariateDistribution {
     // Root finding function for quantile using transformation to maintain positivity
     const rootFun = (xi) => {
       if (xi === 1) return p1;
-      return p1 - this.cdfSingleValue(x1, [xi / (1 - xi)]);
+      return p1 - this.cdfSingleValue(x1, [kon, koff, xi / (1 - xi)]);
     }
 
     let xiOpt = brentSolve(rootFun, 0.0, 1.0);
@@ -1585,6 +1933,10 @@ class BetaDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params, parametrization = this.parametrization) {
+    return Math.exp(this.logpdfSingleValue(x, params, parametrization));
+  }
+
+  logpdfSingleValue(x, params, parametrization = this.parametrization) {
     // Grab parameters in alpha-beta form
     let [alpha, beta] = this.convertParamsToAlphaBeta(params, parametrization);
 
@@ -1594,28 +1946,32 @@ class BetaDistribution extends ContinuousUnivariateDistribution {
 
     if (iszero(x)) {
         if (alpha == 1) {
-            return Math.exp(-lnbeta(alpha, beta));
+            return this.cachedLogNormalizer([alpha, beta]);
         } else if (alpha > 1) {
-            return 0.0;
+            return -Infinity;
         } else {
             return Infinity;
         }
     }
     else if (isone(x)) {
         if (beta == 1) {
-            return Math.exp(-lnbeta(alpha, beta));
+            return this.cachedLogNormalizer([alpha, beta]);
         }
         else if (beta > 1) {
-            return 0.0;
+            return -Infinity;
         }
         else {
             return Infinity;
         }
     }
 
-    let lnProb = (alpha - 1.0) * Math.log(x) + (beta - 1.0) * Math.log(1.0 - x) - lnbeta(alpha, beta);
+    return (alpha - 1.0) * Math.log(x) + (beta - 1.0) * Math.log(1.0 - x) + this.cachedLogNormalizer([alpha, beta]);
+  }
+
+  logNormalizer(params) {
+    let [alpha, beta] = params;
 
-    return Math.exp(lnProb);
+    return -lnbeta(alpha, beta);
   }
 
   cdfSingleValue(x, params, parametrization = this.parametrization) {
@@ -1625,6 +1981,7 @@ class BetaDistribution extends ContinuousUnivariateDistribution {
     if (x <= 0) return 0.0;
     if (x >= 1) return 1.0;
 
+    if (betaincAsymptoticError(alpha, beta) <= this.tol) return betaincAsymptotic(x, alpha, beta);
     return regularizedIncompleteBeta(x, alpha, beta);
   }
 
@@ -1632,6 +1989,12 @@ class BetaDistribution extends ContinuousUnivariateDistribution {
     if (p == 0) return 0.0;
     if (p == 1) return 1.0;
 
+    // Invert the regularized incomplete beta function directly
+    let [alpha, beta] = this.convertParamsToAlphaBeta(params, parametrization);
+    let x = regularizedIncompleteBetaInv(p, alpha, beta);
+    if (!isNaN(x)) return x;
+
+    // Fall back to root finding if the inversion did not converge
     // Root finding function for ppf
     let rootFun = (x, params, p) => p - this.cdfSingleValue(x, params, parametrization);
     
@@ -1654,7 +2017,18 @@ class BetaDistribution extends ContinuousUnivariateDistribution {
     };
 
     let args = [x1, p1, x2, p2];
-    let guess = [1.0, 1.0];
+
+    // Initial guess from a table, computed offline, of the parameters as a
+    // function of the logit of the median and the spread of the logits of
+    // the quantiles, normalized by the spread of their normal scores
+    let z1 = Math.SQRT2 * erfinv(2 * p1 - 1);
+    let z2 = Math.SQRT2 * erfinv(2 * p2 - 1);
+    let spread = (logit(x2) - logit(x1)) / (z2 - z1);
+    let table = betaQuantileSetTable();
+    let [u, v] = [logit(x1) - spread * z1, Math.log(spread)];
+    let guess = [bilinearInterp(table, table.logAlpha, u, v), bilinearInterp(table, table.logBeta, u, v)];
+    if (!guess.every(isFinite)) guess = [1.0, 1.0];
+
     let [logParams, optimSuccess] = findRootTrustRegion(quantileRootFun, guess, args=args);
 
     return [this.convertParamsFromAlphaBeta([Math.exp(logParams[0]), Math.exp(logParams[1])], this.parametrization), optimSuccess];
@@ -1664,6 +2038,41 @@ class BetaDistribution extends ContinuousUnivariateDistribution {
     return [0.0, 1.0];
   }
 
+  sample(out, params, rng, parametrization = this.parametrization) {
+    let [alpha, beta] = this.convertParamsToAlphaBeta(params, parametrization);
+    if (!(alpha > 0 && beta > 0)) return out.fill(NaN);
+
+    if (alpha <= 1 && beta <= 1) {
+      // Johnk's method, with logs if both powers underflow
+      for (let i = 0; i < out.length; i++) {
+        while (true) {
+          let u = rng();
+          let v = rng();
+          let x = Math.pow(u, 1 / alpha);
+          let y = Math.pow(v, 1 / beta);
+          if (x + y <= 1) {
+            if (x + y > 0) {
+              out[i] = x / (x + y);
+            }
+            else {
+              out[i] = 1 / (1 + Math.exp(Math.log(v) / beta - Math.log(u) / alpha));
+            }
+            break;
+          }
+        }
+      }
+    }
+    else {
+      // Ratio of Gamma variates
+      let zig = zigguratNormalTables();
+      for (let i = 0; i < out.length; i++) {
+        let x = standardGamma(alpha, rng, zig);
+        out[i] = x / (x + standardGamma(beta, rng, zig));
+      }
+    }
+
+    return out;
+  }
 }
 
 
@@ -1726,6 +2135,14 @@ class CauchyDistribution extends ContinuousUnivariateDistribution {
     return 1.0 / Math.PI / sigma / (1 + Math.pow((x - mu) / sigma, 2))
   }
 
+  logpdfSingleValue(x, params) {
+    if (x == Infinity || x == -Infinity) return -Infinity;
+
+    let [mu, sigma] = params.slice(0, 2);
+
+    return -Math.log(Math.PI * sigma) - 2 * Math.log(Math.hypot(1, (x - mu) / sigma));
+  }
+
   cdfSingleValue(x, params) {
     let [mu, sigma] = params.slice(0, 2);
 
@@ -1751,11 +2168,22 @@ class CauchyDistribution extends ContinuousUnivariateDistribution {
     let cotp2 = 1.0 / Math.tan(Math.PI * p2);
 
     let mu = (x2 * cotp1 - x1 * cotp2) / (cotp1 - cotp2);
-    let sigma = (x1 - x2) * Math.sin(Math.PI * p1) * Math.sin(Math.PI * p1) 
+    let sigma = (x1 - x2) * Math.sin(Math.PI * p1) * Math.sin(Math.PI * p2)
                 / Math.sin(Math.PI * (p1 - p2));
 
     return [[mu, sigma], true];
   }
+
+  sample(out, params, rng) {
+    let [mu, sigma] = params.slice(0, 2);
+    if (!(sigma > 0)) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = mu + sigma * Math.tan(Math.PI * (rng() - 0.5));
+    }
+
+    return out;
+  }
 }
 
 class ExponentialDistribution extends ContinuousUnivariateDistribution {
@@ -1797,12 +2225,16 @@ class ExponentialDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     let beta = params[0];
 
     if (x < 0) return NaN;
-    if (x == Infinity) return 0.0;
+    if (x == Infinity) return -Infinity;
 
-    return beta * Math.exp(-beta * x);
+    return Math.log(beta) - beta * x;
   }
 
   cdfSingleValue(x, params) {
@@ -1842,6 +2274,16 @@ class ExponentialDistribution extends ContinuousUnivariateDistribution {
     return [0.0, this.ppfSingleValue(0.999, params)];
   }
 
+  sample(out, params, rng) {
+    let beta = params[0];
+    if (!(beta > 0)) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = -Math.log(rng()) / beta;
+    }
+
+    return out;
+  }
 }
 
 class GammaDistribution extends ContinuousUnivariateDistribution {
@@ -1883,25 +2325,30 @@ class GammaDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     if (x < 0) return NaN;
-    if (x == Infinity) return 0.0;
+    if (x == Infinity) return -Infinity;
 
     let [alpha, beta] = params.slice(0, 2);
 
     if (x == 0) {
       if (alpha == 1) {
-        return beta;
+        return Math.log(beta);
       } else if (alpha > 1) {
-        return 0.0;
+        return -Infinity;
       } else {  // alpha < 1
         return Infinity;
       }
     }
 
-    let lnProb;
-    lnProb = alpha * Math.log(beta * x) - Math.log(x) - beta * x - lngamma(alpha);
+    return alpha * Math.log(beta * x) - Math.log(x) - beta * x + this.cachedLogNormalizer(params);
+  }
 
-    return Math.exp(lnProb);
+  logNormalizer(params) {
+    return -lngamma(params[0]);
   }
 
   cdfSingleValue(x, params) {
@@ -1910,6 +2357,7 @@ class GammaDistribution extends ContinuousUnivariateDistribution {
 
     let [alpha, beta] = params.slice(0, 2);
 
+    if (gammaincAsymptoticError(alpha) <= this.tol) return gammaincAsymptotic(beta * x, alpha, false);
     return gammaincL(beta * x, alpha, true);
   }
 
@@ -1917,6 +2365,11 @@ class GammaDistribution extends ContinuousUnivariateDistribution {
     if (p === 0) return 0.0;
     if (p === 1) return Infinity;
 
+    // Invert the regularized incomplete gamma function directly
+    let x = gammaincLInv(p, params[0]);
+    if (!isNaN(x)) return x / params[1];
+
+    // Fall back to root finding if the inversion did not converge
     // Recale params
     let rescaledParams = [params[0], 1.0];
 
@@ -1983,7 +2436,16 @@ class GammaDistribution extends ContinuousUnivariateDistribution {
 
     let args = [x1Rescaled, p1, x2Rescaled, p2];
 
-    let guess = [0.75, 0.75];
+    // Initial guess for alpha from a table, computed offline, of alpha as a
+    // function of the spread of the log quantiles, normalized by the spread
+    // of their normal scores, and the center of the normal scores. The rate
+    // is then chosen to match the upper quantile.
+    let z1 = Math.SQRT2 * erfinv(2 * p1 - 1);
+    let z2 = Math.SQRT2 * erfinv(2 * p2 - 1);
+    let table = gammaQuantileSetTable();
+    let logAlpha = bilinearInterp(table, table.logAlpha, Math.log(-Math.log(x1Rescaled) / (z2 - z1)), (z1 + z2) / 2);
+    let guess = [logAlpha, Math.log(gammaincLInv(p2, Math.exp(logAlpha)) / x2Rescaled)];
+    if (!guess.every(isFinite)) guess = [0.75, 0.75];
 
     let [logParams, optimSuccess] = findRootTrustRegion(quantileRootFun, guess, args=args);
 
@@ -2017,6 +2479,17 @@ class GammaDistribution extends ContinuousUnivariateDistribution {
     return [[retval[0], retval[1] / x2], optimSuccess];
   }
 
+  sample(out, params, rng) {
+    let [alpha, beta] = params.slice(0, 2);
+    if (!(alpha > 0 && beta > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      out[i] = standardGamma(alpha, rng, zig) / beta;
+    }
+
+    return out;
+  }
 }
 
 class HalfCauchyDistribution extends ContinuousUnivariateDistribution {
@@ -2072,6 +2545,15 @@ class HalfCauchyDistribution extends ContinuousUnivariateDistribution {
     return 2.0 / Math.PI / sigma / (1 + Math.pow((x - mu) / sigma, 2));
   }
 
+  logpdfSingleValue(x, params) {
+    let [mu, sigma] = params.slice(0, 2);
+
+    if (x < mu) return NaN;
+    if (x === Infinity) return -Infinity;
+
+    return Math.log(2.0 / Math.PI / sigma) - 2 * Math.log(Math.hypot(1, (x - mu) / sigma));
+  }
+
   cdfSingleValue(x, params) {
     let [mu, sigma] = params.slice(0, 2);
 
@@ -2099,6 +2581,17 @@ class HalfCauchyDistribution extends ContinuousUnivariateDistribution {
 
     return [[(x1 - mu) / Math.tan(Math.PI * p1 / 2)], true];
   }
+
+  sample(out, params, rng) {
+    let [mu, sigma] = params.slice(0, 2);
+    if (!(sigma > 0)) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = mu + sigma * Math.tan(0.5 * Math.PI * rng());
+    }
+
+    return out;
+  }
 }
 
 class HalfNormalDistribution extends ContinuousUnivariateDistribution {
@@ -2155,6 +2648,15 @@ class HalfNormalDistribution extends ContinuousUnivariateDistribution {
     return Math.exp(-expTerm) / sigma * Math.sqrt(2.0 / Math.PI);
   }
 
+  logpdfSingleValue(x, params) {
+    let [mu, sigma] = params.slice(0, 2);
+
+    if (x < mu) return NaN;
+    if (x === Infinity) return -Infinity;
+
+    return -Math.pow(x - mu, 2) / 2.0 / Math.pow(sigma, 2) - Math.log(sigma) + Math.log(2.0 / Math.PI) / 2;
+  }
+
   cdfSingleValue(x, params) {
     let [mu, sigma] = params.slice(0, 2);
 
@@ -2184,6 +2686,18 @@ class HalfNormalDistribution extends ContinuousUnivariateDistribution {
 
     return [[(x1 - mu) / sqrt2 / erfinv(p1)], true];
   }
+
+  sample(out, params, rng) {
+    let [mu, sigma] = params.slice(0, 2);
+    if (!(sigma > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      out[i] = mu + sigma * Math.abs(standardNormal(rng, zig));
+    }
+
+    return out;
+  }
 }
 
 class HalfStudentTDistribution extends ContinuousUnivariateDistribution {
@@ -2215,6 +2729,9 @@ class HalfStudentTDistribution extends ContinuousUnivariateDistribution {
     // Parameters that are fixed in quantile setting
     this.fixedParams = ['ν', 'μ'];
 
+    // CDF requires incomplete beta function or quadrature; compute from PDF for plotting
+    this.expensiveCdf = true;
+
     // Trigger computing active and fixed indices for quantile setting
     super.generateActiveFixedInds();
 
@@ -2231,17 +2748,23 @@ class HalfStudentTDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     let [nu, mu, sigma] = params.slice(0, 3);
 
     if (x < mu) return NaN;
-    if (x === Infinity) return 0.0;
+    if (x === Infinity) return -Infinity;
 
-    let lnprob;
+    return this.cachedLogNormalizer(params)
+           - (nu + 1) / 2 * log1p(Math.pow(x - mu, 2) / nu / Math.pow(sigma, 2));
+  }
 
-    lnprob = Math.log(2.0) + lngamma((nu + 1) / 2) - lngamma(nu / 2) - Math.log(Math.PI * nu) / 2 
-             - Math.log(sigma) - (nu + 1) / 2 * log1p(Math.pow(x - mu, 2) / nu / Math.pow(sigma, 2));
+  logNormalizer(params) {
+    let [nu, , sigma] = params.slice(0, 3);
 
-    return Math.exp(lnprob);
+    return Math.log(2.0) + lnGammaHalfRatio(nu / 2) - Math.log(Math.PI * nu) / 2 - Math.log(sigma);
   }
 
   cdfSingleValue(x, params) {
@@ -2252,6 +2775,7 @@ class HalfStudentTDistribution extends ContinuousUnivariateDistribution {
 
     let y = (x - mu) / sigma;
 
+    if (2 * studentTCdfAsymptoticError(nu) <= this.tol) return 2 * studentTCdfAsymptotic(y, nu) - 1;
     return 1 - regularizedIncompleteBeta(nu / (Math.pow(y, 2) + nu), 0.5 * nu, 0.5);
   }
 
@@ -2344,6 +2868,20 @@ class HalfStudentTDistribution extends ContinuousUnivariateDistribution {
 
     return retval;
   }
+
+  sample(out, params, rng) {
+    // Absolute value of a Normal draw over the root of a scaled Gamma draw
+    let [nu, mu, sigma] = params.slice(0, 3);
+    if (!(nu > 0 && sigma > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      let g = standardGamma(nu / 2, rng, zig);
+      out[i] = mu + sigma * Math.abs(standardNormal(rng, zig)) * Math.sqrt(nu / (2 * g));
+    }
+
+    return out;
+  }
 }
 
 class InverseGammaDistribution extends ContinuousUnivariateDistribution {
@@ -2385,15 +2923,22 @@ class InverseGammaDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     if (x < 0) return NaN;
-    if (x === 0 || x === Infinity) return 0.0;
+    if (x === 0 || x === Infinity) return -Infinity;
 
     let [alpha, beta] = params.slice(0, 2);
 
-    let lnProb;
-    lnProb = alpha * Math.log(beta) - (alpha + 1) * Math.log(x) - beta / x - lngamma(alpha);
+    return this.cachedLogNormalizer(params) - (alpha + 1) * Math.log(x) - beta / x;
+  }
 
-    return Math.exp(lnProb);
+  logNormalizer(params) {
+    let [alpha, beta] = params.slice(0, 2);
+
+    return alpha * Math.log(beta) - lngamma(alpha);
   }
 
   cdfSingleValue(x, params) {
@@ -2402,6 +2947,7 @@ class InverseGammaDistribution extends ContinuousUnivariateDistribution {
 
     let [alpha, beta] = params.slice(0, 2);
 
+    if (gammaincAsymptoticError(alpha) <= this.tol) return gammaincAsymptotic(beta / x, alpha, true);
     return gammaincU(beta / x, alpha, true);
   }
 
@@ -2426,10 +2972,24 @@ class InverseGammaDistribution extends ContinuousUnivariateDistribution {
   quantileSet(x, p) {
     let [x1, x2] = x.slice(0, 2);
 
+    let [p1, p2] = p.slice(0, 2);
+
+    // The reciprocal of an Inverse Gamma variate is Gamma distributed
     let gamma = new GammaDistribution();
-    return gamma.quantileSet([1.0 / x2, 1.0 / x1], p);
+    return gamma.quantileSet([1.0 / x2, 1.0 / x1], [1.0 - p2, 1.0 - p1]);
   }
 
+  sample(out, params, rng) {
+    let [alpha, beta] = params.slice(0, 2);
+    if (!(alpha > 0 && beta > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      out[i] = beta / standardGamma(alpha, rng, zig);
+    }
+
+    return out;
+  }
 }
 
 class InverseGaussianDistribution extends ContinuousUnivariateDistribution {
@@ -2479,16 +3039,17 @@ class InverseGaussianDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params, parametrization = this.parametrization) {
+    return Math.exp(this.logpdfSingleValue(x, params, parametrization));
+  }
+
+  logpdfSingleValue(x, params, parametrization = this.parametrization) {
     if (x < 0) return NaN;
-    if (x === 0 || x === Infinity) return 0.0;  // Technically not zero at x = 0, undefined
+    if (x === 0 || x === Infinity) return -Infinity;  // Technically not zero at x = 0, undefined
 
     let [mu, lambda] = params.slice(0, 2);
 
-    let lnProb;
-    lnProb = -Math.log(2.0 * Math.PI) / 2.0 + (Math.log(lambda) - 3.0 * Math.log(x)) / 2.0
-             - lambda * Math.pow(x - mu, 2) / (2.0 * Math.pow(mu, 2) * x);
-
-    return Math.exp(lnProb);
+    return -Math.log(2.0 * Math.PI) / 2.0 + (Math.log(lambda) - 3.0 * Math.log(x)) / 2.0
+           - lambda * Math.pow(x - mu, 2) / (2.0 * Math.pow(mu, 2) * x);
   }
 
   cdfSingleValue(x, params, parametrization = this.parametrization) {
@@ -2569,6 +3130,23 @@ class InverseGaussianDistribution extends ContinuousUnivariateDistribution {
     // Return result with proper scaling
     return [[x2 * paramsOpt[0], x2 * paramsOpt[1]], optimSuccess];
   }
+
+  sample(out, params, rng) {
+    // Method of Michael, Schucany, and Haas (1976)
+    let [mu, lam] = params.slice(0, 2);
+    if (!(mu > 0 && lam > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      let z = standardNormal(rng, zig);
+      let y = mu * z * z;
+      let sqrtTerm = y + Math.sqrt(y * (4 * lam + y));
+      let x = 4 * mu * lam * y / (sqrtTerm * sqrtTerm);
+      out[i] = rng() * (mu + x) <= mu ? x : mu * mu / x;
+    }
+
+    return out;
+  }
 }
 
 
@@ -2626,6 +3204,14 @@ class LogNormalDistribution extends ContinuousUnivariateDistribution {
     return Math.exp(-expTerm) / x / sigma / Math.sqrt(2 * Math.PI);
   }
 
+  logpdfSingleValue(x, params) {
+    if (x < 0.0) return NaN;
+    if (x === 0 || x === Infinity) return -Infinity;
+
+    let [mu, sigma] = params.slice(0, 2);
+    return -Math.pow(Math.log(x) - mu, 2) / 2.0 / Math.pow(sigma, 2) - Math.log(x * sigma) - Math.log(2 * Math.PI) / 2;
+  }
+
   cdfSingleValue(x, params) {
     if (x <= 0) return 0.0;
     if (x === Infinity) return 1.0;
@@ -2669,6 +3255,18 @@ class LogNormalDistribution extends ContinuousUnivariateDistribution {
 
     return [[mu, sigma], true];
   }
+
+  sample(out, params, rng) {
+    let [mu, sigma] = params.slice(0, 2);
+    if (!(sigma > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      out[i] = Math.exp(mu + sigma * standardNormal(rng, zig));
+    }
+
+    return out;
+  }
 }
 
 
@@ -2725,6 +3323,14 @@ class NormalDistribution extends ContinuousUnivariateDistribution {
     return Math.exp(-expTerm) / sigma / Math.sqrt(2 * Math.PI);
   }
 
+  logpdfSingleValue(x, params) {
+    if (x === -Infinity || x === Infinity) return -Infinity;
+
+    let [mu, sigma] = params.slice(0, 2);
+
+    return -Math.pow(x - mu, 2) / 2.0 / Math.pow(sigma, 2) - Math.log(sigma) - Math.log(2 * Math.PI) / 2;
+  }
+
   cdfSingleValue(x, params) {
     if (x === -Infinity) return 0.0;
     if (x === Infinity) return 1.0;
@@ -2762,6 +3368,18 @@ class NormalDistribution extends ContinuousUnivariateDistribution {
 
     return [[mu, sigma], true];
   }
+
+  sample(out, params, rng) {
+    let [mu, sigma] = params.slice(0, 2);
+    if (!(sigma > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      out[i] = mu + sigma * standardNormal(rng, zig);
+    }
+
+    return out;
+  }
 }
 
 
@@ -2804,13 +3422,16 @@ class ParetoDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     let [ymin, alpha] = params.slice(0, 2);
 
     if (x < ymin) return NaN;
-    if (x === Infinity) return 0.0;
+    if (x === Infinity) return -Infinity;
 
-    let logp = Math.log(alpha) + alpha * Math.log(ymin) - (alpha + 1) * Math.log(x); 
-    return Math.exp(logp);
+    return Math.log(alpha) + alpha * Math.log(ymin) - (alpha + 1) * Math.log(x); 
   }
 
   cdfSingleValue(x, params) {
@@ -2853,6 +3474,17 @@ class ParetoDistribution extends ContinuousUnivariateDistribution {
 
     return [[ymin, alpha], true];
   }
+
+  sample(out, params, rng) {
+    let [yMin, alpha] = params.slice(0, 2);
+    if (!(yMin > 0 && alpha > 0)) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = yMin * Math.exp(-Math.log(rng()) / alpha);
+    }
+
+    return out;
+  }
 }
 
 
@@ -2885,6 +3517,9 @@ class StudentTDistribution extends ContinuousUnivariateDistribution {
     // Parameters that are fixed in quantile setting
     this.fixedParams = ['ν'];
 
+    // CDF requires incomplete beta function or quadrature; compute from PDF for plotting
+    this.expensiveCdf = true;
+
     // Trigger computing active and fixed indices for quantile setting
     super.generateActiveFixedInds();
 
@@ -2901,16 +3536,22 @@ class StudentTDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
-    if (x === -Infinity || x === Infinity) return 0.0;
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
+    if (x === -Infinity || x === Infinity) return -Infinity;
 
     let [nu, mu, sigma] = params.slice(0, 3);
 
-    let lnprob;
+    return this.cachedLogNormalizer(params)
+           - (nu + 1) / 2 * log1p(Math.pow(x - mu, 2) / nu / Math.pow(sigma, 2));
+  }
 
-    lnprob = lngamma((nu + 1) / 2) - lngamma(nu / 2) - Math.log(Math.PI * nu) / 2 - Math.log(sigma)
-             - (nu + 1) / 2 * log1p(Math.pow(x - mu, 2) / nu / Math.pow(sigma, 2));
+  logNormalizer(params) {
+    let [nu, , sigma] = params.slice(0, 3);
 
-    return Math.exp(lnprob);
+    return lnGammaHalfRatio(nu / 2) - Math.log(Math.PI * nu) / 2 - Math.log(sigma);
   }
 
   cdfSingleValue(x, params) {
@@ -2921,6 +3562,8 @@ class StudentTDistribution extends ContinuousUnivariateDistribution {
 
     let y = (x - mu) / sigma;
 
+    if (studentTCdfAsymptoticError(nu) <= this.tol) return studentTCdfAsymptotic(y, nu);
+
     if (y >= 0) {
         return 1 - regularizedIncompleteBeta(nu / (Math.pow(y, 2) + nu), 0.5 * nu, 0.5) / 2;
     }
@@ -2943,7 +3586,22 @@ class StudentTDistribution extends ContinuousUnivariateDistribution {
     // Return is we match special cases
     if (nu === 1 || nu === Infinity) return mu + sigma * guess;
 
-    // Use trust region to compute ppf
+    // Invert the regularized incomplete beta function directly. In the
+    // tails, z = nu / (nu + t^2) is small and is computed; near the median,
+    // 1 - z is small and is computed instead, to avoid cancellation.
+    let pTail = Math.min(p, 1 - p);
+    let t;
+    if (pTail < 0.25) {
+      let z = regularizedIncompleteBetaInv(2 * pTail, nu / 2, 0.5);
+      t = Math.sqrt(nu * (1 - z) / z);
+    }
+    else {
+      let y = regularizedIncompleteBetaInv(1 - 2 * pTail, 0.5, nu / 2);
+      t = Math.sqrt(nu * y / (1 - y));
+    }
+    if (!isNaN(t)) return mu + sigma * (p < 0.5 ? -t : t);
+
+    // Fall back to trust region if the inversion did not converge
     let rootFun = (x, nu, p) => [p - this.cdfSingleValue(x, [nu, 0, 1])];
     let [xOpt, success] = findRootTrustRegion(rootFun, [guess], [nu, p]);
 
@@ -3058,6 +3716,19 @@ class StudentTDistribution extends ContinuousUnivariateDistribution {
     return retval;
   }
 
+  sample(out, params, rng) {
+    // Normal draw over the root of a scaled Gamma draw
+    let [nu, mu, sigma] = params.slice(0, 3);
+    if (!(nu > 0 && sigma > 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    for (let i = 0; i < out.length; i++) {
+      let g = standardGamma(nu / 2, rng, zig);
+      out[i] = mu + sigma * standardNormal(rng, zig) * Math.sqrt(nu / (2 * g));
+    }
+
+    return out;
+  }
 }
 
 class UniformDistribution extends ContinuousUnivariateDistribution {
@@ -3144,6 +3815,17 @@ class UniformDistribution extends ContinuousUnivariateDistribution {
 
     return [[alpha, beta], true];
   }
+
+  sample(out, params, rng) {
+    let [alpha, beta] = params.slice(0, 2);
+    if (!(beta > alpha)) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = alpha + (beta - alpha) * rng();
+    }
+
+    return out;
+  }
 }
 
 class VonMisesDistribution extends ContinuousUnivariateDistribution {
@@ -3177,6 +3859,9 @@ class VonMisesDistribution extends ContinuousUnivariateDistribution {
     // Parameters that are fixed in quantile setting
     this.fixedParams = [];
 
+    // CDF requires incomplete beta function or quadrature; compute from PDF for plotting
+    this.expensiveCdf = true;
+
     // Trigger computing active and fixed indices for quantile setting
     super.generateActiveFixedInds();
 
@@ -3193,9 +3878,17 @@ class VonMisesDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     let [mu, kappa] = params.slice(0, 2);
 
-    return Math.exp(kappa * cosm1(x - mu)) / (2 * Math.PI * besseli0(kappa, true));
+    return kappa * cosm1(x - mu) + this.cachedLogNormalizer(params);
+  }
+
+  logNormalizer(params) {
+    return -Math.log(2 * Math.PI * besseli0(params[1], true));
   }
 
   cdfSingleValueNormalApprox(x, params) {
@@ -3352,6 +4045,51 @@ class VonMisesDistribution extends ContinuousUnivariateDistribution {
 
     return [paramsOpt, optimSuccess];
   }
+
+  sample(out, params, rng) {
+    // Method of Best and Fisher (1979), with a Normal approximation for
+    // large kappa and a uniform distribution for tiny kappa, as in NumPy
+    let [mu, kappa] = params.slice(0, 2);
+    if (!(kappa >= 0)) return out.fill(NaN);
+
+    let zig = zigguratNormalTables();
+    const wrap = theta => theta - 2 * Math.PI * Math.floor((theta + Math.PI) / (2 * Math.PI));
+
+    if (kappa < 1e-8) {
+      for (let i = 0; i < out.length; i++) out[i] = Math.PI * (2 * rng() - 1);
+      return out;
+    }
+
+    if (kappa > 1e5) {
+      for (let i = 0; i < out.length; i++) out[i] = wrap(mu + standardNormal(rng, zig) / Math.sqrt(kappa));
+      return out;
+    }
+
+    let s;
+    if (kappa < 1e-5) {
+      s = 1 / kappa + kappa;
+    }
+    else {
+      let r = 1 + Math.sqrt(1 + 4 * kappa * kappa);
+      let rho = (r - Math.sqrt(2 * r)) / (2 * kappa);
+      s = (1 + rho * rho) / (2 * rho);
+    }
+
+    for (let i = 0; i < out.length; i++) {
+      let w;
+      while (true) {
+        let z = Math.cos(Math.PI * rng());
+        w = (1 + s * z) / (s + z);
+        let y = kappa * (s - w);
+        let v = rng();
+        if (y * (2 - y) - v >= 0 || Math.log(y / v) + 1 - y >= 0) break;
+      }
+      let theta = Math.acos(Math.min(1, Math.max(-1, w)));
+      out[i] = wrap(rng() < 0.5 ? mu - theta : mu + theta);
+    }
+
+    return out;
+  }
 }
 
 
@@ -3394,22 +4132,24 @@ class WeibullDistribution extends ContinuousUnivariateDistribution {
   }
 
   pdfSingleValue(x, params) {
+    return Math.exp(this.logpdfSingleValue(x, params));
+  }
+
+  logpdfSingleValue(x, params) {
     if (x < 0) return NaN;
-    if (x === Infinity) return 0.0;
+    if (x === Infinity) return -Infinity;
 
     let [alpha, sigma] = params.slice(0, 2);
 
     if (x === 0) {
-      if (alpha > 1.0) return 0.0;
+      if (alpha > 1.0) return -Infinity;
       if (alpha < 1.0) return Infinity;
-      if (alpha == 1.0) return Math.exp(-x / sigma) / sigma;
+      if (alpha == 1.0) return -Math.log(sigma);
     }
 
 
-    let logp = -Math.pow(x / sigma, alpha) + (alpha - 1) * Math.log(x) 
-                + Math.log(alpha) - alpha * Math.log(sigma);
-
-    return Math.exp(logp);
+    return -Math.pow(x / sigma, alpha) + (alpha - 1) * Math.log(x) 
+           + Math.log(alpha) - alpha * Math.log(sigma);
   }
 
   cdfSingleValue(x, params) {
@@ -3455,6 +4195,455 @@ class WeibullDistribution extends ContinuousUnivariateDistribution {
   }
 
   // You should not respecify cdf, pdf, ppf; only specify the calculations for a single value.
+
+  sample(out, params, rng) {
+    let [alpha, sigma] = params.slice(0, 2);
+    if (!(alpha > 0 && sigma > 0)) return out.fill(NaN);
+
+    for (let i = 0; i < out.length; i++) {
+      out[i] = sigma * Math.pow(-Math.log(rng()), 1 / alpha);
+    }
+
+    return out;
+  }
+}
+
+
+class SumDistribution extends DiscreteUnivariateDistribution {
+  // Sum of independent discrete random variables, with distributions
+  // given by the instances in components. Its parameters are those of the
+  // components, in order.
+  constructor(components) {
+    super();
+
+    this.components = components;
+
+    // Name of distribution
+    this.name = 'Sum of ' + components.map(component => component.name).join(', ');
+
+    // Name of independent variable (used in quantile setter)
+    this.varName = components[0].varName;
+
+    // Maximum allowed min and max of the distribution, regardless of params
+    this.hardMin = components.reduce((a, component) => a + component.hardMin, 0);
+    this.hardMax = components.reduce((a, component) => a + component.hardMax, 0);
+
+    // Parameter names, in order of params, subscripted by component
+    this.paramNames = components.flatMap(
+      (component, i) => component.paramNames.map(name => name + subscript(i + 1))
+    );
+
+    // Parameter minima and maxima
+    this.paramMin = components.flatMap(component => component.paramMin);
+    this.paramMax = components.flatMap(component => component.paramMax);
+
+    // No quantile setting, so all parameters are fixed
+    this.fixedParams = this.paramNames;
+
+    // Largest number of integers on which the PMF is computed
+    this.maxLattice = 4194304;
+
+    // Trigger computing active and fixed indices for quantile setting
+    super.generateActiveFixedInds()
+  }
+
+  xMin(params) {
+    let parts = componentParams(params, this.components);
+    return this.components.reduce((a, component, i) => a + component.xMin(parts[i]), 0);
+  }
+
+  xMax(params) {
+    let parts = componentParams(params, this.components);
+    return this.components.reduce((a, component, i) => a + component.xMax(parts[i]), 0);
+  }
+
+  lattice(hi, params) {
+    // PMF and CDF on the integers from the smallest value of the support
+    // to at least hi, computed by FFT convolution of the PMFs of the
+    // components in O(n log n) time. Each component contributes to
+    // values up to hi only through its own values up to hi less the
+    // smallest values of the others, so the convolutions are exact on
+    // the lattice. The lattice for the most recent params is kept and is
+    // grown by doubling, so that evaluating the PMF or CDF at a sequence
+    // of increasing values, as is done in plotting and in the ppf, costs
+    // O(n log n) in total.
+    let key = JSON.stringify(params);
+    let cache = this.latticeCache;
+    if (cache !== undefined && cache.key === key && hi <= cache.hi) return cache;
+
+    let parts = componentParams(params, this.components);
+    let lows = this.components.map((component, i) => component.xMin(parts[i]));
+    let start = lows.reduce((a, b) => a + b, 0);
+    if (!Number.isFinite(start)) {
+      this.latticeCache = {key: key, start: NaN, hi: Infinity, pmf: [NaN], cdf: [NaN]};
+      return this.latticeCache;
+    }
+    if (cache !== undefined && cache.key === key) hi = Math.max(hi, 2 * cache.hi - start + 1);
+    hi = Math.min(Math.max(hi, start), start + this.maxLattice - 1);
+    let nInts = hi - start + 1;
+
+    let pmf = null;
+    for (let i = 0; i < this.components.length && (pmf === null || !isNaN(pmf[0])); i++) {
+      let component = this.components[i];
+      let highest = Math.min(nInts - 1, component.xMax(parts[i]) - lows[i]);
+      let componentPMF = new Float64Array(nInts);
+      let valid = false;
+      for (let k = 0; k <= highest; k++) {
+        let prob = component.pmfSingleValue(lows[i] + k, parts[i]);
+        if (!isNaN(prob)) {
+          componentPMF[k] = prob;
+          valid = true;
+        }
+      }
+      if (!valid) componentPMF.fill(NaN);
+
+      pmf = pmf === null ? componentPMF : fftConvolve(pmf, componentPMF, nInts);
+    }
+
+    // Roundoff from the transforms can give small negative values
+    let cdf = new Float64Array(nInts);
+    let cumsum = 0.0;
+    for (let k = 0; k < nInts; k++) {
+      if (pmf[k] < 0) pmf[k] = 0.0;
+      cumsum += pmf[k];
+      cdf[k] = Math.min(1.0, cumsum);
+    }
+
+    this.latticeCache = {key: key, start: start, hi: hi, pmf: pmf, cdf: cdf};
+
+    return this.latticeCache;
+  }
+
+  pmfSingleValue(x, params) {
+    let {start, hi, pmf} = this.lattice(x, params);
+    if (isNaN(start)) return NaN;
+    if (x < start || !Number.isInteger(x)) return 0.0;
+
+    return x <= hi ? pmf[x - start] : NaN;
+  }
+
+  cdfSingleValue(x, params) {
+    x = Math.floor(x);
+    let {start, hi, cdf} = this.lattice(x, params);
+    if (isNaN(start) || isNaN(cdf[0])) return NaN;
+    if (x < start) return 0.0;
+    if (x === Infinity) return 1.0;
+
+    return x <= hi ? cdf[x - start] : NaN;
+  }
+
+  ppfSingleValue(p, params) {
+    let start = this.xMin(params);
+    let xMax = this.xMax(params);
+    if (isNaN(start)) return NaN;
+    if (p <= 0) return start;
+    if (p >= 1) return xMax;
+
+    let hi = start + 63;
+    let lattice = this.lattice(hi, params);
+    while (!(lattice.cdf[lattice.cdf.length - 1] >= p) && lattice.hi < xMax && lattice.hi - start + 1 < this.maxLattice) {
+      lattice = this.lattice(lattice.hi + 1, params);
+    }
+
+    let cdf = lattice.cdf;
+    if (isNaN(cdf[0])) return NaN;
+    if (!(cdf[cdf.length - 1] >= p) && !isclose(cdf[cdf.length - 1], p)) return Math.min(lattice.hi, xMax);
+
+    // Smallest integer with CDF at least p
+    let lo = -1;
+    hi = cdf.length - 1;
+    while (hi - lo > 1) {
+      let mid = (lo + hi) >> 1;
+      if (cdf[mid] >= p || isclose(cdf[mid], p)) hi = mid;
+      else lo = mid;
+    }
+
+    return lattice.start + hi;
+  }
+
+  defaultXRange(params) {
+    return [this.ppfSingleValue(0.001, params) - 1, this.ppfSingleValue(0.999, params) + 1];
+  }
+
+  sample(out, params, rng) {
+    // Sum of draws of each component
+    let parts = componentParams(params, this.components);
+    if (this.sampleBuffer === undefined || this.sampleBuffer.length !== out.length) {
+      this.sampleBuffer = new Float64Array(out.length);
+    }
+
+    out.fill(0);
+    for (let i = 0; i < this.components.length; i++) {
+      this.components[i].sample(this.sampleBuffer, parts[i], rng);
+      for (let j = 0; j < out.length; j++) out[j] += this.sampleBuffer[j];
+    }
+
+    return out;
+  }
+}
+
+
+class DiscreteMixtureDistribution extends DiscreteUnivariateDistribution {
+  // Finite mixture of discrete distributions, given by the instances in
+  // components. Its parameters are those of the components, in order,
+  // followed by the weights of all but the last component.
+  constructor(components) {
+    super();
+
+    this.components = components;
+
+    // Name of distribution
+    this.name = 'Mixture of ' + components.map(component => component.name).join(', ');
+
+    // Name of independent variable (used in quantile setter)
+    this.varName = components[0].varName;
+
+    // Maximum allowed min and max of the distribution, regardless of params
+    this.hardMin = Math.min(...components.map(component => component.hardMin));
+    this.hardMax = Math.max(...components.map(component => component.hardMax));
+
+    // Parameter names, in order of params, subscripted by component
+    let weightNames = components.slice(1).map((component, i) => 'w' + subscript(i + 1));
+    this.paramNames = components.flatMap(
+      (component, i) => component.paramNames.map(name => name + subscript(i + 1))
+    ).concat(weightNames);
+
+    // Parameter minima and maxima
+    this.paramMin = components.flatMap(component => component.paramMin).concat(weightNames.map(name => 0));
+    this.paramMax = components.flatMap(component => component.paramMax).concat(weightNames.map(name => 1));
+
+    // No quantile setting, so all parameters are fixed
+    this.fixedParams = this.paramNames;
+
+    // Trigger computing active and fixed indices for quantile setting
+    super.generateActiveFixedInds()
+  }
+
+  xMin(params) {
+    let parts = componentParams(params, this.components);
+    return Math.min(...this.components.map((component, i) => component.xMin(parts[i])));
+  }
+
+  xMax(params) {
+    let parts = componentParams(params, this.components);
+    return Math.max(...this.components.map((component, i) => component.xMax(parts[i])));
+  }
+
+  pmfSingleValue(x, params) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
+
+    let parts = componentParams(params, this.components);
+    let prob = 0.0;
+    for (let i = 0; i < this.components.length; i++) {
+      if (weights[i] > 0) prob += weights[i] * this.components[i].pmfSingleValue(x, parts[i]);
+    }
+
+    return prob;
+  }
+
+  logpmfSingleValue(x, params) {
+    // Log-sum-exp of the weighted log PMFs of the components
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
+
+    let parts = componentParams(params, this.components);
+    let result = -Infinity;
+    for (let i = 0; i < this.components.length; i++) {
+      if (weights[i] > 0) {
+        let term = Math.log(weights[i]) + this.components[i].logpmfSingleValue(x, parts[i]);
+        if (isNaN(term)) continue;
+        result = result === -Infinity ? term : logSumExp(result, term);
+      }
+    }
+
+    return result;
+  }
+
+  cdfSingleValue(x, params) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
+
+    let parts = componentParams(params, this.components);
+    let prob = 0.0;
+    for (let i = 0; i < this.components.length; i++) {
+      if (weights[i] > 0) prob += weights[i] * this.components[i].cdfSingleValue(x, parts[i]);
+    }
+
+    return Math.min(1.0, prob);
+  }
+
+  ppfSingleValue(p, params) {
+    // The quantile lies between the smallest and largest quantiles of the
+    // components, so it is found by bisection on the integers in between
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
+
+    let parts = componentParams(params, this.components);
+    let quantiles = this.components.map((component, i) => component.ppfSingleValue(p, parts[i]))
+      .filter((x, i) => weights[i] > 0);
+    let lo = Math.min(...quantiles) - 1;
+    let hi = Math.max(...quantiles);
+    if (!isFinite(lo) || !isFinite(hi)) return hi;
+
+    while (hi - lo > 1) {
+      let mid = Math.floor((lo + hi) / 2);
+      let cdfVal = this.cdfSingleValue(mid, params);
+      if (cdfVal >= p || isclose(cdfVal, p)) hi = mid;
+      else lo = mid;
+    }
+
+    return hi;
+  }
+
+  defaultXRange(params) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return [NaN, NaN];
+
+    let parts = componentParams(params, this.components);
+    let ranges = this.components.map((component, i) => component.defaultXRange(parts[i]))
+      .filter((range, i) => weights[i] > 0);
+
+    return [Math.min(...ranges.map(range => range[0])), Math.max(...ranges.map(range => range[1]))];
+  }
+
+  sample(out, params, rng) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return out.fill(NaN);
+
+    return sampleMixture(out, this.components, componentParams(params, this.components), weights, rng);
+  }
+}
+
+
+class ContinuousMixtureDistribution extends ContinuousUnivariateDistribution {
+  // Finite mixture of continuous distributions, given by the instances
+  // in components. Its parameters are those of the components, in order,
+  // followed by the weights of all but the last component.
+  constructor(components) {
+    super();
+
+    this.components = components;
+
+    // Name of distribution
+    this.name = 'Mixture of ' + components.map(component => component.name).join(', ');
+
+    // Name of independent variable (used in quantile setter)
+    this.varName = components[0].varName;
+
+    // Maximum allowed min and max of the distribution, regardless of params
+    this.hardMin = Math.min(...components.map(component => component.hardMin));
+    this.hardMax = Math.max(...components.map(component => component.hardMax));
+
+    // Parameter names, in order of params, subscripted by component
+    let weightNames = components.slice(1).map((component, i) => 'w' + subscript(i + 1));
+    this.paramNames = components.flatMap(
+      (component, i) => component.paramNames.map(name => name + subscript(i + 1))
+    ).concat(weightNames);
+
+    // Parameter minima and maxima
+    this.paramMin = components.flatMap(component => component.paramMin).concat(weightNames.map(name => 0));
+    this.paramMax = components.flatMap(component => component.paramMax).concat(weightNames.map(name => 1));
+
+    // No quantile setting, so all parameters are fixed
+    this.fixedParams = this.paramNames;
+
+    // The CDF is computed by quadrature if it is for any of the components
+    this.expensiveCdf = components.some(component => component.expensiveCdf);
+
+    // Trigger computing active and fixed indices for quantile setting
+    super.generateActiveFixedInds()
+  }
+
+  xMin(params) {
+    let parts = componentParams(params, this.components);
+    return Math.min(...this.components.map((component, i) => component.xMin(parts[i])));
+  }
+
+  xMax(params) {
+    let parts = componentParams(params, this.components);
+    return Math.max(...this.components.map((component, i) => component.xMax(parts[i])));
+  }
+
+  pdfSingleValue(x, params) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
+
+    let parts = componentParams(params, this.components);
+    let density = 0.0;
+    for (let i = 0; i < this.components.length; i++) {
+      if (weights[i] > 0) density += weights[i] * this.components[i].pdfSingleValue(x, parts[i]);
+    }
+
+    return density;
+  }
+
+  logpdfSingleValue(x, params) {
+    // Log-sum-exp of the weighted log PDFs of the components
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
+
+    let parts = componentParams(params, this.components);
+    let result = -Infinity;
+    for (let i = 0; i < this.components.length; i++) {
+      if (weights[i] > 0) {
+        let term = Math.log(weights[i]) + this.components[i].logpdfSingleValue(x, parts[i]);
+        if (isNaN(term)) continue;
+        result = result === -Infinity ? term : logSumExp(result, term);
+      }
+    }
+
+    return result;
+  }
+
+  cdfSingleValue(x, params) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
+
+    let parts = componentParams(params, this.components);
+    let prob = 0.0;
+    for (let i = 0; i < this.components.length; i++) {
+      if (weights[i] > 0) prob += weights[i] * this.components[i].cdfSingleValue(x, parts[i]);
+    }
+
+    return Math.min(1.0, prob);
+  }
+
+  ppfSingleValue(p, params) {
+    // The quantile lies between the smallest and largest quantiles of the
+    // components, which bracket the root of the CDF
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return NaN;
+
+    let parts = componentParams(params, this.components);
+    let quantiles = this.components.map((component, i) => component.ppfSingleValue(p, parts[i]))
+      .filter((x, i) => weights[i] > 0);
+    let lo = Math.min(...quantiles);
+    let hi = Math.max(...quantiles);
+    if (!isFinite(lo) || !isFinite(hi) || lo === hi) return lo;
+
+    let x = brentSolve(x => this.cdfSingleValue(x, params) - p, lo, hi, [], 1e-10 * (hi - lo));
+
+    return x === null ? (lo + hi) / 2 : x;
+  }
+
+  defaultXRange(params) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return [NaN, NaN];
+
+    let parts = componentParams(params, this.components);
+    let ranges = this.components.map((component, i) => component.defaultXRange(parts[i]))
+      .filter((range, i) => weights[i] > 0);
+
+    return [Math.min(...ranges.map(range => range[0])), Math.max(...ranges.map(range => range[1]))];
+  }
+
+  sample(out, params, rng) {
+    let weights = mixtureWeights(params, this.components.length);
+    if (weights === null) return out.fill(NaN);
+
+    return sampleMixture(out, this.components, componentParams(params, this.components), weights, rng);
+  }
 }
 
 
@@ -3487,6 +4676,9 @@ module.exports = {
   UniformDistribution,
   VonMisesDistribution,
   WeibullDistribution,
+  SumDistribution,
+  DiscreteMixtureDistribution,
+  ContinuousMixtureDistribution,
 }
 
 
@@ -0,0 +1,152 @@
+// Profiling of the callbacks, for apps built with profile=True. This code
+// is placed between the callback preamble and the code of each callback,
+// so it is absent, and costs nothing, when profiling is off.
+//
+// The functions that do the work of the callbacks, the solvers, and the
+// methods of dist are wrapped with timers and counters. Since the callback
+// code is rerun on each callback, statistics are kept on globalThis, where
+// they can be scraped as distributionExplorerProfiles[profileDiv.id]. A
+// rolling summary is written to profileDiv.
+
+var profileWindow = 50;
+
+
+function profileState(profileDiv) {
+  if (globalThis.distributionExplorerProfiles === undefined) {
+    globalThis.distributionExplorerProfiles = {};
+  }
+  let states = globalThis.distributionExplorerProfiles;
+
+  if (!(profileDiv.id in states)) {
+    states[profileDiv.id] = {stats: {}, depth: 0, distDepth: 0, points: 0, solverEvals: 0, renderScheduled: false};
+  }
+
+  return states[profileDiv.id];
+}
+
+
+function profileRecord(state, name, elapsed, points, solverEvals) {
+  if (!(name in state.stats)) {
+    state.stats[name] = {calls: 0, last: 0, max: 0, total: 0, recent: [], points: 0, solverEvals: 0};
+  }
+  let entry = state.stats[name];
+
+  entry.calls += 1;
+  entry.last = elapsed;
+  entry.max = Math.max(entry.max, elapsed);
+  entry.total += elapsed;
+  entry.recent.push(elapsed);
+  if (entry.recent.length > profileWindow) entry.recent.shift();
+  entry.avg = entry.recent.reduce((a, b) => a + b, 0) / entry.recent.length;
+  entry.points = points;
+  entry.solverEvals = solverEvals;
+}
+
+
+/**
+ * Write a summary of the most time-consuming calls to profileDiv. This is
+ * done after the current callback finishes, so it is not itself timed.
+ */
+function profileRender(state, profileDiv) {
+  if (state.renderScheduled) return;
+  state.renderScheduled = true;
+
+  setTimeout(() => {
+    state.renderScheduled = false;
+
+    let names = Object.keys(state.stats).sort((a, b) => state.stats[b].total - state.stats[a].total);
+    let cell = 'style="padding: 0 8px; text-align: right;"';
+    let text = '<table style="font-family: monospace; font-size: 11px;"><tr><th></th>'
+               + ['calls', 'last ms', 'avg ms', 'max ms', 'points', 'solver evals'].map(h => '<th ' + cell + '>' + h + '</th>').join('')
+               + '</tr>';
+    for (let name of names.slice(0, 10)) {
+      let entry = state.stats[name];
+      text += '<tr><td>' + name + '</td>'
+              + [entry.calls, entry.last.toFixed(2), entry.avg.toFixed(2), entry.max.toFixed(2), entry.points, entry.solverEvals].map(v => '<td ' + cell + '>' + v + '</td>').join('')
+              + '</tr>';
+    }
+    profileDiv.text = text + '</table>';
+  }, 0);
+}
+
+
+/**
+ * Wrap fn with a timer. Points evaluated and solver function evaluations
+ * during the call are also recorded. If isDistMethod is true, the points at
+ * which the method is evaluated are counted, unless it is called from
+ * another method of dist.
+ */
+function profileWrap(state, name, fn, profileDiv, isDistMethod = false) {
+  return function (...args) {
+    let points = state.points;
+    let solverEvals = state.solverEvals;
+    if (isDistMethod) {
+      if (state.distDepth === 0) state.points += Array.isArray(args[0]) ? args[0].length : 1;
+      state.distDepth += 1;
+    }
+    state.depth += 1;
+
+    let start = performance.now();
+    try {
+      return fn.apply(this, args);
+    }
+    finally {
+      let elapsed = performance.now() - start;
+      state.depth -= 1;
+      if (isDistMethod) state.distDepth -= 1;
+
+      profileRecord(state, name, elapsed, state.points - points, state.solverEvals - solverEvals);
+      if (state.depth === 0) profileRender(state, profileDiv);
+    }
+  };
+}
+
+
+/**
+ * Wrap a solver with a timer, counting evaluations of the function it is
+ * solving, which is argument fInd of the solver.
+ */
+function profileWrapSolver(state, name, solver, fInd, profileDiv) {
+  let wrapped = profileWrap(state, name, solver, profileDiv);
+
+  return function (...args) {
+    let f = args[fInd];
+    args[fInd] = (...fArgs) => {
+      state.solverEvals += 1;
+      return f(...fArgs);
+    };
+
+    return wrapped.apply(this, args);
+  };
+}
+
+
+function profileDist(state, dist, profileDiv) {
+  let names = new Set();
+  for (let proto = Object.getPrototypeOf(dist); proto !== null && proto !== Object.prototype; proto = Object.getPrototypeOf(proto)) {
+    for (let name of Object.getOwnPropertyNames(proto)) {
+      let descriptor = Object.getOwnPropertyDescriptor(proto, name);
+      if (name !== 'constructor' && typeof descriptor.value === 'function') names.add(name);
+    }
+  }
+
+  for (let name of names) {
+    dist[name] = profileWrap(state, 'dist.' + name, dist[name], profileDiv, true);
+  }
+}
+
+
+var profile = profileState(profileDiv);
+
+// Not all functions are present in every preamble
+if (typeof updateData === 'function') updateData = profileWrap(profile, 'updateData', updateData, profileDiv);
+if (typeof updateSamples === 'function') updateSamples = profileWrap(profile, 'updateSamples', updateSamples, profileDiv);
+if (typeof updateSweep === 'function') updateSweep = profileWrap(profile, 'updateSweep', updateSweep, profileDiv);
+if (typeof updateQuantiles === 'function') updateQuantiles = profileWrap(profile, 'updateQuantiles', updateQuantiles, profileDiv);
+if (typeof quantileSetter === 'function') quantileSetter = profileWrap(profile, 'quantileSetter', quantileSetter, profileDiv);
+if (typeof findRootTrustRegion === 'function') findRootTrustRegion = profileWrapSolver(profile, 'findRootTrustRegion', findRootTrustRegion, 0, profileDiv);
+if (typeof bisectionSolve === 'function') bisectionSolve = profileWrapSolver(profile, 'bisectionSolve', bisectionSolve, 0, profileDiv);
+if (typeof newtonSolve === 'function') newtonSolve = profileWrapSolver(profile, 'newtonSolve', newtonSolve, 1, profileDiv);
+if (typeof secantSolve === 'function') secantSolve = profileWrapSolver(profile, 'secantSolve', secantSolve, 1, profileDiv);
+if (typeof brentSolve === 'function') brentSolve = profileWrapSolver(profile, 'brentSolve', brentSolve, 0, profileDiv);
+profileDist(profile, dist, profileDiv);
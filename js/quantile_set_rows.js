@@ -0,0 +1,34 @@
+// Solve quantile setting problems with the quantileSet() methods of the
+// distribution classes, for comparison with the Python implementation in
+// distribution_explorer.quantile_set(). Problems are read as JSON from
+// stdin, as an object with entries className, the name of the class, and
+// rows, an array of [x, p, extraParams]. The results are written as JSON
+// to stdout, an array with [params, success, seconds] for each row, where
+// params is null if quantileSet() threw an error.
+//
+// Usage:
+//   node quantile_set_rows.js < problems.json > results.json
+
+const fs = require('fs');
+const { loadBundle } = require('./load_bundle.js');
+
+
+function main() {
+  let { className, rows } = JSON.parse(fs.readFileSync(0, 'utf8'));
+  let { dist } = loadBundle([], { distClass: className });
+
+  let results = rows.map(([x, p, extraParams]) => {
+    let start = performance.now();
+    try {
+      let [params, success] = dist.quantileSet(x, p, extraParams);
+      return [params.map(Number), Boolean(success), (performance.now() - start) / 1000];
+    } catch (e) {
+      return [null, false, (performance.now() - start) / 1000];
+    }
+  });
+
+  process.stdout.write(JSON.stringify(results));
+}
+
+
+main();
@@ -1,8 +0,0 @@
-// The code below assumes that dist is an instance of a 
-// ContinuousUnivariateDistribution class or of a
-// DiscreteUnivariateDistribution and that all necessary
-// functions and classes have been loaded.
-
-if (quantileSetterSwitch.active) {
-  quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p);
-}
\ No newline at end of file
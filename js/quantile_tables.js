@@ -0,0 +1,34 @@
+// THIS FILE IS AUTOGENERATED BY generate_quantile_tables.py. DO NOT EDIT.
+//
+// Tables of initial guesses for quantile setting. Values are on a
+// regular grid of u and v, stored with v varying fastest, and are
+// interpolated with bilinearInterp().
+
+
+function gammaQuantileSetTable() {
+  // log alpha vs. u = log normalized log-quantile spread, v = center of normal scores
+  return {
+    uMin: -6,
+    uMax: 6,
+    nU: 49,
+    vMin: -2,
+    vMax: 2,
+    nV: 9,
+    logAlpha: [12.003, 12.002, 12.002, 12.001, 12, 11.999, 11.998, 11.998, 11.997, 11.504, 11.503, 11.502, 11.501, 11.5, 11.499, 11.498, 11.497, 11.496, 11.005, 11.004, 11.003, 11.001, 11, 10.999, 10.997, 10.996, 10.995, 10.507, 10.505, 10.504, 10.502, 10.5, 10.498, 10.497, 10.495, 10.493, 10.009, 10.007, 10.005, 10.002, 10, 9.9978, 9.9955, 9.9933, 9.991, 9.5115, 9.5087, 9.5058, 9.5029, 9.5, 9.4971, 9.4943, 9.4914, 9.4885, 9.0148, 9.0111, 9.0074, 9.0038, 9.0001, 8.9964, 8.9926, 8.9889, 8.9852, 8.519, 8.5143, 8.5096, 8.5048, 8.5001, 8.4953, 8.4906, 8.4858, 8.4809, 8.0244, 8.0184, 8.0123, 8.0063, 8.0002, 7.994, 7.9879, 7.9817, 7.9755, 7.5313, 7.5236, 7.5159, 7.5081, 7.5003, 7.4924, 7.4845, 7.4766, 7.4686, 7.0401, 7.0303, 7.0204, 7.0105, 7.0004, 6.9903, 6.9802, 6.9699, 6.9596, 6.5514, 6.5389, 6.5263, 6.5136, 6.5007, 6.4878, 6.4747, 6.4614, 6.4481, 6.0659, 6.05, 6.034, 6.0177, 6.0012, 5.9845, 5.9677, 5.9506, 5.9332, 5.5844, 5.5643, 5.5439, 5.5231, 5.502, 5.4806, 5.4588, 5.4367, 5.4141, 5.1081, 5.0827, 5.0567, 5.0303, 5.0033, 4.9758, 4.9477, 4.9189, 4.8896, 4.6382, 4.6062, 4.5735, 4.5399, 4.5054, 4.4701, 4.4337, 4.3964, 4.358, 4.1765, 4.1365, 4.0953, 4.0528, 4.0089, 3.9635, 3.9166, 3.8679, 3.8174, 3.7249, 3.6753, 3.6239, 3.5704, 3.5146, 3.4565, 3.3957, 3.3321, 3.2653, 3.2857, 3.2249, 3.1612, 3.0943, 3.0239, 2.9497, 2.8711, 2.7877, 2.6988, 2.8616, 2.7879, 2.7099, 2.6271, 2.5389, 2.4446, 2.3433, 2.2338, 2.115, 2.4551, 2.3672, 2.2731, 2.172, 2.0627, 1.9441, 1.8143, 1.6711, 1.5116, 2.0687, 1.9657, 1.8543, 1.7329, 1.5998, 1.4527, 1.2886, 1.1031, 0.89048, 1.7042, 1.5861, 1.4568, 1.3143, 1.1558, 0.97748, 0.77443, 0.53945, 0.26205, 1.362, 1.2296, 1.0833, 0.92019, 0.73637, 0.52663, 0.28366, -0.0030453, -0.34887, 1.0411, 0.89609, 0.73452, 0.55277, 0.34602, 0.10764, -0.17157, -0.50461, -0.90992, 0.73888, 0.58327, 0.40889, 0.21155, -0.014318, -0.27622, -0.58447, -0.95321, -1.4016, 0.4518, 0.2877, 0.10305, -0.10669, -0.34747, -0.62726, -0.95675, -1.3502, -1.8265, 0.17623, 0.0054479, -0.18724, -0.40654, -0.65859, -0.95147, -1.2958, -1.7058, -2.1996, -0.091006, -0.26699, -0.46593, -0.6926, -0.95313, -1.2555, -1.6104, -2.0314, -2.5365, -0.35232, -0.53235, -0.73619, -0.96857, -1.2356, -1.545, -1.9074, -2.3361, -2.8488, -0.60948, -0.79265, -1.0003, -1.2372, -1.5092, -1.824, -2.1919, -2.6261, -3.1442, -0.86381, -1.0494, -1.26, -1.5004, -1.7764, -2.0953, -2.4674, -2.9058, -3.4277, -1.1162, -1.3036, -1.5166, -1.7598, -2.0388, -2.361, -2.7363, -3.1778, -3.7027, -1.3675, -1.556, -1.7708, -2.0163, -2.2978, -2.6226, -3.0004, -3.4443, -3.9714, -1.6181, -1.8074, -2.0235, -2.2707, -2.5542, -2.8811, -3.2609, -3.7066, -4.2355, -1.8683, -2.0581, -2.2751, -2.5236, -2.8087, -3.1372, -3.5187, -3.9659, -4.4961, -2.1183, -2.3084, -2.526, -2.7755, -3.0619, -3.3917, -3.7745, -4.2229, -4.7542, -2.3684, -2.5585, -2.7764, -3.0267, -3.314, -3.645, -4.0288, -4.4781, -5.0103, -2.6184, -2.8085, -3.0266, -3.2773, -3.5655, -3.8973, -4.2819, -4.7321, -5.2649, -2.8684, -3.0585, -3.2767, -3.5277, -3.8164, -4.1489, -4.5343, -4.985, -5.5184, -3.1184, -3.3085, -3.5267, -3.7779, -4.067, -4.4001, -4.786, -5.2373, -5.771, -3.3684, -3.5585, -3.7767, -4.0279, -4.3173, -4.6508, -5.0372, -5.4889, -6.0231, -3.6184, -3.8085, -4.0267, -4.278, -4.5675, -4.9014, -5.2881, -5.7401, -6.2746, -3.8684, -4.0585, -4.2767, -4.528, -4.8176, -5.1517, -5.5387, -5.991, -6.5257, -4.1184, -4.3085, -4.5267, -4.778, -5.0676, -5.4019, -5.7892, -6.2417, -6.7766, -4.2912, -4.5066, -4.7445, -5.0095, -5.3075, -5.6462, -6.0358, -6.4899, -7.0257, -4.2912, -4.5066, -4.7445, -5.0095, -5.3075, -5.6462, -6.0358, -6.4899, -7.0257, -4.2912, -4.5066, -4.7445, -5.0095, -5.3075, -5.6462, -6.0358, -6.4899, -7.0257, -4.2912, -4.5066, -4.7445, -5.0095, -5.3075, -5.6462, -6.0358, -6.4899, -7.0257],
+  };
+}
+
+
+function betaQuantileSetTable() {
+  // log alpha and log beta vs. u = logit of median, v = log normalized logit-quantile spread
+  return {
+    uMin: -8,
+    uMax: 8,
+    nU: 17,
+    vMin: -5,
+    vMax: 2,
+    nV: 15,
+    logAlpha: [10, 9.0004, 8.0005, 7.0008, 6.0016, 5.0036, 4.0093, 3.0243, 2.0631, 1.1561, 0.34647, -0.34663, -0.9495, -1.4709, -1.8814, 10.001, 9.001, 8.0011, 7.0014, 6.0021, 5.0042, 4.0098, 3.0248, 2.0637, 1.1567, 0.34723, -0.3452, -0.94369, -1.4418, -1.8492, 10.002, 9.0025, 8.0026, 7.0029, 6.0037, 5.0058, 4.0114, 3.0264, 2.0653, 1.1584, 0.3493, -0.34138, -0.93002, -1.4041, -1.8149, 10.007, 9.0068, 8.0069, 7.0072, 6.0079, 5.01, 4.0157, 3.0307, 2.0696, 1.163, 0.35485, -0.33153, -0.90231, -1.3591, -1.7784, 10.018, 9.0182, 8.0183, 7.0186, 6.0194, 5.0215, 4.0271, 3.0422, 2.0813, 1.1752, 0.36943, -0.30781, -0.85583, -1.3074, -1.7396, 10.049, 9.0486, 8.0488, 7.049, 6.0498, 5.0519, 4.0576, 3.0728, 2.1121, 1.2072, 0.40577, -0.25763, -0.78952, -1.2493, -1.6983, 10.127, 9.127, 8.1271, 7.1274, 6.1281, 5.1302, 4.1359, 3.151, 2.1903, 1.2858, 0.48779, -0.16794, -0.70374, -1.1843, -1.6543, 10.313, 9.3133, 8.3134, 7.3137, 6.3144, 5.3163, 4.3215, 3.3353, 2.3713, 1.4596, 0.64828, -0.029143, -0.59757, -1.1117, -1.6074, 10.693, 9.6932, 8.6932, 7.6934, 6.6939, 5.6951, 4.6983, 3.7072, 2.7304, 1.789, 0.9218, 0.16952, -0.46758, -1.0303, -1.5572, 11.313, 10.313, 9.3133, 8.3133, 7.3133, 6.3133, 5.3133, 4.3134, 3.3141, 2.3187, 1.3446, 0.44807, -0.30687, -0.93841, -1.5032, 12.127, 11.127, 10.127, 9.1267, 8.1263, 7.1253, 6.1224, 5.1148, 4.0947, 3.0456, 1.9469, 0.84082, -0.10315, -0.83334, -1.4451, 13.049, 12.049, 11.048, 10.048, 9.0476, 8.046, 7.0415, 6.0295, 4.9975, 3.9148, 2.7217, 1.3898, 0.16476, -0.71133, -1.382, 14.018, 13.018, 12.018, 11.018, 10.017, 9.0152, 8.01, 6.9961, 5.9587, 4.8603, 3.6164, 2.1128, 0.53156, -0.56653, -1.3133, 15.007, 14.007, 13.007, 12.006, 11.006, 10.004, 8.9981, 7.9835, 6.944, 5.8391, 4.5732, 2.9747, 1.0432, -0.38956, -1.2378, 16.002, 15.002, 14.002, 13.002, 12.001, 10.999, 9.9937, 8.9788, 7.9385, 6.8312, 5.5565, 3.9158, 1.7297, -0.16472, -1.1541, 17.001, 16.001, 15.001, 14, 13, 11.998, 10.992, 9.9771, 8.9364, 7.8283, 6.5503, 4.8928, 2.5674, 0.13466, -1.0603, 18, 17, 16, 15, 13.999, 12.997, 11.992, 10.976, 9.9357, 8.8272, 7.548, 5.8841, 3.4966, 0.55037, -0.9537],
+    logBeta: [18, 17, 16, 15, 13.999, 12.997, 11.992, 10.976, 9.9357, 8.8272, 7.548, 5.8841, 3.4966, 0.55037, -0.9537, 17.001, 16.001, 15.001, 14, 13, 11.998, 10.992, 9.9771, 8.9364, 7.8283, 6.5503, 4.8928, 2.5674, 0.13466, -1.0603, 16.002, 15.002, 14.002, 13.002, 12.001, 10.999, 9.9937, 8.9788, 7.9385, 6.8312, 5.5565, 3.9158, 1.7297, -0.16472, -1.1541, 15.007, 14.007, 13.007, 12.006, 11.006, 10.004, 8.9981, 7.9835, 6.944, 5.8391, 4.5732, 2.9747, 1.0432, -0.38956, -1.2378, 14.018, 13.018, 12.018, 11.018, 10.017, 9.0152, 8.01, 6.9961, 5.9587, 4.8603, 3.6164, 2.1128, 0.53156, -0.56653, -1.3133, 13.049, 12.049, 11.048, 10.048, 9.0476, 8.046, 7.0415, 6.0295, 4.9975, 3.9148, 2.7217, 1.3898, 0.16476, -0.71133, -1.382, 12.127, 11.127, 10.127, 9.1267, 8.1263, 7.1253, 6.1224, 5.1148, 4.0947, 3.0456, 1.9469, 0.84082, -0.10315, -0.83334, -1.4451, 11.313, 10.313, 9.3133, 8.3133, 7.3133, 6.3133, 5.3133, 4.3134, 3.3141, 2.3187, 1.3446, 0.44807, -0.30687, -0.93841, -1.5032, 10.693, 9.6932, 8.6932, 7.6934, 6.6939, 5.6951, 4.6983, 3.7072, 2.7304, 1.789, 0.9218, 0.16952, -0.46758, -1.0303, -1.5572, 10.313, 9.3133, 8.3134, 7.3137, 6.3144, 5.3163, 4.3215, 3.3353, 2.3713, 1.4596, 0.64828, -0.029143, -0.59757, -1.1117, -1.6074, 10.127, 9.127, 8.1271, 7.1274, 6.1281, 5.1302, 4.1359, 3.151, 2.1903, 1.2858, 0.48779, -0.16794, -0.70374, -1.1843, -1.6543, 10.049, 9.0486, 8.0488, 7.049, 6.0498, 5.0519, 4.0576, 3.0728, 2.1121, 1.2072, 0.40577, -0.25763, -0.78952, -1.2493, -1.6983, 10.018, 9.0182, 8.0183, 7.0186, 6.0194, 5.0215, 4.0271, 3.0422, 2.0813, 1.1752, 0.36943, -0.30781, -0.85583, -1.3074, -1.7396, 10.007, 9.0068, 8.0069, 7.0072, 6.0079, 5.01, 4.0157, 3.0307, 2.0696, 1.163, 0.35485, -0.33153, -0.90231, -1.3591, -1.7784, 10.002, 9.0025, 8.0026, 7.0029, 6.0037, 5.0058, 4.0114, 3.0264, 2.0653, 1.1584, 0.3493, -0.34138, -0.93002, -1.4041, -1.8149, 10.001, 9.001, 8.0011, 7.0014, 6.0021, 5.0042, 4.0098, 3.0248, 2.0637, 1.1567, 0.34723, -0.3452, -0.94369, -1.4418, -1.8492, 10, 9.0004, 8.0005, 7.0008, 6.0016, 5.0036, 4.0093, 3.0243, 2.0631, 1.1561, 0.34647, -0.34663, -0.9495, -1.4709, -1.8814],
+  };
+}
@@ -2,6 +2,67 @@
  * Make a guess of parameters to give lowest function value
  */ 
 
+/**
+ * Make a budget for solvers. A budget is exhausted when the time limit
+ * (in milliseconds) has passed since it was made or when token.cancelled
+ * is true. When their budget is exhausted, solvers stop and return the best
+ * result found so far, and the status of the budget is set to 'timeout' or
+ * 'cancelled'. The status is 'ok' otherwise.
+ * @param {float} timeLimit - time limit in milliseconds
+ * @param {object} token - cancellation token; solvers stop when token.cancelled is true
+ */
+function makeSolverBudget(timeLimit=Infinity, token=null) {
+	return {
+		deadline: performance.now() + timeLimit,
+		token: token,
+		status: 'ok',
+	};
+}
+
+
+/**
+ * Check if a solver budget is exhausted, updating its status. A null
+ * budget is never exhausted.
+ */
+function solverBudgetExhausted(budget) {
+	if (budget === null) return false;
+	if (budget.status !== 'ok') return true;
+
+	if (budget.token !== null && budget.token.cancelled) {
+		budget.status = 'cancelled';
+	}
+	else if (performance.now() > budget.deadline) {
+		budget.status = 'timeout';
+	}
+
+	return budget.status !== 'ok';
+}
+
+
+/**
+ * Call fn() with budget used by all solvers called within it that are not
+ * explicitly given a budget, and return the result.
+ */
+function withSolverBudget(budget, fn) {
+	let previous = defaultSolverBudget();
+	withSolverBudget.active = budget;
+	try {
+		return fn();
+	}
+	finally {
+		withSolverBudget.active = previous;
+	}
+}
+
+
+/**
+ * Budget used by solvers if none is given.
+ */
+function defaultSolverBudget() {
+	return withSolverBudget.active === undefined ? null : withSolverBudget.active;
+}
+
+
 /** 
  * Compute the Jacobian of vector-valued f at point x using central differencing
  * @param {function} f - vector-valued function we are computing the Jacobian for with call signature f(x, ...args)
@@ -54,7 +115,8 @@ function findRootTrustRegion(
 		maxIters=10000, 
 		deltaBar=1000.0, 
 		eta=0.125, 
-		minDelta=1e-12
+		minDelta=1e-12,
+		budget=defaultSolverBudget()
   ) {
 	// Starting point
 	let x = deepCopy(x0);
@@ -78,7 +140,7 @@ function findRootTrustRegion(
 	let normJTr = norm(JTr);
 
 	let iters = 0;
-	while (iters < maxIters && checkTol(r, tol) && delta >= minDelta) {
+	while (iters < maxIters && checkTol(r, tol) && delta >= minDelta && !solverBudgetExhausted(budget)) {
 		// Solve for search direction
 		let p = doglegStep(JTJ, JTr, normJTr, delta);
 
@@ -187,13 +249,16 @@ function doglegStep(JTJ, JTr, normJTr, delta) {
  * @param {array} args - arguments to pass to f
  * @param {float} tol - tolerance for convergence
  * @param {int} maxIter - maximum of Newton steps to take
+ * @param {object} budget - solver budget; if exhausted, return the current midpoint
  */
-function bisectionSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000) {
+function bisectionSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000, budget=defaultSolverBudget()) {
 	// Fail because didn't cross zero at interval
   if (f(lower, ...args) * f(upper, ...args) >= 0) return null;
 
   let mid = lower;
   for (let i = 0; i < maxIter; i++) {
+    if (solverBudgetExhausted(budget)) return (lower + upper) / 2;
+
     mid = (lower + upper) / 2;
     let fMid = f(mid, ...args);
 
@@ -216,12 +281,15 @@ function bisectionSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000) {
  * @param {float} tol - tolerance for convergence
  * @param {int} maxIter - maximum of Newton steps to take
  * @param {float} epsilon - small number. Abort if derivative is smaller than this.
+ * @param {object} budget - solver budget; if exhausted, return the current iterate
  */
-function newtonSolve(x0, f, df, args=[], tol=1e-8, maxIter=200, epsilon=1e-14) {
+function newtonSolve(x0, f, df, args=[], tol=1e-8, maxIter=200, epsilon=1e-14, budget=defaultSolverBudget()) {
 	let x = Infinity;
 	let solved = false;
 
   for (let i = 0; i < maxIter; i++) {
+      if (solverBudgetExhausted(budget)) return x0;
+
       let y = f(x0, ...args);
       let yprime = df(x0, ...args);
 
@@ -254,8 +322,9 @@ function newtonSolve(x0, f, df, args=[], tol=1e-8, maxIter=200, epsilon=1e-14) {
  * @param {int} maxIter - maximum of steps to take
  * @param {float} epsilon - small number. Abort if derivative is smaller than this.
  * @param {float} h - small number. Secant method initialized with x0 * (1 + h).
+ * @param {object} budget - solver budget; if exhausted, return the current iterate
  */
-function secantSolve(x0, f, args=[], tol=1e-8, maxIter=200, epsilon=1e-14, h=1e-4) {
+function secantSolve(x0, f, args=[], tol=1e-8, maxIter=200, epsilon=1e-14, h=1e-4, budget=defaultSolverBudget()) {
 	let x = Infinity;
 	let solved = false;
 
@@ -270,6 +339,8 @@ function secantSolve(x0, f, args=[], tol=1e-8, maxIter=200, epsilon=1e-14, h=1e-
 	}
 
 	for (let i = 0; i < maxIter; i++) {
+		if (solverBudgetExhausted(budget)) return x1;
+
 		if (q0 == q1) {
 			solved = x0 == x1;
 			x = (x0 + x1) / 2.0;
@@ -305,8 +376,9 @@ function secantSolve(x0, f, args=[], tol=1e-8, maxIter=200, epsilon=1e-14, h=1e-
  * @param {array} args - arguments to pass to f
  * @param {float} tol - tolerance for convergence
  * @param {int} maxIter - maximum of Newton steps to take
+ * @param {object} budget - solver budget; if exhausted, return the current best estimate
  */
-function brentSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000) {
+function brentSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000, budget=defaultSolverBudget()) {
 	let a = lower;
 	let b = upper;
   let fa = f(a, ...args);
@@ -327,6 +399,10 @@ function brentSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000) {
 
 	let iter = 0;
   while (iter++ < maxIter) {
+  	if (solverBudgetExhausted(budget)) {
+  		return Math.abs(fb) <= Math.abs(fc) ? b : c;
+  	}
+
   	let prevStep = b - a;
 
     // Make sure a has the larger function value
@@ -403,4 +479,4 @@ function brentSolve(f, lower, upper, args=[], tol=1e-8, maxIter=1000) {
 }
 
 
-module.exports = { jacCentralDiff, findRootTrustRegion, computeRho, checkTol, doglegStep, bisectionSolve, brentSolve, secantSolve, newtonSolve };
+module.exports = { makeSolverBudget, solverBudgetExhausted, withSolverBudget, defaultSolverBudget, jacCentralDiff, findRootTrustRegion, computeRho, checkTol, doglegStep, bisectionSolve, brentSolve, secantSolve, newtonSolve };
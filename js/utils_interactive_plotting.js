@@ -28,12 +28,15 @@ function paramsFromBoxes(boxes) {
 
 
 /**
- * Set the y-ranges for PDF and CDF plots.
+ * Set the y-ranges for PDF and CDF plots. When the log density is plotted,
+ * the range of the PDF/PMF plot follows the data on its own.
  */
 function setYRanges(p_p, p_c, source_p) {
     p_c.y_range.start = 0.0;
     p_c.y_range.end = 1.0;        
 
+    if (logDensity) return;
+
     let pdfMax = source_p.data['y_p'];
     p_p.y_range.start = 0.0;
     p_p.y_range.end = 1.04 * pdfMax;
@@ -105,107 +108,1061 @@ function checkQuantileInput(x, p, xMin, xMax, varName, quantileSetterDiv) {
 }
 
 
-function updateContinuousPDFandCDF(source_p, source_c, xRange, sliders) {
-  // Extract data from sources
-  let x_p = source_p.data['x'];
-  let y_p = source_p.data['y_p'];
-  let x_c = source_c.data['x'];
-  let y_c = source_c.data['y_c'];
-  let xRangeMin = xRange.start;
-  let xRangeMax = xRange.end;
+/**
+ * Width and height in pixels of the plotting frame of a figure.
+ */
+function plotFrameSize(p) {
+  try {
+    return [p.inner_width, p.inner_height];
+  }
+  catch (e) {
+    // Figure not yet rendered, so use the requested sizes
+    return [p.frame_width || p.width || 300, p.frame_height || p.height || 175];
+  }
+}
 
-  // x-values to evaluate PDF and CDF
-  x_p = linspace(xRangeMin, xRangeMax, n);
-  x_c = x_p;
 
-  // Update sources with new x-values
-  source_p.data['x'] = x_p;
-  source_c.data['x'] = x_c;
+/**
+ * Adaptively choose points at which to evaluate a function for plotting.
+ *
+ * f is a vectorized function of an array of x-values. We start with a
+ * point every four pixels and repeatedly bisect the intervals adjacent
+ * to points where the local linear interpolation is off by more than
+ * tol pixels, or where the function switches between finite and
+ * non-finite values, until intervals are half a pixel wide or
+ * maxPoints points have been evaluated. If logScale is true, deviations
+ * are measured on a logarithmic y-axis.
+ *
+ * Returns [x, y], the points and the function values at them.
+ */
+function adaptiveGrid(f, xMin, xMax, width, height, tol = 0.5, maxPoints = null, logScale = false) {
+  if (maxPoints === null) maxPoints = 4 * width;
 
-  // Obtain parameter values
-  let params = paramsFromSliders(sliders);
+  let nInit = Math.min(Math.max(16, Math.floor(width / 4)), maxPoints);
+  let x = linspace(xMin, xMax, nInit);
+  let y = f(x);
+
+  let minDx = (xMax - xMin) / width / 2;
+
+  while (x.length < maxPoints) {
+    let yPlot = logScale ? y.map(val => Math.log10(val)) : y;
+    let finite = yPlot.map(val => isFinite(val));
+
+    // Pixels per unit of y
+    let yLow = Infinity;
+    let yHigh = -Infinity;
+    for (let i = 0; i < yPlot.length; i++) {
+      if (finite[i]) {
+        yLow = Math.min(yLow, logScale ? yPlot[i] : -Math.abs(yPlot[i]));
+        yHigh = Math.max(yHigh, logScale ? yPlot[i] : Math.abs(yPlot[i]));
+      }
+    }
+    if (yHigh === -Infinity) break;
+    let yScale = logScale ? yHigh - yLow : yHigh;
+    let pxPerY = yScale > 0 ? height / yScale : 1.0;
+
+    // Error attributed to each interval is the largest deviation of the
+    // points at either end from the chord joining their neighbors
+    let intervalErr = new Array(x.length - 1).fill(0.0);
+    for (let i = 1; i < x.length - 1; i++) {
+      let err;
+      if (finite[i - 1] && finite[i] && finite[i + 1]) {
+        let chord = yPlot[i - 1] + (yPlot[i + 1] - yPlot[i - 1]) * (x[i] - x[i - 1]) / (x[i + 1] - x[i - 1]);
+        err = Math.abs(yPlot[i] - chord) * pxPerY;
+      }
+      else if (finite[i - 1] || finite[i] || finite[i + 1]) {
+        err = Infinity;
+      }
+      else {
+        err = 0.0;
+      }
+      intervalErr[i - 1] = Math.max(intervalErr[i - 1], err);
+      intervalErr[i] = Math.max(intervalErr[i], err);
+    }
+
+    let refine = [];
+    for (let i = 0; i < intervalErr.length; i++) {
+      if (x[i + 1] - x[i] > minDx && intervalErr[i] > tol) refine.push(i);
+    }
+    if (refine.length === 0) break;
+
+    // Spend what is left of the budget on the worst intervals
+    let nLeft = maxPoints - x.length;
+    if (refine.length > nLeft) {
+      refine = refine.sort((a, b) => intervalErr[b] - intervalErr[a]).slice(0, nLeft).sort((a, b) => a - b);
+    }
+
+    let xNew = refine.map(i => (x[i] + x[i + 1]) / 2);
+    let yNew = f(xNew);
+
+    // Merge the new points in
+    let xMerged = [];
+    let yMerged = [];
+    let j = 0;
+    for (let i = 0; i < x.length; i++) {
+      xMerged.push(x[i]);
+      yMerged.push(y[i]);
+      if (j < refine.length && refine[j] === i) {
+        xMerged.push(xNew[j]);
+        yMerged.push(yNew[j]);
+        j++;
+      }
+    }
+    x = xMerged;
+    y = yMerged;
+  }
+
+  return [x, y];
+}
+
+
+/**
+ * Log base 10 of the PDF, computed from the log PDF so that it does not
+ * underflow in the tails.
+ */
+function log10PDF(x, params) {
+  return dist.logpdf(x, params).map(val => val / Math.LN10);
+}
+
+
+function computeContinuousPDFandCDF(xRange, params, width, height, logDensity) {
+  let [xRangeMin, xRangeMax] = xRange;
+
+  // Whether to compute CDF by quadrature of the PDF
+  let cdfQuadrature = cdfStrategy === 'quadrature' || (cdfStrategy === 'auto' && dist.expensiveCdf);
+
+  // The log density is plotted on a linear axis, so the adaptive grid
+  // measures deviations in the values it is given either way
+  const pdfFun = (x, params) => logDensity ? log10PDF(x, params) : dist.pdf(x, params);
+
+  let x_p, x_c, pdf, cdf;
+  if (n === 'auto') {
+    // Place points according to the pixel size of the plot
+    [x_p, pdf] = adaptiveGrid(x => pdfFun(x, params), xRangeMin, xRangeMax, width, height);
+    if (cdfQuadrature) {
+      x_c = x_p;
+    }
+    else {
+      [x_c, cdf] = adaptiveGrid(x => dist.cdf(x, params), xRangeMin, xRangeMax, width, height);
+    }
+  }
+  else {
+    // x-values to evaluate PDF and CDF
+    x_p = linspace(xRangeMin, xRangeMax, n);
+    x_c = x_p;
+
+    pdf = pdfFun(x_p, params);
+    if (!cdfQuadrature) cdf = dist.cdf(x_c, params);
+  }
 
-  // Compute PDF
-  let pdf = dist.pdf(x_p, params);
+  if (cdfQuadrature) cdf = dist.cdfFromPDF(x_c, logDensity ? pdf.map(val => 10 ** val) : pdf, params);
 
   // Convert Infinity's to NaN's for plotting
   pdf = pdf.map(val => (val === Infinity || val === -Infinity) ? NaN : val);
 
-  // Update the PDF and CDF
-  source_p.data['y_p'] = pdf;
-  source_c.data['y_c'] = dist.cdf(x_c, params);
+  return [x_p, pdf, x_c, cdf];
+}
 
-  source_p.change.emit();
-  source_c.change.emit();
+
+/**
+ * Compute PMF and CDF aggregated into per-pixel buckets.
+ *
+ * The PMF is aggregated according to discreteLod, either 'max' or 'sum',
+ * and the staircase CDF is replaced with a line through its values at the
+ * edges of the buckets, so the number of glyphs is bounded by the width of
+ * the plot, not the width of the range.
+ */
+function computeBucketedPMFandCDF(xRange, params, nBuckets, logDensity) {
+  let xRangeMin = Math.ceil(xRange[0]);
+  let xRangeMax = Math.floor(xRange[1]);
+  let nInts = xRangeMax - xRangeMin + 1;
+
+  // Integer edges of buckets
+  let edges = [];
+  for (let k = 0; k < nBuckets; k++) {
+    edges.push(xRangeMin + Math.floor(k * nInts / nBuckets));
+  }
+  edges.push(xRangeMax + 1);
+
+  let [x_p, y_p, cdfVals] = dist.bucketedPMFandCDF(edges, params, discreteLod, logDensity);
+  if (logDensity) y_p = y_p.map(val => isFinite(val) ? val / Math.LN10 : NaN);
+
+  // CDF is plotted at the start of the range and at the last integer of each bucket
+  let x_c = [xRange[0], ...edges.slice(1).map(x => x - 1), xRange[1]];
+  let y_c = [...cdfVals, cdfVals[cdfVals.length - 1]];
+
+  return [x_p, y_p, x_c, y_c];
 }
 
 
-function updateDiscretePMFandCDF(source_p, source_c, xRange, sliders) {
+function computeDiscretePMFandCDF(xRange, params, width, logDensity) {
   // Extract data range for PMF
-  let xRangeMin = Math.ceil(xRange.start);
-  let xRangeMax = Math.floor(xRange.end);
+  let xRangeMin = Math.ceil(xRange[0]);
+  let xRangeMax = Math.floor(xRange[1]);
+
+  // Aggregate if there are more integers than pixels
+  if (discreteLod && xRangeMax - xRangeMin + 1 > width) {
+    return computeBucketedPMFandCDF(xRange, params, Math.floor(width), logDensity);
+  }
 
   // x-values to evaluate PMF and CDF
   let x_p = arange(xRangeMin, xRangeMax + 1);
 
   // Set up x-values for plotting the staircase CDF
   let x_c;
-  if (Number.isInteger(xRange.start)) {
-    if (Number.isInteger(xRange.end)) {
+  if (Number.isInteger(xRange[0])) {
+    if (Number.isInteger(xRange[1])) {
       x_c = x_p.flatMap(x => [x, x]);
     }
     else {
-      x_c = [...x_p.flatMap(x => [x, x]), xRange.end];
+      x_c = [...x_p.flatMap(x => [x, x]), xRange[1]];
     }
   }
   else {
-    if (Number.isInteger(xRange.end)) {
-      x_c = [xRange.start, ...x_p.flatMap(x => [x, x])];
+    if (Number.isInteger(xRange[1])) {
+      x_c = [xRange[0], ...x_p.flatMap(x => [x, x])];
     }
     else {
-      x_c = [xRange.start, ...x_p.flatMap(x => [x, x]), xRange.end];
+      x_c = [xRange[0], ...x_p.flatMap(x => [x, x]), xRange[1]];
     }    
   }
 
-  // Update sources with new x-values
+  // Compute the PMF and CDF
+  let y_p = logDensity
+    ? dist.logpmf(x_p, params).map(val => isFinite(val) ? val / Math.LN10 : NaN)
+    : dist.pmf(x_p, params);
+  let y_c = dist.cdfForPlotting(x_c[0], x_c[x_c.length - 1], params);
+
+  // Only one point per step is needed if the CDF is drawn with a Step glyph
+  if (stepCdf) [x_c, y_c] = staircaseToSteps(x_c, y_c);
+
+  return [x_p, y_p, x_c, y_c];
+}
+
+
+/**
+ * Points of a staircase to be drawn with a Step glyph in 'after' mode,
+ * keeping the first point, the top of each riser, and the end of the last
+ * tread.
+ */
+function staircaseToSteps(x_c, y_c) {
+  let x = [x_c[0]];
+  let y = [y_c[0]];
+  for (let i = 1; i < x_c.length; i++) {
+    if (x_c[i] === x_c[i - 1] || i === x_c.length - 1) {
+      x.push(x_c[i]);
+      y.push(y_c[i]);
+    }
+  }
+
+  return [x, y];
+}
+
+
+/**
+ * Compute data for plotting PDF/PMF and CDF. If logDensity is true, the
+ * log base 10 of the PDF/PMF is computed in place of the PDF/PMF. This
+ * does not touch any Bokeh models, so it may also be run in a worker.
+ */
+function computeData(xRange, params, discrete, width, height, logDensity) {
+  if (discrete) {
+    return computeDiscretePMFandCDF(xRange, params, width, logDensity);
+  }
+  else {
+    return computeContinuousPDFandCDF(xRange, params, width, height, logDensity);
+  }
+}
+
+
+function setSourceData(source_p, source_c, x_p, y_p, x_c, y_c) {
   source_p.data['x'] = x_p;
+  source_p.data['y_p'] = y_p;
   source_c.data['x'] = x_c;
+  source_c.data['y_c'] = y_c;
+
+  source_p.change.emit();
+  source_c.change.emit();
+}
+
+
+/**
+ * Get the worker for the app whose worker code is held in workerScript,
+ * creating it the first time it is requested. There is one worker per
+ * app, which is kept across callbacks. The worker is null if it could
+ * not be created.
+ */
+function workerState(workerScript) {
+  if (globalThis.distributionExplorerWorkers === undefined) {
+    globalThis.distributionExplorerWorkers = {};
+  }
+  let states = globalThis.distributionExplorerWorkers;
+
+  if (!(workerScript.id in states)) {
+    let state = {worker: null, nextId: 0, latestIds: {}, onResult: {}};
+
+    try {
+      let url = URL.createObjectURL(new Blob([workerScript.code], {type: 'text/javascript'}));
+      state.worker = new Worker(url);
+
+      // Only act on the response to the most recent request of each kind
+      state.worker.onmessage = event => {
+        let response = event.data;
+        if (response.id !== state.latestIds[response.kind]) return;
+        if (response.error !== undefined) {
+          console.warn('Distribution explorer worker: ' + response.error);
+          return;
+        }
+        state.onResult[response.kind](response.result);
+      };
+
+      state.worker.onerror = event => {
+        console.warn('Distribution explorer worker failed; computing on the main thread.');
+        state.worker = null;
+      };
+    }
+    catch (e) {
+      state.worker = null;
+    }
+
+    states[workerScript.id] = state;
+  }
+
+  return states[workerScript.id];
+}
+
+
+/**
+ * Post a request to the worker, if we are using one. The result is passed
+ * to onResult, unless a newer request of the same kind has been posted in
+ * the meantime. Returns false if there is no worker, in which case the
+ * caller should do the computation itself.
+ */
+function postToWorker(workerScript, kind, request, onResult) {
+  if (workerScript === null) return false;
+
+  let state = workerState(workerScript);
+  if (state.worker === null) return false;
+
+  state.nextId += 1;
+  state.latestIds[kind] = state.nextId;
+  state.onResult[kind] = onResult;
+
+  request.kind = kind;
+  request.id = state.nextId;
+  request.n = n;
+  request.discreteLod = discreteLod;
+  request.cdfStrategy = cdfStrategy;
+  request.stepCdf = stepCdf;
+  request.solverTimeLimit = solverTimeLimit;
+  state.worker.postMessage(request);
+
+  return true;
+}
+
+
+/**
+ * Decode frame k of precomputed data. Each frame holds the x-values of the
+ * PMF, if they differ between frames, followed by the values of the
+ * PDF/PMF and of the CDF, each delta-encoded.
+ */
+function decodePrecomputedFrame(precomputed, k) {
+  let lengths = precomputed.x_p === null ? [precomputed.nP, precomputed.nP, precomputed.nC] : [precomputed.nP, precomputed.nC];
+  let frameLen = lengths.reduce((a, b) => a + b, 0);
+  let offset = k * frameLen;
+
+  let segments = [];
+  for (let len of lengths) {
+    let segment = new Array(len);
+    let acc = 0.0;
+    for (let i = 0; i < len; i++) {
+      let delta = precomputed.frames[offset + i];
+      if (isNaN(delta)) {
+        segment[i] = NaN;
+      }
+      else {
+        acc += delta;
+        segment[i] = acc;
+      }
+    }
+    segments.push(segment);
+    offset += len;
+  }
+
+  return segments.length === 3 ? segments : [precomputed.x_p, ...segments];
+}
+
+
+/**
+ * Look up plotting data in frames precomputed for a grid of parameter
+ * values, interpolating linearly in each parameter between grid points.
+ * Returns data as computeData() does, or null if the x-range is not the
+ * one the frames were computed for, the parameters are off the grid, or
+ * the neighboring frames differ by more than tol relative to their
+ * largest value, in which case interpolation would be visibly wrong.
+ */
+function precomputedData(precomputed, xRange, params, tol = 0.01) {
+  if (precomputed === null) return null;
+
+  let xTol = 1e-9 * (precomputed.xRange[1] - precomputed.xRange[0]);
+  if (Math.abs(xRange[0] - precomputed.xRange[0]) > xTol || Math.abs(xRange[1] - precomputed.xRange[1]) > xTol) return null;
+
+  // Neighboring grid points and interpolation weights for each parameter
+  let inds = [];
+  let weights = [];
+  for (let i = 0; i < params.length; i++) {
+    let grid = precomputed.grids[i];
+    let tol = 1e-6 * (grid.length > 1 ? grid[1] - grid[0] : Math.max(1, Math.abs(grid[0])));
+    if (params[i] < grid[0] - tol || params[i] > grid[grid.length - 1] + tol) return null;
+
+    if (grid.length === 1) {
+      inds.push(0);
+      weights.push(0.0);
+      continue;
+    }
+
+    let j = 0;
+    while (j < grid.length - 2 && params[i] > grid[j + 1]) j++;
+    let t = (params[i] - grid[j]) / (grid[j + 1] - grid[j]);
+    if (Math.abs(params[i] - grid[j]) <= tol) t = 0.0;
+    if (Math.abs(params[i] - grid[j + 1]) <= tol) t = 1.0;
+
+    // Stems of an aggregated PMF cannot be interpolated
+    if (precomputed.x_p === null && t !== 0.0 && t !== 1.0) return null;
+
+    inds.push(j);
+    weights.push(t);
+  }
 
-  // Obtain parameter values
+  // Frames at the corners of the cell containing params
+  let corners = [];
+  for (let corner = 0; corner < (1 << params.length); corner++) {
+    let weight = 1.0;
+    let k = 0;
+    for (let i = 0; i < params.length; i++) {
+      let upper = (corner >> i) & 1;
+      weight *= upper ? weights[i] : 1.0 - weights[i];
+      k = k * precomputed.grids[i].length + inds[i] + upper;
+    }
+    if (weight > 0.0) corners.push([weight, decodePrecomputedFrame(precomputed, k)]);
+  }
+
+  if (corners.length === 1) {
+    let [x_p, y_p, y_c] = corners[0][1];
+    return [x_p, y_p, Array.from(precomputed.x_c), y_c];
+  }
+
+  // Interpolation is only faithful if the frames differ by little
+  // relative to the scale of the plots
+  for (let j of [1, 2]) {
+    if (!framesAgree(corners.map(([weight, frame]) => frame[j]), tol)) return null;
+  }
+
+  let y_p = corners[0][1][1].map((_, i) => corners.reduce((sum, [weight, frame]) => sum + weight * frame[1][i], 0.0));
+  let y_c = corners[0][1][2].map((_, i) => corners.reduce((sum, [weight, frame]) => sum + weight * frame[2][i], 0.0));
+
+  return [corners[0][1][0], y_p, Array.from(precomputed.x_c), y_c];
+}
+
+
+/**
+ * Whether the arrays in ys differ pointwise by at most tol times their
+ * largest absolute value. Arrays with NaN's, as for invalid parameters,
+ * do not agree.
+ */
+function framesAgree(ys, tol) {
+  let scale = 0.0;
+  for (let y of ys) {
+    for (let val of y) {
+      if (isNaN(val)) return false;
+      scale = Math.max(scale, Math.abs(val));
+    }
+  }
+
+  for (let i = 0; i < ys[0].length; i++) {
+    let yMin = Infinity;
+    let yMax = -Infinity;
+    for (let y of ys) {
+      yMin = Math.min(yMin, y[i]);
+      yMax = Math.max(yMax, y[i]);
+    }
+    if (yMax - yMin > tol * scale) return false;
+  }
+
+  return true;
+}
+
+
+/**
+ * State of an app that is kept across callbacks, keyed by the id of its
+ * triggerCallbacks switch: the depth of nested batches of updates, a key
+ * for the most recently requested redraw, the arrays holding the
+ * displayed samples, and a key for the displayed histogram of observed
+ * data.
+ */
+function appState() {
+  if (globalThis.distributionExplorerApps === undefined) {
+    globalThis.distributionExplorerApps = {};
+  }
+  let states = globalThis.distributionExplorerApps;
+
+  if (!(triggerCallbacks.id in states)) {
+    states[triggerCallbacks.id] = {batchDepth: 0, drawnKey: null, samples: null, observedKey: null, sweepKey: null};
+  }
+
+  return states[triggerCallbacks.id];
+}
+
+
+/**
+ * Begin a batch of updates of widgets and ranges. Each update may trigger
+ * the dispatch callback, which may run after the update returns. Those
+ * callbacks find triggerCallbacks inactive and do nothing.
+ */
+function beginBatch() {
+  appState().batchDepth += 1;
+  triggerCallbacks.active = false;
+}
+
+
+/**
+ * Commit a batch of updates. If this ends the outermost batch, the plots
+ * are redrawn once by calling redraw, and triggering of callbacks is
+ * turned back on in a new task, after the callbacks triggered by updates
+ * in the batch have run.
+ */
+function commitBatch(redraw = null) {
+  let state = appState();
+  state.batchDepth -= 1;
+  if (state.batchDepth > 0) return;
+
+  if (redraw !== null) redraw();
+
+  setTimeout(() => {
+    if (state.batchDepth === 0) triggerCallbacks.active = true;
+  }, 0);
+}
+
+
+function updateData(source_p, source_c, p_p, sliders, discrete, onUpdated = null) {
   let params = paramsFromSliders(sliders);
+  let xRange = [p_p.x_range.start, p_p.x_range.end];
+  let [width, height] = plotFrameSize(p_p);
 
-  // Update the PMF and CDF
-  source_p.data['y_p'] = dist.pmf(x_p, params);
-  source_c.data['y_c'] = dist.cdfForPlotting(x_c[0], x_c[x_c.length - 1], params);
+  // Nothing to do if the plots already show, or are about to show, the
+  // same data, unless the caller needs to act on the redraw
+  let state = appState();
+  let key = JSON.stringify([xRange, params, width, height]);
+  if (onUpdated === null && key === state.drawnKey) return;
+  state.drawnKey = key;
 
-  source_p.change.emit();
-  source_c.change.emit();
+  // Samples are redrawn along with the PDF/PMF and CDF
+  if (sampleSwitch !== null && sampleSwitch.active) {
+    updateSamples(source_hist, source_ecdf, p_p, sliders, discrete);
+  }
+
+  // The histogram of observed data only changes with the x-range
+  if (observed !== null) updateObservedHistogram(source_observed, p_p);
+
+  // The family of curves of a parameter sweep
+  if (sweep !== null) updateSweep(source_sweep, p_p, sliders, discrete);
+
+  const onResult = data => {
+    setSourceData(source_p, source_c, ...data);
+    if (onUpdated !== null) onUpdated();
+  };
+
+  let data = precomputedData(precomputed, xRange, params);
+  if (data !== null) {
+    onResult(data);
+    return;
+  }
+
+  let request = {xRange: xRange, params: params, discrete: discrete, width: width, height: height, logDensity: logDensity};
+  if (!postToWorker(workerScript, 'data', request, onResult)) {
+    onResult(computeData(xRange, params, discrete, width, height, logDensity));
+  }
 }
 
-function updateData(source_p, source_c, p_p, sliders, discrete) {
+
+/**
+ * Bins for counting samples over xRange. Continuous samples are counted in
+ * fine bins, perBar of which make up a bar of the histogram, and the ECDF
+ * is evaluated at their edges. Discrete samples are counted in bins
+ * holding one integer each, or several adjacent integers if there are more
+ * integers in the range than pixels across the plot.
+ */
+function sampleBins(xRange, discrete, width) {
   if (discrete) {
-    updateDiscretePMFandCDF(source_p, source_c, p_p.x_range, sliders);
+    let first = Math.ceil(xRange[0]);
+    let nInts = Math.max(1, Math.floor(xRange[1]) - first + 1);
+    let binWidth = Math.ceil(nInts / Math.max(1, Math.round(width)));
+
+    return {start: first - 0.5, binWidth: binWidth, nBins: Math.ceil(nInts / binWidth), perBar: 1};
   }
-  else {
-    updateContinuousPDFandCDF(source_p, source_c, p_p.x_range, sliders);
+
+  let nBars = Math.max(10, Math.round(width / 6));
+  let perBar = 8;
+
+  return {start: xRange[0], binWidth: (xRange[1] - xRange[0]) / (nBars * perBar), nBins: nBars * perBar, perBar: perBar};
+}
+
+
+/**
+ * Draw sampleSize samples from the distribution and count them in bins
+ * given by sampleBins(). Samples are drawn in chunks into a buffer that is
+ * kept across calls and binned as they are drawn, so they are never all
+ * held at once. counts must have nBins + 2 entries, the first and last of
+ * which hold the counts below and above the bins; it is filled in place.
+ * NaN samples are not counted. This does not touch any Bokeh models, so it
+ * may also be run in a worker.
+ */
+function sampleCounts(counts, bins, params, sampleSize) {
+  if (globalThis.distributionExplorerSampling === undefined) {
+    globalThis.distributionExplorerSampling = {rng: makeRng(), buffer: new Float64Array(65536)};
+  }
+  let {rng, buffer} = globalThis.distributionExplorerSampling;
+
+  let nBins = bins.nBins;
+  let start = bins.start;
+  let scale = 1 / bins.binWidth;
+
+  counts.fill(0);
+  for (let drawn = 0; drawn < sampleSize; drawn += buffer.length) {
+    let chunk = sampleSize - drawn < buffer.length ? buffer.subarray(0, sampleSize - drawn) : buffer;
+    dist.sample(chunk, params, rng);
+
+    for (let i = 0; i < chunk.length; i++) {
+      let j = Math.floor((chunk[i] - start) * scale);
+      if (j < 0) counts[0] += 1;
+      else if (j >= nBins) counts[nBins + 1] += 1;
+      else counts[j + 1] += 1;
+    }
+  }
+
+  return counts;
+}
+
+
+/**
+ * Arrays for counts of samples and for the histogram and ECDF, which are
+ * kept in the state of the app and reused as long as the number of bins is
+ * unchanged. When they are reallocated, they become the data of the
+ * sources.
+ */
+function sampleArrays(source_hist, source_ecdf, bins) {
+  let state = appState();
+  let nBins = bins.nBins;
+  let nBars = nBins / bins.perBar;
+
+  if (state.samples === null || state.samples.counts.length !== nBins + 2 || state.samples.top.length !== nBars) {
+    state.samples = {
+      counts: new Float64Array(nBins + 2),
+      left: new Float64Array(nBars),
+      right: new Float64Array(nBars),
+      top: new Float64Array(nBars),
+      x: new Float64Array(nBins + 1),
+      y: new Float64Array(nBins + 1),
+    };
+    source_hist.data = {left: state.samples.left, right: state.samples.right, top: state.samples.top};
+    source_ecdf.data = {x: state.samples.x, y: state.samples.y};
+  }
+
+  return state.samples;
+}
+
+
+/**
+ * Display a histogram of counts of samples over the PDF/PMF and the ECDF
+ * over the CDF, writing into the arrays of the sources in place. The
+ * histogram of a continuous distribution is normalized as a density; that
+ * of a discrete distribution gives the frequency of each integer. When the
+ * log density is plotted, the heights of the bars are their log base 10.
+ */
+function setSampleData(source_hist, source_ecdf, counts, bins, discrete) {
+  let {left, right, top, x, y} = sampleArrays(source_hist, source_ecdf, bins);
+  let nBins = bins.nBins;
+
+  let total = 0;
+  for (let j = 0; j < nBins + 2; j++) total += counts[j];
+  let norm = total > 0 ? 1 / total : NaN;
+
+  // ECDF at the left edge of the range and at the right edge of each bin,
+  // or, for discrete distributions, at the first integer of each bin
+  let cumsum = counts[0];
+  x[0] = bins.start;
+  y[0] = cumsum * norm;
+  for (let j = 0; j < nBins; j++) {
+    cumsum += counts[j + 1];
+    x[j + 1] = discrete ? bins.start + 0.5 + j * bins.binWidth : bins.start + (j + 1) * bins.binWidth;
+    y[j + 1] = cumsum * norm;
+  }
+
+  let barWidth = bins.perBar * bins.binWidth;
+  for (let k = 0; k < top.length; k++) {
+    let count = 0;
+    for (let j = k * bins.perBar; j < (k + 1) * bins.perBar; j++) count += counts[j + 1];
+
+    if (discrete && bins.binWidth === 1) {
+      left[k] = bins.start + 0.5 + k - 0.4;
+      right[k] = bins.start + 0.5 + k + 0.4;
+    }
+    else {
+      left[k] = bins.start + k * barWidth;
+      right[k] = left[k] + barWidth;
+    }
+    top[k] = count * norm / barWidth;
+    if (logDensity) top[k] = count > 0 ? Math.log10(top[k]) : NaN;
+  }
+
+  source_hist.change.emit();
+  source_ecdf.change.emit();
+}
+
+
+/**
+ * Draw samples for the current parameters and display their histogram and
+ * ECDF over the x-range of the plots.
+ */
+function updateSamples(source_hist, source_ecdf, p_p, sliders, discrete) {
+  let params = paramsFromSliders(sliders);
+  let [width, height] = plotFrameSize(p_p);
+  let bins = sampleBins([p_p.x_range.start, p_p.x_range.end], discrete, width);
+
+  const onResult = counts => setSampleData(source_hist, source_ecdf, counts, bins, discrete);
+
+  let request = {bins: bins, params: params, sampleSize: sampleSize};
+  if (!postToWorker(workerScript, 'samples', request, onResult)) {
+    onResult(sampleCounts(sampleArrays(source_hist, source_ecdf, bins).counts, bins, params, sampleSize));
+  }
+}
+
+
+function clearSamples(source_hist, source_ecdf) {
+  appState().samples = null;
+  source_hist.data = {left: [], right: [], top: []};
+  source_ecdf.data = {x: [], y: []};
+}
+
+
+/**
+ * Histogram of observed data over xRange from the level of the pyramid of
+ * counts computed in Python whose bars are closest to 6 pixels wide. Bins
+ * at level k are 2^k times as wide as those of the finest level, and the
+ * levels are stored one after another in observed.counts. Returns the
+ * left and right edges and the heights of the bars, normalized as a
+ * density, or, for discrete data, as the frequency of each integer.
+ */
+function observedHistogram(observed, xRange, width) {
+  let nBars = Math.max(10, Math.round(width / 6));
+  let target = (xRange[1] - xRange[0]) / nBars;
+  let level = Math.round(Math.log2(target / observed.binWidth));
+  level = isNaN(level) ? 0 : Math.max(0, Math.min(observed.nLevels - 1, level));
+
+  let offset = 0;
+  for (let k = 0; k < level; k++) offset += observed.nBins >> k;
+  let nBins = observed.nBins >> level;
+  let binWidth = observed.binWidth * 2 ** level;
+
+  let i0 = Math.max(0, Math.floor((xRange[0] - observed.start) / binWidth));
+  let i1 = Math.min(nBins, Math.ceil((xRange[1] - observed.start) / binWidth));
+  let nVisible = Math.max(0, i1 - i0);
+
+  let left = new Float64Array(nVisible);
+  let right = new Float64Array(nVisible);
+  let top = new Float64Array(nVisible);
+  let narrow = observed.discrete && binWidth === 1;
+  for (let i = 0; i < nVisible; i++) {
+    let edge = observed.start + (i0 + i) * binWidth;
+    left[i] = narrow ? edge + 0.1 : edge;
+    right[i] = narrow ? edge + 0.9 : edge + binWidth;
+    top[i] = observed.counts[offset + i0 + i] / (observed.total * binWidth);
   }
+
+  return [left, right, top];
+}
+
+
+/**
+ * Rebin the histogram of observed data for the current x-range, unless it
+ * is already shown.
+ */
+function updateObservedHistogram(source_observed, p_p) {
+  let xRange = [p_p.x_range.start, p_p.x_range.end];
+  let [width, height] = plotFrameSize(p_p);
+
+  let state = appState();
+  let key = JSON.stringify([xRange, width]);
+  if (key === state.observedKey) return;
+  state.observedKey = key;
+
+  let [left, right, top] = observedHistogram(observed, xRange, width);
+  if (logDensity) top = top.map(val => val > 0 ? Math.log10(val) : NaN);
+  source_observed.data = {left: left, right: right, top: top};
 }
 
+
+/**
+ * Shared x-values at which each member of a parameter sweep is evaluated.
+ * For continuous distributions, they are n evenly spaced points, or twice
+ * as many as there are pixels across the plot if n is 'auto'. For discrete
+ * distributions, they are the integers in the range, strided so that
+ * there are no more of them than pixels.
+ */
+function sweepGrid(xRange, discrete, width) {
+  if (discrete) {
+    let first = Math.ceil(xRange[0]);
+    let last = Math.floor(xRange[1]);
+    let stride = Math.max(1, Math.ceil((last - first + 1) / Math.max(1, Math.round(width))));
+
+    let x = [];
+    for (let k = first; k <= last; k += stride) x.push(k);
+
+    return x;
+  }
+
+  return linspace(xRange[0], xRange[1], n === 'auto' ? 2 * Math.round(width) : n);
+}
+
+
+/**
+ * Compute the PDF/PMF and CDF of each member of a parameter sweep, for
+ * which parameter sweepInd takes each of sweepValues and the others are
+ * given by params. All members are evaluated in one pass over the grid
+ * given by sweepGrid(), and parts of the PDF/PMF that depend only on the
+ * parameters, as kept by dist.cachedLogNormalizer(), are computed once per
+ * member instead of once per point. The CDF of a discrete distribution is
+ * given as a staircase. Returns the x-values and rows of values for the
+ * PDF/PMF and for the CDF. This does not touch any Bokeh models, so it may
+ * also be run in a worker.
+ */
+function computeSweepData(xRange, params, sweepInd, sweepValues, discrete, width, logDensity) {
+  let x = sweepGrid(xRange, discrete, width);
+  let nX = x.length;
+  let strided = discrete && nX > 1 && x[1] - x[0] > 1;
+  let cdfQuadrature = !discrete && (cdfStrategy === 'quadrature' || (cdfStrategy === 'auto' && dist.expensiveCdf));
+
+  // Treads and risers of the staircase CDF, each integer but the first
+  // appearing twice
+  let x_c = discrete ? x.flatMap((val, i) => i === 0 ? [val] : [val, val]) : x;
+
+  let ys_p = [];
+  let ys_c = [];
+  let member = params.slice();
+  for (let value of sweepValues) {
+    member[sweepInd] = value;
+
+    // The log density is computed directly, so that it does not underflow
+    let density, log10Density;
+    if (logDensity) {
+      log10Density = discrete ? dist.logpmf(x, member).map(val => val / Math.LN10) : log10PDF(x, member);
+      density = log10Density.map(val => 10 ** val);
+    }
+    else {
+      density = discrete ? dist.pmf(x, member) : dist.pdf(x, member);
+    }
+
+    let cdf;
+    if (cdfQuadrature) {
+      cdf = dist.cdfFromPDF(x, density, member);
+    }
+    else if (discrete && !strided && nX > 0) {
+      // Accumulate the PMF that has already been computed
+      cdf = new Array(nX);
+      let cumsum = dist.cdfSingleValue(x[0] - 1, member);
+      for (let i = 0; i < nX; i++) {
+        if (!isNaN(density[i])) cumsum += density[i];
+        cdf[i] = cumsum;
+      }
+    }
+    else {
+      cdf = dist.cdf(x, member);
+    }
+
+    let y_p = new Float64Array(nX);
+    for (let i = 0; i < nX; i++) {
+      let val = logDensity ? log10Density[i] : density[i];
+      y_p[i] = isFinite(val) ? val : NaN;
+    }
+    ys_p.push(y_p);
+
+    if (discrete) {
+      let y_c = new Float64Array(x_c.length);
+      for (let i = 0; i < nX; i++) {
+        if (i > 0) y_c[2 * i - 1] = cdf[i - 1];
+        y_c[2 * i] = cdf[i];
+      }
+      ys_c.push(y_c);
+    }
+    else {
+      ys_c.push(Float64Array.from(cdf));
+    }
+  }
+
+  return [x, ys_p, x_c, ys_c];
+}
+
+
+/**
+ * Redraw the members of the parameter sweep for the current values of the
+ * other parameters and the x-range of the plots. The family does not
+ * depend on the value of the swept parameter, so it is left alone when
+ * only that slider moves.
+ */
+function updateSweep(source_sweep, p_p, sliders, discrete) {
+  let params = paramsFromSliders(sliders);
+  let xRange = [p_p.x_range.start, p_p.x_range.end];
+  let [width, height] = plotFrameSize(p_p);
+
+  let state = appState();
+  let key = JSON.stringify([xRange, params.filter((val, i) => i !== sweep.ind), width]);
+  if (key === state.sweepKey) return;
+  state.sweepKey = key;
+
+  const onResult = ([x, ys_p, x_c, ys_c]) => {
+    source_sweep.data['xs_p'] = ys_p.map(() => x);
+    source_sweep.data['ys_p'] = ys_p;
+    source_sweep.data['xs_c'] = ys_c.map(() => x_c);
+    source_sweep.data['ys_c'] = ys_c;
+    source_sweep.change.emit();
+  };
+
+  let request = {xRange: xRange, params: params, sweepInd: sweep.ind, sweepValues: sweep.values, discrete: discrete, width: width, logDensity: logDensity};
+  if (!postToWorker(workerScript, 'sweep', request, onResult)) {
+    onResult(computeSweepData(xRange, params, sweep.ind, sweep.values, discrete, width, logDensity));
+  }
+}
+
+
+function computeQuantiles(pVals, params) {
+  return pVals.map(p => dist.ppfSingleValue(p, params).toPrecision(4));
+}
+
+
 function updateQuantiles(quantileSetterSwitch, sliders, xBoxes, pBoxes) {
   if (!quantileSetterSwitch.active) {
     let params = paramsFromSliders(sliders);
+    let pVals = pBoxes.map(pBox => Number(pBox.value));
+
+    const onResult = xVals => {
+      for (let i = 0; i < xBoxes.length; i++) {
+        xBoxes[i].value = xVals[i];
+      }
+    };
 
-    for (let i = 0; i < xBoxes.length; i++) {
-      xBoxes[i].value = dist.ppfSingleValue(Number(pBoxes[i].value), params).toPrecision(4);
+    if (!postToWorker(workerScript, 'quantiles', {pVals: pVals, params: params}, onResult)) {
+      onResult(computeQuantiles(pVals, params));
     }
   }
 }
 
 
-function quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p) {
-  // Shut off the triggering of callbacks
-  triggerCallbacks.active = false;
+/**
+ * Solve for parameters matching quantiles, spending at most solverTimeLimit
+ * seconds in solvers. Returns the parameters, whether the solve was
+ * successful, error text in the event of failure, and the status of the
+ * solver budget, which is 'timeout' if solvers were stopped at the time
+ * limit, in which case the parameters are the best found so far. This does
+ * not touch any Bokeh models, so it may also be run in a worker.
+ */
+function solveQuantileSet(x, p, extraParams) {
+  // Error text in the event of failure
+  let errText = '<p style="color:tomato;">Failed to find parameters to match quantiles.</p>';
+
+  let budget = makeSolverBudget(solverTimeLimit === null ? Infinity : 1000 * solverTimeLimit);
+
+  // Obtain parameter values to match quantiles
+  let optimParams, optimSuccess;
+  try {
+    [optimParams, optimSuccess] = withSolverBudget(budget, () => dist.quantileSet(x, p, extraParams));
+  } catch(e) {
+    optimSuccess = false;
+    errText = '<p style="color:tomato;">' + e.message + '</p>';
+  }
 
+  return [optimParams, optimSuccess, errText, budget.status];
+}
+
+
+function applyQuantileSetResult(optimParams, optimSuccess, errText, status, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p) {
+  // Updates of sliders and ranges are batched so that the plots are
+  // redrawn once
+  beginBatch();
+
+  // If solvers were stopped at the time limit, use the best parameters
+  // found so far, provided they are valid
+  let partial = status !== 'ok' && optimParams !== undefined && optimParams.every((param, i) => {
+    let j = dist.activeParamsInds[i];
+    return isFinite(param) && !(param <= dist.paramMin[j]) && !(param >= dist.paramMax[j]);
+  });
+
+  let text;
+  if (optimSuccess || partial) {
+    // Update text
+    text = partial ? '<p style="color:orange;">Stopped at time limit; best parameters found: ' : '<p>';
+    for (let i = 0; i < optimParams.length - 1; i++) {
+      text += dist.paramNames[dist.activeParamsInds[i]] + ' = ' + optimParams[i].toPrecision(4) + ', ';
+    }
+    let i = optimParams.length - 1;
+    text += dist.paramNames[dist.activeParamsInds[i]] + ' = ' + optimParams[i].toPrecision(4) + '</p>';
+  } else if (status !== 'ok') {
+    text = '<p style="color:tomato;">Timed out before finding parameters to match quantiles.</p>';
+  } else{
+    text = errText;
+  }
+
+  quantileSetterDiv.text = text;
+
+  if (optimSuccess || partial) {
+    // Build optimal parameter values
+    let params = [];
+    let aInd = 0;
+    for (let i = 0; i < sliders.length; i++) {
+      if (dist.activeParamsInds.includes(i)) {
+        params.push(optimParams[aInd]);
+
+        // Set slider value
+        sliders[i].value = optimParams[aInd];
+
+        aInd += 1;
+      } else { // Slider is fixed
+        params.push(sliders[i].value);
+      }
+    }
+
+    // Update slider ranges to put parameter values in middle.
+    for (let i = 0; i < optimParams.length; i++ ) {
+      if (sliders[dist.activeParamsInds[i]].start > optimParams[i] || sliders[dist.activeParamsInds[i]].end < optimParams[i]) {
+        // Set location parameter or parameter that can take neg. values range 95% of ppf range
+        if (dist.locationParamInd === dist.activeParamsInds[i] || dist.paramMin[dist.activeParamsInds[i]] < 0) {
+          let width = (dist.ppf(0.975, params) - dist.ppf(0.025, params)) / 2;
+          startBoxes[dist.activeParamsInds[i]].value = (optimParams[i] - width).toPrecision(4);
+          endBoxes[dist.activeParamsInds[i]].value = (optimParams[i] + width).toPrecision(4);
+        } else {
+          startBoxes[dist.activeParamsInds[i]].value = (4 * optimParams[i] / 1001).toPrecision(4);
+          endBoxes[dist.activeParamsInds[i]].value = (4 * optimParams[i]).toPrecision(4);
+        }
+      }
+      // Set slider range
+      sliders[dist.activeParamsInds[i]].start = Number(startBoxes[dist.activeParamsInds[i]].value);
+      sliders[dist.activeParamsInds[i]].end = Number(endBoxes[dist.activeParamsInds[i]].value);
+    }
+
+    // Obtain limits of x-axis
+    let [x1, x2] = dist.defaultXRange(params);
+
+    p_p.x_range.start = x1;
+    p_p.x_range.end = x2;
+
+    // Recompute PDF/PMF and CDF, then set y-ranges to the defaults
+    commitBatch(() => updateData(source_p, source_c, p_p, sliders, discrete, () => setYRanges(p_p, p_c, source_p)));
+  }
+  else {
+    commitBatch();
+  }
+}
+
+
+function quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p) {
   // Extract quantiles and desired targets
   let inputOk;
   try {
@@ -218,7 +1175,7 @@ function quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes,
     // Make sure the input is ok.
     inputOk = checkQuantileInput(x, p, dist.hardMin, dist.hardMax, dist.varName, quantileSetterDiv);
   } catch (e) {
-    quantileSetterDiv.text = '<p style="color:tomato;">' + e.message; + '</p>';
+    quantileSetterDiv.text = '<p style="color:tomato;">' + e.message + '</p>';
     inputOk = false;
   }
 
@@ -231,82 +1188,15 @@ function quantileSetter(xBoxes, pBoxes, quantileSetterDiv, sliders, startBoxes,
       }
     }
 
-    // Error text in the event of failure
-    let errText = '<p style="color:tomato;">Failed to find parameters to match quantiles.</p>';
+    const onResult = ([optimParams, optimSuccess, errText, status]) => {
+      applyQuantileSetResult(optimParams, optimSuccess, errText, status, quantileSetterDiv, sliders, startBoxes, endBoxes, p_p, p_c, source_p);
+    };
 
-    // Obtain parameter values to match quantiles
-    let optimParams, optimSuccess;
-    try {
-      [optimParams, optimSuccess] = dist.quantileSet(x, p, extraParams);
-    } catch(e) {
-      optimSuccess = false;
-      errText = '<p style="color:tomato;">' + e.message; + '</p>';
-    }
-
-    let text;
-    if (optimSuccess) {
-      // Update text
-      text = '<p>';
-      for (let i = 0; i < optimParams.length - 1; i++) {
-        text += dist.paramNames[dist.activeParamsInds[i]] + ' = ' + optimParams[i].toPrecision(4) + ', ';
-      }
-      let i = optimParams.length - 1;
-      text += dist.paramNames[dist.activeParamsInds[i]] + ' = ' + optimParams[i].toPrecision(4) + '</p>';
-    } else{
-      text = errText;
+    if (postToWorker(workerScript, 'quantileSet', {x: x, p: p, extraParams: extraParams}, onResult)) {
+      quantileSetterDiv.text = '<p>Computing...</p>';
     }
-
-    quantileSetterDiv.text = text;
-
-    if (optimSuccess) {
-      // Build optimal parameter values
-      let params = [];
-      let aInd = 0;
-      for (let i = 0; i < sliders.length; i++) {
-        if (dist.activeParamsInds.includes(i)) {
-          params.push(optimParams[aInd]);
-
-          // Set slider value
-          sliders[i].value = optimParams[aInd];
-
-          aInd += 1;
-        } else { // Slider is fixed
-          params.push(sliders[i].value);
-        }
-      }
-
-      // Update slider ranges to put parameter values in middle.
-      for (let i = 0; i < optimParams.length; i++ ) {
-        if (sliders[dist.activeParamsInds[i]].start > optimParams[i] || sliders[dist.activeParamsInds[i]].end < optimParams[i]) {
-          // Set location parameter or parameter that can take neg. values range 95% of ppf range
-          if (dist.locationParamInd === dist.activeParamsInds[i] || dist.paramMin[dist.activeParamsInds[i]] < 0) {
-            let width = (dist.ppf(0.975, params) - dist.ppf(0.025, params)) / 2;
-            startBoxes[dist.activeParamsInds[i]].value = (optimParams[i] - width).toPrecision(4);
-            endBoxes[dist.activeParamsInds[i]].value = (optimParams[i] + width).toPrecision(4);
-          } else {
-            startBoxes[dist.activeParamsInds[i]].value = (4 * optimParams[i] / 1001).toPrecision(4);
-            endBoxes[dist.activeParamsInds[i]].value = (4 * optimParams[i]).toPrecision(4);
-          }
-        }
-        // Set slider range
-        sliders[dist.activeParamsInds[i]].start = Number(startBoxes[dist.activeParamsInds[i]].value);
-        sliders[dist.activeParamsInds[i]].end = Number(endBoxes[dist.activeParamsInds[i]].value);
-      }
-
-      // Obtain limits of x-axis
-      let [x1, x2] = dist.defaultXRange(params);
-
-      p_p.x_range.start = x1;
-      p_p.x_range.end = x2;
-
-      // Recompute PDF/PMF and CDF
-      updateData(source_p, source_c, p_p, sliders, discrete);
-
-      // Set y-ranges to the defaults
-      setYRanges(p_p, p_c, source_p);  
+    else {
+      onResult(solveQuantileSet(x, p, extraParams));
     }
   }
-
-  // Turn quantile trigger back on in case slider moves
-  triggerCallbacks.active = true;  
-}
\ No newline at end of file
+}
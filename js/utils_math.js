@@ -96,6 +96,19 @@ function log1p(x) {
 }
 
 
+function log1pmx(x) {
+  // log(1 + x) - x, accurate when x is small, where the two terms nearly
+  // cancel. The Taylor series is used for |x| < 0.01, truncated with
+  // relative error below 1e-16.
+  if (Math.abs(x) >= 1e-2) return Math.log1p(x) - x;
+
+  let result = 0;
+  for (let k = 10; k >= 2; k--) result = (k % 2 === 0 ? -1 : 1) / k + x * result;
+
+  return x * x * result;
+}
+
+
 function logSumExp(x1, x2) {
   if (x1 > x2) {
     return x1 + log1p(Math.exp(x2 - x1));
@@ -373,6 +386,163 @@ function regularizedIncompleteBeta(x, a, b) {
 }
 
 
+function regularizedIncompleteBetaInv(p, a, b) {
+    // Inverse of the regularized incomplete beta function, i.e., x such that
+    // regularizedIncompleteBeta(x, a, b) = p. An initial approximation is
+    // refined with Halley steps, using the Beta PDF as the derivative.
+    // Adapted from Numerical Recipes, 3rd ed., section 6.4.
+    // Returns NaN if the iterations fail to converge.
+    if (p <= 0) return 0;
+    if (p >= 1) return 1;
+
+    var EPSILON = 1e-10;
+    var a1 = a - 1,
+        b1 = b - 1,
+        x, t, u, w, err;
+
+    if (a >= 1 && b >= 1) {
+        var pp = p < 0.5 ? p : 1 - p;
+        t = Math.sqrt(-2 * Math.log(pp));
+        x = (2.30753 + t * 0.27061) / (1 + t * (0.99229 + t * 0.04481)) - t;
+        if (p < 0.5) x = -x;
+        var al = (x * x - 3) / 6;
+        var h = 2 / (1 / (2 * a - 1) + 1 / (2 * b - 1));
+        w = x * Math.sqrt(al + h) / h - (1 / (2 * b - 1) - 1 / (2 * a - 1)) * (al + 5 / 6 - 2 / (3 * h));
+        x = a / (a + b * Math.exp(2 * w));
+    }
+    else {
+        t = Math.exp(a * Math.log(a / (a + b))) / a;
+        u = Math.exp(b * Math.log(b / (a + b))) / b;
+        w = t + u;
+        if (p < t / w) x = Math.pow(a * w * p, 1 / a);
+        else x = 1 - Math.pow(b * w * (1 - p), 1 / b);
+    }
+
+    var afac = -lnbeta(a, b);
+    for (var i = 0; i < 20; i++) {
+        if (x === 0 || x === 1) return x;
+
+        err = regularizedIncompleteBeta(x, a, b) - p;
+        t = Math.exp(a1 * Math.log(x) + b1 * log1p(-x) + afac);
+        u = err / t;
+        t = u / (1 - 0.5 * Math.min(1, u * (a1 / x - b1 / (1 - x))));
+        x -= t;
+        if (x <= 0) x = 0.5 * (x + t);
+        if (x >= 1) x = 0.5 * (x + t + 1);
+        if (Math.abs(t) < EPSILON * x && i > 0) return x;
+    }
+
+    return Math.abs(regularizedIncompleteBeta(x, a, b) - p) < 1e-8 ? x : NaN;
+}
+
+
+/**
+ * Regularized incomplete beta function for large a and b, using the
+ * Lugannani-Rice saddle point approximation for the Beta distribution as
+ * the distribution of a ratio of Gamma variates, I_x(a, b) = P(W <= 0) with
+ * W = (1 - x) G_a - x G_b. See R. W. Butler, Saddlepoint Approximations
+ * with Applications, Cambridge, 2007, section 1.2.
+ *
+ * The approximation is singular at the mean, x = a / (a + b), so there the
+ * correction to the Normal CDF is interpolated quadratically from its
+ * limit at the mean and its values to either side. The absolute error is
+ * uniformly bounded in x by betaincAsymptoticError(a, b).
+ *
+ */
+function betaincAsymptotic(x, a, b) {
+  if (x <= 0) return 0;
+  if (x >= 1) return 1;
+
+  const wCutoff = 0.05;
+
+  // Signed root of the saddle point, w, and the standardized saddle point, u
+  let saddle = (x) => {
+    let sHat = (b * x - a * (1 - x)) / (x * (1 - x) * (a + b));
+    let u = -(1 - x) * sHat;
+    let v = x * sHat;
+    let K = -a * log1pmx(u) - b * log1pmx(v) - sHat**2 * x * (1 - x) * (a + b);
+    let K2 = a * ((1 - x) / (1 + u))**2 + b * (x / (1 + v))**2;
+
+    return [Math.sign(sHat) * Math.sqrt(Math.max(-2 * K, 0)), sHat * Math.sqrt(K2)];
+  };
+
+  let stdNormCdf = (w) => erfc(-w / Math.SQRT2) / 2;
+  let stdNormPdf = (w) => Math.exp(-w * w / 2) / Math.sqrt(2 * Math.PI);
+
+  let [w, u] = saddle(x);
+  if (Math.abs(w) >= wCutoff) return stdNormCdf(w) + stdNormPdf(w) * (1 / w - 1 / u);
+
+  // Interpolate correction across the mean
+  let xi = a / (a + b);
+  let delta = 1.5 * wCutoff * Math.sqrt(xi * (1 - xi) / (a + b + 1));
+  let K2 = a * (1 - xi)**2 + b * xi**2;
+  let K3 = 2 * a * (1 - xi)**3 - 2 * b * xi**3;
+  let h0 = K3 / Math.pow(K2, 1.5) / 6;
+
+  let [wLeft, uLeft] = saddle(xi - delta);
+  let [wRight, uRight] = saddle(xi + delta);
+  let hLeft = 1 / wLeft - 1 / uLeft;
+  let hRight = 1 / wRight - 1 / uRight;
+
+  let t = (x - xi) / delta;
+  let h = h0 + t * (hRight - hLeft) / 2 + t**2 * ((hRight + hLeft) / 2 - h0);
+
+  return stdNormCdf(w) + stdNormPdf(w) * h;
+}
+
+
+/**
+ * Bound on the absolute error of betaincAsymptotic(), determined by
+ * comparison with SciPy for min(a, b) from 3 to 10^6.
+ *
+ */
+function betaincAsymptoticError(a, b) {
+  return 0.005 * Math.pow(Math.min(a, b), -1.5);
+}
+
+
+/**
+ * CDF of the standard Student-t distribution for large nu, using
+ * Fisher's expansion about the standard Normal distribution to order
+ * 1/nu^2. Its absolute error is bounded by studentTCdfAsymptoticError(nu).
+ *
+ */
+function studentTCdfAsymptotic(t, nu) {
+  let stdNormCdf = erfc(-t / Math.SQRT2) / 2;
+
+  // Far in the tails, the correction underflows
+  if (Math.abs(t) > 40) return stdNormCdf;
+
+  let g1 = (t**3 + t) / 4;
+  let g2 = (3 * t**7 - 7 * t**5 - 5 * t**3 - 3 * t) / 96;
+
+  return stdNormCdf - Math.exp(-t * t / 2) / Math.sqrt(2 * Math.PI) * (g1 / nu + g2 / nu**2);
+}
+
+
+/**
+ * Bound on the absolute error of studentTCdfAsymptotic(), determined by
+ * comparison with SciPy for nu from 30 to 10^4.
+ *
+ */
+function studentTCdfAsymptoticError(nu) {
+  return 1 / nu**3;
+}
+
+
+/**
+ * log Gamma(z + 1/2) - log Gamma(z). For large z, the difference of the two
+ * log Gamma functions loses precision to cancellation, so the asymptotic
+ * series is used for z >= 10, with absolute error below 2e-12.
+ *
+ */
+function lnGammaHalfRatio(z) {
+  if (z < 10) return lngamma(z + 0.5) - lngamma(z);
+
+  return Math.log(z) / 2 - 1 / (8 * z) + 1 / (192 * z**3) - 1 / (640 * z**5) + 17 / (14336 * z**7);
+}
+
+
 function incompleteBeta(x, a, b) {
     return regularizedIncompleteBeta(x, a, b) * Math.exp(lnbeta(a, b));
 }
@@ -487,6 +657,99 @@ function gammaincL(x, s, regularized) {
 }
 
 
+function gammaincLInv(p, s) {
+  // Inverse of the regularized lower incomplete gamma function, i.e., x
+  // such that gammaincL(x, s, true) = p. An initial approximation is refined
+  // with Halley steps, using the Gamma PDF as the derivative. Near the upper
+  // tail, the residual is computed with the upper incomplete gamma function
+  // to avoid cancellation. Adapted from Numerical Recipes, 3rd ed., section
+  // 6.2. Returns NaN if the iterations fail to converge.
+  if (p <= 0) return 0;
+  if (p >= 1) return Infinity;
+
+  var EPSILON = 1e-10;
+  var s1 = s - 1,
+    gln = lngamma(s),
+    x, t, u, err, lns1, afac;
+
+  if (s > 1) {
+    lns1 = Math.log(s1);
+    afac = Math.exp(s1 * (lns1 - 1) - gln);
+    var pp = p < 0.5 ? p : 1 - p;
+    t = Math.sqrt(-2 * Math.log(pp));
+    x = (2.30753 + t * 0.27061) / (1 + t * (0.99229 + t * 0.04481)) - t;
+    if (p < 0.5) x = -x;
+    x = Math.max(1e-3, s * Math.pow(1 - 1 / (9 * s) - x / (3 * Math.sqrt(s)), 3));
+  }
+  else {
+    t = 1 - s * (0.253 + s * 0.12);
+    if (p < t) x = Math.pow(p / t, 1 / s);
+    else x = 1 - Math.log(1 - (p - t) / (1 - t));
+  }
+
+  for (var i = 0; i < 20; i++) {
+    if (x <= 0) return 0;
+
+    err = p < 0.5 ? gammaincL(x, s, true) - p : (1 - p) - gammaincU(x, s, true);
+    if (s > 1) t = afac * Math.exp(-(x - s1) + s1 * (Math.log(x) - lns1));
+    else t = Math.exp(-x + s1 * Math.log(x) - gln);
+    u = err / t;
+    t = u / (1 - 0.5 * Math.min(1, u * (s1 / x - 1)));
+    x -= t;
+    if (x <= 0) x = 0.5 * (x + t);
+    if (Math.abs(t) < EPSILON * x) return x;
+  }
+
+  return Math.abs(gammaincL(x, s, true) - p) < 1e-8 ? x : NaN;
+}
+
+
+/**
+ * Regularized incomplete gamma function for large s, using Temme's uniform
+ * asymptotic expansion with two terms, N. M. Temme, Special Functions,
+ * Wiley, 1996, section 11.3.
+ *
+ * Returns the upper function Q(s, x) if upper is true and the lower
+ * function P(s, x) otherwise. Its absolute error is uniformly bounded in x
+ * by gammaincAsymptoticError(s).
+ *
+ */
+function gammaincAsymptotic(x, s, upper) {
+  if (x <= 0) return upper ? 1 : 0;
+  if (x === Infinity) return upper ? 0 : 1;
+
+  let sigma = (x - s) / s;
+  let eta = Math.sign(sigma) * Math.sqrt(-2.0 * log1pmx(sigma));
+
+  // Coefficients of the expansion, by series where they cancel near x = s
+  let c0, c1;
+  if (Math.abs(sigma) < 1e-3) {
+    c0 = -1 / 3 + eta / 12 - 2 * eta**2 / 135 + eta**3 / 864;
+    c1 = -1 / 540 - eta / 288 + 2.6455026455026455e-3 * eta**2;
+  }
+  else {
+    c0 = 1 / sigma - 1 / eta;
+    c1 = 1 / eta**3 - 1 / sigma**3 - 1 / sigma**2 - 1 / (12 * sigma);
+  }
+
+  let remainder = Math.exp(-s * eta**2 / 2) / Math.sqrt(2 * Math.PI * s) * (c0 + c1 / s);
+  let z = eta * Math.sqrt(s / 2);
+
+  if (upper) return erfc(z) / 2 + remainder;
+  return erfc(-z) / 2 - remainder;
+}
+
+
+/**
+ * Bound on the absolute error of gammaincAsymptotic(), determined by
+ * comparison with SciPy for s from 10 to 10^4.
+ *
+ */
+function gammaincAsymptoticError(s) {
+  return 0.01 * Math.pow(s, -2.5);
+}
+
+
 function hyp1f1(a, b, x) {
   let i, j, la, n, nl;
   let a0 = a, a1 = a, x0 = x, y0, y1, hg1, hg2, r1, r2, rg, xg, sum1, sum2;
@@ -713,6 +976,26 @@ function cosm1(x) {
   return -0.5 * x2 + x2 * x2 * polevl(x2, coeffs);
 }
 
+function bilinearInterp(table, values, u, v) {
+  // Bilinear interpolation of values tabulated on a regular grid of u and
+  // v, described by table.uMin, table.uMax, table.nU, and likewise for v,
+  // with v varying fastest. Points outside of the grid are clamped to it.
+  let i = (table.nU - 1) * (u - table.uMin) / (table.uMax - table.uMin);
+  let j = (table.nV - 1) * (v - table.vMin) / (table.vMax - table.vMin);
+  i = Math.min(Math.max(i, 0), table.nU - 1);
+  j = Math.min(Math.max(j, 0), table.nV - 1);
+
+  let i0 = Math.min(Math.floor(i), table.nU - 2);
+  let j0 = Math.min(Math.floor(j), table.nV - 2);
+  let di = i - i0;
+  let dj = j - j0;
+  let k = i0 * table.nV + j0;
+
+  return (1 - di) * ((1 - dj) * values[k] + dj * values[k + 1])
+         + di * ((1 - dj) * values[k + table.nV] + dj * values[k + table.nV + 1]);
+}
+
+
 function chebPoints(n, low = -1, high = 1) {
   // Chebyshev points going from 1 to -1
   let points = Array.from({ length: n }, (_, i) => Math.cos(Math.PI * i / (n - 1)));
@@ -1056,4 +1339,374 @@ function lnfactorial(n) {
 }
 
 
-module.exports = { isclose, isone, iszero, linspace, logspace, meshgrid, arange, logit, log1p, erf, erfinv, lnchoice, lnbeta, betacf, regularizedIncompleteBeta, incompleteBeta, lngamma, gammaincU, gammaincL, clenshawCurtisWeights, clenshawCurtisIntegrate, chebPoints, lnfactorial, hyp1f1, chbevl, besseli0, cosm1 };
\ No newline at end of file
+/**
+ * Seeded pseudorandom number generator using xoshiro128**, with the state
+ * initialized from the seed with splitmix32. Returns a function that gives
+ * uniform draws on the open interval (0, 1), so that logarithms of the
+ * draws are always finite.
+ */
+function makeRng(seed = Date.now()) {
+  let z = seed >>> 0;
+  let state = [];
+  for (let i = 0; i < 4; i++) {
+    z = (z + 0x9e3779b9) >>> 0;
+    let t = z;
+    t = Math.imul(t ^ (t >>> 16), 0x21f0aaad);
+    t = Math.imul(t ^ (t >>> 15), 0x735a2d97);
+    state.push((t ^ (t >>> 15)) >>> 0);
+  }
+  let [a, b, c, d] = state;
+
+  return () => {
+    let r = Math.imul(b, 5);
+    r = Math.imul((r << 7) | (r >>> 25), 9);
+    let t = b << 9;
+    c ^= a;
+    d ^= b;
+    b ^= c;
+    a ^= d;
+    c ^= t;
+    d = (d << 11) | (d >>> 21);
+
+    return ((r >>> 0) + 0.5) / 4294967296;
+  };
+}
+
+
+/**
+ * Tables for the ziggurat method for sampling the standard Normal
+ * distribution with 128 layers (Marsaglia and Tsang, 2000, in the form of
+ * Doornik, 2005). x holds the right edges of the layers, x[0] being the
+ * width of the base layer including the tail, and f the Normal density at
+ * those edges, up to normalization. The tables are computed once and kept
+ * on globalThis.
+ */
+function zigguratNormalTables() {
+  if (globalThis.distributionExplorerZiggurat !== undefined) {
+    return globalThis.distributionExplorerZiggurat;
+  }
+
+  let nLayers = 128;
+  let r = 3.442619855899;
+  let v = 9.91256303526217e-3;
+
+  let x = new Float64Array(nLayers + 1);
+  let f = new Float64Array(nLayers + 1);
+  x[0] = v / Math.exp(-0.5 * r * r);
+  x[1] = r;
+  for (let i = 2; i < nLayers; i++) {
+    x[i] = Math.sqrt(-2 * Math.log(v / x[i - 1] + Math.exp(-0.5 * x[i - 1] * x[i - 1])));
+  }
+  x[nLayers] = 0;
+
+  let ratio = new Float64Array(nLayers);
+  for (let i = 0; i <= nLayers; i++) {
+    f[i] = Math.exp(-0.5 * x[i] * x[i]);
+    if (i < nLayers) ratio[i] = x[i + 1] / x[i];
+  }
+
+  globalThis.distributionExplorerZiggurat = {nLayers: nLayers, r: r, x: x, f: f, ratio: ratio};
+
+  return globalThis.distributionExplorerZiggurat;
+}
+
+
+/**
+ * Draw from the standard Normal distribution by the ziggurat method. zig
+ * is the output of zigguratNormalTables().
+ */
+function standardNormal(rng, zig) {
+  while (true) {
+    let u = 2 * rng() - 1;
+    let i = Math.floor(rng() * zig.nLayers);
+
+    // Inside the rectangle of the layer, which is most of the time
+    if (Math.abs(u) < zig.ratio[i]) return u * zig.x[i];
+
+    // Tail beyond r
+    if (i === 0) {
+      let xTail, yTail;
+      do {
+        xTail = Math.log(rng()) / zig.r;
+        yTail = Math.log(rng());
+      } while (-2 * yTail < xTail * xTail);
+
+      return u < 0 ? xTail - zig.r : zig.r - xTail;
+    }
+
+    // Wedge between the rectangle and the density
+    let x = u * zig.x[i];
+    if (zig.f[i + 1] + rng() * (zig.f[i] - zig.f[i + 1]) < Math.exp(-0.5 * x * x)) return x;
+  }
+}
+
+
+/**
+ * Draw from the Gamma distribution with shape parameter alpha and unit
+ * rate by the method of Marsaglia and Tsang (2000). For alpha < 1, a draw
+ * with shape alpha + 1 is multiplied by u^(1/alpha).
+ */
+function standardGamma(alpha, rng, zig) {
+  if (alpha < 1) {
+    return standardGamma(alpha + 1, rng, zig) * Math.pow(rng(), 1 / alpha);
+  }
+
+  let d = alpha - 1 / 3;
+  let c = 1 / Math.sqrt(9 * d);
+  while (true) {
+    let x, v;
+    do {
+      x = standardNormal(rng, zig);
+      v = 1 + c * x;
+    } while (v <= 0);
+
+    v = v * v * v;
+    let u = rng();
+    if (u < 1 - 0.0331 * x * x * x * x) return d * v;
+    if (Math.log(u) < 0.5 * x * x + d * (1 - v + Math.log(v))) return d * v;
+  }
+}
+
+
+/**
+ * Alias table for sampling from a discrete distribution with the given
+ * (possibly unnormalized) probabilities, built by Vose's method. Entries
+ * of probs that are NaN or negative are treated as zero.
+ */
+function aliasTable(probs) {
+  let nProbs = probs.length;
+  let total = 0.0;
+  for (let i = 0; i < nProbs; i++) {
+    if (probs[i] > 0) total += probs[i];
+  }
+
+  let prob = new Float64Array(nProbs);
+  let alias = new Int32Array(nProbs);
+  let small = new Int32Array(nProbs);
+  let large = new Int32Array(nProbs);
+  let nSmall = 0;
+  let nLarge = 0;
+  for (let i = 0; i < nProbs; i++) {
+    prob[i] = probs[i] > 0 ? probs[i] * nProbs / total : 0.0;
+    if (prob[i] < 1) small[nSmall++] = i;
+    else large[nLarge++] = i;
+  }
+
+  while (nSmall > 0 && nLarge > 0) {
+    let s = small[--nSmall];
+    let l = large[--nLarge];
+    alias[s] = l;
+    prob[l] = prob[l] + prob[s] - 1;
+    if (prob[l] < 1) small[nSmall++] = l;
+    else large[nLarge++] = l;
+  }
+
+  // Whatever remains has probability one, up to roundoff
+  while (nLarge > 0) prob[large[--nLarge]] = 1;
+  while (nSmall > 0) prob[small[--nSmall]] = 1;
+
+  return {prob: prob, alias: alias};
+}
+
+
+/**
+ * Draw an index from an alias table. The fractional part of the scaled
+ * uniform draw decides between a column and its alias.
+ */
+function aliasSample(table, rng) {
+  let w = rng() * table.prob.length;
+  let i = Math.floor(w);
+
+  return w - i < table.prob[i] ? i : table.alias[i];
+}
+
+
+
+/**
+ * Subscript of a positive integer in Unicode digits, for naming the
+ * parameters of the components of composite distributions.
+ */
+function subscript(n) {
+  return String(n).split('').map(d => '₀₁₂₃₄₅₆₇₈₉'[Number(d)]).join('');
+}
+
+
+/**
+ * Table of cos(2πk/n) and sin(2πk/n) for k < n/2, used as twiddle
+ * factors by fftRadix2(). Computing them directly, instead of by recurrence,
+ * keeps the relative error of small outputs at roundoff. The table for
+ * the most recent n is kept on globalThis.
+ */
+function fftTwiddles(n) {
+  let cache = globalThis.distributionExplorerTwiddles;
+  if (cache === undefined || cache.n !== n) {
+    let cos = new Float64Array(n / 2);
+    let sin = new Float64Array(n / 2);
+    for (let k = 0; k < n / 2; k++) {
+      cos[k] = Math.cos(2 * Math.PI * k / n);
+      sin[k] = Math.sin(2 * Math.PI * k / n);
+    }
+    cache = {n: n, cos: cos, sin: sin};
+    globalThis.distributionExplorerTwiddles = cache;
+  }
+
+  return cache;
+}
+
+
+/**
+ * In-place iterative radix-2 fast Fourier transform of the complex
+ * sequence with real parts re and imaginary parts im, which are typed
+ * arrays whose length is a power of two. If inverse is true, the inverse
+ * transform, including the factor 1/n, is computed.
+ */
+function fftRadix2(re, im, inverse = false) {
+  let n = re.length;
+  if (n <= 1) return;
+
+  // Bit-reversal permutation
+  for (let i = 1, j = 0; i < n; i++) {
+    let bit = n >> 1;
+    for (; j & bit; bit >>= 1) j ^= bit;
+    j ^= bit;
+    if (i < j) {
+      let t = re[i]; re[i] = re[j]; re[j] = t;
+      t = im[i]; im[i] = im[j]; im[j] = t;
+    }
+  }
+
+  let {cos, sin} = fftTwiddles(n);
+  let sign = inverse ? 1 : -1;
+  for (let len = 2; len <= n; len <<= 1) {
+    let half = len >> 1;
+    let stride = n / len;
+    for (let i = 0; i < n; i += len) {
+      for (let k = 0; k < half; k++) {
+        let wr = cos[k * stride];
+        let wi = sign * sin[k * stride];
+        let a = i + k;
+        let b = a + half;
+        let tr = re[b] * wr - im[b] * wi;
+        let ti = re[b] * wi + im[b] * wr;
+        re[b] = re[a] - tr;
+        im[b] = im[a] - ti;
+        re[a] += tr;
+        im[a] += ti;
+      }
+    }
+  }
+
+  if (inverse) {
+    for (let i = 0; i < n; i++) {
+      re[i] /= n;
+      im[i] /= n;
+    }
+  }
+}
+
+
+/**
+ * First nOut entries of the linear convolution of the real sequences a
+ * and b, computed by FFT in O(n log n) time. Both sequences are packed
+ * into a single complex transform, z = a + ib, whose spectrum gives the
+ * product of the spectra of a and b as (Z[k]² - conj(Z[n-k])²) / 4i, so
+ * only one forward and one inverse transform are needed.
+ */
+function fftConvolve(a, b, nOut = a.length + b.length - 1) {
+  let nA = Math.min(a.length, nOut);
+  let nB = Math.min(b.length, nOut);
+  let out = new Float64Array(nOut);
+  if (nA === 0 || nB === 0) return out;
+
+  let n = 1;
+  while (n < nA + nB - 1) n <<= 1;
+
+  let re = new Float64Array(n);
+  let im = new Float64Array(n);
+  for (let i = 0; i < nA; i++) re[i] = a[i];
+  for (let i = 0; i < nB; i++) im[i] = b[i];
+
+  fftRadix2(re, im);
+
+  for (let k = 0; k <= n / 2; k++) {
+    let j = (n - k) % n;
+    let dRe = re[k] * re[k] - im[k] * im[k] - re[j] * re[j] + im[j] * im[j];
+    let dIm = 2 * (re[k] * im[k] + re[j] * im[j]);
+
+    // Product at k and its complex conjugate at n - k
+    re[k] = dIm / 4;
+    im[k] = -dRe / 4;
+    re[j] = dIm / 4;
+    im[j] = dRe / 4;
+  }
+
+  fftRadix2(re, im, true);
+
+  for (let i = 0; i < Math.min(nOut, n); i++) out[i] = re[i];
+
+  return out;
+}
+
+
+/**
+ * Split the parameters of a composite distribution into the parameters
+ * of each of its components, in order.
+ */
+function componentParams(params, components) {
+  let parts = [];
+  let offset = 0;
+  for (let component of components) {
+    parts.push(params.slice(offset, offset + component.paramNames.length));
+    offset += component.paramNames.length;
+  }
+
+  return parts;
+}
+
+
+/**
+ * Weights of the components of a mixture, given by the last
+ * nComponents - 1 parameters, with the weight of the last component
+ * being what remains. Returns null if the weights are not a valid
+ * probability vector.
+ */
+function mixtureWeights(params, nComponents) {
+  let weights = params.slice(params.length - nComponents + 1);
+  let last = 1 - weights.reduce((a, b) => a + b, 0);
+  if (last < 0 && last > -1e-12) last = 0;
+  weights.push(last);
+
+  return weights.every(w => w >= 0 && w <= 1) ? weights : null;
+}
+
+
+/**
+ * Fill out with draws from a mixture. The number of draws from each
+ * component is drawn first, and then the draws of each component fill a
+ * contiguous block of out, so each component samples in bulk. The order
+ * of the draws is therefore not random, which does not matter for
+ * binning them.
+ */
+function sampleMixture(out, components, parts, weights, rng) {
+  let counts = new Array(components.length).fill(0);
+  for (let i = 0; i < out.length; i++) {
+    let u = rng();
+    let j = 0;
+    while (j < components.length - 1 && u >= weights[j]) {
+      u -= weights[j];
+      j++;
+    }
+    counts[j]++;
+  }
+
+  let offset = 0;
+  for (let j = 0; j < components.length; j++) {
+    if (counts[j] > 0) components[j].sample(out.subarray(offset, offset + counts[j]), parts[j], rng);
+    offset += counts[j];
+  }
+
+  return out;
+}
+
+
+module.exports = { isclose, isone, iszero, linspace, logspace, meshgrid, arange, logit, log1p, erf, erfinv, lnchoice, lnbeta, betacf, regularizedIncompleteBeta, regularizedIncompleteBetaInv, incompleteBeta, lngamma, gammaincU, gammaincL, gammaincLInv, log1pmx, gammaincAsymptotic, gammaincAsymptoticError, betaincAsymptotic, betaincAsymptoticError, studentTCdfAsymptotic, studentTCdfAsymptoticError, lnGammaHalfRatio, bilinearInterp, clenshawCurtisWeights, clenshawCurtisIntegrate, chebPoints, lnfactorial, hyp1f1, chbevl, besseli0, cosm1, makeRng, zigguratNormalTables, standardNormal, standardGamma, aliasTable, aliasSample, subscript, fftTwiddles, fftRadix2, fftConvolve, componentParams, mixtureWeights, sampleMixture };
\ No newline at end of file
@@ -0,0 +1,69 @@
+// Message handler for running the distribution library in a Web Worker.
+// The worker's code is the callback preamble followed by this code, so
+// that dist and all functions for computing with it are available.
+// Requests are coalesced, so that if several requests of the same kind
+// arrive while the worker is busy, only the most recent one is processed.
+
+var n, discreteLod, cdfStrategy, stepCdf, solverTimeLimit;
+
+var workerPending = {};
+var workerScheduled = false;
+
+function handleWorkerRequest(request) {
+  n = request.n;
+  discreteLod = request.discreteLod;
+  cdfStrategy = request.cdfStrategy;
+  stepCdf = request.stepCdf;
+  solverTimeLimit = request.solverTimeLimit;
+
+  let response = {kind: request.kind, id: request.id};
+  try {
+    if (request.kind === 'data') {
+      response.result = computeData(request.xRange, request.params, request.discrete, request.width, request.height, request.logDensity);
+    }
+    else if (request.kind === 'sweep') {
+      response.result = computeSweepData(request.xRange, request.params, request.sweepInd, request.sweepValues, request.discrete, request.width, request.logDensity);
+    }
+    else if (request.kind === 'quantiles') {
+      response.result = computeQuantiles(request.pVals, request.params);
+    }
+    else if (request.kind === 'samples') {
+      response.result = sampleCounts(new Float64Array(request.bins.nBins + 2), request.bins, request.params, request.sampleSize);
+    }
+    else if (request.kind === 'quantileSet') {
+      response.result = solveQuantileSet(request.x, request.p, request.extraParams);
+    }
+    else {
+      response.error = 'Unknown request ' + request.kind + '.';
+    }
+  }
+  catch (e) {
+    response.error = e.message;
+  }
+
+  return response;
+}
+
+function processWorkerRequests() {
+  workerScheduled = false;
+
+  // Quantile setting first, since it results in new data requests
+  for (let kind of ['quantileSet', 'data', 'sweep', 'samples', 'quantiles']) {
+    if (kind in workerPending) {
+      let request = workerPending[kind];
+      delete workerPending[kind];
+      self.postMessage(handleWorkerRequest(request));
+    }
+  }
+}
+
+self.onmessage = (event) => {
+  // Supersede any pending request of the same kind
+  workerPending[event.data.kind] = event.data;
+
+  // Process after all messages that have already arrived are received
+  if (!workerScheduled) {
+    workerScheduled = true;
+    setTimeout(processWorkerRequests, 0);
+  }
+};
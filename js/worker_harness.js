@@ -0,0 +1,195 @@
+// Headless harness for running the distribution library in a worker, as
+// is done in the browser when explore() is called with execution='worker'.
+// The browser APIs used to create the worker (Blob, URL.createObjectURL,
+// and Worker) are shimmed using worker_threads, and the worker code is
+// built from the library and worker_handler.js in the same way as the
+// callbacks are.
+//
+// Usage: node worker_harness.js
+
+const fs = require('fs');
+const path = require('path');
+const { Worker: ThreadWorker } = require('worker_threads');
+const { bundleCode, loadBundle } = require('./load_bundle.js');
+
+// Makes the worker_threads API look like the Web Worker API inside the worker
+const workerShim = `
+const { parentPort } = require('worker_threads');
+const self = { postMessage: (message) => parentPort.postMessage(message) };
+parentPort.on('message', (data) => self.onmessage({ data: data }));
+`;
+
+
+/**
+ * Code for the worker, as built by explore().
+ */
+function workerCode(distClass) {
+  return bundleCode()
+         + '\nvar dist = new ' + distClass + '();\n'
+         + fs.readFileSync(path.join(__dirname, 'worker_handler.js'), 'utf8');
+}
+
+
+/**
+ * Install shims for the browser APIs used in workerState().
+ */
+function installBrowserShims() {
+  globalThis.Blob = class {
+    constructor(parts) {
+      this.code = parts.join('');
+    }
+  };
+
+  URL.createObjectURL = blob => 'data:text/javascript,' + encodeURIComponent(blob.code);
+
+  globalThis.Worker = class {
+    constructor(url) {
+      let code = decodeURIComponent(url.slice('data:text/javascript,'.length));
+      this.thread = new ThreadWorker(workerShim + code, { eval: true });
+      this.thread.on('message', data => this.onmessage({ data: data }));
+      this.thread.on('error', e => this.onerror(e));
+      this.thread.unref();
+    }
+
+    postMessage(message) {
+      this.thread.postMessage(message);
+    }
+  };
+}
+
+
+// Minimal stand-ins for Bokeh models
+const mockSource = () => ({ data: {}, change: { emit() {} } });
+const mockPlot = (start, end) => ({
+  x_range: { start: start, end: end },
+  y_range: { start: 0, end: 1 },
+  frame_width: 300,
+  frame_height: 175,
+  get inner_width() { throw new Error('unset'); },
+});
+
+
+/**
+ * Measure the largest gap between ticks of a 5 ms interval timer while
+ * waiting for condition() to become true, which shows how responsive the
+ * main thread is.
+ */
+function maxTickGap(condition, timeout = 20000) {
+  return new Promise((resolve, reject) => {
+    let last = performance.now();
+    let maxGap = 0;
+    let start = last;
+    let timer = setInterval(() => {
+      let now = performance.now();
+      maxGap = Math.max(maxGap, now - last);
+      last = now;
+      if (condition()) {
+        clearInterval(timer);
+        resolve(maxGap);
+      }
+      else if (now - start > timeout) {
+        clearInterval(timer);
+        reject(new Error('Timed out waiting for worker.'));
+      }
+    }, 5);
+  });
+}
+
+
+function check(condition, message) {
+  console.log((condition ? 'ok     ' : 'FAILED ') + message);
+  if (!condition) process.exitCode = 1;
+}
+
+
+async function main() {
+  installBrowserShims();
+
+  const distClass = 'VonMisesDistribution';
+  const globals = {
+    distClass: distClass,
+    n: 4000,
+    discrete: false,
+    discreteLod: 'max',
+    cdfStrategy: 'exact',
+    stepCdf: false,
+    logDensity: false,
+    precomputed: null,
+    sampleSwitch: null,
+    observed: null,
+    sweep: null,
+    solverTimeLimit: null,
+    triggerCallbacks: { active: true },
+    source_c: mockSource(),
+    workerScript: { id: 'harness', code: workerCode(distClass) },
+  };
+  const names = ['computeData', 'computeSweepData', 'updateData', 'updateQuantiles', 'quantileSetter', 'updateSamples', 'updateSweep', 'workerState'];
+  const lib = loadBundle(names, globals);
+  const local = loadBundle(names, { ...globals, workerScript: null });
+
+  // Redraws computed in the worker match those computed locally
+  let p_p = mockPlot(-Math.PI, Math.PI);
+  let [source_p, source_c] = [mockSource(), mockSource()];
+  let sliders = [{ value: 0.5 }, { value: 4.0 }];
+
+  let t0 = performance.now();
+  local.updateData(mockSource(), mockSource(), p_p, sliders, false);
+  let localTime = performance.now() - t0;
+
+  let updated = false;
+  lib.updateData(source_p, source_c, p_p, sliders, false, () => { updated = true; });
+  check(!updated, 'updateData returns before the worker is done');
+  let gap = await maxTickGap(() => updated);
+  let expected = local.computeData([-Math.PI, Math.PI], [0.5, 4.0], false, 300, 175, false);
+  check(JSON.stringify(source_c.data['y_c']) === JSON.stringify(expected[3]), 'worker results match local results');
+  console.log(`        redraw takes ${localTime.toFixed(0)} ms locally; longest main thread stall with worker ${gap.toFixed(0)} ms`);
+  check(gap < localTime, 'main thread stays responsive during redraw in worker');
+
+  // Superseded requests are discarded
+  let nApplied = 0;
+  for (let kappa = 1; kappa <= 10; kappa++) {
+    lib.updateData(source_p, source_c, p_p, [{ value: 0.5 }, { value: kappa }], false, () => { nApplied += 1; });
+  }
+  await maxTickGap(() => nApplied > 0);
+  await new Promise(resolve => setTimeout(resolve, 1000));
+  expected = local.computeData([-Math.PI, Math.PI], [0.5, 10], false, 300, 175, false);
+  check(nApplied === 1, `only most recent of 10 rapid requests applied (${nApplied} applied)`);
+  check(JSON.stringify(source_c.data['y_c']) === JSON.stringify(expected[3]), 'applied result is from most recent request');
+
+  // Quantile setting in the worker
+  let div = { text: '' };
+  let xBoxes = [{ value: '-1' }, { value: '1' }];
+  let pBoxes = [{ value: '0.05' }, { value: '0.95' }];
+  let boxes = () => [{ value: '-3.14' }, { value: '3.14' }];
+  sliders = [{ value: 0.0, start: -Math.PI, end: Math.PI }, { value: 1.0, start: 0.001, end: 10 }];
+  lib.quantileSetter(xBoxes, pBoxes, div, sliders, boxes(), boxes(), p_p, p_p, source_p);
+  check(div.text === '<p>Computing...</p>', 'quantile setter shows that it is computing');
+  await maxTickGap(() => div.text !== '<p>Computing...</p>');
+  check(div.text.startsWith('<p>μ = '), `quantile setter result: ${div.text}`);
+  let params = sliders.map(slider => slider.value);
+  let cdf = [-1, 1].map(x => lib.dist.cdfSingleValue(x, params));
+  check(Math.abs(cdf[0] - 0.05) < 1e-6 && Math.abs(cdf[1] - 0.95) < 1e-6, 'sliders set to parameters matching quantiles');
+
+  // Samples drawn and binned in the worker
+  let [source_hist, source_ecdf] = [mockSource(), mockSource()];
+  const sampling = loadBundle(names, { ...globals, sampleSwitch: { active: true }, sampleSize: 1000000, source_hist: source_hist, source_ecdf: source_ecdf });
+  sampling.updateSamples(source_hist, source_ecdf, p_p, sliders, false);
+  await maxTickGap(() => source_ecdf.data['y'] !== undefined);
+  let ecdfError = Math.max(...source_ecdf.data['x'].map((x, i) => Math.abs(source_ecdf.data['y'][i] - lib.dist.cdfSingleValue(x, params))));
+  check(ecdfError < 0.005, `ECDF of samples drawn in worker matches CDF (max error ${ecdfError.toFixed(4)})`);
+
+  // Family of curves of a parameter sweep computed in the worker
+  let source_sweep = mockSource();
+  let sweep = { ind: 1, values: [0.5, 1, 2, 4, 8] };
+  const sweeping = loadBundle(names, { ...globals, sweep: sweep, source_sweep: source_sweep });
+  sweeping.updateSweep(source_sweep, p_p, sliders, false);
+  await maxTickGap(() => source_sweep.data['ys_c'] !== undefined);
+  expected = local.computeSweepData([p_p.x_range.start, p_p.x_range.end], params, sweep.ind, sweep.values, false, 300, false);
+  check(JSON.stringify(source_sweep.data['ys_c']) === JSON.stringify(expected[3]), 'sweep computed in worker matches local results');
+}
+
+
+main().catch(e => {
+  console.error(e);
+  process.exitCode = 1;
+});
@@ -1,3 +0,0 @@
-if (triggerCallbacks.active) {
-  updateData(source_p, source_c, p_p, sliders, discrete);
-}
\ No newline at end of file
@@ -36,5 +36,10 @@ setup(
     author='Justin Bois',
     install_requires=install_requires,
     dependency_links=dependency_links,
+    entry_points={
+        'console_scripts': [
+            'distribution-explorer=distribution_explorer.site:main',
+        ],
+    },
     author_email='bois@caltech.edu'
 )